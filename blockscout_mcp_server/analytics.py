@@ -10,6 +10,10 @@ of two bases, selected per-path: the legacy composite of client IP, client name,
 and client version, or the caller's PRO API key fingerprint. Which basis applies
 depends on how the event reached analytics -- see `track_tool_invocation` and
 `track_community_usage` for the exact selection rule on each path.
+
+``track`` does not send anything itself: unless BLOCKSCOUT_MIXPANEL_QUEUE_SIZE is
+0, the client's consumer is :data:`blockscout_mcp_server.analytics_queue.analytics_queue`,
+which queues the event for a background worker that sends batches.
 """
 
 from __future__ import annotations
@@ -34,6 +38,7 @@ except ImportError:  # pragma: no cover
     Consumer = _MissingMixpanel  # type: ignore[assignment]
     Mixpanel = _MissingMixpanel  # type: ignore[assignment]
 
+from blockscout_mcp_server.analytics_queue import analytics_queue
 from blockscout_mcp_server.client_meta import (
     ClientMeta,
     extract_client_meta_from_ctx,
@@ -81,7 +86,11 @@ def _get_mixpanel_client() -> Any | None:
         return None
     try:
         api_host = getattr(config, "mixpanel_api_host", "")
-        if api_host:
+        if config.mixpanel_queue_size > 0:
+            # Queued events are sent in batches from a worker thread over this consumer's connection pool.
+            consumer = Consumer(api_host=api_host) if api_host else Consumer()
+            _mp_client = Mixpanel(token, consumer=analytics_queue.attach(consumer))
+        elif api_host:
             consumer = Consumer(api_host=api_host)
             _mp_client = Mixpanel(token, consumer=consumer)
         else:
@@ -318,9 +327,13 @@ def track_resource_read(
     )
 
 
-def track_community_usage(report: ToolUsageReport, ip: str, user_agent: str) -> None:
+def track_community_usage(report: ToolUsageReport, ip: str, user_agent: str, count: int = 1) -> None:
     """Track a tool invocation from a community (self-hosted) server.
 
+    ``count`` is how many identical reports the event stands for: the ingestion
+    path can roll them up (see :mod:`blockscout_mcp_server.community_ingest`), and
+    it is recorded as the ``report_count`` property on every community event.
+
     ``distinct_id`` is keyed on the report's ``api_key_fingerprint`` whenever one is
     present, regardless of ``auth_origin`` — unlike the direct path (see
     :func:`track_tool_invocation`), a community report's server-key fingerprint
@@ -352,6 +365,7 @@ def track_community_usage(report: ToolUsageReport, ip: str, user_agent: str) ->
             "protocol_version": report.protocol_version,
             "source": "community",
             "auth_origin": report.auth_origin if report.auth_origin is not None else AUTH_ORIGIN_UNKNOWN,
+            "report_count": count,
         }
 
         meta = {"ip": ip} if ip else None
@@ -0,0 +1,200 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Bounded, batched delivery of Mixpanel events off the event loop.
+
+The stock Mixpanel ``Consumer`` sends every ``track`` as its own blocking HTTPS
+POST, and the analytics helpers call ``track`` on the event loop — once per tool
+call in HTTP mode — so each invocation paid Mixpanel's round-trip and stalled
+every other request meanwhile. :class:`AnalyticsQueue` implements the consumer
+interface instead: ``send`` only appends the already-serialized event to a
+bounded in-memory queue, and a daemon worker thread drains it into Mixpanel's
+batch form of the endpoint (a JSON array of up to 50 events per POST) over the
+wrapped consumer's pooled connection.
+
+A batch is sent once ``BLOCKSCOUT_MIXPANEL_BATCH_SIZE`` events of one endpoint
+are pending, or ``BLOCKSCOUT_MIXPANEL_FLUSH_INTERVAL_SECONDS`` after the oldest
+pending event was queued, whichever comes first; the lifespan flushes what is
+left at shutdown. The queue holds at most ``BLOCKSCOUT_MIXPANEL_QUEUE_SIZE``
+events (``0`` keeps the synchronous stock consumer). When it is full, the new
+event is dropped — analytics must never slow down or fail a tool call — and
+counted. ``BLOCKSCOUT_MIXPANEL_SAMPLE_RATE`` below ``1`` keeps that fraction of
+events at random. A batch the wrapped consumer fails to send (after its own
+retries) is dropped and counted as failed.
+
+Counters are exported at ``/metrics``.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import random
+import threading
+import time
+from typing import Any
+
+from blockscout_mcp_server.config import config
+
+logger = logging.getLogger(__name__)
+
+# How long shutdown waits for the worker to send what is still queued.
+_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+# Wakes the worker up for shutdown when it is idle.
+_STOP = object()
+
+
+class AnalyticsQueue:
+    """Mixpanel consumer that queues events for a background batching worker."""
+
+    def __init__(self) -> None:
+        self._consumer: Any | None = None
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._closing = threading.Event()
+        self.queued = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.sampled_out = 0
+
+    def attach(self, consumer: Any) -> AnalyticsQueue:
+        """Send batches through ``consumer`` (a stock Mixpanel ``Consumer``) and return ``self``."""
+        self._consumer = consumer
+        return self
+
+    def clear(self) -> None:
+        # Detached first, so a worker still running sends nothing more.
+        self._consumer = None
+        self.close(timeout=0, flush=False)
+        self.queued = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.sampled_out = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queued": self.queued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "depth": self._queue.qsize(),
+        }
+
+    def send(self, endpoint: str, json_message: str, api_key: Any = None, api_secret: Any = None) -> None:
+        """Queue one serialized event; never blocks and never raises for a full queue.
+
+        Only the plain ``track`` form (no API key or secret) is queued, which is
+        the only form the analytics helpers use.
+        """
+        sample_rate = config.mixpanel_sample_rate
+        if sample_rate < 1.0 and random.random() >= sample_rate:
+            self.sampled_out += 1
+            return
+        if self._queue.qsize() >= config.mixpanel_queue_size:
+            self.dropped += 1
+            logger.debug("Mixpanel event queue is full; dropping a %s event", endpoint)
+            return
+        self._ensure_worker()
+        self._queue.put_nowait((endpoint, json_message))
+        self.queued += 1
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._lock:
+            if self._worker is None:
+                self._closing.clear()
+                self._worker = threading.Thread(target=self._run, name="mixpanel-analytics", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        pending: dict[str, list[str]] = {}
+        # When the oldest pending event must be sent by; ``None`` while nothing is pending.
+        deadline: float | None = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _STOP or self._closing.is_set():
+                if item is not None and item is not _STOP:
+                    pending.setdefault(item[0], []).append(item[1])
+                self._drain(pending)
+                return
+            if item is None:
+                self._flush(pending)
+                deadline = None
+                continue
+            endpoint, message = item
+            batch = pending.setdefault(endpoint, [])
+            batch.append(message)
+            if deadline is None:
+                deadline = time.monotonic() + config.mixpanel_flush_interval_seconds
+            if len(batch) >= config.mixpanel_batch_size:
+                self._send_batch(endpoint, pending.pop(endpoint))
+                if not pending:
+                    deadline = None
+
+    def _drain(self, pending: dict[str, list[str]]) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                pending.setdefault(item[0], []).append(item[1])
+        self._flush(pending)
+
+    def _flush(self, pending: dict[str, list[str]]) -> None:
+        batch_size = config.mixpanel_batch_size
+        for endpoint, messages in pending.items():
+            for start in range(0, len(messages), batch_size):
+                self._send_batch(endpoint, messages[start : start + batch_size])
+        pending.clear()
+
+    def _send_batch(self, endpoint: str, messages: list[str]) -> None:
+        if self._consumer is None:
+            # Detached by ``clear`` while the worker was still running.
+            return
+        try:
+            self._consumer.send(endpoint, "[" + ",".join(messages) + "]")
+        except Exception as exc:
+            self.failed += len(messages)
+            logger.debug("Sending %d Mixpanel events failed: %s", len(messages), exc)
+            return
+        self.sent += len(messages)
+
+    def close(self, timeout: float = _SHUTDOWN_TIMEOUT_SECONDS, *, flush: bool = True) -> None:
+        """Stop the worker after it sent everything still queued, waiting at most ``timeout`` seconds.
+
+        With ``flush=False`` the queued events are discarded instead. A later
+        ``send`` starts a new worker.
+        """
+        with self._lock:
+            worker = self._worker
+            self._worker = None
+            if not flush:
+                self._discard()
+            if worker is None:
+                return
+            self._closing.set()
+            try:
+                self._queue.put_nowait(_STOP)
+            except queue.Full:  # pragma: no cover - the queue is unbounded; ``send`` enforces the limit
+                pass
+        worker.join(timeout)
+        if worker.is_alive():
+            logger.warning("Mixpanel analytics worker did not finish sending within %.1fs of shutdown", timeout)
+
+    def _discard(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+
+analytics_queue = AnalyticsQueue()
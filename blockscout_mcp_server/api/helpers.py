@@ -9,7 +9,9 @@ import httpx
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
-from blockscout_mcp_server.models import ToolResponse
+from blockscout_mcp_server import json_codec
+from blockscout_mcp_server.circuit_breaker import CircuitOpenError
+from blockscout_mcp_server.models import ToolResponse, serialize_tool_response
 from blockscout_mcp_server.session_gate import (
     SessionBudgetExhaustedError,
     SessionExpiredError,
@@ -33,6 +35,29 @@ PARAM_TYPES: dict[str, Callable[[str], Any]] = {
 }
 
 
+class CodecJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with the shared ``json_codec``.
+
+    Same compact, non-ASCII-escaped bytes Starlette writes, without the cost of
+    the stdlib encoder on large tool payloads.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps_bytes(content)
+
+
+class ToolResponseJSON(Response):
+    """REST body of a ToolResponse, encoded once with ``serialize_tool_response``.
+
+    Skips the ``model_dump`` dict and its re-encoding that ``JSONResponse`` would need.
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, tool_response: ToolResponse, status_code: int = 200) -> None:
+        super().__init__(serialize_tool_response(tool_response), status_code=status_code)
+
+
 def extract_and_validate_params(request: Request, required: list[str], optional: list[str]) -> dict[str, Any]:
     """Extract and validate query parameters from a request.
 
@@ -83,7 +108,7 @@ def handle_rest_errors(
             # 403, not 429: this refusal is terminal, and 429 sits in the default
             # retry lists of common HTTP clients and LLM SDKs (see SPEC.md).
             return JSONResponse({"error": str(e)}, status_code=403)
-        except SessionStoreUnavailableError as e:
+        except (SessionStoreUnavailableError, CircuitOpenError) as e:
             return JSONResponse({"error": str(e)}, status_code=503)
         except ValueError as e:
             return JSONResponse({"error": str(e)}, status_code=400)
@@ -102,4 +127,4 @@ def handle_rest_errors(
 def create_deprecation_response(notes: list[str]) -> Response:
     """Creates a standardized JSON response for a deprecated tool endpoint."""
     tool_response = ToolResponse(data={"status": "deprecated"}, notes=notes)
-    return JSONResponse(tool_response.model_dump(), status_code=410)
+    return CodecJSONResponse(tool_response.model_dump(), status_code=410)
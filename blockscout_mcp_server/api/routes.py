@@ -2,6 +2,7 @@
 """Module for registering all REST API routes with the FastMCP server."""
 
 import json
+import math
 import mimetypes
 import pathlib
 from collections.abc import Callable
@@ -11,22 +12,45 @@ from mcp.server.fastmcp import FastMCP
 from starlette.requests import Request
 from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
 
-from blockscout_mcp_server import analytics, observability
+from blockscout_mcp_server import analytics, metrics, observability
 from blockscout_mcp_server.analytics import track_event
+from blockscout_mcp_server.analytics_queue import analytics_queue
 from blockscout_mcp_server.api.dependencies import get_mock_context
 from blockscout_mcp_server.api.helpers import (
+    ToolResponseJSON,
     create_deprecation_response,
     extract_and_validate_params,
     handle_rest_errors,
 )
+from blockscout_mcp_server.cache import contract_cache
+from blockscout_mcp_server.circuit_breaker import OPEN, circuit_breakers
+from blockscout_mcp_server.community_ingest import (
+    MAX_BATCH_BODY_BYTES,
+    admission_ip,
+    community_ingest,
+    parse_reports,
+    validate_reports,
+)
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.constants import COMMUNITY_TELEMETRY_MAX_BATCH_SIZE
+from blockscout_mcp_server.hedging import hedge_policy
+from blockscout_mcp_server.logging_utils import log_pipeline
 from blockscout_mcp_server.models import ToolUsageReport
+from blockscout_mcp_server.page_buffer import page_buffer
+from blockscout_mcp_server.prefetch import prefetcher
+from blockscout_mcp_server.rate_limiter import rate_pacer
 from blockscout_mcp_server.resources import skill_resources
+from blockscout_mcp_server.response_cache import response_cache
+from blockscout_mcp_server.singleflight import contract_fetch_flight, upstream_get_flight
+from blockscout_mcp_server.snapshot_refresher import snapshot_refresher
+from blockscout_mcp_server.telemetry_dispatcher import telemetry_dispatcher
 from blockscout_mcp_server.tools.address.get_address_info import get_address_info
 from blockscout_mcp_server.tools.address.get_tokens_by_address import get_tokens_by_address
 from blockscout_mcp_server.tools.address.nft_tokens_by_address import nft_tokens_by_address
 from blockscout_mcp_server.tools.block.get_block_info import get_block_info
 from blockscout_mcp_server.tools.block.get_block_number import get_block_number
 from blockscout_mcp_server.tools.chains.get_chains_list import get_chains_list
+from blockscout_mcp_server.tools.common import chains_list_cache, pro_api_config_cache
 from blockscout_mcp_server.tools.contract.get_contract_abi import get_contract_abi
 from blockscout_mcp_server.tools.contract.inspect_contract_code import inspect_contract_code
 from blockscout_mcp_server.tools.contract.read_contract import read_contract
@@ -43,6 +67,7 @@ from blockscout_mcp_server.tools.transaction.get_transaction_info import get_tra
 from blockscout_mcp_server.tools.transaction.get_transactions_by_address import (
     get_transactions_by_address,
 )
+from blockscout_mcp_server.web3_pool import WEB3_POOL
 
 # Define paths to static files relative to this file's location
 BASE_DIR = pathlib.Path(__file__).resolve().parent.parent
@@ -68,6 +93,260 @@ async def health_check(_: Request) -> Response:
     return JSONResponse({"status": "ok"})
 
 
+async def upstream_health(_: Request) -> Response:
+    """Return the per-upstream health scoreboard, the rate-limit pacing state, and hedging counters."""
+    return JSONResponse(
+        {
+            "upstreams": circuit_breakers.snapshot(),
+            "rate_limits": rate_pacer.snapshot(),
+            "hedging": hedge_policy.stats(),
+        }
+    )
+
+
+def _component_metrics() -> str:
+    """Render the counters components already keep (``stats()``/``snapshot()``) as metric families."""
+    caches = {
+        "contract": contract_cache.stats(),
+        "contract_persistent": contract_cache.persistent_stats(),
+        "chains_list": chains_list_cache.stats(),
+        "pro_api_config": pro_api_config_cache.stats(),
+        "upstream_response": response_cache.stats(),
+        "page_buffer": page_buffer.stats(),
+    }
+    cache_lookups = [
+        ({"cache": name, "result": result}, stats[result])
+        for name, stats in caches.items()
+        for result in ("hits", "misses", "stale_hits")
+        if result in stats
+    ]
+    cache_entries = [({"cache": name}, stats["entries"]) for name, stats in caches.items() if "entries" in stats]
+    flights = [upstream_get_flight, contract_fetch_flight]
+    breakers = circuit_breakers.snapshot()
+    pacing = rate_pacer.snapshot()
+    hedging = hedge_policy.stats()
+    prefetch = prefetcher.stats()
+    analytics_events = analytics_queue.stats()
+    log_records = log_pipeline.stats()
+    community_reports = telemetry_dispatcher.stats()
+    ingest = community_ingest.stats()
+    pool = WEB3_POOL.stats()
+    snapshots = snapshot_refresher.stats()
+    families = [
+        ("cache_lookups_total", "counter", "Cache lookups by cache and result.", cache_lookups),
+        ("cache_entries", "gauge", "Entries currently held by each cache.", cache_entries),
+        (
+            "response_cache_bytes",
+            "gauge",
+            "Body bytes held by the upstream response cache.",
+            [({}, caches["upstream_response"]["bytes"])],
+        ),
+        (
+            "contract_cache_bytes",
+            "gauge",
+            "Estimated source and metadata bytes held by the contract cache.",
+            [({}, caches["contract"]["bytes"])],
+        ),
+        (
+            "contract_persistent_cache_operations_total",
+            "counter",
+            "Persistent contract cache writes, evictions, and errors.",
+            [
+                ({"operation": operation}, caches["contract_persistent"][operation])
+                for operation in ("writes", "evictions", "errors")
+                if operation in caches["contract_persistent"]
+            ],
+        ),
+        (
+            "contract_source_blobs",
+            "gauge",
+            "Distinct source file bodies held by the contract cache after deduplication.",
+            [({}, caches["contract"]["source_blobs"])],
+        ),
+        (
+            "contract_source_logical_bytes",
+            "gauge",
+            "Uncompressed source bytes referenced by cached contracts, counting every copy.",
+            [({}, caches["contract"]["source_logical_bytes"])],
+        ),
+        (
+            "contract_cache_evictions_total",
+            "counter",
+            "Contracts evicted from the contract cache to make room.",
+            [({}, caches["contract"]["evictions"])],
+        ),
+        (
+            "contract_cache_rejections_total",
+            "counter",
+            "Contracts not cached: larger than the byte budget or colder than the entries they would evict.",
+            [({}, caches["contract"]["rejections"])],
+        ),
+        (
+            "coalescing_executions_total",
+            "counter",
+            "Coalesced work actually executed, by group.",
+            [({"group": flight.name}, flight.executions) for flight in flights],
+        ),
+        (
+            "coalescing_joined_total",
+            "counter",
+            "Calls that joined an in-flight execution, by group.",
+            [({"group": flight.name}, flight.coalesced) for flight in flights],
+        ),
+        (
+            "coalescing_in_flight",
+            "gauge",
+            "Coalesced executions currently in flight, by group.",
+            [({"group": flight.name}, flight.in_flight) for flight in flights],
+        ),
+        (
+            "circuit_breaker_open",
+            "gauge",
+            "1 while the upstream's circuit breaker is open.",
+            [({"upstream": key}, int(state["state"] == OPEN)) for key, state in breakers.items()],
+        ),
+        (
+            "circuit_breaker_rejected_total",
+            "counter",
+            "Calls failed fast by an open circuit breaker.",
+            [({"upstream": key}, state["rejected"]) for key, state in breakers.items()],
+        ),
+        (
+            "rate_limit_queue_depth",
+            "gauge",
+            "Requests waiting in a rate-limit pacing bucket.",
+            [({"bucket": label}, state["queue_depth"]) for label, state in pacing.items()],
+        ),
+        (
+            "rate_limited_total",
+            "counter",
+            "HTTP 429 responses received, by pacing bucket.",
+            [({"bucket": label}, state["rate_limited"]) for label, state in pacing.items()],
+        ),
+        (
+            "snapshot_age_seconds",
+            "gauge",
+            "Age of the PRO API config and chains list snapshots.",
+            [
+                ({"snapshot": name}, state["age_seconds"])
+                for name, state in snapshots.items()
+                if state["age_seconds"] is not None
+            ],
+        ),
+        (
+            "snapshot_refreshes_total",
+            "counter",
+            "Successful background snapshot refreshes.",
+            [({"snapshot": name}, state["refreshes"]) for name, state in snapshots.items()],
+        ),
+        (
+            "snapshot_refresh_failures_total",
+            "counter",
+            "Failed background snapshot refreshes.",
+            [({"snapshot": name}, state["failures"]) for name, state in snapshots.items()],
+        ),
+        (
+            "snapshot_refresh_consecutive_failures",
+            "gauge",
+            "Background snapshot refreshes failed in a row (0 when healthy).",
+            [({"snapshot": name}, state["consecutive_failures"]) for name, state in snapshots.items()],
+        ),
+        (
+            "prefetch_outcomes_total",
+            "counter",
+            "Finished next-page prefetches by outcome; served over all outcomes is the hit rate.",
+            [({"outcome": outcome}, prefetch[outcome]) for outcome in ("served", "unused", "failed", "cancelled")],
+        ),
+        (
+            "prefetch_skipped_total",
+            "counter",
+            "Next-page prefetches not started, by reason.",
+            [({"reason": reason}, prefetch[f"skipped_{reason}"]) for reason in ("budget", "concurrency", "load")],
+        ),
+        ("prefetch_in_flight", "gauge", "Next-page prefetches currently running.", [({}, prefetch["in_flight"])]),
+        (
+            "analytics_events_total",
+            "counter",
+            "Mixpanel events by outcome: sent, failed (batch rejected), dropped (queue full), sampled_out.",
+            [
+                ({"outcome": outcome}, analytics_events[outcome])
+                for outcome in ("sent", "failed", "dropped", "sampled_out")
+            ],
+        ),
+        (
+            "log_records_total",
+            "counter",
+            "Log records not written: dropped (log queue full) or sampled_out.",
+            [({"outcome": outcome}, log_records[outcome]) for outcome in ("dropped", "sampled_out")],
+        ),
+        ("log_queue_depth", "gauge", "Log records waiting to be written.", [({}, log_records["depth"])]),
+        (
+            "analytics_queue_depth",
+            "gauge",
+            "Mixpanel events waiting to be sent.",
+            [({}, analytics_events["depth"])],
+        ),
+        (
+            "community_reports_total",
+            "counter",
+            "Community telemetry reports by outcome: sent, failed (batch rejected), dropped (queue full).",
+            [({"outcome": outcome}, community_reports[outcome]) for outcome in ("sent", "failed", "dropped")],
+        ),
+        (
+            "community_reports_pending",
+            "gauge",
+            "Community telemetry reports waiting for their batch.",
+            [({}, community_reports["pending"])],
+        ),
+        (
+            "community_ingest_reports_total",
+            "counter",
+            "Community reports by outcome: received (admitted; includes rejected), rejected (invalid), "
+            "throttled (not admitted), dropped (roll-up buffer full).",
+            [({"outcome": outcome}, ingest[outcome]) for outcome in ("received", "rejected", "throttled", "dropped")],
+        ),
+        (
+            "community_ingest_events_total",
+            "counter",
+            "Mixpanel events exported for community reports; fewer than reports when identical ones are rolled up.",
+            [({}, ingest["exported"])],
+        ),
+        ("hedge_requests_total", "counter", "Hedge requests sent.", [({}, hedging["hedges"])]),
+        ("hedge_wins_total", "counter", "Hedge requests that answered first.", [({}, hedging["hedge_wins"])]),
+        ("web3_pool_instances", "gauge", "Pooled AsyncWeb3 instances.", [({}, pool["instances"])]),
+        (
+            "web3_pool_connections_in_use",
+            "gauge",
+            "JSON-RPC connections in use.",
+            [({}, pool["connections_in_use"])],
+        ),
+        (
+            "web3_pool_connection_waiters",
+            "gauge",
+            "JSON-RPC requests waiting for a connection.",
+            [({}, pool["connection_waiters"])],
+        ),
+        (
+            "web3_pool_connection_limit",
+            "gauge",
+            "JSON-RPC connection limit.",
+            [({}, pool["connection_limit"])],
+        ),
+    ]
+    return "".join(
+        metrics.render_family(f"blockscout_mcp_{name}", kind, help_text, samples)
+        for name, kind, help_text, samples in families
+    )
+
+
+async def serve_metrics(_: Request) -> Response:
+    """Serve request metrics and component counters in the Prometheus text format."""
+    return Response(
+        metrics.registry.render() + _component_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 async def serve_llms_txt(_: Request) -> Response:
     """Serve the llms.txt file."""
     if LLMS_TXT_CONTENT is None:
@@ -102,6 +381,10 @@ async def main_page(request: Request) -> Response:
     return HTMLResponse(INDEX_HTML_CONTENT)
 
 
+def _throttled_response(retry_after: float) -> Response:
+    return Response(status_code=429, headers={"Retry-After": str(max(1, math.ceil(retry_after)))})
+
+
 async def report_tool_usage(request: Request) -> Response:
     """Receive and process an anonymous tool usage report from a self-hosted server."""
     try:
@@ -115,7 +398,41 @@ async def report_tool_usage(request: Request) -> Response:
         return Response(status_code=400)
 
     ip = analytics._extract_ip_from_request(request)
-    analytics.track_community_usage(report=report, ip=ip, user_agent=user_agent)
+    retry_after = community_ingest.admit(admission_ip(request), 1)
+    if retry_after is not None:
+        return _throttled_response(retry_after)
+    community_ingest.add([report], ip, user_agent)
+    return Response(status_code=202)
+
+
+async def report_tool_usage_batch(request: Request) -> Response:
+    """Receive a batch of anonymous tool usage reports (a JSON array or NDJSON) from a self-hosted server.
+
+    Reports that fail validation are skipped rather than rejecting the batch, so
+    one malformed report from a version-skewed reporter does not lose the rest.
+    """
+    declared_length = request.headers.get("content-length")
+    if declared_length is not None and declared_length.isdigit() and int(declared_length) > MAX_BATCH_BODY_BYTES:
+        return Response(status_code=413)
+    body = await request.body()
+    if len(body) > MAX_BATCH_BODY_BYTES:
+        return Response(status_code=413)
+    items = parse_reports(body, request.headers.get("content-type"))
+    if items is None:
+        return Response(status_code=422)
+    if len(items) > COMMUNITY_TELEMETRY_MAX_BATCH_SIZE:
+        return Response(status_code=413)
+
+    user_agent = request.headers.get("user-agent")
+    if not user_agent:
+        return Response(status_code=400)
+
+    ip = analytics._extract_ip_from_request(request)
+    retry_after = community_ingest.admit(admission_ip(request), len(items))
+    if retry_after is not None:
+        return _throttled_response(retry_after)
+    reports, rejected = validate_reports(items)
+    community_ingest.add(reports, ip, user_agent, rejected=rejected)
     return Response(status_code=202)
 
 
@@ -127,14 +444,14 @@ async def get_instructions_rest(request: Request) -> Response:
     # old route will be removed soon and another wrapper would add needless
     # indirection.
     tool_response = await __unlock_blockchain_analysis__(ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
 async def unlock_blockchain_analysis_rest(request: Request) -> Response:
     """REST wrapper for the __unlock_blockchain_analysis__ tool."""
     tool_response = await __unlock_blockchain_analysis__(ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -146,7 +463,7 @@ async def get_block_info_rest(request: Request) -> Response:
         optional=["include_transactions", "session_id"],
     )
     tool_response = await get_block_info(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -159,7 +476,7 @@ async def get_latest_block_rest(request: Request) -> Response:
         session_id=params.get("session_id"),
         ctx=get_mock_context(request),
     )
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -167,7 +484,7 @@ async def get_block_number_rest(request: Request) -> Response:
     """REST wrapper for the get_block_number tool."""
     params = extract_and_validate_params(request, required=["chain_id"], optional=["datetime", "session_id"])
     tool_response = await get_block_number(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -175,7 +492,7 @@ async def get_address_by_ens_name_rest(request: Request) -> Response:
     """REST wrapper for the get_address_by_ens_name tool."""
     params = extract_and_validate_params(request, required=["name"], optional=["session_id"])
     tool_response = await get_address_by_ens_name(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -187,7 +504,7 @@ async def get_transactions_by_address_rest(request: Request) -> Response:
         optional=["age_to", "methods", "cursor", "session_id"],
     )
     tool_response = await get_transactions_by_address(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -199,7 +516,7 @@ async def get_token_transfers_by_address_rest(request: Request) -> Response:
         optional=["age_to", "token", "cursor", "session_id"],
     )
     tool_response = await get_token_transfers_by_address(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -207,7 +524,7 @@ async def lookup_token_by_symbol_rest(request: Request) -> Response:
     """REST wrapper for the lookup_token_by_symbol tool."""
     params = extract_and_validate_params(request, required=["chain_id", "symbol"], optional=["session_id"])
     tool_response = await lookup_token_by_symbol(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -215,7 +532,7 @@ async def get_contract_abi_rest(request: Request) -> Response:
     """REST wrapper for the get_contract_abi tool."""
     params = extract_and_validate_params(request, required=["chain_id", "address"], optional=["session_id"])
     tool_response = await get_contract_abi(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -225,7 +542,7 @@ async def inspect_contract_code_rest(request: Request) -> Response:
         request, required=["chain_id", "address"], optional=["file_name", "session_id"]
     )
     tool_response = await inspect_contract_code(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -246,7 +563,7 @@ async def read_contract_rest(request: Request) -> Response:
     if "block" in params and params["block"].isdigit():
         params["block"] = int(params["block"])
     tool_response = await read_contract(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -254,7 +571,7 @@ async def get_address_info_rest(request: Request) -> Response:
     """REST wrapper for the get_address_info tool."""
     params = extract_and_validate_params(request, required=["chain_id", "address"], optional=["session_id"])
     tool_response = await get_address_info(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -262,7 +579,7 @@ async def get_tokens_by_address_rest(request: Request) -> Response:
     """REST wrapper for the get_tokens_by_address tool."""
     params = extract_and_validate_params(request, required=["chain_id", "address"], optional=["cursor", "session_id"])
     tool_response = await get_tokens_by_address(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -284,7 +601,7 @@ async def nft_tokens_by_address_rest(request: Request) -> Response:
     """REST wrapper for the nft_tokens_by_address tool."""
     params = extract_and_validate_params(request, required=["chain_id", "address"], optional=["cursor", "session_id"])
     tool_response = await nft_tokens_by_address(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -296,7 +613,7 @@ async def get_transaction_info_rest(request: Request) -> Response:
         optional=["include_raw_input", "session_id"],
     )
     tool_response = await get_transaction_info(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -331,7 +648,7 @@ async def get_chains_list_rest(request: Request) -> Response:
     """REST wrapper for the get_chains_list tool."""
     params = extract_and_validate_params(request, required=[], optional=["query", "session_id"])
     tool_response = await get_chains_list(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 @handle_rest_errors
@@ -357,7 +674,7 @@ async def direct_api_call_rest(request: Request) -> Response:
     if extra:
         params["query_params"] = extra
     tool_response = await direct_api_call(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump(mode="json", by_alias=True))
+    return ToolResponseJSON(tool_response)
 
 
 def _add_v1_tool_route(mcp: FastMCP, path: str, handler: Callable[..., Any], methods: list[str] | None = None) -> None:
@@ -392,10 +709,15 @@ def register_api_routes(mcp: FastMCP) -> None:
 
     # These routes are not part of the OpenAPI schema for tools.
     mcp.custom_route("/health", methods=["GET"], include_in_schema=False)(health_check)
+    if config.metrics_enabled:
+        # Unauthenticated views of internal state: registered only when enabled.
+        mcp.custom_route("/health/upstreams", methods=["GET"], include_in_schema=False)(upstream_health)
+        mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)(serve_metrics)
     mcp.custom_route("/llms.txt", methods=["GET"], include_in_schema=False)(serve_llms_txt)
     mcp.custom_route("/skill/{path:path}", methods=["GET"], include_in_schema=False)(serve_skill_resource)
     mcp.custom_route("/", methods=["GET"], include_in_schema=False)(main_page)
     mcp.custom_route("/v1/report_tool_usage", methods=["POST"])(report_tool_usage)
+    mcp.custom_route("/v1/report_tool_usage/batch", methods=["POST"])(report_tool_usage_batch)
 
     # Version 1 of the REST API
     _add_v1_tool_route(mcp, "/tools", list_tools_rest)
@@ -1,14 +1,21 @@
 # SPDX-License-Identifier: LicenseRef-Blockscout
 """Simple in-memory cache for chain metadata."""
 
+import logging
 import time
-from collections import OrderedDict
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
 
 import anyio
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
+from blockscout_mcp_server import json_codec
 from blockscout_mcp_server.config import config
+from blockscout_mcp_server.contract_store import ContractStore
 from blockscout_mcp_server.models import ChainInfo
+from blockscout_mcp_server.source_store import LazySourceFiles, SourceBlob, SourceStore
+
+logger = logging.getLogger(__name__)
 
 
 class ChainsListCache:
@@ -17,7 +24,13 @@ class ChainsListCache:
     def __init__(self) -> None:
         self.chains_snapshot: list[ChainInfo] | None = None
         self.expiry_timestamp: float = 0.0
+        self.stored_at: float = 0.0
         self.lock = anyio.Lock()
+        # Set while the background refresher owns revalidation (see snapshot_refresher.py).
+        self.background_refresh = False
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
 
     def invalidate(self) -> None:
         self.chains_snapshot = None
@@ -26,9 +39,22 @@ class ChainsListCache:
     def get_if_fresh(self) -> list[ChainInfo] | None:
         """Return cached chains if the snapshot is still fresh."""
         if self.chains_snapshot is None or time.monotonic() >= self.expiry_timestamp:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.chains_snapshot
+
+    def get_stale_if_refreshing(self) -> list[ChainInfo] | None:
+        """Return the expired snapshot while the background refresher revalidates it."""
+        if not self.background_refresh or self.chains_snapshot is None:
             return None
+        self.stale_hits += 1
         return self.chains_snapshot
 
+    def stats(self) -> dict[str, int]:
+        """Return the lookup counters (a re-check under the refresh lock counts as a lookup)."""
+        return {"hits": self.hits, "misses": self.misses, "stale_hits": self.stale_hits}
+
     def needs_refresh(self) -> bool:
         """Return ``True`` if the snapshot is missing or expired."""
         return self.get_if_fresh() is None
@@ -36,7 +62,8 @@ class ChainsListCache:
     def store_snapshot(self, chains: list[ChainInfo]) -> None:
         """Store a fresh snapshot and compute its expiry timestamp."""
         self.chains_snapshot = chains
-        self.expiry_timestamp = time.monotonic() + config.chains_list_ttl_seconds
+        self.stored_at = time.monotonic()
+        self.expiry_timestamp = self.stored_at + config.chains_list_ttl_seconds
 
 
 class ProApiConfigCache:
@@ -45,8 +72,14 @@ class ProApiConfigCache:
     def __init__(self) -> None:
         self.chain_urls_snapshot: dict[str, str] | None = None
         self.expiry_timestamp: float = 0.0
+        self.stored_at: float = 0.0
         self.lock = anyio.Lock()
         self.refresh_retry_after: float = 0.0
+        # Set while the background refresher owns revalidation (see snapshot_refresher.py).
+        self.background_refresh = False
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
 
     def invalidate(self) -> None:
         self.chain_urls_snapshot = None
@@ -55,9 +88,22 @@ class ProApiConfigCache:
 
     def get_if_fresh(self) -> dict[str, str] | None:
         if self.chain_urls_snapshot is None or time.monotonic() >= self.expiry_timestamp:
+            self.misses += 1
             return None
+        self.hits += 1
         return self.chain_urls_snapshot
 
+    def get_stale_if_refreshing(self) -> dict[str, str] | None:
+        """Return the expired snapshot while the background refresher revalidates it."""
+        if not self.background_refresh or self.chain_urls_snapshot is None:
+            return None
+        self.stale_hits += 1
+        return self.chain_urls_snapshot
+
+    def stats(self) -> dict[str, int]:
+        """Return the lookup counters (a re-check under the refresh lock counts as a lookup)."""
+        return {"hits": self.hits, "misses": self.misses, "stale_hits": self.stale_hits}
+
     def can_retry_refresh(self) -> bool:
         return time.monotonic() >= self.refresh_retry_after
 
@@ -66,7 +112,8 @@ class ProApiConfigCache:
 
     def store_snapshot(self, chain_urls: dict[str, str]) -> None:
         self.chain_urls_snapshot = chain_urls
-        self.expiry_timestamp = time.monotonic() + config.pro_api_config_ttl_seconds
+        self.stored_at = time.monotonic()
+        self.expiry_timestamp = self.stored_at + config.pro_api_config_ttl_seconds
         self.refresh_retry_after = 0.0
 
 
@@ -75,37 +122,271 @@ class CachedContract(BaseModel):
 
     metadata: dict = Field(description="The processed metadata of the contract, with large fields removed.")
     source_files: dict[str, str] = Field(description="A map of file paths to their source code content.")
+    abi: list | None = Field(default=None, description="The contract ABI as returned by Blockscout, if any.")
+
+
+# Frequency counters are halved once this many accesses have been recorded
+# since the last halving, so popularity from long ago fades out and the
+# counter table stays bounded.
+_FREQUENCY_AGING_WINDOW = 10_000
+# Counters saturate here; a contract read this often is simply "hot".
+_MAX_FREQUENCY = 15
+
+
+class _FrequencySketch:
+    """Aged access counts used to decide whether a new contract is worth caching.
+
+    Counts survive eviction (that is the point: a contract evicted once and
+    requested again earns its way back in) and are halved every
+    ``_FREQUENCY_AGING_WINDOW`` accesses, dropping keys that reach zero.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[str, int] = {}
+        self._recorded = 0
+
+    def record(self, key: str) -> None:
+        count = self._counts.get(key, 0)
+        if count < _MAX_FREQUENCY:
+            self._counts[key] = count + 1
+        self._recorded += 1
+        if self._recorded >= _FREQUENCY_AGING_WINDOW:
+            self._age()
+
+    def frequency(self, key: str) -> int:
+        return self._counts.get(key, 0)
+
+    def _age(self) -> None:
+        self._counts = {key: count // 2 for key, count in self._counts.items() if count > 1}
+        self._recorded = 0
+
+
+def _entry_overhead(metadata: dict, abi: list | None, paths: Iterable[str]) -> int:
+    """Bytes a cached contract holds besides its source bodies.
+
+    The metadata and ABI are measured as their compact JSON encoding; file paths
+    are counted as UTF-8.
+    """
+    size = len(json_codec.dumps_bytes(metadata, default=str))
+    if abi is not None:
+        size += len(json_codec.dumps_bytes(abi, default=str))
+    return size + sum(len(path.encode("utf-8")) for path in paths)
+
+
+class _CacheEntry:
+    __slots__ = ("abi", "expiry_timestamp", "metadata", "overhead", "sources")
+
+    def __init__(
+        self,
+        metadata: dict,
+        abi: list | None,
+        sources: dict[str, SourceBlob],
+        expiry_timestamp: float,
+        overhead: int,
+    ) -> None:
+        self.metadata = metadata
+        self.abi = abi
+        self.sources = sources
+        self.expiry_timestamp = expiry_timestamp
+        self.overhead = overhead
 
 
 class ContractCache:
-    """In-process, thread-safe, LRU, TTL cache for processed contract data."""
+    """In-process, thread-safe, TTL cache for processed contract data.
+
+    Memory is bounded by the bytes held for cached metadata and sources
+    (``contracts_cache_max_bytes``) and, secondarily, by the number of entries
+    (``contracts_cache_max_number``). Source bodies live in a
+    :class:`~blockscout_mcp_server.source_store.SourceStore`: deduplicated by
+    content hash across contracts and chains, compressed, and only inflated
+    when a file is read, so a shared library costs its compressed size once.
+
+    Eviction is LRU, but admission is frequency-aware (TinyLFU): when a new
+    contract would push out existing entries it is only admitted if it has been
+    requested at least as often as each of them. A one-off sweep over many cold
+    contracts therefore cannot flush the handful of hot contracts agents keep
+    returning to.
+
+    When ``contracts_cache_db_path`` is set, a persistent
+    :class:`~blockscout_mcp_server.contract_store.ContractStore` sits behind the
+    memory tier: every stored contract is written through to it, and a memory
+    miss is looked up there (and promoted into memory) before the caller goes
+    upstream, so restarts and sibling worker processes start warm.
+    """
 
     def __init__(self) -> None:
-        self._cache: OrderedDict[str, tuple[CachedContract, float]] = OrderedDict()
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._sources = SourceStore()
         self._lock = anyio.Lock()
         self._max_size = config.contracts_cache_max_number
+        self._max_bytes = config.contracts_cache_max_bytes
         self._ttl = config.contracts_cache_ttl_seconds
+        self._frequency = _FrequencySketch()
+        self._overhead_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejections = 0
+        self._persistent: ContractStore | None = None
+
+    def _persistent_tier(self) -> ContractStore | None:
+        """Return the persistent tier for the configured path, opening it lazily."""
+        path = config.contracts_cache_db_path
+        if not path:
+            return None
+        if self._persistent is None or self._persistent.path != path:
+            if self._persistent is not None:
+                self._persistent.close()
+            self._persistent = ContractStore(
+                path, config.contracts_cache_db_max_bytes, config.contracts_cache_db_ttl_seconds
+            )
+        return self._persistent
+
+    @property
+    def total_bytes(self) -> int:
+        return self._overhead_bytes + self._sources.total_bytes
 
     async def get(self, key: str) -> CachedContract | None:
-        """Retrieve an entry from the cache if it exists and is fresh."""
+        """Retrieve an entry from the cache if it exists and is fresh.
+
+        Source files of a contract served from memory are decompressed on access.
+        """
         async with self._lock:
-            if key not in self._cache:
-                return None
-            contract_data, expiry_timestamp = self._cache[key]
-            if time.monotonic() >= expiry_timestamp:
-                self._cache.pop(key)
-                return None
-            self._cache.move_to_end(key)
-            return contract_data
+            cached = self._get_from_memory(key)
+        if cached is not None:
+            return cached
+        persistent = self._persistent_tier()
+        if persistent is None:
+            return None
+        document = await persistent.get(key)
+        if document is None:
+            return None
+        try:
+            contract = CachedContract.model_validate(document)
+        except ValidationError as e:
+            logger.warning("Discarding malformed persistent contract cache entry %s: %s", key, e)
+            return None
+        await self._store_in_memory(key, contract)
+        return contract
+
+    def _get_from_memory(self, key: str) -> CachedContract | None:
+        self._frequency.record(key)
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if time.monotonic() >= entry.expiry_timestamp:
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        # Built without validation: the mapping is already well-typed and
+        # validating it would decompress every file.
+        return CachedContract.model_construct(
+            metadata=entry.metadata, source_files=LazySourceFiles(entry.sources), abi=entry.abi
+        )
 
     async def set(self, key: str, value: CachedContract) -> None:
-        """Add an entry to the cache, enforcing size and TTL."""
+        """Add an entry to the cache, enforcing the size budgets and TTL.
+
+        The entry is also written through to the persistent tier, if configured.
+        """
+        await self._store_in_memory(key, value)
+        persistent = self._persistent_tier()
+        if persistent is not None:
+            document = {"metadata": value.metadata, "source_files": dict(value.source_files), "abi": value.abi}
+            await persistent.put(key, document)
+
+    async def _store_in_memory(self, key: str, value: CachedContract) -> None:
+        prepared = self._sources.prepare(value.source_files)
+        overhead = _entry_overhead(value.metadata, value.abi, prepared)
         async with self._lock:
-            expiry_timestamp = time.monotonic() + self._ttl
-            self._cache[key] = (value, expiry_timestamp)
-            self._cache.move_to_end(key)
-            if len(self._cache) > self._max_size:
-                self._cache.popitem(last=False)
+            self._frequency.record(key)
+            refreshing = key in self._cache
+            victims = self._victims_for(key, overhead, prepared)
+            # A refreshed entry was already admitted; only newcomers must beat the victims.
+            if victims is None or (not refreshing and not self._admits(key, victims)):
+                self.rejections += 1
+                if refreshing:
+                    self._remove(key)
+                return
+            # Reference the new sources before releasing the victims' so bodies
+            # they share are never dropped and re-stored.
+            stored = self._sources.acquire(prepared)
+            for victim in victims:
+                self._remove(victim)
+                if victim != key:
+                    self.evictions += 1
+            self._cache[key] = _CacheEntry(value.metadata, value.abi, stored, time.monotonic() + self._ttl, overhead)
+            self._overhead_bytes += overhead
+
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key)
+        self._overhead_bytes -= entry.overhead
+        self._sources.release(entry.sources)
+
+    def _victims_for(self, key: str, overhead: int, prepared: dict[str, SourceBlob]) -> list[str] | None:
+        """Return the keys that must go to fit the new entry, or ``None`` if it can never fit.
+
+        An existing entry under ``key`` is always replaced; the rest are taken
+        in LRU order.
+        """
+        size = overhead + self._sources.new_bytes(prepared)
+        if self._max_size <= 0 or (self._max_bytes > 0 and size > self._max_bytes):
+            return None
+        # Bodies the new entry references are never freed by evicting others.
+        released = {digest: -count for digest, count in Counter(blob.digest for blob in prepared.values()).items()}
+        victims: list[str] = []
+        freed = 0
+        if key in self._cache:
+            victims.append(key)
+            freed += self._freed_by(key, released)
+        lru_order = (candidate for candidate in self._cache if candidate != key)
+        while len(self._cache) - len(victims) >= self._max_size or (
+            self._max_bytes > 0 and self.total_bytes - freed + size > self._max_bytes
+        ):
+            victim = next(lru_order, None)
+            if victim is None:
+                return None
+            victims.append(victim)
+            freed += self._freed_by(victim, released)
+        return victims
+
+    def _freed_by(self, key: str, released: dict[str, int]) -> int:
+        entry = self._cache[key]
+        return entry.overhead + self._sources.freed_bytes(entry.sources, released)
+
+    def _admits(self, key: str, victims: list[str]) -> bool:
+        candidate = self._frequency.frequency(key)
+        now = time.monotonic()
+        return all(
+            # Expired entries are dead weight and never protect their slot.
+            self._cache[victim].expiry_timestamp <= now or candidate >= self._frequency.frequency(victim)
+            for victim in victims
+        )
+
+    def stats(self) -> dict[str, int]:
+        """Return the lookup and eviction counters and the current occupancy."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._cache),
+            "bytes": self.total_bytes,
+            "evictions": self.evictions,
+            "rejections": self.rejections,
+            **self._sources.stats(),
+        }
+
+    def close(self) -> None:
+        """Close the persistent tier's connection; it is reopened on next use."""
+        if self._persistent is not None:
+            self._persistent.close()
+            self._persistent = None
+
+    def persistent_stats(self) -> dict[str, int]:
+        """Return the persistent tier's counters, or an empty dict when it is disabled."""
+        return self._persistent.stats() if self._persistent is not None else {}
 
 
 # Global singleton instance for the contract cache
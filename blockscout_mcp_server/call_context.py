@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Per-call request facts shared by every stage of a tool call.
+
+A tool call passes through several layers that each need something from the
+request: the structured-output wrapper (is this a summary-content client?), the
+logging/analytics/telemetry stage (client metadata, auth origin and
+fingerprint), the PRO API key scope (the client key state), and the session
+gate (the call source that picks the ceiling, the ``session_id``). Each used to
+bind the arguments and read ``ctx`` on its own. :class:`CallContext` derives
+each fact lazily and at most once per call, and :func:`call_context` hands the
+same object to every layer of the call: the structured-output wrapper opens it
+with :func:`use_call_context`, and the tool pipeline in ``tools/decorators.py``
+reuses it (REST calls, which skip that wrapper, get a fresh one).
+
+:class:`ArgumentBinder` is the argument half: the tool's parameter positions
+and defaults are read from its signature once, at registration, instead of a
+``bind_partial`` plus ``apply_defaults`` per call and per layer.
+"""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from blockscout_mcp_server import analytics, telemetry
+from blockscout_mcp_server.client_meta import ClientMeta, extract_client_meta_from_ctx
+from blockscout_mcp_server.constants import AuthOrigin
+from blockscout_mcp_server.pro_api_key_context import ClientKeyState, extract_client_pro_api_key_from_ctx
+
+_UNSET: Any = object()
+
+
+class CallContext:
+    """Request facts of one tool call, each derived from ``ctx`` on first use."""
+
+    __slots__ = ("ctx", "_client_meta", "_key_state", "_auth_signals", "_call_source")
+
+    def __init__(self, ctx: Any) -> None:
+        self.ctx = ctx
+        self._client_meta: ClientMeta | None = None
+        self._key_state: ClientKeyState | None = None
+        self._auth_signals: tuple[AuthOrigin | None, str | None] = _UNSET
+        self._call_source: str | None = None
+
+    @property
+    def client_meta(self) -> ClientMeta:
+        if self._client_meta is None:
+            self._client_meta = extract_client_meta_from_ctx(self.ctx)
+        return self._client_meta
+
+    @property
+    def key_state(self) -> ClientKeyState:
+        if self._key_state is None:
+            self._key_state = extract_client_pro_api_key_from_ctx(self.ctx)
+        return self._key_state
+
+    @property
+    def auth_signals(self) -> tuple[AuthOrigin | None, str | None]:
+        """The ``(auth_origin, api_key_fingerprint)`` pair; see ``telemetry.resolve_auth_signals``."""
+        if self._auth_signals is _UNSET:
+            self._auth_signals = telemetry.resolve_auth_signals(self.ctx, key_state=self.key_state)
+        return self._auth_signals
+
+    @property
+    def call_source(self) -> str:
+        if self._call_source is None:
+            self._call_source = analytics.get_call_source(self.ctx)
+        return self._call_source
+
+
+_current_call: ContextVar[CallContext | None] = ContextVar("_current_call", default=None)
+
+
+def call_context(ctx: Any) -> CallContext:
+    """Return the call context opened for *ctx* by an outer layer, or a new one."""
+    current = _current_call.get()
+    if current is not None and current.ctx is ctx:
+        return current
+    return CallContext(ctx)
+
+
+@contextmanager
+def use_call_context(ctx: Any) -> Iterator[CallContext]:
+    """Open the call context for *ctx* so the inner layers of the same call share it."""
+    call = call_context(ctx)
+    token = _current_call.set(call)
+    try:
+        yield call
+    finally:
+        _current_call.reset(token)
+
+
+class ArgumentBinder:
+    """Binds call arguments to a function's parameters like ``bind_partial`` + ``apply_defaults``.
+
+    Parameter names, positions, and defaults are read from the signature once.
+    Calls the fast path cannot bind exactly the way ``bind_partial`` would
+    (variadic or positional-only parameters, unknown or duplicated arguments,
+    too many positionals) go through ``bind_partial`` itself, so the result and
+    any ``TypeError`` are unchanged.
+    """
+
+    __slots__ = ("_signature", "_names", "_known", "_positional", "_defaults", "_simple")
+
+    def __init__(self, signature: inspect.Signature) -> None:
+        parameters = signature.parameters.values()
+        self._signature = signature
+        self._names = tuple(signature.parameters)
+        self._known = frozenset(self._names)
+        self._positional = sum(p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD for p in parameters)
+        self._defaults = {p.name: p.default for p in parameters if p.default is not inspect.Parameter.empty}
+        self._simple = all(
+            p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY) for p in parameters
+        )
+
+    def bind(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Return the call's arguments by parameter name, in signature order, defaults applied."""
+        if (
+            not self._simple
+            or len(args) > self._positional
+            or not self._known.issuperset(kwargs)
+            or any(name in kwargs for name in self._names[: len(args)])
+        ):
+            bound = self._signature.bind_partial(*args, **kwargs)
+            bound.apply_defaults()
+            return dict(bound.arguments)
+        arguments = dict(zip(self._names, args))
+        defaults = self._defaults
+        for name in self._names[len(args) :]:
+            if name in kwargs:
+                arguments[name] = kwargs[name]
+            elif name in defaults:
+                arguments[name] = defaults[name]
+        return arguments
@@ -0,0 +1,212 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Per-upstream circuit breakers and the health scoreboard built from them.
+
+A single degraded chain behind the PRO API gateway used to cost every call up to
+``bs_request_max_retries`` attempts with backoff — and up to ``bs_timeout`` for
+heavy calls — while agents kept sending traffic to it. A :class:`CircuitBreaker`
+per upstream (``chain:<id>`` for chain-scoped PRO API calls, ``host:<host>`` for
+BENS, Chainscout, and the chain-agnostic PRO API endpoints) watches the outcome
+and latency of every attempt over a rolling window and stops traffic to an
+upstream that is clearly failing:
+
+* **closed** – requests flow; once the window holds at least
+  ``BLOCKSCOUT_CIRCUIT_BREAKER_MIN_REQUESTS`` attempts and the failure ratio
+  reaches ``BLOCKSCOUT_CIRCUIT_BREAKER_FAILURE_RATIO``, the breaker opens.
+* **open** – requests fail fast with :class:`CircuitOpenError` (no network
+  call, no retries) for ``BLOCKSCOUT_CIRCUIT_BREAKER_OPEN_SECONDS``.
+* **half-open** – one probe request at a time is let through; its success
+  closes the breaker with a clean window, its failure re-opens it.
+
+Only upstream-health failures count: transport errors and 5xx responses. 4xx
+responses (including 429 and 402) describe the request or the caller's quota,
+not the upstream's health, and count as successes here.
+
+``BLOCKSCOUT_CIRCUIT_BREAKER_MIN_REQUESTS=0`` disables the breakers; outcomes
+are still recorded so the scoreboard stays useful.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import httpx
+
+from blockscout_mcp_server.config import config
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit breaker is open."""
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """Return ``True`` if *error* indicates an unhealthy upstream (transport error or 5xx)."""
+    if isinstance(error, httpx.RequestError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        status = getattr(error.response, "status_code", None)
+        return isinstance(status, int) and status >= 500
+    return False
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float | None:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[max(index, 0)]
+
+
+class CircuitBreaker:
+    """Rolling-window breaker for one upstream key."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.times_opened = 0
+        self.rejected = 0
+        # (monotonic timestamp, failed, latency seconds)
+        self._outcomes: deque[tuple[float, bool, float]] = deque()
+
+    def _prune(self, now: float) -> None:
+        horizon = now - config.circuit_breaker_window_seconds
+        while self._outcomes and self._outcomes[0][0] < horizon:
+            self._outcomes.popleft()
+
+    def before_request(self) -> bool:
+        """Admit or reject an attempt; return ``True`` if the attempt is a half-open probe.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a probe
+                already in flight.
+        """
+        if config.circuit_breaker_min_requests <= 0 or self.state == CLOSED:
+            return False
+        now = time.monotonic()
+        if self.state == OPEN:
+            remaining = self.opened_at + config.circuit_breaker_open_seconds - now
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(
+                    f"Upstream '{self.key}' is temporarily unavailable: its circuit breaker opened after repeated "
+                    f"failures. Retry in about {math.ceil(remaining)}s."
+                )
+            self.state = HALF_OPEN
+        if self.probe_in_flight:
+            self.rejected += 1
+            raise CircuitOpenError(
+                f"Upstream '{self.key}' is recovering from repeated failures and is being probed; retry shortly."
+            )
+        self.probe_in_flight = True
+        return True
+
+    def release_probe(self) -> None:
+        """Free the half-open probe slot without recording an outcome (e.g. on cancellation)."""
+        self.probe_in_flight = False
+
+    def record(self, *, failed: bool, latency: float, probe: bool = False) -> None:
+        """Record one attempt's outcome and update the breaker state."""
+        now = time.monotonic()
+        if probe:
+            self.probe_in_flight = False
+        if self.state == HALF_OPEN and probe:
+            if failed:
+                self._open(now)
+            else:
+                self.state = CLOSED
+                self._outcomes.clear()
+        self._outcomes.append((now, failed, latency))
+        self._prune(now)
+        if self.state == CLOSED and config.circuit_breaker_min_requests > 0:
+            total = len(self._outcomes)
+            failures = sum(1 for _, f, _ in self._outcomes if f)
+            if (
+                total >= config.circuit_breaker_min_requests
+                and failures / total >= config.circuit_breaker_failure_ratio
+            ):
+                self._open(now)
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Guard one upstream attempt: admit it, time it, and record its outcome.
+
+        Exceptions propagate unchanged after being classified with
+        :func:`is_upstream_failure`. A cancelled attempt records nothing but
+        frees the probe slot it may hold.
+        """
+        probe = self.before_request()
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self.record(failed=is_upstream_failure(e), latency=time.monotonic() - started, probe=probe)
+            raise
+        except BaseException:
+            if probe:
+                self.release_probe()
+            raise
+        self.record(failed=False, latency=time.monotonic() - started, probe=probe)
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self.opened_at = now
+        self.times_opened += 1
+
+    def snapshot(self) -> dict[str, object]:
+        """Return the health view of this upstream for monitoring."""
+        now = time.monotonic()
+        self._prune(now)
+        total = len(self._outcomes)
+        failures = sum(1 for _, f, _ in self._outcomes if f)
+        latencies = sorted(latency for _, f, latency in self._outcomes if not f)
+        p50 = _percentile(latencies, 0.5)
+        p95 = _percentile(latencies, 0.95)
+        return {
+            "state": self.state,
+            "requests": total,
+            "failures": failures,
+            "failure_ratio": round(failures / total, 4) if total else 0.0,
+            "latency_p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "latency_p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+
+
+class CircuitBreakerRegistry:
+    """Lazily created breakers keyed by upstream."""
+
+    def __init__(self) -> None:
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(key)
+        return breaker
+
+    def clear(self) -> None:
+        self._breakers.clear()
+
+    def snapshot(self) -> dict[str, dict[str, object]]:
+        """Return the health scoreboard: one entry per upstream seen so far."""
+        return {key: breaker.snapshot() for key, breaker in sorted(self._breakers.items())}
+
+
+def chain_breaker_key(chain_id: str) -> str:
+    return f"chain:{chain_id}"
+
+
+def host_breaker_key(url: str) -> str:
+    return f"host:{httpx.URL(url).host}"
+
+
+circuit_breakers = CircuitBreakerRegistry()
@@ -0,0 +1,232 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Ingestion of community telemetry reports on the central server.
+
+Every self-hosted server reports its tool calls to ``/v1/report_tool_usage``
+(one report per request) or ``/v1/report_tool_usage/batch`` (a JSON array, or
+NDJSON with ``Content-Type: application/x-ndjson``). Both endpoints go through
+this module:
+
+* :func:`parse_reports` and :func:`validate_reports` decode a batch and validate
+  it with one ``TypeAdapter(list[ToolUsageReport])`` call — a single pass in
+  pydantic-core instead of one ``model_validate`` per report. Only when that
+  fails are the reports it named dropped and the rest validated again, so a
+  malformed report never costs the valid ones.
+* :class:`AdmissionLimiter` admits at most
+  ``BLOCKSCOUT_COMMUNITY_INGEST_REPORTS_PER_IP_PER_MINUTE`` reports per sender
+  IP (``0`` disables the limit); a request over the limit is rejected with 429
+  as a whole, before any of its reports is handed on. The IP comes from
+  :func:`admission_ip`, which never trusts what the sender itself wrote into
+  ``X-Forwarded-For``.
+* :class:`CommunityIngest` hands the reports to analytics. With
+  ``BLOCKSCOUT_COMMUNITY_INGEST_WINDOW_SECONDS`` at ``0`` (the default) each
+  report becomes one Mixpanel event right away. Above ``0``, reports are
+  buffered for that window and identical ones from the same sender (same IP,
+  User-Agent, and report) are rolled up into a single event whose
+  ``report_count`` property carries how many there were; at most
+  ``BLOCKSCOUT_COMMUNITY_INGEST_MAX_PENDING`` distinct reports are buffered and
+  the rest are dropped. The lifespan exports what is buffered at shutdown.
+
+Counters are exported at ``/metrics``; ``scripts/load_test_report_ingest.py``
+measures the reports per second one worker process sustains.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from blockscout_mcp_server import analytics, json_codec
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.models import ToolUsageReport
+
+logger = logging.getLogger(__name__)
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+# Largest batch body accepted; 100 reports of ordinary size fit many times over.
+MAX_BATCH_BODY_BYTES = 1024 * 1024
+# Distinct sender IPs the admission limiter remembers; the least recently seen is forgotten first.
+_MAX_TRACKED_IPS = 10_000
+
+_REPORT_LIST = TypeAdapter(list[ToolUsageReport])
+
+
+def admission_ip(request: Any) -> str:
+    """Return the sender address the per-IP limit is keyed on.
+
+    With ``BLOCKSCOUT_COMMUNITY_INGEST_TRUSTED_PROXIES`` at ``N``, each of the
+    last ``N`` hops (the connection itself and the ``X-Forwarded-For`` entries
+    appended by the inner proxies) is a trusted proxy, so the address before
+    them is the one the outermost proxy saw. Entries further left are written
+    by the sender and are ignored.
+    """
+    client = getattr(request, "client", None)
+    hops = [getattr(client, "host", None) or ""]
+    trusted = config.community_ingest_trusted_proxies
+    if trusted:
+        forwarded = ",".join(request.headers.getlist("x-forwarded-for"))
+        hops = [entry.strip() for entry in forwarded.split(",") if entry.strip()] + hops
+    return hops[max(len(hops) - 1 - trusted, 0)]
+
+
+def parse_reports(body: bytes, content_type: str | None) -> list[Any] | None:
+    """Decode a batch body into its raw reports, or return ``None`` when it is malformed.
+
+    NDJSON bodies hold one report per non-empty line; anything else must be a
+    JSON array.
+    """
+    try:
+        if content_type is not None and content_type.split(";")[0].strip().lower() == NDJSON_CONTENT_TYPE:
+            return [json_codec.loads(line) for line in body.splitlines() if line.strip()]
+        items = json_codec.loads(body)
+    except ValueError:
+        return None
+    return items if isinstance(items, list) else None
+
+
+def validate_reports(items: list[Any]) -> tuple[list[ToolUsageReport], int]:
+    """Validate raw reports in one pass; return the valid ones and how many were rejected."""
+    try:
+        return _REPORT_LIST.validate_python(items), 0
+    except ValidationError as exc:
+        invalid = {error["loc"][0] for error in exc.errors() if error["loc"]}
+    remaining = [item for index, item in enumerate(items) if index not in invalid]
+    # Every report the first pass rejected is named in its errors, so this pass succeeds.
+    return _REPORT_LIST.validate_python(remaining), len(items) - len(remaining)
+
+
+class AdmissionLimiter:
+    """Per-IP token buckets of reports, refilled continuously."""
+
+    def __init__(self) -> None:
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def admit(self, ip: str, reports: int) -> float | None:
+        """Spend ``reports`` tokens of ``ip``; return ``None`` if admitted, else the seconds until they would be."""
+        rate = config.community_ingest_reports_per_ip_per_minute
+        if rate <= 0:
+            return None
+        now = time.monotonic()
+        tokens, refilled_at = self._buckets.pop(ip, (rate, now))
+        tokens = min(rate, tokens + (now - refilled_at) * rate / 60.0)
+        admitted = tokens >= reports
+        if admitted:
+            tokens -= reports
+        self._buckets[ip] = (tokens, now)
+        if len(self._buckets) > _MAX_TRACKED_IPS:
+            self._buckets.popitem(last=False)
+        if admitted:
+            return None
+        # A request larger than the whole bucket can never be admitted; report a full refill.
+        return (min(reports, rate) - tokens) * 60.0 / rate
+
+
+class CommunityIngest:
+    """Hands validated reports to analytics, rolling up identical ones within the configured window."""
+
+    def __init__(self) -> None:
+        self.limiter = AdmissionLimiter()
+        self._pending: dict[tuple[str, str, str], list[Any]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._worker: asyncio.Task | None = None
+        self.received = 0
+        self.rejected = 0
+        self.throttled = 0
+        self.dropped = 0
+        self.exported = 0
+
+    def clear(self) -> None:
+        if self._worker is not None:
+            # The task's loop may already be closed (tests run one loop each).
+            with suppress(RuntimeError):
+                self._worker.cancel()
+        self.limiter.clear()
+        self._pending.clear()
+        self._loop = None
+        self._worker = None
+        self.received = 0
+        self.rejected = 0
+        self.throttled = 0
+        self.dropped = 0
+        self.exported = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "received": self.received,
+            "rejected": self.rejected,
+            "throttled": self.throttled,
+            "dropped": self.dropped,
+            "exported": self.exported,
+            "pending": len(self._pending),
+        }
+
+    def admit(self, ip: str, reports: int) -> float | None:
+        """Apply the per-IP limit to a request carrying ``reports`` reports; see :meth:`AdmissionLimiter.admit`."""
+        retry_after = self.limiter.admit(ip, reports)
+        if retry_after is not None:
+            self.throttled += reports
+        return retry_after
+
+    def add(self, reports: list[ToolUsageReport], ip: str, user_agent: str, *, rejected: int = 0) -> None:
+        """Export ``reports`` now, or buffer them for the next roll-up. Never blocks."""
+        self.received += len(reports) + rejected
+        self.rejected += rejected
+        if config.community_ingest_window_seconds <= 0:
+            for report in reports:
+                self._export(report, ip, user_agent, 1)
+            return
+        self._ensure_worker()
+        for report in reports:
+            key = (ip, user_agent, json_codec.dumps(report.model_dump(mode="json"), sort_keys=True))
+            entry = self._pending.get(key)
+            if entry is not None:
+                entry[1] += 1
+            elif len(self._pending) < config.community_ingest_max_pending:
+                self._pending[key] = [report, 1]
+            else:
+                self.dropped += 1
+
+    def _export(self, report: ToolUsageReport, ip: str, user_agent: str, count: int) -> None:
+        analytics.track_community_usage(report=report, ip=ip, user_agent=user_agent, count=count)
+        self.exported += 1
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._worker is not None and not self._worker.done():
+            return
+        self._loop = loop
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(config.community_ingest_window_seconds)
+            self.flush()
+
+    def flush(self) -> None:
+        """Export every buffered report as one event per distinct report."""
+        pending, self._pending = self._pending, {}
+        for (ip, user_agent, _), (report, count) in pending.items():
+            try:
+                self._export(report, ip, user_agent, count)
+            except Exception as exc:  # pragma: no cover - analytics never raises today
+                logger.debug("Exporting a community report failed: %s", exc)
+
+    async def close(self) -> None:
+        """Stop the roll-up worker and export what is still buffered."""
+        worker, self._worker = self._worker, None
+        if worker is not None and self._loop is asyncio.get_running_loop():
+            worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await worker
+        self.flush()
+
+
+community_ingest = CommunityIngest()
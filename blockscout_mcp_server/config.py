@@ -21,6 +21,11 @@ class ServerConfig(BaseSettings):
     pro_api_config_timeout: float = 15.0
     pro_api_config_ttl_seconds: int = 300
     pro_api_config_refresh_retry_seconds: int = 30
+    # Background refresh of the PRO API config and chains list snapshots in HTTP
+    # mode (see snapshot_refresher.py): each is refreshed once this fraction of its
+    # TTL has elapsed, and expired snapshots are served while refreshes fail.
+    snapshot_refresh_enabled: bool = True
+    snapshot_refresh_fraction: float = Field(0.8, gt=0, lt=1)
     pro_api_key: str = ""
     pro_api_key_header: str = "Blockscout-MCP-Pro-Api-Key"
     # Operator-configurable notice appended to tool responses when the request was not
@@ -63,21 +68,106 @@ class ServerConfig(BaseSettings):
     chains_list_ttl_seconds: int = 300  # Default 5 minutes
     progress_interval_seconds: float = 15.0  # Default interval for periodic progress updates
 
-    contracts_cache_max_number: int = 10  # Default 10 contracts
+    # The contract cache is bounded by the estimated bytes of cached sources and
+    # metadata; the entry count is a secondary cap. 0 bytes disables the byte bound.
+    contracts_cache_max_bytes: int = 64 * 1024 * 1024  # Default 64 MiB
+    contracts_cache_max_number: int = 1000  # Default 1000 contracts
     contracts_cache_ttl_seconds: int = 3600  # Default 1 hour
+    # Optional persistent contract cache tier (SQLite), shared by the worker processes
+    # on one host and kept across restarts. Empty disables it; the parent directory
+    # must already exist. Its TTL matches the memory tier's by default: verification
+    # status, proxy implementations, and metadata can change after a lookup.
+    contracts_cache_db_path: str = ""
+    contracts_cache_db_max_bytes: int = 512 * 1024 * 1024  # Default 512 MiB of compressed rows; 0 = unbounded
+    contracts_cache_db_ttl_seconds: int = 3600  # Default 1 hour
 
     nft_page_size: int = 10
     logs_page_size: int = 10
     advanced_filters_page_size: int = 10
+    # Time-sharded first-page scans for get_transactions_by_address and
+    # get_token_transfers_by_address: the age window is split into up to this many
+    # shards (at least an hour wide) fetched concurrently, at most `concurrency` at
+    # once; the ten-page budget of a walk is divided between them, so at most 10
+    # shards are used. 1 keeps the sequential walk.
+    advanced_filters_scan_shards: int = Field(1, ge=1)
+    advanced_filters_scan_concurrency: int = Field(4, ge=1)
+    # Upstream items fetched past a returned page are kept for the follow-up call
+    # that repeats the emitted next_call (see page_buffer.py). 0 entries disables it.
+    page_buffer_max_entries: int = Field(512, ge=0)
+    page_buffer_ttl_seconds: float = Field(300.0, gt=0)
+    # Speculative prefetch of the upstream page a paginated response points to (see
+    # prefetch.py). A concurrency of 0 disables it. The budget caps speculative
+    # requests per minute (a prefetch that serves its follow-up call is refunded);
+    # no prefetch runs while more tool calls than the in-flight limit are executing.
+    prefetch_max_concurrency: int = Field(0, ge=0)
+    prefetch_budget_per_minute: float = Field(60.0, ge=0)
+    prefetch_ttl_seconds: float = Field(60.0, gt=0)
+    prefetch_max_tool_calls_in_flight: int = Field(32, ge=0)
     direct_api_response_size_limit: int = Field(
         100000,
-        description="Maximum allowed characters for direct_api_call raw responses.",
+        description="Maximum allowed body size in bytes for direct_api_call raw responses.",
     )
+    # Byte cap on the transactions page get_block_info(include_transactions=True)
+    # streams; the transfer is aborted past it. 0 disables the cap.
+    block_transactions_max_bytes: int = Field(2_000_000, ge=0)
 
     # RPC connection pool configuration
     rpc_request_timeout: float = 60.0
     rpc_pool_per_host: int = 50
 
+    # Pooled httpx transport shared by the upstream REST calls (PRO API, BENS,
+    # Chainscout). Limits apply per upstream origin. HTTP/2 is only negotiated
+    # when the optional ``h2`` package is installed (``http2`` extra).
+    http_pool_max_connections: int = Field(100, ge=1)
+    http_pool_max_keepalive_connections: int = Field(20, ge=0)
+    http_pool_keepalive_expiry_seconds: float = Field(30.0, ge=0)
+    http_pool_http2: bool = False
+
+    # JSON codec for upstream bodies and tool output (see json_codec.py):
+    # "auto" uses orjson when installed (the ``fast-json`` extra), "stdlib" forces
+    # the standard library, "orjson" warns at startup if it is missing.
+    json_codec: str = "auto"
+
+    # Share one upstream request between concurrent identical PRO API GETs
+    # (and one fetch between concurrent cold-cache contract lookups).
+    request_coalescing_enabled: bool = True
+
+    # Immutability-aware cache for PRO API GET responses (see response_cache.py).
+    # A max size of 0 disables the cache. Finality depths are block counts;
+    # per-chain overrides use the "chain_id:depth,chain_id:depth" format.
+    response_cache_max_bytes: int = Field(32 * 1024 * 1024, ge=0)
+    response_cache_finality_depth: int = Field(64, ge=0)
+    response_cache_finality_depths: str = ""
+    response_cache_contract_ttl_seconds: float = Field(3600.0, ge=0)
+    response_cache_mutable_ttl_seconds: float = Field(0.0, ge=0)
+    response_cache_stale_if_error_seconds: float = Field(300.0, ge=0)
+
+    # Per-upstream circuit breakers (see circuit_breaker.py). A breaker opens when
+    # the rolling window holds at least `min_requests` attempts and the failure
+    # ratio reaches `failure_ratio`; it stays open for `open_seconds` before a
+    # half-open probe. A min_requests of 0 disables the breakers.
+    circuit_breaker_min_requests: int = Field(10, ge=0)
+    circuit_breaker_failure_ratio: float = Field(0.5, gt=0, le=1)
+    circuit_breaker_window_seconds: float = Field(60.0, gt=0)
+    circuit_breaker_open_seconds: float = Field(30.0, ge=0)
+
+    # Client-side pacing around upstream 429s (see rate_limiter.py). A max wait
+    # of 0 disables pacing and surfaces every 429 immediately.
+    rate_limit_max_wait_seconds: float = Field(10.0, ge=0)
+    rate_limit_recovery_seconds: float = Field(60.0, ge=0)
+
+    # Hedged light-timeout GETs (see hedging.py). The budget ratio caps extra
+    # requests (0.05 = at most ~5% more); 0 disables hedging.
+    hedge_budget_ratio: float = Field(0.0, ge=0, le=1)
+    hedge_percentile: float = Field(0.95, gt=0, le=1)
+    hedge_min_samples: int = Field(20, ge=1)
+
+    # Serve tool, upstream, cache, and session-store metrics in the Prometheus text
+    # format at GET /metrics, and the upstream scoreboard at GET /health/upstreams
+    # (HTTP mode; see metrics.py). Both are unauthenticated and expose internal
+    # state, so they are off unless enabled. Recording is always on.
+    metrics_enabled: bool = False
+
     # Base name used in the User-Agent header sent to Blockscout RPC
     mcp_user_agent: str = "Blockscout MCP"
     mcp_allowed_hosts: str = ""
@@ -89,12 +179,48 @@ class ServerConfig(BaseSettings):
     # Deployments whose Mixpanel project is US-resident (or in another region) should
     # override this via BLOCKSCOUT_MIXPANEL_API_HOST (e.g. "api.mixpanel.com" for US).
     mixpanel_api_host: str = "api-eu.mixpanel.com"
+    # Events are queued and sent in batches by a background worker; 0 sends each
+    # event synchronously from the calling request, as the stock consumer does.
+    mixpanel_queue_size: int = Field(10000, ge=0)
+    # Events per batch POST (Mixpanel accepts at most 50) and the longest an event waits.
+    mixpanel_batch_size: int = Field(50, ge=1, le=50)
+    mixpanel_flush_interval_seconds: float = Field(5.0, gt=0)
+    # Fraction of events kept; the rest are counted and not sent.
+    mixpanel_sample_rate: float = Field(1.0, ge=0, le=1)
     disable_community_telemetry: bool = False
+    # Community reports are queued and POSTed in batches to the central server's batch
+    # endpoint; 0 sends every report in its own request, as before.
+    community_telemetry_queue_size: int = Field(1000, ge=0)
+    # Reports per batch (the batch endpoint accepts at most 100), the longest a report
+    # waits for its batch, and how many batches may be in flight at once.
+    community_telemetry_batch_size: int = Field(50, ge=1, le=100)
+    community_telemetry_flush_interval_seconds: float = Field(5.0, gt=0)
+    community_telemetry_max_concurrency: int = Field(2, ge=1)
+    # Central server: reports accepted per sender IP and minute (0 = no limit), and the
+    # window identical reports are rolled up over before export (0 = export each at once).
+    community_ingest_reports_per_ip_per_minute: int = Field(6000, ge=0)
+    community_ingest_window_seconds: float = Field(0.0, ge=0)
+    community_ingest_max_pending: int = Field(10000, ge=1)
+    # Reverse proxies in front of the central server whose X-Forwarded-For entries are
+    # trusted when keying the per-IP limit (0 = key on the connecting address).
+    community_ingest_trusted_proxies: int = Field(0, ge=0)
 
     # Transport mode for the server ("stdio" or "http").
     # Controls the server's operational mode, can be overridden by CLI flags.
     mcp_transport: str = "stdio"
     dev_json_response: bool = False
+    # Number of HTTP worker processes (HTTP mode only); the --workers CLI flag wins.
+    http_workers: int = Field(1, ge=1)
+
+    # Log output: "text" lines or one JSON object per record ("json"). Records are written by
+    # a background thread through a queue of log_queue_size records (0 = write on the calling
+    # thread); tool arguments are rendered up to log_arg_max_chars characters (0 = no cap);
+    # log_sample_rates keeps a fraction of a logger's records below WARNING
+    # ("httpx=0.1,blockscout_mcp_server.tools.decorators=0.5").
+    log_format: str = "text"
+    log_queue_size: int = Field(10000, ge=0)
+    log_arg_max_chars: int = Field(2000, ge=0)
+    log_sample_rates: str = ""
 
     # Optional port for the HTTP server, read from the PORT environment variable.
     port: int | None = Field(None, alias="PORT")
@@ -134,6 +260,12 @@ class ServerConfig(BaseSettings):
     # the sweep's deletion cutoff derives from the TTL at call time, so no cadence
     # can delete a live identifier's row (see `SessionStore.sweep_batch`).
     session_sweep_interval_seconds: int | None = Field(None, ge=1)
+    # Write-behind interval for session counters. 0 (the default) writes every counter
+    # change straight to SQLite on the event loop. A positive value keeps counters in
+    # memory and flushes the changed ones from a writer thread every this many seconds,
+    # so a crash can lose up to one interval of debits and refunds (see
+    # `WriteBehindSessionStore`). Single-process only: refused with `--workers` > 1.
+    session_flush_interval_seconds: float = Field(0.0, ge=0)
 
     @field_validator("session_sweep_interval_seconds", mode="before")
     @classmethod
@@ -144,6 +276,14 @@ class ServerConfig(BaseSettings):
             return None
         return value
 
+    @field_validator("log_format")
+    @classmethod
+    def normalize_log_format(cls, value: str) -> str:
+        value = value.strip().lower()
+        if value not in ("text", "json"):
+            raise ValueError('log_format must be "text" or "json"')
+        return value
+
     @field_validator("session_secret")
     @classmethod
     def normalize_session_secret(cls, value: str) -> str:
@@ -154,6 +294,11 @@ class ServerConfig(BaseSettings):
     def normalize_session_db_path(cls, value: str) -> str:
         return value.strip()
 
+    @field_validator("contracts_cache_db_path")
+    @classmethod
+    def normalize_contracts_cache_db_path(cls, value: str) -> str:
+        return value.strip()
+
     @property
     def pro_api_config_url(self) -> str:
         """URL for the PRO API chain config endpoint, derived from the PRO API base URL."""
@@ -22,6 +22,9 @@ SKILL_RESOLUTION_RULE_TEXT = (
 
 COMMUNITY_TELEMETRY_URL = "https://mcp.blockscout.com"
 COMMUNITY_TELEMETRY_ENDPOINT = "/v1/report_tool_usage"
+COMMUNITY_TELEMETRY_BATCH_ENDPOINT = "/v1/report_tool_usage/batch"
+# Most reports the batch endpoint accepts in one request.
+COMMUNITY_TELEMETRY_MAX_BATCH_SIZE = 100
 
 # Sentinel event name for MCP resource reads. UPPERCASE so it can never collide
 # with a tool function name (all tool names are snake_case/lowercase).
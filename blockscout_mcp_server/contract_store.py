@@ -0,0 +1,214 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Persistent, process-shared tier behind the in-memory contract cache.
+
+Every deploy or restart emptied ``contract_cache``, so the first agents after a
+rollout paid the full ``/api/v2/smart-contracts/{address}`` fetch (up to about
+350 KB, several seconds on a loaded instance) for every contract again. A copy
+on disk stays useful across restarts and is shared by sibling workers. Its TTL
+defaults to the memory tier's, because a contract's verification status, proxy
+implementation, and metadata can change after it is cached.
+
+:class:`ContractStore` keeps processed contracts — metadata, sources, and the
+raw ABI, as the JSON document ``ContractCache`` builds — in a SQLite database at
+``BLOCKSCOUT_CONTRACTS_CACHE_DB_PATH``. Each row is one zlib-compressed JSON
+payload with a wall-clock expiry
+(``BLOCKSCOUT_CONTRACTS_CACHE_DB_TTL_SECONDS``); once the payload bytes exceed
+``BLOCKSCOUT_CONTRACTS_CACHE_DB_MAX_BYTES`` the least recently read rows are
+deleted. WAL mode lets every worker process on the host open the same file and
+read concurrently while writers take turns under ``busy_timeout``.
+
+Unlike the session store, whose single-row upserts run on the event loop, rows
+here are large and decoding them is real work, so every call is offloaded to a
+worker thread (one at a time per process). The tier is an optimization: any
+SQLite error is logged and treated as a miss, and a database that cannot be
+opened disables the tier instead of failing tool calls.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+import zlib
+from typing import Any
+
+import anyio
+
+from blockscout_mcp_server import json_codec
+
+logger = logging.getLogger(__name__)
+
+# Waits for another process's write lock before giving up on one operation.
+_BUSY_TIMEOUT_MS = 2_000
+# A hit refreshes a row's LRU position at most this often, so hot rows do not
+# turn every read into a write.
+_TOUCH_INTERVAL_SECONDS = 60.0
+_COMPRESSION_LEVEL = 6
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS contracts (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    payload BLOB NOT NULL
+) STRICT;
+
+CREATE INDEX IF NOT EXISTS idx_contracts_accessed_at ON contracts (accessed_at);
+"""
+
+
+def encode_document(document: dict[str, Any]) -> bytes:
+    """Serialize a processed contract document into a compressed row payload."""
+    return zlib.compress(json_codec.dumps_bytes(document, default=str), _COMPRESSION_LEVEL)
+
+
+def decode_document(payload: bytes) -> dict[str, Any]:
+    return json_codec.loads(zlib.decompress(payload))
+
+
+class ContractStore:
+    """SQLite-backed contract cache tier shared by the processes on one host."""
+
+    def __init__(self, path: str, max_bytes: int, ttl_seconds: float) -> None:
+        self.path = path
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._conn: sqlite3.Connection | None = None
+        self._unavailable = False
+        self._limiter = anyio.CapacityLimiter(1)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if self._conn is not None or self._unavailable:
+            return self._conn
+        try:
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            try:
+                conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
+                conn.execute("PRAGMA journal_mode = WAL")
+                conn.execute("PRAGMA synchronous = NORMAL")
+                conn.executescript(_DDL)
+            except sqlite3.Error:
+                conn.close()
+                raise
+        except sqlite3.Error as e:
+            self._unavailable = True
+            logger.warning("Persistent contract cache at %s is unavailable and disabled: %s", self.path, e)
+            return None
+        self._conn = conn
+        return conn
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored contract document for ``key`` if it has not expired."""
+        return await anyio.to_thread.run_sync(self._get, key, limiter=self._limiter)
+
+    async def put(self, key: str, document: dict[str, Any]) -> None:
+        """Store ``document`` under ``key``, evicting least recently read rows past the byte budget."""
+        await anyio.to_thread.run_sync(self._put, key, document, limiter=self._limiter)
+
+    def _get(self, key: str, now: float | None = None) -> dict[str, Any] | None:
+        conn = self._connection()
+        if conn is None:
+            return None
+        current_time = time.time() if now is None else now
+        try:
+            row = conn.execute(
+                "SELECT payload, accessed_at FROM contracts WHERE key = :key AND expires_at > :now",
+                {"key": key, "now": current_time},
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            payload, accessed_at = row
+            if current_time - accessed_at >= _TOUCH_INTERVAL_SECONDS:
+                conn.execute(
+                    "UPDATE contracts SET accessed_at = :now WHERE key = :key",
+                    {"key": key, "now": current_time},
+                )
+            document = decode_document(payload)
+        except (sqlite3.Error, ValueError, zlib.error) as e:
+            self._record_error("read", key, e)
+            return None
+        self.hits += 1
+        return document
+
+    def _put(self, key: str, document: dict[str, Any], now: float | None = None) -> None:
+        conn = self._connection()
+        if conn is None:
+            return
+        current_time = time.time() if now is None else now
+        payload = encode_document(document)
+        if self._max_bytes > 0 and len(payload) > self._max_bytes:
+            return
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    """
+                    INSERT INTO contracts (key, expires_at, accessed_at, size, payload)
+                    VALUES (:key, :expires_at, :now, :size, :payload)
+                    ON CONFLICT(key) DO UPDATE SET
+                        expires_at = excluded.expires_at,
+                        accessed_at = excluded.accessed_at,
+                        size = excluded.size,
+                        payload = excluded.payload
+                    """,
+                    {
+                        "key": key,
+                        "expires_at": current_time + self._ttl,
+                        "now": current_time,
+                        "size": len(payload),
+                        "payload": payload,
+                    },
+                )
+                evicted = self._enforce_budget(conn, current_time)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            self._record_error("write", key, e)
+            return
+        self.writes += 1
+        self.evictions += evicted
+
+    def _enforce_budget(self, conn: sqlite3.Connection, now: float) -> int:
+        """Delete expired rows, then least recently read rows, until under the byte budget."""
+        evicted = conn.execute("DELETE FROM contracts WHERE expires_at <= :now", {"now": now}).rowcount
+        if self._max_bytes <= 0:
+            return evicted
+        excess = conn.execute("SELECT COALESCE(SUM(size), 0) FROM contracts").fetchone()[0] - self._max_bytes
+        if excess <= 0:
+            return evicted
+        victims: list[str] = []
+        for victim, size in conn.execute("SELECT key, size FROM contracts ORDER BY accessed_at"):
+            victims.append(victim)
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM contracts WHERE key = ?", [(victim,) for victim in victims])
+        return evicted + len(victims)
+
+    def _record_error(self, operation: str, key: str, error: Exception) -> None:
+        self.errors += 1
+        logger.warning("Persistent contract cache %s failed for %s; treating it as a miss: %s", operation, key, error)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+
+    def close(self) -> None:
+        """Close the underlying connection. Idempotent."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Hedged requests for light-timeout point lookups.
+
+Point lookups made with ``timeout=config.bs_light_timeout`` (the transaction in
+``get_transaction_info``, block details, address info, smart-contract fetches)
+normally answer in a few hundred milliseconds, but occasionally one stalls on a
+slow gateway connection even though the same request would finish quickly if
+sent again. Hedging sends that second copy: if the first attempt has not
+answered within a latency percentile learned from recent light lookups, a
+second attempt is issued, whichever answers first wins, and the loser is
+cancelled. Each retry attempt is hedged on its own, never a whole retry loop.
+
+Every hedge is an extra upstream request (and credit spend), so hedging is
+bounded by a global budget: each primary request earns
+``BLOCKSCOUT_HEDGE_BUDGET_RATIO`` of a hedge token, and a hedge can only be
+issued by spending a whole token. With a ratio of ``0.05`` at most ~5% extra
+requests are ever sent, however slow the upstream gets. Hedging waits for
+``BLOCKSCOUT_HEDGE_MIN_SAMPLES`` observed latencies before it starts, so the
+threshold is never a guess.
+
+Only idempotent GETs are hedged. A ratio of ``0`` (the default) disables
+hedging.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import anyio
+from anyio.abc import TaskGroup
+
+from blockscout_mcp_server.config import config
+
+# Latency samples kept for the percentile estimate.
+_SAMPLE_WINDOW = 512
+# Hedge tokens may accumulate up to this many, so a quiet period cannot bank an
+# unbounded burst of hedges.
+_MAX_HEDGE_TOKENS = 10.0
+# Never hedge sooner than this, however fast recent traffic was.
+_MIN_HEDGE_DELAY_SECONDS = 0.05
+
+
+class HedgePolicy:
+    """Learned hedge delay, hedge budget, and hedging counters."""
+
+    def __init__(self) -> None:
+        self._latencies: deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+        self._tokens = 0.0
+        self.primaries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+
+    @property
+    def enabled(self) -> bool:
+        return config.hedge_budget_ratio > 0
+
+    def clear(self) -> None:
+        self._latencies.clear()
+        self._tokens = 0.0
+        self.primaries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+
+    def record_latency(self, seconds: float) -> None:
+        self._latencies.append(seconds)
+
+    def hedge_delay(self) -> float | None:
+        """Return the learned hedge delay, or ``None`` until enough samples exist."""
+        if len(self._latencies) < max(1, config.hedge_min_samples):
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, max(0, math.ceil(config.hedge_percentile * len(ordered)) - 1))
+        return max(_MIN_HEDGE_DELAY_SECONDS, ordered[index])
+
+    def _earn(self) -> None:
+        self.primaries += 1
+        self._tokens = min(_MAX_HEDGE_TOKENS, self._tokens + config.hedge_budget_ratio)
+
+    def _try_spend(self) -> bool:
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            self.hedges += 1
+            return True
+        self.budget_denied += 1
+        return False
+
+    def stats(self) -> dict[str, Any]:
+        delay = self.hedge_delay()
+        return {
+            "primaries": self.primaries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "budget_denied": self.budget_denied,
+            "hedge_delay_ms": round(delay * 1000, 1) if delay is not None else None,
+        }
+
+    async def run(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn``, hedging it with a second call if it is slower than the learned delay.
+
+        ``fn`` should be a single upstream attempt, not a retry loop, so a hedge
+        never stacks a second retry and backoff sequence. The first successful
+        attempt wins and the other is cancelled. If an attempt fails while the
+        other is still running, the other is awaited; if both fail, the
+        primary's error is raised.
+
+        Only the primary's latency is learned: a hedged call that only recorded
+        the faster of its two attempts would drag the percentile down and fire
+        more hedges than the budget ratio intends.
+        """
+        self._earn()
+        delay = self.hedge_delay()
+        if delay is None:
+            started = time.monotonic()
+            result = await fn()
+            self.record_latency(time.monotonic() - started)
+            return result
+
+        outcome: dict[str, Any] = {}
+        errors: dict[bool, Exception] = {}
+        first_settled = anyio.Event()
+        primary_started = time.monotonic()
+
+        async def attempt(is_hedge: bool, tg: TaskGroup) -> None:
+            try:
+                result = await fn()
+            except Exception as e:
+                errors[is_hedge] = e
+            else:
+                if "result" not in outcome:
+                    outcome["result"] = result
+                    if False not in errors:
+                        # Learn from the primary only. When the hedge wins this is
+                        # how long the primary had run, a lower bound that is past
+                        # the delay, so the tail is not lost to the faster attempt.
+                        self.record_latency(time.monotonic() - primary_started)
+                    if is_hedge:
+                        self.hedge_wins += 1
+                    tg.cancel_scope.cancel()
+            finally:
+                first_settled.set()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(attempt, False, tg)
+            with anyio.move_on_after(delay):
+                await first_settled.wait()
+            # Hedge only a primary that is still running; a primary that already
+            # failed is reported as-is (the retry policy lives above this layer).
+            if not first_settled.is_set() and self._try_spend():
+                tg.start_soon(attempt, True, tg)
+
+        if "result" in outcome:
+            return outcome["result"]
+        raise errors.get(False) or errors[True]
+
+
+hedge_policy = HedgePolicy()
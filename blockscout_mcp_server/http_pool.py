@@ -0,0 +1,197 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Process-wide pooled ``httpx`` transport for the upstream REST APIs.
+
+Every upstream REST call (PRO API gateway, BENS, Chainscout, and the PRO API
+chain config) used to open and tear down its own ``httpx.AsyncClient``, paying a
+fresh TCP+TLS handshake per request — and three of them for the concurrent
+requests ``get_address_info`` issues. This module keeps one long-lived client per
+upstream origin (``scheme://host[:port]``) so keep-alive connections are reused
+across tool calls, with the pool bounded by environment variables:
+
+* ``BLOCKSCOUT_HTTP_POOL_MAX_CONNECTIONS`` – maximum open connections per origin
+* ``BLOCKSCOUT_HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS`` – idle connections kept warm
+* ``BLOCKSCOUT_HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS`` – idle connection lifetime
+* ``BLOCKSCOUT_HTTP_POOL_HTTP2`` – negotiate HTTP/2 (requires the ``h2`` package,
+  installed by the ``http2`` extra); silently falls back to HTTP/1.1 without it
+
+The clients carry no per-request state. Timeouts are passed on every request
+(``make_blockscout_request`` distinguishes light and heavy timeouts per call)
+and authentication headers are supplied per request by the callers, so two
+concurrent requests with different client PRO API keys share connections
+without ever sharing credentials — the same isolation contract ``Web3Pool``
+documents for the JSON-RPC path. For the same reason the clients never store
+cookies: a ``Set-Cookie`` from one upstream response (load-balancer stickiness,
+bot-management or session cookies) is not sent with anyone else's requests.
+
+The JSON-RPC path deliberately keeps its own ``aiohttp`` session in
+:mod:`blockscout_mcp_server.web3_pool`: ``web3.py``'s async provider stack is
+built on ``aiohttp`` and cannot drive an ``httpx`` client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import http.cookiejar
+import importlib.util
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import anyio
+import httpx
+
+from blockscout_mcp_server.config import config
+
+logger = logging.getLogger(__name__)
+
+# Checked once at import: ``httpx`` raises at client construction when
+# ``http2=True`` is requested without ``h2`` installed, and a missing optional
+# dependency must degrade to HTTP/1.1 rather than fail every upstream call.
+_H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _current_loop_token() -> object:
+    """Return an identity for the event loop the caller runs on.
+
+    The server only ever runs on asyncio; the trio branch exists because the
+    request helpers are exercised under both anyio backends in the test suite.
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        import trio  # only reachable under anyio's trio backend
+
+        return trio.lowlevel.current_trio_token()
+
+
+def _origin_of(url: str) -> str:
+    """Return the ``scheme://host[:port]`` pool key for *url*."""
+    parsed = httpx.URL(url)
+    port = f":{parsed.port}" if parsed.port is not None else ""
+    return f"{parsed.scheme}://{parsed.host}{port}"
+
+
+class PooledClientLease:
+    """Async context manager handing out the shared client for one logical request.
+
+    Mirrors the ``async with httpx.AsyncClient(...) as client`` shape the request
+    helpers in ``tools/common.py`` were written against, so they (and the test
+    doubles patched in at ``_create_httpx_client``) keep the same structure. The
+    lease resolves the pooled client from the request URL, applies its timeout to
+    every request it sends, and — unlike a real client — does *not* close
+    anything on exit: the connections go back to the pool.
+    """
+
+    def __init__(self, pool: HttpClientPool, timeout: float) -> None:
+        self._pool = pool
+        self.timeout = httpx.Timeout(timeout)
+
+    async def __aenter__(self) -> PooledClientLease:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        client = await self._pool.get_client(url)
+        return await client.get(url, timeout=self.timeout, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        client = await self._pool.get_client(url)
+        return await client.post(url, timeout=self.timeout, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """Send a request whose body is read incrementally (see ``httpx.AsyncClient.stream``).
+
+        Leaving the block closes the response, which releases its connection
+        back to the pool or drops it when the body was not fully read.
+        """
+        client = await self._pool.get_client(url)
+        async with client.stream(method, url, timeout=self.timeout, **kwargs) as response:
+            yield response
+
+
+class _RejectAllCookies(http.cookiejar.DefaultCookiePolicy):
+    """Cookie policy that stores nothing, so a shared client never replays one caller's cookies."""
+
+    def set_ok(self, cookie: http.cookiejar.Cookie, request: Any) -> bool:
+        return False
+
+
+class HttpClientPool:
+    """Lazily created ``httpx.AsyncClient`` instances, one per upstream origin.
+
+    Clients are bound to the event loop that created them (their connections
+    hold loop-bound streams). The pool remembers that loop and discards its
+    clients when it is asked for one from a different loop — which only happens
+    when a process runs several loops in sequence (e.g. one per test) — instead
+    of handing out connections that would fail on first use.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._loop: object | None = None
+        self._lock: anyio.Lock | None = None
+
+    def lease(self, *, timeout: float) -> PooledClientLease:
+        """Return a lease on the pool whose requests use *timeout* seconds."""
+        return PooledClientLease(self, timeout)
+
+    def _build_client(self) -> httpx.AsyncClient:
+        http2 = config.http_pool_http2 and _H2_AVAILABLE
+        if config.http_pool_http2 and not _H2_AVAILABLE:
+            logger.warning(
+                "BLOCKSCOUT_HTTP_POOL_HTTP2 is enabled but the 'h2' package is not installed; using HTTP/1.1."
+            )
+        return httpx.AsyncClient(
+            follow_redirects=True,
+            http2=http2,
+            cookies=http.cookiejar.CookieJar(policy=_RejectAllCookies()),
+            limits=httpx.Limits(
+                max_connections=config.http_pool_max_connections,
+                max_keepalive_connections=config.http_pool_max_keepalive_connections,
+                keepalive_expiry=config.http_pool_keepalive_expiry_seconds,
+            ),
+        )
+
+    async def get_client(self, url: str) -> httpx.AsyncClient:
+        """Return the shared client for *url*'s origin, creating it on first use.
+
+        Uses a double-checked pattern under an ``anyio.Lock`` so two concurrent
+        first callers cannot create two clients for the same origin.
+        """
+        loop = _current_loop_token()
+        if self._loop is not loop:
+            # Connections of a previous loop cannot be closed from this one;
+            # drop the references and start over.
+            self._clients = {}
+            self._loop = loop
+            self._lock = anyio.Lock()
+
+        origin = _origin_of(url)
+        client = self._clients.get(origin)
+        if client is not None and not client.is_closed:
+            return client
+
+        assert self._lock is not None
+        async with self._lock:
+            client = self._clients.get(origin)
+            if client is None or client.is_closed:
+                client = self._build_client()
+                self._clients[origin] = client
+        return client
+
+    async def close(self) -> None:
+        """Close every pooled client. Idempotent; a failing close never blocks the rest."""
+        clients = list(self._clients.values())
+        self._clients = {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+
+
+HTTP_POOL = HttpClientPool()
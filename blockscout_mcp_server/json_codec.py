@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Single JSON codec for the hot path, backed by ``orjson`` when it is installed.
+
+Upstream bodies (350 KB contract payloads, advanced-filter pages) are decoded,
+and tool results are encoded, on every call: once for the MCP text content, and
+once per REST response. This module routes that work through one place that
+uses ``orjson`` (installed by the ``fast-json`` extra) and falls back to the
+standard library otherwise, or when ``BLOCKSCOUT_JSON_CODEC=stdlib`` forces it.
+
+The fast path never changes what callers observe:
+
+* :func:`dumps` always writes compact separators, and with ``ensure_ascii=True``
+  only keeps ``orjson`` output that is pure ASCII (identical to the stdlib's);
+  anything ``orjson`` refuses (integers beyond 64 bits, non-string keys) is
+  encoded by the stdlib instead. The visible differences are the spelling of
+  floats in exponent form (``1e16`` rather than ``1e+16``, the same value) and
+  NaN/Infinity, which ``orjson`` writes as ``null`` instead of invalid JSON.
+* :func:`loads` re-parses with the stdlib when ``orjson``'s result holds a float
+  outside the 64-bit integer range — which is what ``orjson`` silently makes of
+  a wider integer literal, and on-chain quantities must never lose precision —
+  and on a decode error, so malformed input raises the same
+  ``json.JSONDecodeError`` it always did.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from blockscout_mcp_server.config import config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# orjson decodes integer literals in [-2**63, 2**64) exactly and anything wider
+# as a float, so a float outside this range may be a truncated integer. (A
+# body-level pre-scan for long digit runs costs more than the decode it guards.)
+_MIN_EXACT_INT = -(2.0**63)
+_MAX_EXACT_INT = 2.0**64
+
+
+def _may_hold_truncated_integer(obj: Any) -> bool:
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        item = pop()
+        kind = type(item)
+        if kind is dict:
+            extend(item.values())
+        elif kind is list:
+            extend(item)
+        elif kind is float and not _MIN_EXACT_INT < item < _MAX_EXACT_INT:
+            return True
+    return False
+
+
+def _select_backend() -> Any | None:
+    """Return the ``orjson`` module if it is installed and allowed, else ``None``."""
+    choice = config.json_codec.strip().lower()
+    if choice == "stdlib":
+        return None
+    if orjson is None:
+        if choice == "orjson":
+            logger.warning("BLOCKSCOUT_JSON_CODEC=orjson but orjson is not installed; using the stdlib json module")
+        return None
+    return orjson
+
+
+_orjson = _select_backend()
+
+
+def codec_name() -> str:
+    """Return the name of the active backend (``orjson`` or ``stdlib``)."""
+    return "orjson" if _orjson is not None else "stdlib"
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    """Decode a JSON document; same results and errors as ``json.loads``."""
+    if _orjson is not None:
+        try:
+            decoded = _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass  # Let the stdlib raise its own error (or accept what orjson rejects, e.g. NaN).
+        else:
+            if not _may_hold_truncated_integer(decoded):
+                return decoded
+    return json.loads(data)
+
+
+def _fast_dumps(obj: Any, ensure_ascii: bool, sort_keys: bool, default: Callable[[Any], Any] | None) -> bytes | None:
+    """Encode with orjson, or return ``None`` when the stdlib must do it."""
+    if _orjson is None:
+        return None
+    option = _orjson.OPT_SORT_KEYS if sort_keys else 0
+    if default is not None:
+        # Let ``default`` see the types orjson would otherwise encode natively, as the stdlib does.
+        option |= _orjson.OPT_PASSTHROUGH_DATETIME | _orjson.OPT_PASSTHROUGH_DATACLASS
+    try:
+        encoded = _orjson.dumps(obj, default=default, option=option)
+    except TypeError:
+        return None  # e.g. integers beyond 64 bits or non-string keys: the stdlib handles them.
+    if ensure_ascii and not encoded.isascii():
+        return None
+    return encoded
+
+
+def dumps(
+    obj: Any,
+    *,
+    ensure_ascii: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """Encode *obj* as a compact JSON string (``separators=(",", ":")``)."""
+    encoded = _fast_dumps(obj, ensure_ascii, sort_keys, default)
+    if encoded is not None:
+        return encoded.decode("utf-8")
+    return json.dumps(obj, ensure_ascii=ensure_ascii, sort_keys=sort_keys, default=default, separators=(",", ":"))
+
+
+def dumps_bytes(
+    obj: Any,
+    *,
+    ensure_ascii: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Encode *obj* as compact UTF-8 JSON; same output as :func:`dumps`, encoded."""
+    encoded = _fast_dumps(obj, ensure_ascii, sort_keys, default)
+    if encoded is not None:
+        return encoded
+    return json.dumps(
+        obj, ensure_ascii=ensure_ascii, sort_keys=sort_keys, default=default, separators=(",", ":")
+    ).encode("utf-8")
@@ -1,11 +1,25 @@
 # SPDX-License-Identifier: LicenseRef-Blockscout
 """Logging utilities for the Blockscout MCP Server."""
 
+import atexit
+import copy
 import logging
+import queue
+import random
 import sys
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
 
 import anyio
 
+from blockscout_mcp_server import json_codec
+from blockscout_mcp_server.config import config
+
+# Line format of the standard handlers that replace FastMCP's Rich handlers.
+TEXT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+TEXT_LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 # Pre-define module logger to avoid circular dependencies during logging system manipulation
 # This logger is created before any handler manipulation occurs, ensuring safe error reporting
 _module_logger = logging.getLogger(__name__)
@@ -97,9 +111,7 @@ def replace_rich_handlers_with_standard() -> None:
     reporting even if the logging system is in an inconsistent state.
     """
     # Standard log format that matches our desired output
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    formatter = logging.Formatter(fmt=TEXT_LOG_FORMAT, datefmt=TEXT_LOG_DATE_FORMAT)
 
     # Get all existing loggers
     loggers_to_process = [logging.getLogger()]  # Start with root logger
@@ -171,3 +183,275 @@ def replace_rich_handlers_with_standard() -> None:
         except Exception:
             # Fallback if logging system is unstable - use direct stderr output
             print(f"Info: Replaced {handlers_replaced} Rich logging handlers with standard handlers", file=sys.stderr)
+
+
+# ---------------------------------------------------------------------------
+# Bounded argument rendering
+# ---------------------------------------------------------------------------
+
+
+class CappedRepr:
+    """Log argument that renders *value* like ``repr()``, cut off after ``limit`` characters.
+
+    Rendering happens when the record is formatted, and it walks plain dicts,
+    lists, and tuples only until the budget is spent, so a large ``abi`` or
+    ``query_params`` argument costs at most about ``limit`` characters of work.
+    Values that fit are rendered exactly as ``repr()`` would. ``limit``
+    defaults to ``BLOCKSCOUT_LOG_ARG_MAX_CHARS``; ``0`` renders in full.
+
+    The value is rendered later, possibly on the log listener thread, so it must
+    not be mutated after it is logged.
+    """
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value: Any, limit: int | None = None) -> None:
+        self.value = value
+        self.limit = config.log_arg_max_chars if limit is None else limit
+
+    def __str__(self) -> str:
+        if self.limit <= 0:
+            return repr(self.value)
+        parts: list[str] = []
+        _render(self.value, parts, self.limit + 1)
+        text = "".join(parts)
+        if len(text) <= self.limit:
+            return text
+        return f"{text[: self.limit]}...<truncated>"
+
+    __repr__ = __str__
+
+
+def _render(value: Any, parts: list[str], budget: int) -> int:
+    """Append the ``repr()`` of *value* to *parts* until *budget* characters are spent."""
+    if budget <= 0:
+        return budget
+    kind = type(value)
+    if kind is dict:
+        parts.append("{")
+        budget -= 1
+        for index, (key, item) in enumerate(value.items()):
+            if budget <= 0:
+                return budget
+            if index:
+                parts.append(", ")
+                budget -= 2
+            budget = _render(key, parts, budget)
+            parts.append(": ")
+            budget = _render(item, parts, budget - 2)
+        parts.append("}")
+        return budget - 1
+    if kind is list or kind is tuple:
+        opening, closing = ("[", "]") if kind is list else ("(", ",)" if len(value) == 1 else ")")
+        parts.append(opening)
+        budget -= 1
+        for index, item in enumerate(value):
+            if budget <= 0:
+                return budget
+            if index:
+                parts.append(", ")
+                budget -= 2
+            budget = _render(item, parts, budget)
+        parts.append(closing)
+        return budget - len(closing)
+    if (kind is str or kind is bytes) and len(value) > budget:
+        value = value[:budget]
+    text = repr(value)
+    parts.append(text)
+    return budget - len(text)
+
+
+# ---------------------------------------------------------------------------
+# Structured output and sampling
+# ---------------------------------------------------------------------------
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as one JSON object (``BLOCKSCOUT_LOG_FORMAT=json``)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json_codec.dumps(entry, default=str)
+
+
+def parse_sample_rates(spec: str) -> dict[str, float]:
+    """Parse ``BLOCKSCOUT_LOG_SAMPLE_RATES`` (``"httpx=0.1,mcp.server=0.5"``) into rates by logger name."""
+    rates: dict[str, float] = {}
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        name, separator, rate = entry.partition("=")
+        try:
+            value = float(rate)
+        except ValueError:
+            value = -1.0
+        if not separator or not name.strip() or not 0.0 <= value <= 1.0:
+            raise ValueError(f"Invalid log sample rate {entry.strip()!r}; expected <logger>=<rate between 0 and 1>")
+        rates[name.strip()] = value
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a configured fraction of the records below WARNING, per logger.
+
+    A rate set for a logger applies to its children too; the most specific
+    configured name wins. Warnings and errors are never sampled out.
+    """
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        self._rates = rates
+        self._resolved: dict[str, float] = {}
+        self.sampled_out = 0
+
+    def _rate(self, name: str) -> float:
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = 1.0
+            candidate = name
+            while candidate:
+                if candidate in self._rates:
+                    rate = self._rates[candidate]
+                    break
+                candidate = candidate.rpartition(".")[0]
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        if rate >= 1.0 or random.random() < rate:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Queued log output
+# ---------------------------------------------------------------------------
+
+# Arguments that cannot change after the call, so formatting can wait for the listener.
+_DEFERRABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None), CappedRepr)
+
+
+class _LogQueueHandler(QueueHandler):
+    """Hands records to the listener thread unformatted, and drops them when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike QueueHandler.prepare, the message is not formatted here: the
+        # listener's handlers do that off the event loop. Only records carrying an
+        # argument that could be mutated in the meantime are resolved now.
+        args = record.args
+        if args and not (isinstance(args, tuple) and all(isinstance(arg, _DEFERRABLE_ARG_TYPES) for arg in args)):
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """Formatting, sampling, and queueing of the root logger's output.
+
+    :meth:`install` runs once at startup (in every worker process). It sets the
+    text or JSON formatter on the root handlers and, with
+    ``BLOCKSCOUT_LOG_QUEUE_SIZE`` above ``0``, moves those handlers behind a
+    ``QueueHandler``: logging calls only enqueue the record, and a
+    ``QueueListener`` thread formats and writes it, so a slow stderr never
+    blocks the event loop. Records arriving while the queue is full are dropped
+    and counted. ``BLOCKSCOUT_LOG_SAMPLE_RATES`` filters records before they are
+    queued. Loggers that do not propagate to the root (Uvicorn's) and handlers
+    other than the plain stream handlers are untouched.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: list[logging.Handler] = []
+        self._queue_handler: _LogQueueHandler | None = None
+        self._listener: QueueListener | None = None
+        self._sampler: SamplingFilter | None = None
+
+    def install(self) -> None:
+        root = logging.getLogger()
+        # Only the plain stream handlers FastMCP and replace_rich_handlers_with_standard
+        # set up; handlers added by anything else keep working as they were.
+        handlers = [handler for handler in root.handlers if type(handler) is logging.StreamHandler]
+        if self._handlers or not handlers:
+            return
+        self._handlers = handlers
+        formatter = (
+            JsonFormatter()
+            if config.log_format == "json"
+            else logging.Formatter(fmt=TEXT_LOG_FORMAT, datefmt=TEXT_LOG_DATE_FORMAT)
+        )
+        for handler in self._handlers:
+            handler.setFormatter(formatter)
+        rates = parse_sample_rates(config.log_sample_rates)
+        self._sampler = SamplingFilter(rates) if rates else None
+
+        if config.log_queue_size == 0:
+            if self._sampler is not None:
+                for handler in self._handlers:
+                    handler.addFilter(self._sampler)
+            return
+
+        self._queue_handler = _LogQueueHandler(queue.Queue(config.log_queue_size))
+        if self._sampler is not None:
+            self._queue_handler.addFilter(self._sampler)
+        for handler in self._handlers:
+            root.removeHandler(handler)
+        root.addHandler(self._queue_handler)
+        self._listener = QueueListener(self._queue_handler.queue, *self._handlers, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Write what is still queued and give the root logger its handlers back."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        root = logging.getLogger()
+        if self._queue_handler is not None:
+            root.removeHandler(self._queue_handler)
+            for handler in self._handlers:
+                root.addHandler(handler)
+            self._queue_handler = None
+        for handler in self._handlers:
+            if self._sampler is not None:
+                handler.removeFilter(self._sampler)
+        self._handlers = []
+        self._sampler = None
+
+    def clear(self) -> None:
+        self.close()
+
+    def stats(self) -> dict[str, int]:
+        queue_handler = self._queue_handler
+        return {
+            "dropped": queue_handler.dropped if queue_handler is not None else 0,
+            "sampled_out": self._sampler.sampled_out if self._sampler is not None else 0,
+            "depth": queue_handler.queue.qsize() if queue_handler is not None else 0,
+        }
+
+
+log_pipeline = LogPipeline()
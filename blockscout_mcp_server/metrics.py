@@ -0,0 +1,321 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""In-process metrics exported in the Prometheus text format at ``GET /metrics``.
+
+The only production signal used to be the ``Tool invoked:`` log line, which says
+what was called but not where the time went. This module keeps a small set of
+counters, gauges, and histograms that the request path records into:
+
+* tool latency by tool and outcome (``log_tool_invocation``),
+* upstream attempt latency by host, chain, endpoint template, and status, plus
+  retries (``_send_blockscout_http_request`` and the BENS/Chainscout helpers),
+* session-store operation latency (the ``session_gate`` store chokepoint),
+* in-flight gauges for tool calls and upstream attempts.
+
+Component state that already has a ``stats()``/``snapshot()`` method (caches,
+circuit breakers, rate pacing, hedging, coalescing, the web3 pool) is not
+duplicated here; the ``/metrics`` route renders it at scrape time with
+:func:`render_family`.
+
+Recording is meant to stay on in production: it happens on the event loop
+thread and is a dict lookup, a ``bisect`` and a few integer updates — no locks,
+no allocation once a series exists. Upstream paths are reduced to templates
+(``/api/v2/transactions/{hash}``) and every metric caps its number of series, so
+arbitrary ``direct_api_call`` paths cannot grow memory without bound.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from time import perf_counter
+
+# A metric never holds more series than this; further label combinations are
+# folded into one series whose label values are all ``_OVERFLOW_LABEL``.
+_MAX_SERIES_PER_METRIC = 2000
+_OVERFLOW_LABEL = "other"
+
+_TOOL_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+_UPSTREAM_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+_STORE_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.1, 0.5)
+
+_HASH_SEGMENT = re.compile(r"^0x[0-9a-fA-F]{64}$")
+_ADDRESS_SEGMENT = re.compile(r"^0x[0-9a-fA-F]{40}$")
+_HEX_SEGMENT = re.compile(r"^0x[0-9a-fA-F]*$")
+_NUMBER_SEGMENT = re.compile(r"^\d+$")
+# Anything with a digit that is longer than a typical path word (ENS names,
+# token ids, UUIDs) is treated as an identifier.
+_ID_SEGMENT = re.compile(r"^(?=.*\d).{16,}$|.*\.")
+
+
+def endpoint_template(path: str) -> str:
+    """Reduce an upstream API path to a low-cardinality template.
+
+    ``/api/v2/addresses/0xabc…/token-transfers`` becomes
+    ``/api/v2/addresses/{address}/token-transfers``.
+    """
+    segments = path.split("?", 1)[0].split("/")
+    for index, segment in enumerate(segments):
+        if not segment:
+            continue
+        if _HASH_SEGMENT.match(segment):
+            segments[index] = "{hash}"
+        elif _ADDRESS_SEGMENT.match(segment):
+            segments[index] = "{address}"
+        elif _HEX_SEGMENT.match(segment) or _NUMBER_SEGMENT.match(segment) or _ID_SEGMENT.match(segment):
+            segments[index] = "{id}"
+    return "/".join(segments) or "/"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = ",".join(f'{name}="{_escape_label_value(str(value))}"' for name, value in zip(names, values, strict=True))
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int) or (isinstance(value, float) and value.is_integer()):
+        return str(int(value))
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(value)
+
+
+def render_family(name: str, kind: str, help_text: str, samples: Iterable[tuple[dict[str, str], float]]) -> str:
+    """Render one metric family from ``(labels, value)`` samples."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        lines.append(f"{name}{_format_labels(labels.keys(), labels.values())} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._series: dict[tuple[str, ...], object] = {}
+
+    def _admit(self, labels: tuple[str, ...]) -> tuple[str, ...]:
+        """Return the key a new label combination is recorded under."""
+        if len(self._series) < _MAX_SERIES_PER_METRIC:
+            return labels
+        return (_OVERFLOW_LABEL,) * len(self.labelnames)
+
+    def clear(self) -> None:
+        self._series.clear()
+
+    def render(self) -> str:
+        return render_family(
+            self.name,
+            self.kind,
+            self.help_text,
+            ((dict(zip(self.labelnames, labels, strict=True)), value) for labels, value in self._series.items()),
+        )
+
+
+class Counter(_Metric):
+    """Monotonic counter per label combination."""
+
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        key = labels if labels in self._series else self._admit(labels)
+        self._series[key] = self._series.get(key, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._series.get(labels, 0)
+
+
+class Gauge(_Metric):
+    """Up/down gauge per label combination (used for in-flight counts)."""
+
+    kind = "gauge"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        key = labels if labels in self._series else self._admit(labels)
+        self._series[key] = self._series.get(key, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def value(self, *labels: str) -> float:
+        return self._series.get(labels, 0)
+
+    def total(self) -> float:
+        """Sum over every label combination."""
+        return sum(self._series.values())
+
+
+class _HistogramSeries:
+    __slots__ = ("counts", "total")
+
+    def __init__(self, size: int) -> None:
+        # Per-bucket (not cumulative) counts; the last slot is the +Inf bucket.
+        self.counts = [0] * size
+        self.total = 0.0
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram of seconds per label combination."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...], buckets: tuple[float, ...]) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = buckets
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            key = self._admit(labels)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _HistogramSeries(len(self.buckets) + 1)
+        series.counts[bisect_left(self.buckets, value)] += 1
+        series.total += value
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        """Observe the duration of the ``with`` block under ``labels`` plus its outcome.
+
+        The final label (``status``) is ``success`` or ``error`` depending on
+        whether the block raised.
+        """
+        status = "error"
+        started = perf_counter()
+        try:
+            yield
+            status = "success"
+        finally:
+            self.observe(perf_counter() - started, *labels, status)
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return sum(series.counts) if series is not None else 0
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for labels, series in self._series.items():
+            names = (*self.labelnames, "le")
+            cumulative = 0
+            for bound, count in zip(bounds, series.counts, strict=True):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(names, (*labels, bound))} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(series.total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsRegistry:
+    """The set of metrics recorded by the request path, rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: list[_Metric] = []
+
+    def counter(self, name: str, help_text: str, labelnames: tuple[str, ...]) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: tuple[str, ...]) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(
+        self, name: str, help_text: str, labelnames: tuple[str, ...], buckets: tuple[float, ...]
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def _register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def clear(self) -> None:
+        for metric in self._metrics:
+            metric.clear()
+
+    def render(self) -> str:
+        return "".join(metric.render() for metric in self._metrics)
+
+
+registry = MetricsRegistry()
+
+tool_duration = registry.histogram(
+    "blockscout_mcp_tool_duration_seconds",
+    "Tool call latency by tool and outcome.",
+    ("tool", "status"),
+    _TOOL_BUCKETS,
+)
+tools_in_flight = registry.gauge("blockscout_mcp_tool_calls_in_flight", "Tool calls currently executing.", ("tool",))
+upstream_duration = registry.histogram(
+    "blockscout_mcp_upstream_request_duration_seconds",
+    "Upstream HTTP attempt latency by host, chain, endpoint template, and status.",
+    ("host", "chain", "endpoint", "status"),
+    _UPSTREAM_BUCKETS,
+)
+upstream_retries = registry.counter(
+    "blockscout_mcp_upstream_retries_total",
+    "Upstream attempts retried, by reason (transport error or rate limit).",
+    ("host", "chain", "endpoint", "reason"),
+)
+upstream_in_flight = registry.gauge(
+    "blockscout_mcp_upstream_requests_in_flight", "Upstream HTTP attempts currently in flight.", ("host",)
+)
+contract_artifact_lookups = registry.counter(
+    "blockscout_mcp_contract_artifact_lookups_total",
+    "Contract cache lookups by the artifact requested (metadata, source, abi) and result.",
+    ("artifact", "result"),
+)
+session_store_duration = registry.histogram(
+    "blockscout_mcp_session_store_operation_duration_seconds",
+    "Session counter store operation latency by operation and outcome.",
+    ("operation", "status"),
+    _STORE_BUCKETS,
+)
+
+
+class UpstreamAttempt:
+    """Handle yielded by :func:`track_upstream`; set ``response`` once it arrives."""
+
+    __slots__ = ("response",)
+
+    def __init__(self) -> None:
+        self.response: object | None = None
+
+
+@contextmanager
+def track_upstream(host: str, chain: str, endpoint: str) -> Iterator[UpstreamAttempt]:
+    """Time one upstream HTTP attempt and count it as in flight while it runs."""
+    attempt = UpstreamAttempt()
+    error: BaseException | None = None
+    started = perf_counter()
+    upstream_in_flight.inc(host)
+    try:
+        yield attempt
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        upstream_in_flight.dec(host)
+        upstream_duration.observe(
+            perf_counter() - started, host, chain, endpoint, upstream_status(attempt.response, error)
+        )
+
+
+def upstream_status(response: object | None, error: BaseException | None) -> str:
+    """Return the ``status`` label for an upstream attempt."""
+    if error is not None:
+        response = getattr(error, "response", None)
+        if response is None:
+            return type(error).__name__
+    status_code = getattr(response, "status_code", None)
+    return str(status_code) if isinstance(status_code, int) else "unknown"
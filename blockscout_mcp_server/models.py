@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: LicenseRef-Blockscout
 """Pydantic models for standardized tool responses."""
 
+import functools
 import logging
 import re
 from typing import Any, Generic, TypeVar, get_args
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_serializer
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_serializer
 
 from blockscout_mcp_server.constants import AuthOrigin
 
@@ -552,6 +553,26 @@ class ToolResponse(BaseModel, Generic[T]):
     )
 
 
+@functools.cache
+def _tool_response_adapter(response_type: type[ToolResponse]) -> TypeAdapter:
+    # One adapter per concrete ToolResponse[...] class; pydantic caches the
+    # parametrized classes themselves, so this stays bounded by the tool count.
+    return TypeAdapter(response_type)
+
+
+def serialize_tool_response(tool_response: ToolResponse) -> bytes:
+    """Serialize a ToolResponse to compact UTF-8 JSON in one native pass.
+
+    The output decodes to the same value as ``json.dumps(tool_response.model_dump(
+    mode="json", by_alias=True), ensure_ascii=False, separators=(",", ":"))`` and
+    uses the same compact, unescaped-UTF-8 layout, but it is not always the same
+    bytes: pydantic spells some floats differently (``1e-7`` rather than
+    ``1e-07``). It is built without the intermediate dict, so one encoding serves
+    the MCP text content block and the REST body.
+    """
+    return _tool_response_adapter(type(tool_response)).dump_json(tool_response, by_alias=True)
+
+
 # --- Model for get_block_info Data Payload ---
 class BlockInfoData(BaseModel):
     """A structured representation of a block's information."""
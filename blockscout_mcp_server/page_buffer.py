@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Short-lived buffer of upstream items fetched past the page a tool returned.
+
+Paginated tools fetch a full upstream page (50 advanced-filter items, logs, or
+NFT collections) and return only the first ``*_page_size`` (10) of them. Without
+this buffer the surplus is thrown away and the emitted cursor makes the
+follow-up call fetch it again, so reading 50 items costs five upstream requests.
+
+``create_items_pagination`` stores the upstream items past the returned page
+under the ``next_call`` it emits (tool name plus parameters, cursor included).
+When the agent makes exactly that call, the tool takes the items from here
+instead of calling upstream and runs them through its usual processing, which
+emits the next cursor and buffers the remainder again.
+
+Cursors stay stateless: they are the same upstream ``next_page_params`` as
+before, and a miss (expired, evicted, another worker process, a restart, or a
+remainder too short to fill a page) simply falls back to the upstream request.
+A remainder no longer than one page is served only when the upstream had no
+more pages; otherwise the buffer cannot know whether a following page exists,
+and the upstream request answers that.
+
+Entries are single-use and live for ``BLOCKSCOUT_PAGE_BUFFER_TTL_SECONDS``;
+at most ``BLOCKSCOUT_PAGE_BUFFER_MAX_ENTRIES`` are kept, least recently stored
+evicted first (``0`` disables the buffer). Like the other caches, keys exclude
+the PRO API key: the items are public chain data and a hit makes no upstream
+request.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from blockscout_mcp_server import json_codec
+from blockscout_mcp_server.config import config
+
+
+@dataclass(slots=True)
+class BufferedPage:
+    """Upstream items following a cursor, and whether the upstream had more after them."""
+
+    items: list[Any]
+    upstream_has_more: bool
+
+
+@dataclass(slots=True)
+class _Entry:
+    page: BufferedPage
+    # A remainder no longer than this (the page size it was buffered with) can
+    # only be served when the upstream has nothing more.
+    page_size: int
+    expires_at: float
+
+
+class PageBuffer:
+    """Single-use, TTL-bounded LRU of surplus upstream items keyed by the next call."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return config.page_buffer_max_entries > 0
+
+    @staticmethod
+    def make_key(tool_name: str, next_call_params: dict[str, Any]) -> str:
+        return json_codec.dumps([tool_name, next_call_params], sort_keys=True, default=str)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+        }
+
+    def store(
+        self,
+        tool_name: str,
+        next_call_params: dict[str, Any],
+        items: list[Any],
+        *,
+        page_size: int,
+        upstream_has_more: bool,
+    ) -> None:
+        """Keep ``items`` for the call ``tool_name(**next_call_params)``."""
+        if not self.enabled or not items:
+            return
+        key = self.make_key(tool_name, next_call_params)
+        self._entries[key] = _Entry(
+            BufferedPage(items, upstream_has_more), page_size, time.monotonic() + config.page_buffer_ttl_seconds
+        )
+        self._entries.move_to_end(key)
+        self.stores += 1
+        while len(self._entries) > config.page_buffer_max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def holds(self, tool_name: str, next_call_params: dict[str, Any]) -> bool:
+        """Whether ``take`` would serve this call right now (without consuming or counting it)."""
+        entry = self._entries.get(self.make_key(tool_name, next_call_params)) if self.enabled else None
+        return entry is not None and self._servable(entry)
+
+    @staticmethod
+    def _servable(entry: _Entry) -> bool:
+        return entry.expires_at > time.monotonic() and (
+            len(entry.page.items) > entry.page_size or not entry.page.upstream_has_more
+        )
+
+    def take(self, tool_name: str, next_call_params: dict[str, Any]) -> BufferedPage | None:
+        """Remove and return the items buffered for this call, if they can stand in for the upstream page."""
+        if not self.enabled:
+            return None
+        entry = self._entries.pop(self.make_key(tool_name, next_call_params), None)
+        if entry is None or not self._servable(entry):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.page
+
+
+page_buffer = PageBuffer()
@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Speculative prefetch of the upstream page a paginated response points to.
+
+An agent that receives ``pagination.next_call`` almost always makes that call
+within seconds, and then waits the full upstream latency again — many seconds
+for advanced filters. When a paginated tool response is returned, the tool asks
+this module to start the upstream GET the follow-up call will make (the
+current query with the emitted cursor applied) in the background.
+``make_blockscout_request`` looks the request up here before going upstream: a
+finished prefetch is served directly, a running one is awaited instead of being
+sent twice.
+
+Entries are keyed like in-flight coalescing (chain, path, normalized params,
+timeout, body cap, and the PRO API key fingerprint), so a prefetch is only ever
+served to a caller using the key it was made and billed with. Each entry is
+single-use and is dropped ``BLOCKSCOUT_PREFETCH_TTL_SECONDS`` after it finished.
+A next call the page buffer will serve is never prefetched.
+
+Prefetches spend PRO API credits on a guess, so they are bounded three ways:
+
+* at most ``BLOCKSCOUT_PREFETCH_MAX_CONCURRENCY`` run at once per process (``0``,
+  the default, disables prefetching);
+* a budget of ``BLOCKSCOUT_PREFETCH_BUDGET_PER_MINUTE`` speculative requests,
+  refilled continuously. A prefetch that serves its follow-up call is refunded —
+  that request would have been made anyway — so the budget caps the requests
+  spent on pages nobody asked for;
+* while more than ``BLOCKSCOUT_PREFETCH_MAX_TOOL_CALLS_IN_FLIGHT`` tool calls are
+  executing, no prefetch starts, and the first foreground request that notices
+  the load cancels the running ones nobody is waiting for.
+
+Outcomes (served, unused, failed, cancelled) and skips are exported at
+``/metrics``; served over all outcomes is the hit rate that tells whether
+prefetching pays off for a deployment.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from blockscout_mcp_server import metrics
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.pro_api_key_context import CreditSink, _credit_sink
+
+logger = logging.getLogger(__name__)
+
+# Set inside prefetch tasks, whose own upstream request must not wait for itself.
+_prefetching: ContextVar[bool] = ContextVar("_prefetching", default=False)
+
+
+@dataclass(slots=True)
+class _Prefetch:
+    task: asyncio.Task | None = None
+    # Set once the fetch succeeded; the entry is dropped this long after.
+    expires_at: float | None = None
+    result: Any = None
+    # ``x-credits-remaining`` observed by the prefetch, replayed into the sink of
+    # the call it serves so the low-credits note still works.
+    credits_remaining: float | None = None
+    sink: CreditSink = field(default_factory=CreditSink)
+
+
+class Prefetcher:
+    """Per-process registry of speculative next-page fetches with their budget and counters."""
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, _Prefetch] = {}
+        self._running: set[asyncio.Task] = set()
+        self._tokens = 0.0
+        self._refilled_at: float | None = None
+        self.started = 0
+        self.served = 0
+        self.unused = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.skipped_budget = 0
+        self.skipped_concurrency = 0
+        self.skipped_load = 0
+
+    @property
+    def enabled(self) -> bool:
+        return config.prefetch_max_concurrency > 0
+
+    def clear(self) -> None:
+        for task in self._running:
+            task.cancel()
+        self._running.clear()
+        self._entries.clear()
+        self._tokens = 0.0
+        self._refilled_at = None
+        self.started = 0
+        self.served = 0
+        self.unused = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.skipped_budget = 0
+        self.skipped_concurrency = 0
+        self.skipped_load = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "started": self.started,
+            "served": self.served,
+            "unused": self.unused,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "skipped_budget": self.skipped_budget,
+            "skipped_concurrency": self.skipped_concurrency,
+            "skipped_load": self.skipped_load,
+            "in_flight": len(self._running),
+            "entries": len(self._entries),
+        }
+
+    def _overloaded(self) -> bool:
+        return metrics.tools_in_flight.total() > config.prefetch_max_tool_calls_in_flight
+
+    def _refill(self, now: float) -> None:
+        capacity = config.prefetch_budget_per_minute
+        if self._refilled_at is None:
+            self._tokens = capacity
+        else:
+            self._tokens = min(capacity, self._tokens + (now - self._refilled_at) * capacity / 60.0)
+        self._refilled_at = now
+
+    def _prune(self, now: float) -> None:
+        # Running prefetches have no expiry yet; they are dropped once finished and unused.
+        expired = [
+            key for key, entry in self._entries.items() if entry.expires_at is not None and entry.expires_at <= now
+        ]
+        for key in expired:
+            del self._entries[key]
+            self.unused += 1
+
+    def schedule(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> bool:
+        """Start ``fetch`` in the background and keep its result under ``key``.
+
+        Returns whether a prefetch was started. Must be called from the tool call
+        whose response points to the page, so the task inherits its PRO API key.
+        """
+        if not self.enabled:
+            return False
+        now = time.monotonic()
+        self._prune(now)
+        if key in self._entries:
+            return False
+        if self._overloaded():
+            self.skipped_load += 1
+            return False
+        if len(self._running) >= config.prefetch_max_concurrency:
+            self.skipped_concurrency += 1
+            return False
+        self._refill(now)
+        if self._tokens < 1.0:
+            self.skipped_budget += 1
+            return False
+        self._tokens -= 1.0
+
+        entry = _Prefetch()
+        self._entries[key] = entry
+        self.started += 1
+        entry.task = asyncio.create_task(self._run(key, entry, fetch))
+        self._running.add(entry.task)
+        entry.task.add_done_callback(self._on_done)
+        return True
+
+    async def _run(self, key: Hashable, entry: _Prefetch, fetch: Callable[[], Awaitable[Any]]) -> None:
+        # The task runs in a copy of the scheduling call's context; give it its own
+        # credit sink so the finished call's sink is not written to afterwards.
+        _credit_sink.set(entry.sink)
+        _prefetching.set(True)
+        try:
+            entry.result = await fetch()
+        except Exception as e:
+            # Nobody awaits a prefetch for its error: the follow-up call misses and
+            # makes the request itself, surfacing whatever the upstream says then.
+            self.failed += 1
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+            logger.debug("Prefetch failed; the follow-up call will fetch the page itself: %s", e)
+            return
+        entry.expires_at = time.monotonic() + config.prefetch_ttl_seconds
+        entry.credits_remaining = entry.sink.remaining
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        # A done callback rather than ``finally`` in ``_run``: a task cancelled before
+        # its first step never enters the coroutine. Tasks dropped by ``clear`` are
+        # no longer tracked and are not counted.
+        if task not in self._running:
+            return
+        self._running.discard(task)
+        if task.cancelled():
+            self.cancelled += 1
+
+    def shed_load(self) -> None:
+        """Cancel the running prefetches no caller is waiting for when too many tool calls are in flight."""
+        if not self._overloaded():
+            return
+        for key, entry in list(self._entries.items()):
+            if entry.task is not None and not entry.task.done():
+                entry.task.cancel()
+                del self._entries[key]
+
+    async def take(self, key: Hashable) -> Any | None:
+        """Return the prefetched result for ``key`` (awaiting a running prefetch), or ``None``."""
+        if not self._entries or _prefetching.get():
+            return None
+        now = time.monotonic()
+        self._prune(now)
+        entry = self._entries.pop(key, None)
+        if entry is None or entry.task is None:
+            self.shed_load()
+            return None
+        # Popped, so neither load shedding nor expiry can take it away while we wait.
+        await asyncio.wait({entry.task})
+        if entry.task.cancelled() or entry.expires_at is None:
+            return None
+        self.served += 1
+        self._tokens = min(config.prefetch_budget_per_minute, self._tokens + 1.0)
+        sink = _credit_sink.get()
+        if sink is not None and entry.credits_remaining is not None:
+            sink.record(entry.credits_remaining)
+        return entry.result
+
+
+prefetcher = Prefetcher()
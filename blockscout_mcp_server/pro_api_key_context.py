@@ -56,7 +56,7 @@ import inspect
 import logging
 import math
 from collections.abc import Awaitable, Callable
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from dataclasses import dataclass
 from typing import Any
 
@@ -344,7 +344,7 @@ def _server_api_key_fingerprint(key: str) -> str:
     return _fingerprint_pro_api_key(key)
 
 
-def compute_auth_signals(ctx: Any) -> tuple[AuthOrigin, str | None]:
+def compute_auth_signals(ctx: Any, key_state: ClientKeyState | None = None) -> tuple[AuthOrigin, str | None]:
     """Derive the ``(auth_origin, api_key_fingerprint)`` pair for *ctx* in one pass.
 
     Single source of truth for both signals: each precedence branch returns the
@@ -374,8 +374,14 @@ def compute_auth_signals(ctx: Any) -> tuple[AuthOrigin, str | None]:
 
     The raw key is never returned, logged, or used anywhere but as the hash
     input.
+
+    ``key_state``, when given, is the state already extracted from *ctx* (the
+    fused tool pipeline extracts it once per call for both this and
+    :func:`pro_api_key_scope`'s ContextVar); ``ctx`` is then not read again.
     """
-    decision = _apply_key_precedence(extract_client_pro_api_key_from_ctx(ctx))
+    if key_state is None:
+        key_state = extract_client_pro_api_key_from_ctx(ctx)
+    decision = _apply_key_precedence(key_state)
 
     if isinstance(decision, _UseClientKey):
         return "client", _fingerprint_pro_api_key(decision.key)
@@ -575,4 +581,20 @@ def pro_api_key_scope(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awai
         finally:
             _client_key_state.reset(token)
 
+    wrapper.__tool_stage__ = "pro_api_key_scope"
     return wrapper
+
+
+def enter_key_scope(state: ClientKeyState) -> Token[ClientKeyState]:
+    """Record *state* for the current request, as :func:`pro_api_key_scope` does.
+
+    For the fused tool pipeline (``tools/decorators.py``), which has already
+    extracted the state from ``ctx``; pair every call with :func:`exit_key_scope`
+    in ``finally``.
+    """
+    return _client_key_state.set(state)
+
+
+def exit_key_scope(token: Token[ClientKeyState]) -> None:
+    """Restore the key state recorded before the matching :func:`enter_key_scope`."""
+    _client_key_state.reset(token)
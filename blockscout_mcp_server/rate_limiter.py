@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Client-side pacing of upstream requests around HTTP 429 rate limits.
+
+Previously a 429 from the PRO API gateway surfaced as an immediate tool error,
+and under a burst of tool calls the server kept firing requests into a limit it
+had already hit — turning a burst into a wave of errors. This module keeps one
+:class:`PacingBucket` per (PRO API key, upstream host) pair and makes a burst
+degrade into slightly higher latency instead:
+
+* A 429 response's ``Retry-After`` (seconds or HTTP date) blocks the bucket
+  until that moment; the request helper then retries the 429'd request once the
+  block lifts, instead of failing it, as long as the wait fits the budget.
+* A 429 also switches the bucket into *paced* mode: a token bucket whose rate is
+  derived from the throughput actually observed when the limit was hit (the
+  best available estimate of the real limit), so later callers queue briefly
+  instead of provoking the next 429. Pacing lifts again after
+  ``BLOCKSCOUT_RATE_LIMIT_RECOVERY_SECONDS`` without a 429.
+* No caller waits longer than ``BLOCKSCOUT_RATE_LIMIT_MAX_WAIT_SECONDS``; past
+  that the request is sent anyway (a pacing estimate must never turn into an
+  indefinite stall) and a 429 that demands a longer wait is surfaced as before.
+
+``BLOCKSCOUT_RATE_LIMIT_MAX_WAIT_SECONDS=0`` disables pacing entirely. Queue
+depth, waits, and 429 counts are exported via :meth:`RatePacer.snapshot`.
+
+Buckets are keyed by a fingerprint of the effective PRO API key, because the
+gateway enforces limits per key: one tenant's burst must not slow another's.
+The snapshot sums them per upstream host: a key fingerprint identifies a
+customer and must not appear in metrics labels (nor multiply their series).
+At most ``_MAX_TRACKED_BUCKETS`` buckets are kept, least recently used first out.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import time
+from collections import OrderedDict, deque
+from typing import Any
+
+import anyio
+
+from blockscout_mcp_server.client_meta import get_header_case_insensitive
+from blockscout_mcp_server.config import config
+
+# Throughput is measured over this many seconds when a 429 arrives.
+_THROUGHPUT_WINDOW_SECONDS = 10.0
+# The paced rate is this fraction of the throughput that triggered the 429,
+# never below the floor (a single early 429 must not pace to a crawl).
+_PACED_RATE_FACTOR = 0.8
+_MIN_PACED_RPS = 1.0
+# Retry-After assumed when a 429 carries none.
+_DEFAULT_RETRY_AFTER_SECONDS = 1.0
+# (key, host) buckets the pacer remembers; the least recently used is forgotten
+# first, so per-client keys cannot grow the registry without bound.
+_MAX_TRACKED_BUCKETS = 10_000
+
+
+def parse_retry_after(value: Any, now: float | None = None) -> float | None:
+    """Parse a ``Retry-After`` header into seconds from now (delta-seconds or HTTP date)."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    wall_now = now if now is not None else time.time()
+    return max(0.0, parsed.timestamp() - wall_now)
+
+
+class PacingBucket:
+    """Token bucket for one (key, host) pair; unpaced until it observes a 429."""
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.rate: float | None = None
+        self.tokens = 0.0
+        self.last_refill = 0.0
+        self.blocked_until = 0.0
+        self.last_rate_limited = 0.0
+        self._sent: deque[float] = deque()
+        # Observability
+        self.waiting = 0
+        self.waits = 0
+        self.wait_seconds_total = 0.0
+        self.max_wait_seconds = 0.0
+        self.rate_limited = 0
+        self.over_budget = 0
+
+    def _reserve(self, now: float) -> float:
+        """Reserve a send slot and return how long the caller must wait for it."""
+        if self.rate is not None and now - self.last_rate_limited > config.rate_limit_recovery_seconds:
+            self.rate = None
+        wait = max(0.0, self.blocked_until - now)
+        if self.rate is not None:
+            self.tokens = min(self.rate, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            # Tokens may go negative: that is the queue of reservations ahead.
+            token_wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+            wait = max(wait, token_wait)
+            if wait <= config.rate_limit_max_wait_seconds:
+                self.tokens -= 1
+        return wait
+
+    async def acquire(self) -> None:
+        """Wait (briefly) until this bucket allows the next request."""
+        now = time.monotonic()
+        wait = self._reserve(now)
+        if wait > config.rate_limit_max_wait_seconds:
+            self.over_budget += 1
+            wait = 0.0
+        if wait > 0:
+            self.waiting += 1
+            self.waits += 1
+            self.wait_seconds_total += wait
+            self.max_wait_seconds = max(self.max_wait_seconds, wait)
+            try:
+                await anyio.sleep(wait)
+            finally:
+                self.waiting -= 1
+        sent_at = time.monotonic()
+        self._sent.append(sent_at)
+        while self._sent and self._sent[0] < sent_at - _THROUGHPUT_WINDOW_SECONDS:
+            self._sent.popleft()
+
+    def on_rate_limited(self, response: Any) -> float:
+        """Record a 429 and return the number of seconds the upstream asked us to wait."""
+        now = time.monotonic()
+        headers = getattr(response, "headers", {})
+        retry_after = parse_retry_after(get_header_case_insensitive(headers, "retry-after", ""))
+        if retry_after is None:
+            retry_after = _DEFAULT_RETRY_AFTER_SECONDS
+        self.rate_limited += 1
+        self.last_rate_limited = now
+        self.blocked_until = max(self.blocked_until, now + retry_after)
+
+        observed_rps = sum(1 for t in self._sent if t >= now - _THROUGHPUT_WINDOW_SECONDS) / _THROUGHPUT_WINDOW_SECONDS
+        target = max(_MIN_PACED_RPS, observed_rps * _PACED_RATE_FACTOR)
+        self.rate = target if self.rate is None else min(self.rate, target)
+        self.tokens = min(self.tokens, 0.0)
+        self.last_refill = now
+        return retry_after
+
+    def snapshot(self) -> dict[str, object]:
+        now = time.monotonic()
+        return {
+            "paced_rps": round(self.rate, 3) if self.rate is not None else None,
+            "blocked_for_seconds": round(max(0.0, self.blocked_until - now), 3),
+            "queue_depth": self.waiting,
+            "waits": self.waits,
+            "wait_seconds_total": round(self.wait_seconds_total, 3),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+            "rate_limited": self.rate_limited,
+            "over_budget": self.over_budget,
+        }
+
+
+class RatePacer:
+    """Registry of pacing buckets keyed by (PRO API key fingerprint, host)."""
+
+    def __init__(self) -> None:
+        self._buckets: OrderedDict[tuple[str, str], PacingBucket] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return config.rate_limit_max_wait_seconds > 0
+
+    def bucket(self, key_fingerprint: str, host: str) -> PacingBucket:
+        key = (key_fingerprint, host)
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            self._buckets.move_to_end(key)
+            return bucket
+        bucket = self._buckets[key] = PacingBucket(host)
+        if len(self._buckets) > _MAX_TRACKED_BUCKETS:
+            self._buckets.popitem(last=False)
+        return bucket
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def snapshot(self) -> dict[str, dict[str, object]]:
+        """Return the pacing state per upstream host, summed over the keys' buckets."""
+        hosts: dict[str, dict[str, Any]] = {}
+        for bucket in self._buckets.values():
+            state = bucket.snapshot()
+            total = hosts.get(bucket.label)
+            if total is None:
+                hosts[bucket.label] = {**state, "buckets": 1}
+                continue
+            total["buckets"] += 1
+            for field in ("queue_depth", "waits", "rate_limited", "over_budget"):
+                total[field] += state[field]
+            total["wait_seconds_total"] = round(total["wait_seconds_total"] + state["wait_seconds_total"], 3)
+            for field in ("blocked_for_seconds", "max_wait_seconds"):
+                total[field] = max(total[field], state[field])
+            rates = [rate for rate in (total["paced_rps"], state["paced_rps"]) if rate is not None]
+            total["paced_rps"] = min(rates, default=None)
+        return hosts
+
+
+rate_pacer = RatePacer()
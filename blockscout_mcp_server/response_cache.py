@@ -0,0 +1,313 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Immutability-aware cache for PRO API GET responses.
+
+Much of what the tools fetch never changes once it is final: a confirmed
+transaction, a block buried below the chain's finality depth, or the
+``getblocknobytime`` answer for a block that is already final. Fully verified
+contracts are not strictly immutable (proxies can be upgraded, metadata can be
+refreshed) but change rarely enough to deserve a long TTL. This module caches
+those responses underneath ``make_blockscout_request`` so repeated analyses stop
+paying latency and PRO API credits for data that cannot have changed.
+
+Rules are per endpoint (:data:`_RULES`). Each rule recognises a path and decides,
+from the decoded body, whether the response is final (cached without expiry),
+cacheable for a bounded TTL, or not cacheable. Responses from endpoints without a
+rule are never cached. Finality is judged against a per-chain *head* that the
+cache learns passively from the responses it sees (block heights, transaction
+confirmations). The head only ever moves forward, so a stale head makes the cache
+more conservative, never less. Until a chain's head has been observed, blocks and
+``getblocknobytime`` answers for that chain are treated as not yet final.
+
+Entries hold the raw response body; every hit decodes a fresh copy, so callers
+may mutate what they receive. A cached transaction's ``confirmations`` count is
+brought up to the head known at the time of the hit, so a final transaction
+served from the cache keeps counting confirmations as the chain advances. Memory is bounded by total body bytes with LRU
+eviction. Entries whose TTL has elapsed are kept (until evicted) so they can be
+served as a last resort when the upstream fails with a transport error, a 429, or
+a 5xx — *stale-if-error*, bounded by ``BLOCKSCOUT_RESPONSE_CACHE_STALE_IF_ERROR_SECONDS``.
+
+Cache keys deliberately exclude the PRO API key: the cached data is public chain
+data and a hit makes no upstream request, the same reasoning the contract cache
+applies. The key requirement and chain validation in ``make_blockscout_request``
+still run before any lookup.
+
+Configuration:
+
+* ``BLOCKSCOUT_RESPONSE_CACHE_MAX_BYTES`` – total body budget; ``0`` disables the cache
+* ``BLOCKSCOUT_RESPONSE_CACHE_FINALITY_DEPTH`` – default confirmations/blocks for finality
+* ``BLOCKSCOUT_RESPONSE_CACHE_FINALITY_DEPTHS`` – per-chain overrides, e.g. ``"1:64,137:256"``
+* ``BLOCKSCOUT_RESPONSE_CACHE_CONTRACT_TTL_SECONDS`` – TTL for fully verified contracts
+* ``BLOCKSCOUT_RESPONSE_CACHE_MUTABLE_TTL_SECONDS`` – TTL for not-yet-final responses
+  of cacheable endpoints; ``0`` (default) does not cache them
+* ``BLOCKSCOUT_RESPONSE_CACHE_STALE_IF_ERROR_SECONDS`` – how long past expiry an entry
+  may still be served when the upstream fails
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from blockscout_mcp_server import json_codec
+from blockscout_mcp_server.config import config
+
+logger = logging.getLogger(__name__)
+
+# A single response may use at most this fraction of the byte budget, so one
+# huge payload cannot flush the whole cache.
+_MAX_ENTRY_FRACTION = 16
+
+# TTL sentinel for final (never expiring) responses.
+FINAL = math.inf
+
+
+@dataclass(slots=True)
+class _Entry:
+    body: bytes
+    expires_at: float
+
+
+def _exceeds(entry: _Entry, max_bytes: int | None) -> bool:
+    return max_bytes is not None and len(entry.body) > max_bytes
+
+
+def _as_int(value: Any) -> int | None:
+    """Parse an int from the int or numeric-string fields Blockscout returns."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value, 0) if value.startswith("0x") else int(value)
+        except ValueError:
+            return None
+    return None
+
+
+def finality_depth(chain_id: str) -> int:
+    """Return the finality depth for *chain_id*, honouring per-chain overrides."""
+    for item in config.response_cache_finality_depths.split(","):
+        chain, sep, depth = item.strip().partition(":")
+        if sep and chain.strip() == chain_id:
+            parsed = _as_int(depth.strip())
+            if parsed is not None and parsed >= 0:
+                return parsed
+    return config.response_cache_finality_depth
+
+
+class UpstreamResponseCache:
+    """Byte-bounded LRU of raw PRO API response bodies with finality-aware TTLs."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple[str, str, str], _Entry] = OrderedDict()
+        self._chain_heads: dict[str, int] = {}
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return config.response_cache_max_bytes > 0
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._chain_heads.clear()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the cache counters and occupancy."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+        }
+
+    @staticmethod
+    def make_key(chain_id: str, api_path: str, params: dict[str, Any] | None) -> tuple[str, str, str]:
+        normalized_params = json_codec.dumps(params or {}, sort_keys=True, default=str)
+        return (chain_id, api_path, normalized_params)
+
+    def chain_head(self, chain_id: str) -> int | None:
+        return self._chain_heads.get(chain_id)
+
+    def observe_head(self, chain_id: str, height: int | None) -> None:
+        """Advance the known head of *chain_id* to *height* if it is higher."""
+        if height is None:
+            return
+        if height > self._chain_heads.get(chain_id, -1):
+            self._chain_heads[chain_id] = height
+
+    def is_final_height(self, chain_id: str, height: int | None) -> bool:
+        head = self._chain_heads.get(chain_id)
+        if height is None or head is None:
+            return False
+        return height <= head - finality_depth(chain_id)
+
+    def get(self, key: tuple[str, str, str], *, max_bytes: int | None = None) -> Any | None:
+        """Return a fresh copy of the cached body for *key*, or ``None`` on a miss.
+
+        An entry whose body is larger than *max_bytes* counts as a miss, so a
+        byte-capped caller gets the same ``ResponseTooLargeError`` it would get
+        from the upstream.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic() or _exceeds(entry, max_bytes):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return self._refresh(key, json_codec.loads(entry.body))
+
+    def get_stale(self, key: tuple[str, str, str], *, max_bytes: int | None = None) -> Any | None:
+        """Return an expired entry still inside the stale-if-error window, or ``None``."""
+        entry = self._entries.get(key)
+        if entry is None or _exceeds(entry, max_bytes):
+            return None
+        if time.monotonic() > entry.expires_at + config.response_cache_stale_if_error_seconds:
+            return None
+        self.stale_hits += 1
+        return self._refresh(key, json_codec.loads(entry.body))
+
+    def _refresh(self, key: tuple[str, str, str], data: Any) -> Any:
+        """Update the parts of a cached body that follow the chain head rather than the response."""
+        chain_id, api_path, _ = key
+        if isinstance(data, dict) and _TX_PATH.match(api_path):
+            head = self._chain_heads.get(chain_id)
+            block_number = _as_int(data.get("block_number"))
+            confirmations = _as_int(data.get("confirmations"))
+            if head is not None and block_number is not None and confirmations is not None:
+                data["confirmations"] = max(confirmations, head - block_number + 1)
+        return data
+
+    def store(self, chain_id: str, api_path: str, params: dict[str, Any] | None, body: bytes | None, data: Any) -> None:
+        """Apply the endpoint rules to a successful response and cache it if allowed."""
+        self._observe_heads(chain_id, api_path, data)
+        ttl = self._ttl_for(chain_id, api_path, params, data)
+        if not ttl or ttl <= 0:
+            return
+        if not isinstance(body, bytes):
+            return
+        size = len(body)
+        if size > config.response_cache_max_bytes // _MAX_ENTRY_FRACTION:
+            return
+
+        key = self.make_key(chain_id, api_path, params)
+        existing = self._entries.pop(key, None)
+        if existing is not None:
+            self.total_bytes -= len(existing.body)
+        self._entries[key] = _Entry(body=body, expires_at=time.monotonic() + ttl)
+        self.total_bytes += size
+        self.stores += 1
+        while self.total_bytes > config.response_cache_max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= len(evicted.body)
+            self.evictions += 1
+
+    def _ttl_for(self, chain_id: str, api_path: str, params: dict[str, Any] | None, data: Any) -> float | None:
+        if not isinstance(data, dict):
+            return None
+        for pattern, rule in _RULES:
+            if pattern.match(api_path):
+                return rule(self, chain_id, params or {}, data)
+        return None
+
+    def _observe_heads(self, chain_id: str, api_path: str, data: Any) -> None:
+        if isinstance(data, list) and api_path.rstrip("/") == "/api/v2/main-page/blocks":
+            heights = [_as_int(item.get("height")) for item in data if isinstance(item, dict)]
+            self.observe_head(chain_id, max((h for h in heights if h is not None), default=None))
+        elif isinstance(data, dict):
+            if _BLOCK_PATH.match(api_path):
+                self.observe_head(chain_id, _as_int(data.get("height")))
+            elif _TX_PATH.match(api_path):
+                block_number = _as_int(data.get("block_number"))
+                confirmations = _as_int(data.get("confirmations"))
+                if block_number is not None and confirmations:
+                    self.observe_head(chain_id, block_number + confirmations - 1)
+
+
+def _mutable_ttl() -> float | None:
+    return config.response_cache_mutable_ttl_seconds or None
+
+
+def _transaction_rule(cache: UpstreamResponseCache, chain_id: str, params: dict, data: dict) -> float | None:
+    # ``status`` is null while the transaction is pending.
+    confirmations = _as_int(data.get("confirmations"))
+    if data.get("status") in ("ok", "error") and confirmations is not None:
+        if confirmations >= finality_depth(chain_id):
+            return FINAL
+    return _mutable_ttl()
+
+
+def _block_rule(cache: UpstreamResponseCache, chain_id: str, params: dict, data: dict) -> float | None:
+    if cache.is_final_height(chain_id, _as_int(data.get("height"))):
+        return FINAL
+    return _mutable_ttl()
+
+
+def _smart_contract_rule(cache: UpstreamResponseCache, chain_id: str, params: dict, data: dict) -> float | None:
+    # Verified sources do not change, but proxy implementations and metadata can,
+    # so even fully verified contracts get a (long) TTL rather than finality.
+    if data.get("is_fully_verified") is True:
+        return config.response_cache_contract_ttl_seconds or None
+    return _mutable_ttl()
+
+
+def _legacy_api_rule(cache: UpstreamResponseCache, chain_id: str, params: dict, data: dict) -> float | None:
+    if params.get("module") != "block" or params.get("action") != "getblocknobytime":
+        return None
+    result = data.get("result")
+    if data.get("status") != "1" or not isinstance(result, dict):
+        return None
+    if cache.is_final_height(chain_id, _as_int(result.get("blockNumber"))):
+        return FINAL
+    return _mutable_ttl()
+
+
+_TX_PATH = re.compile(r"^/api/v2/transactions/0x[0-9a-fA-F]{64}/?$")
+_BLOCK_PATH = re.compile(r"^/api/v2/blocks/[^/]+/?$")
+
+_RULES: list[tuple[re.Pattern[str], Callable[[UpstreamResponseCache, str, dict, dict], float | None]]] = [
+    (_TX_PATH, _transaction_rule),
+    (_BLOCK_PATH, _block_rule),
+    (re.compile(r"^/api/v2/smart-contracts/0x[0-9a-fA-F]{40}/?$"), _smart_contract_rule),
+    (re.compile(r"^/api/?$"), _legacy_api_rule),
+]
+
+
+def is_stale_servable_error(error: Exception) -> bool:
+    """Return ``True`` for upstream failures that may be answered from a stale entry.
+
+    Transport errors, rate limiting, and server errors qualify. Other client
+    errors (including 402 credit exhaustion, which is not an ``HTTPStatusError``)
+    describe the request itself and are always surfaced.
+    """
+    if isinstance(error, httpx.RequestError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        status = getattr(error.response, "status_code", None)
+        return isinstance(status, int) and (status == 429 or status >= 500)
+    return False
+
+
+response_cache = UpstreamResponseCache()
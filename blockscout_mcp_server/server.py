@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: LicenseRef-Blockscout
 import json
 import logging
+import os
 from collections.abc import Iterable
 from functools import wraps
 from pathlib import Path
@@ -13,11 +14,13 @@ from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.transport_security import TransportSecuritySettings
 from mcp.types import CallToolResult, TextContent, ToolAnnotations
 from pydantic import AnyUrl
+from starlette.applications import Starlette
 from starlette.middleware.cors import CORSMiddleware
 
 from blockscout_mcp_server import analytics, observability
 from blockscout_mcp_server.api.routes import register_api_routes
-from blockscout_mcp_server.client_meta import extract_client_meta_from_ctx, is_summary_content_client
+from blockscout_mcp_server.call_context import call_context, use_call_context
+from blockscout_mcp_server.client_meta import is_summary_content_client
 from blockscout_mcp_server.config import config
 from blockscout_mcp_server.constants import (
     DEFAULT_HTTP_PORT,
@@ -28,8 +31,10 @@ from blockscout_mcp_server.constants import (
 )
 from blockscout_mcp_server.logging_utils import (
     install_client_disconnect_filter,
+    log_pipeline,
     replace_rich_handlers_with_standard,
 )
+from blockscout_mcp_server.models import serialize_tool_response
 from blockscout_mcp_server.resources import skill_resources
 from blockscout_mcp_server.session_lifecycle import (
     SessionStartupError,
@@ -38,7 +43,7 @@ from blockscout_mcp_server.session_lifecycle import (
     validate_gated_startup,
     wire_lifespan,
 )
-from blockscout_mcp_server.session_store import SessionStoreInitializationError
+from blockscout_mcp_server.session_store import SessionStoreInitializationError, close_store
 from blockscout_mcp_server.tools.address.get_address_info import get_address_info
 from blockscout_mcp_server.tools.address.get_tokens_by_address import get_tokens_by_address
 from blockscout_mcp_server.tools.address.nft_tokens_by_address import nft_tokens_by_address
@@ -156,29 +161,39 @@ Blockscout MCP server version: {SERVER_VERSION}
 """
 
 
-def _is_summary_needed(*args, **kwargs) -> bool:
+def _find_ctx(*args, **kwargs):
     ctx = kwargs.get("ctx")
     if ctx is None:
         ctx = next((arg for arg in args if type(arg).__name__ == "Context"), None)
+    return ctx
+
+
+def _is_summary_needed(*args, **kwargs) -> bool:
+    ctx = _find_ctx(*args, **kwargs)
     if ctx is None:
         return False
 
-    meta = extract_client_meta_from_ctx(ctx)
-    return is_summary_content_client(meta)
+    # Shares the client metadata the tool pipeline already extracted for this call.
+    return is_summary_content_client(call_context(ctx).client_meta)
 
 
-def _generate_content(tool_response, structured_dict: dict, *args, **kwargs) -> str:
+def _generate_content(tool_response, *args, **kwargs) -> str:
     if _is_summary_needed(*args, **kwargs):
         return tool_response.content_text or "Tool executed successfully."
-    return json.dumps(structured_dict, ensure_ascii=False, separators=(",", ":"))
+    return serialize_tool_response(tool_response).decode("utf-8")
 
 
 def _wrap_tool_for_structured_output(tool_function):
     @wraps(tool_function)
     async def _wrapped_tool(*args, **kwargs):
-        tool_response = await tool_function(*args, **kwargs)
-        structured = tool_response.model_dump(mode="json", by_alias=True)
-        content_text = _generate_content(tool_response, structured, *args, **kwargs)
+        # Open the call context here so the tool pipeline and the summary check
+        # below derive the request facts of this call once between them.
+        with use_call_context(_find_ctx(*args, **kwargs)):
+            tool_response = await tool_function(*args, **kwargs)
+            # The protocol needs structuredContent as a dict; the text block is the
+            # single native JSON encoding of the same response, not a re-encoding of it.
+            structured = tool_response.model_dump(mode="json", by_alias=True)
+            content_text = _generate_content(tool_response, *args, **kwargs)
         return CallToolResult(
             content=[TextContent(type="text", text=content_text)],
             structuredContent=structured,
@@ -349,6 +364,59 @@ replace_rich_handlers_with_standard()
 install_client_disconnect_filter()
 
 # Create a Typer application for our CLI
+# Carries the CLI-derived HTTP options from the supervisor to `--workers` processes,
+# which Uvicorn spawns fresh: they rebuild the app in `create_worker_app`.
+_WORKER_OPTIONS_ENV = "_BLOCKSCOUT_MCP_WORKER_OPTIONS"
+
+
+def _build_http_app(*, rest: bool, gate_enabled: bool) -> Starlette:
+    """Configure the shared `mcp` instance for HTTP mode and return its ASGI app."""
+    if rest:
+        register_api_routes(mcp)
+
+    # Configure the existing 'mcp' instance for stateless HTTP with JSON responses
+    mcp.settings.stateless_http = True  # Enable stateless mode
+    # JSON response mode (configurable via BLOCKSCOUT_DEV_JSON_RESPONSE)
+    # False (default): Enables SSE and progress notifications (production mode)
+    # True: Returns plain JSON for easier testing with curl/Insomnia (dev mode)
+    mcp.settings.json_response = config.dev_json_response
+    # Enable analytics in HTTP mode
+    analytics.set_http_mode(True)
+
+    asgi_app = mcp.streamable_http_app()
+
+    # Wrap ASGI application with CORS middleware to expose Mcp-Session-Id header
+    # for browser-based clients (ensures 500 errors get proper CORS headers)
+    # See: https://github.com/modelcontextprotocol/python-sdk/pull/1059
+    asgi_app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # Configure this more restrictively if needed
+        allow_methods=["GET", "POST", "OPTIONS", "HEAD"],
+        allow_headers=["*"],
+        expose_headers=["mcp-session-id"],  # Allow client to read session ID
+        max_age=86400,
+    )
+
+    wire_lifespan(asgi_app, gate_enabled=gate_enabled, refresh_snapshots=config.snapshot_refresh_enabled)
+    return asgi_app
+
+
+def create_worker_app() -> Starlette:
+    """Uvicorn app factory for `--workers` mode, called once in every worker process.
+
+    Startup validation, the status log lines, and session store schema creation
+    already ran once in the supervisor; a worker only opens its own store
+    connection and builds the app.
+    """
+    log_pipeline.install()
+    options = json.loads(os.environ[_WORKER_OPTIONS_ENV])
+    mcp.settings.transport_security = _resolve_transport_security(options["http_host"])
+    gate_enabled = bool(config.session_secret)
+    if gate_enabled:
+        initialize_gated_store()
+    return _build_http_app(rest=options["rest"], gate_enabled=gate_enabled)
+
+
 cli_app = typer.Typer()
 
 
@@ -363,6 +431,10 @@ def main_command(
         int | None,
         typer.Option("--http-port", help="Port for HTTP server if --http is used."),
     ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", min=1, help="Number of HTTP worker processes (requires --http)."),
+    ] = None,
 ):
     """Blockscout MCP Server. Runs in stdio mode by default.
     Use --http to enable HTTP Streamable mode.
@@ -374,6 +446,8 @@ def main_command(
     # Reject --rest without --http early, before any startup work (including the diagnostic).
     if rest and not http and mcp_transport != "http":
         raise typer.BadParameter("The --rest flag can only be used with the --http flag.")
+    if workers is not None and not http and mcp_transport != "http":
+        raise typer.BadParameter("The --workers flag can only be used with the --http flag.")
 
     # Detect whether the env var (not the CLI flag) triggered HTTP mode.
     env_triggered = not http and mcp_transport == "http"
@@ -400,6 +474,8 @@ def main_command(
 
     mcp.settings.transport_security = _resolve_transport_security(final_http_host)
 
+    log_pipeline.install()
+
     # Emit single startup diagnostics about the server-side PRO API key status and the
     # bundled skill version, now that logging is fully configured.
     _log_pro_api_key_status()
@@ -407,20 +483,17 @@ def main_command(
     log_session_gating_status(run_in_http)
 
     if run_in_http:
+        final_workers = workers if workers is not None else config.http_workers
+        worker_note = f" with {final_workers} workers" if final_workers > 1 else ""
         if rest:
-            typer.echo(f"Starting Blockscout MCP Server with REST API on {final_http_host}:{final_http_port}")
-            register_api_routes(mcp)
+            typer.echo(
+                f"Starting Blockscout MCP Server with REST API on {final_http_host}:{final_http_port}{worker_note}"
+            )
         else:
-            typer.echo(f"Starting Blockscout MCP Server in HTTP Streamable mode on {final_http_host}:{final_http_port}")
-
-        # Configure the existing 'mcp' instance for stateless HTTP with JSON responses
-        mcp.settings.stateless_http = True  # Enable stateless mode
-        # JSON response mode (configurable via BLOCKSCOUT_DEV_JSON_RESPONSE)
-        # False (default): Enables SSE and progress notifications (production mode)
-        # True: Returns plain JSON for easier testing with curl/Insomnia (dev mode)
-        mcp.settings.json_response = config.dev_json_response
-        # Enable analytics in HTTP mode
-        analytics.set_http_mode(True)
+            typer.echo(
+                "Starting Blockscout MCP Server in HTTP Streamable mode on "
+                f"{final_http_host}:{final_http_port}{worker_note}"
+            )
 
         gate_enabled = bool(config.session_secret)
         if gate_enabled:
@@ -430,27 +503,28 @@ def main_command(
             # These are operator configuration errors: surface the message cleanly
             # and exit non-zero instead of dumping a traceback.
             try:
-                validate_gated_startup()
+                validate_gated_startup(workers=final_workers)
                 initialize_gated_store()
             except (SessionStartupError, SessionStoreInitializationError) as exc:
                 typer.echo(f"Session gating startup failed: {exc}", err=True)
                 raise typer.Exit(code=1) from exc
 
-        asgi_app = mcp.streamable_http_app()
-
-        # Wrap ASGI application with CORS middleware to expose Mcp-Session-Id header
-        # for browser-based clients (ensures 500 errors get proper CORS headers)
-        # See: https://github.com/modelcontextprotocol/python-sdk/pull/1059
-        asgi_app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],  # Configure this more restrictively if needed
-            allow_methods=["GET", "POST", "OPTIONS", "HEAD"],
-            allow_headers=["*"],
-            expose_headers=["mcp-session-id"],  # Allow client to read session ID
-            max_age=86400,
-        )
+        if final_workers > 1:
+            # The supervisor only validated the setup and created the store's
+            # schema; every worker opens its own connection in `create_worker_app`.
+            if gate_enabled:
+                close_store()
+            os.environ[_WORKER_OPTIONS_ENV] = json.dumps({"rest": rest, "http_host": final_http_host})
+            uvicorn.run(
+                "blockscout_mcp_server.server:create_worker_app",
+                factory=True,
+                workers=final_workers,
+                host=final_http_host,
+                port=final_http_port,
+            )
+            return
 
-        wire_lifespan(asgi_app, gate_enabled=gate_enabled)
+        asgi_app = _build_http_app(rest=rest, gate_enabled=gate_enabled)
         uvicorn.run(asgi_app, host=final_http_host, port=final_http_port)
     else:
         # This is the original behavior: run in stdio mode
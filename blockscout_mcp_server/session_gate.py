@@ -59,7 +59,7 @@ from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
 from typing import Any
 
-from blockscout_mcp_server import analytics
+from blockscout_mcp_server import analytics, metrics
 from blockscout_mcp_server.config import config
 from blockscout_mcp_server.constants import (
     SESSION_ID_REQUIRED_MESSAGE,
@@ -323,17 +323,17 @@ def get_effective_max_calls() -> int | None:
 # ---------------------------------------------------------------------------
 
 
-def _effective_ceiling(ctx: Any) -> int:
+def _effective_ceiling(call_source: str) -> int:
     """Return the call's effective ceiling, resolved from its surface.
 
-    `config.session_rest_max_calls` applies if and only if
-    `analytics.get_call_source(ctx)` returns exactly `"rest"` (Overview, decision
+    `config.session_rest_max_calls` applies if and only if the call source
+    (`analytics.get_call_source(ctx)`) is exactly `"rest"` (Overview, decision
     2); any other value — no marker, empty string, an unexpected marker, or the
     defensive `"unknown"` fallback — selects `config.session_mcp_max_calls` (the
     agent-facing default). Read from `config` at call time, like every other
     consumer, so a runtime config change takes effect on the next call.
     """
-    if analytics.get_call_source(ctx) == "rest":
+    if call_source == "rest":
         return config.session_rest_max_calls
     return config.session_mcp_max_calls
 
@@ -348,7 +348,8 @@ def _effective_ceiling(ctx: Any) -> int:
 # agent-facing nudge) — the tool body is never invoked on a store fault, so no
 # fault direction yields unmetered access. `_refund` is the one exception:
 # it must never raise, because a failed refund must not mask the tool's own
-# error (see `session_gate`'s docstring).
+# error (see `session_gate`'s docstring). Each access is timed into the
+# session-store latency histogram served at `/metrics`.
 
 
 def _log_store_fault(operation: str, exc: Exception) -> None:
@@ -357,7 +358,8 @@ def _log_store_fault(operation: str, exc: Exception) -> None:
 
 def _increment(random_part: str, issued_at: int, max_calls: int) -> int | None:
     try:
-        return get_store().check_and_increment(random_part, issued_at, max_calls)
+        with metrics.session_store_duration.time("check_and_increment"):
+            return get_store().check_and_increment(random_part, issued_at, max_calls)
     except Exception as exc:
         _log_store_fault("check_and_increment", exc)
         raise SessionStoreUnavailableError() from exc
@@ -365,7 +367,8 @@ def _increment(random_part: str, issued_at: int, max_calls: int) -> int | None:
 
 def _read_calls(random_part: str) -> int:
     try:
-        return get_store().get_calls(random_part)
+        with metrics.session_store_duration.time("get_calls"):
+            return get_store().get_calls(random_part)
     except Exception as exc:
         _log_store_fault("get_calls", exc)
         raise SessionStoreUnavailableError() from exc
@@ -374,7 +377,8 @@ def _read_calls(random_part: str) -> int:
 def _refund(random_part: str) -> None:
     """Best-effort refund. Never raises — a failed refund must not mask the tool's own error."""
     try:
-        get_store().refund(random_part)
+        with metrics.session_store_duration.time("refund"):
+            get_store().refund(random_part)
     except Exception as exc:
         _log_store_fault("refund", exc)
 
@@ -433,6 +437,82 @@ def _extract_session_id_and_ctx(
     return arguments.get("session_id", None), arguments.get("ctx", None)
 
 
+# ---------------------------------------------------------------------------
+# Gated call bodies
+# ---------------------------------------------------------------------------
+#
+# Everything the two decorators do once a call is known to be gated and not
+# exempt. Split out so the fused tool pipeline (`tools/decorators.py`), which
+# binds the arguments and resolves the call source once for the whole call,
+# runs exactly the same steps without a second `bind_partial`.
+
+
+async def run_metered(
+    func: Callable[..., Awaitable[Any]],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    session_id: str | None,
+    call_source: str,
+) -> Any:
+    """Run steps 3-9 of `session_gate` around `func(*args, **kwargs)`."""
+    effective_ceiling = _effective_ceiling(call_source)
+
+    if effective_ceiling == 0:
+        raise SessionBudgetExhaustedError()
+
+    if not session_id:
+        raise SessionIdMissingError()
+
+    random_part, issued_at = verify_token(session_id)
+
+    calls = _increment(random_part, issued_at, effective_ceiling)
+    if calls is None:
+        raise SessionBudgetExhaustedError()
+
+    budget_token = _remaining_budget.set(effective_ceiling - calls)
+    max_calls_token = _effective_max_calls.set(effective_ceiling)
+    try:
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as exc:
+            if not _refund_exempt(exc):
+                _refund(random_part)
+            raise
+    finally:
+        _remaining_budget.reset(budget_token)
+        _effective_max_calls.reset(max_calls_token)
+
+    return _inject_session_id_into_pagination(result, session_id)
+
+
+async def run_unmetered(
+    func: Callable[..., Awaitable[Any]],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    session_id: str | None,
+    call_source: str,
+) -> Any:
+    """Run the gated steps of `session_gate_unmetered` around `func(*args, **kwargs)`."""
+    if not session_id:
+        raise SessionIdMissingError()
+
+    random_part, _issued_at = verify_token(session_id)
+
+    effective_ceiling = _effective_ceiling(call_source)
+    calls = _read_calls(random_part)
+    remaining = max(0, effective_ceiling - calls)
+
+    budget_token = _remaining_budget.set(remaining)
+    max_calls_token = _effective_max_calls.set(effective_ceiling)
+    try:
+        result = await func(*args, **kwargs)
+    finally:
+        _remaining_budget.reset(budget_token)
+        _effective_max_calls.reset(max_calls_token)
+
+    return _inject_session_id_into_pagination(result, session_id)
+
+
 # ---------------------------------------------------------------------------
 # The metered decorator
 # ---------------------------------------------------------------------------
@@ -489,35 +569,9 @@ def session_gate(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable
             return await func(*args, **kwargs)
 
         session_id, ctx = _extract_session_id_and_ctx(sig, args, kwargs)
-        effective_ceiling = _effective_ceiling(ctx)
-
-        if effective_ceiling == 0:
-            raise SessionBudgetExhaustedError()
-
-        if not session_id:
-            raise SessionIdMissingError()
-
-        random_part, issued_at = verify_token(session_id)
-
-        calls = _increment(random_part, issued_at, effective_ceiling)
-        if calls is None:
-            raise SessionBudgetExhaustedError()
-
-        budget_token = _remaining_budget.set(effective_ceiling - calls)
-        max_calls_token = _effective_max_calls.set(effective_ceiling)
-        try:
-            try:
-                result = await func(*args, **kwargs)
-            except BaseException as exc:
-                if not _refund_exempt(exc):
-                    _refund(random_part)
-                raise
-        finally:
-            _remaining_budget.reset(budget_token)
-            _effective_max_calls.reset(max_calls_token)
-
-        return _inject_session_id_into_pagination(result, session_id)
+        return await run_metered(func, args, kwargs, session_id, analytics.get_call_source(ctx))
 
+    wrapper.__tool_stage__ = "session_gate"
     return wrapper
 
 
@@ -558,23 +612,7 @@ def session_gate_unmetered(func: Callable[..., Awaitable[Any]]) -> Callable[...,
             return await func(*args, **kwargs)
 
         session_id, ctx = _extract_session_id_and_ctx(sig, args, kwargs)
-        if not session_id:
-            raise SessionIdMissingError()
-
-        random_part, _issued_at = verify_token(session_id)
-
-        effective_ceiling = _effective_ceiling(ctx)
-        calls = _read_calls(random_part)
-        remaining = max(0, effective_ceiling - calls)
-
-        budget_token = _remaining_budget.set(remaining)
-        max_calls_token = _effective_max_calls.set(effective_ceiling)
-        try:
-            result = await func(*args, **kwargs)
-        finally:
-            _remaining_budget.reset(budget_token)
-            _effective_max_calls.reset(max_calls_token)
-
-        return _inject_session_id_into_pagination(result, session_id)
+        return await run_unmetered(func, args, kwargs, session_id, analytics.get_call_source(ctx))
 
+    wrapper.__tool_stage__ = "session_gate_unmetered"
     return wrapper
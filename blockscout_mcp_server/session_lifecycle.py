@@ -3,7 +3,8 @@
 
 This module is the composed lifespan owner for the HTTP ASGI app: it validates
 gated-startup preconditions, initializes/closes the session store, emits the
-startup status lines, and runs the periodic expiry sweep. It also carries the
+startup status lines, and runs the periodic expiry sweep and the background
+snapshot refresher (``snapshot_refresher.py``). It also carries the
 relocated ``WEB3_POOL`` shutdown closure — this module is the one place that
 owns "what happens across the whole HTTP app's lifetime", not only the session
 pieces, because ``mcp.streamable_http_app()`` builds its Starlette app with a
@@ -29,23 +30,41 @@ distinct:
 Runtime policy after startup is degraded-mode only: once the store has
 initialized, a sweep fault is logged and swallowed, never raised. The only
 fail-fast boundary is startup validation before Uvicorn ever binds a socket.
+
+With ``--workers N`` every worker process runs this lifespan against its own
+store connection, but only one of them sweeps: the holder of an exclusive
+``flock`` on ``<session db>.sweep-lock`` (see :func:`_holds_sweep_lease`). The
+lease is re-contested on every pass, so a replacement worker takes over when
+the holder exits.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from collections.abc import AsyncIterator, Callable
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from pathlib import Path
 
 from starlette.applications import Starlette
 
-from blockscout_mcp_server import session_store
+from blockscout_mcp_server import metrics, session_store
+from blockscout_mcp_server.analytics_queue import analytics_queue
+from blockscout_mcp_server.cache import contract_cache
+from blockscout_mcp_server.community_ingest import community_ingest
 from blockscout_mcp_server.config import config
+from blockscout_mcp_server.http_pool import HTTP_POOL
 from blockscout_mcp_server.session_store import SessionStore, close_store, initialize_store
+from blockscout_mcp_server.snapshot_refresher import snapshot_refresher
+from blockscout_mcp_server.telemetry_dispatcher import telemetry_dispatcher
 from blockscout_mcp_server.web3_pool import WEB3_POOL
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 # Batch size for a single `sweep_batch` call during a sweep pass. A module-level
@@ -58,9 +77,11 @@ class SessionStartupError(Exception):
     """Raised when gated HTTP startup validation fails (fail-fast, pre-Uvicorn)."""
 
 
-def validate_gated_startup() -> None:
+def validate_gated_startup(workers: int = 1) -> None:
     """Validate all preconditions for gated HTTP startup.
 
+    ``workers`` is the number of HTTP worker processes about to serve.
+
     Raises:
         SessionStartupError: naming the offending setting, if any precondition
             is not met. Must be called, and must succeed, before
@@ -107,6 +128,13 @@ def validate_gated_startup() -> None:
             "metered call would fail and be refunded before reaching upstream."
         )
 
+    if config.session_flush_interval_seconds > 0 and workers > 1:
+        raise SessionStartupError(
+            "BLOCKSCOUT_SESSION_FLUSH_INTERVAL_SECONDS keeps session counters in process memory, "
+            f"so it cannot be combined with {workers} worker processes: each would enforce the "
+            "ceiling against its own counters. Set it to 0 or run a single worker."
+        )
+
 
 def initialize_gated_store() -> SessionStore:
     """Initialize the session store for gated HTTP startup.
@@ -159,19 +187,65 @@ def log_session_gating_status(run_in_http: bool) -> None:
         )
 
 
+# File descriptor and path of the sweep lease this process holds, if any.
+_sweep_lease: tuple[int, str] | None = None
+
+
+def _holds_sweep_lease() -> bool:
+    """Return whether this process is the one that sweeps the session store.
+
+    Worker processes sharing one database contend for a non-blocking exclusive
+    ``flock`` on a file next to it; the lock is released by the kernel when the
+    holder exits, so a later pass elsewhere picks it up. Without a configured
+    path (or on platforms without ``fcntl``) every process sweeps, which is
+    still correct — deletions are idempotent — just redundant.
+    """
+    global _sweep_lease
+    path = f"{config.session_db_path}.sweep-lock" if config.session_db_path else ""
+    if not path or fcntl is None:
+        return True
+    if _sweep_lease is not None:
+        if _sweep_lease[1] == path:
+            return True
+        _release_sweep_lease()
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    except OSError:
+        logger.warning("Cannot open the sweep lease file %s; sweeping from this process.", path)
+        return True
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return False
+    _sweep_lease = (fd, path)
+    return True
+
+
+def _release_sweep_lease() -> None:
+    global _sweep_lease
+    if _sweep_lease is not None:
+        os.close(_sweep_lease[0])
+        _sweep_lease = None
+
+
 async def run_sweep_pass() -> None:
     """Run one full sweep pass, draining the expiry backlog in batches.
 
     Loops ``sweep_batch(SWEEP_BATCH_SIZE)`` until nothing more is deleted,
     yielding the event loop between batches so a large expiry cohort never
-    stalls in-flight requests. Never raises: a failure is logged at ERROR and
+    stalls in-flight requests. A worker that does not hold the sweep lease
+    returns immediately. Never raises: a failure is logged at ERROR and
     swallowed, since the sweep has no caller to answer to and correctness
     never depends on it running (only garbage collection does).
     """
     try:
+        if not _holds_sweep_lease():
+            return
         store = session_store.get_store()
         while True:
-            deleted = store.sweep_batch(SWEEP_BATCH_SIZE)
+            with metrics.session_store_duration.time("sweep_batch"):
+                deleted = store.sweep_batch(SWEEP_BATCH_SIZE)
             if deleted < SWEEP_BATCH_SIZE:
                 break
             await asyncio.sleep(0)
@@ -208,33 +282,41 @@ def build_lifespan(
     original_lifespan: Callable[[Starlette], AbstractAsyncContextManager[None]],
     *,
     gate_enabled: bool,
+    refresh_snapshots: bool = False,
 ) -> Callable[[Starlette], AbstractAsyncContextManager[None]]:
     """Compose the app's original lifespan with session-sweep and shutdown wiring.
 
     Returns a new lifespan callable suitable for assignment to
     ``asgi_app.router.lifespan_context``. On entry, if ``gate_enabled``, runs
-    one immediate sweep pass and spawns the periodic sweep task. On exit
-    (always inside the original lifespan's context), cancels and awaits the
-    sweep task (suppressing its ``CancelledError``), closes the session store
+    one immediate sweep pass and spawns the periodic sweep task; if
+    ``refresh_snapshots``, spawns the background snapshot refresher (which
+    warms the PRO API config and chains list without delaying startup). On
+    exit (always inside the original lifespan's context), cancels and awaits
+    the background tasks (suppressing their ``CancelledError``), closes the session store
     (a no-op if it was never initialized, and its failure is logged rather than
-    propagated so it cannot skip the next step), and awaits
+    propagated so it cannot skip the next step), closes the persistent contract
+    cache tier (likewise logged), exports the rolled-up community
+    reports, sends the queued Mixpanel events and community telemetry reports,
+    and awaits ``HTTP_POOL.close()`` (which never raises) and
     ``WEB3_POOL.close()``.
     """
 
     @asynccontextmanager
     async def _composed_lifespan(app: Starlette) -> AsyncIterator[None]:
         async with original_lifespan(app):
-            sweep_task: asyncio.Task[None] | None = None
+            background_tasks: list[asyncio.Task[None]] = []
             if gate_enabled:
                 await run_sweep_pass()
-                sweep_task = asyncio.create_task(_periodic_sweep_loop())
+                background_tasks.append(asyncio.create_task(_periodic_sweep_loop()))
+            if refresh_snapshots:
+                background_tasks.append(asyncio.create_task(snapshot_refresher.run()))
             try:
                 yield
             finally:
-                if sweep_task is not None:
-                    sweep_task.cancel()
+                for task in background_tasks:
+                    task.cancel()
                     try:
-                        await sweep_task
+                        await task
                     except asyncio.CancelledError:
                         pass
                 try:
@@ -244,16 +326,31 @@ def build_lifespan(
                     # be released, so no shutdown step may depend on the previous
                     # one succeeding.
                     logger.exception("Closing the session store failed during shutdown.")
+                try:
+                    # Closing the last connection checkpoints the SQLite WAL into the database.
+                    contract_cache.close()
+                except Exception:
+                    logger.exception("Closing the persistent contract cache failed during shutdown.")
+                _release_sweep_lease()
+                # Rolled-up community reports become Mixpanel events, so before the queue closes.
+                await community_ingest.close()
+                # Joins the analytics worker thread, so keep it off the event loop.
+                await asyncio.to_thread(analytics_queue.close)
+                # Sends over the pooled client, so before the pool closes.
+                await telemetry_dispatcher.close()
+                await HTTP_POOL.close()
                 await WEB3_POOL.close()
 
     return _composed_lifespan
 
 
-def wire_lifespan(asgi_app: Starlette, *, gate_enabled: bool) -> None:
+def wire_lifespan(asgi_app: Starlette, *, gate_enabled: bool, refresh_snapshots: bool = False) -> None:
     """Replace ``asgi_app.router.lifespan_context`` with the composed lifespan.
 
     Do not use ``add_event_handler`` for any of this — see the module
     docstring for why it silently never runs on this app.
     """
     original_lifespan = asgi_app.router.lifespan_context
-    asgi_app.router.lifespan_context = build_lifespan(original_lifespan, gate_enabled=gate_enabled)
+    asgi_app.router.lifespan_context = build_lifespan(
+        original_lifespan, gate_enabled=gate_enabled, refresh_snapshots=refresh_snapshots
+    )
@@ -8,33 +8,53 @@ span days. SQLite in WAL mode with ``synchronous=NORMAL`` gives durability
 across clean restarts at microsecond cost for a single-row upsert, which is why
 this module talks to ``sqlite3`` directly on the event loop rather than through
 a thread pool or ``aiosqlite``: the hot path is one primary-key upsert against
-a single production connection, and offloading it would add latency without
-buying anything. This is a deliberate, settled design choice — do not change it
+one connection per process, and offloading it would add latency without buying
+anything. This is a deliberate, settled design choice — do not change it
 without revisiting the design discussion referenced by the implementation plan.
 
+In multi-worker HTTP mode (``--workers N``) each worker process opens its own
+connection to the same file. Correctness does not depend on there being one
+writer: every counter operation is a single autocommitted statement, and WAL
+serializes writers across processes (a writer that finds the lock taken waits
+up to ``busy_timeout``). Writes are sub-millisecond, so that wait stays short.
+
 The database also stores a random "store generation" value alongside the
 counters. Phase 3 (session tokens) mixes the generation into every issued
 token's MAC, so replacing or losing the database file invalidates every
 previously issued identifier instead of silently restoring their budgets.
+
+:class:`WriteBehindSessionStore` is the opt-in alternative for single-process
+deployments whose disk can stall the loop (WAL checkpoints, slow volumes):
+counters live in memory, where check-and-increment and refund are atomic, and a
+dedicated writer thread flushes changed counters to SQLite in one transaction
+per ``BLOCKSCOUT_SESSION_FLUSH_INTERVAL_SECONDS``. In-memory counters are exact,
+so the ceiling holds as long as the process lives; a crash loses at most the
+changes of the last interval (plus a flush in progress), which can hand the
+affected identifiers back that many calls after a restart. Startup loads every
+unexpired row into memory, so a clean restart resumes exactly where it stopped.
 """
 
 from __future__ import annotations
 
+import logging
 import secrets
 import sqlite3
+import threading
 import time
 from pathlib import Path
 
 from blockscout_mcp_server.config import config
 
+logger = logging.getLogger(__name__)
+
 _MIN_SQLITE_VERSION = (3, 37, 0)
 _MIN_SQLITE_VERSION_STR = "3.37.0"
 
-# PRAGMA busy_timeout, in milliseconds. The single production connection never
-# contends with itself, so this never fires in normal operation; it exists for
-# the multi-connection concurrency test and as a hard cap on how long a store
-# call could stall the event loop if an external process ever held the file's
-# write lock (out of contract — see the module docstring/plan).
+# PRAGMA busy_timeout, in milliseconds. A single-process deployment never
+# contends with itself, so this never fires there. With several worker
+# processes it absorbs the brief waits for another worker's write, and it caps
+# how long a store call could stall the event loop if an external process ever
+# held the file's write lock (out of contract — see the module docstring/plan).
 _BUSY_TIMEOUT_MS = 5_000
 
 _DDL = """
@@ -122,12 +142,13 @@ class SessionStore:
         row = conn.execute("SELECT generation FROM meta WHERE id = 0").fetchone()
         if row is not None:
             return row[0]
-        generation = secrets.token_hex(16)
+        # Several worker processes may initialize a fresh database at once; the
+        # first insert wins and everyone reads back the same generation.
         conn.execute(
-            "INSERT INTO meta (id, generation) VALUES (0, :generation)",
-            {"generation": generation},
+            "INSERT INTO meta (id, generation) VALUES (0, :generation) ON CONFLICT(id) DO NOTHING",
+            {"generation": secrets.token_hex(16)},
         )
-        return generation
+        return conn.execute("SELECT generation FROM meta WHERE id = 0").fetchone()[0]
 
     def check_and_increment(self, session_id: str, created_at: int, max_calls: int) -> int | None:
         """Atomically increment the call counter for ``session_id``.
@@ -212,6 +233,166 @@ class SessionStore:
             self._conn = None
 
 
+class WriteBehindSessionStore(SessionStore):
+    """Session store whose counters live in memory and reach SQLite in batches.
+
+    Only valid with a single process per database: each process would
+    otherwise enforce the ceiling against its own counters alone.
+    """
+
+    def __init__(self, path: str, flush_interval: float) -> None:
+        super().__init__(path)
+        self._flush_interval = flush_interval
+        # session_id -> [created_at, calls]; authoritative while the store is open.
+        self._counters: dict[str, list[int]] = {}
+        self._dirty: set[str] = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._writer_conn: sqlite3.Connection | None = None
+        self._stop = threading.Event()
+        self._writer: threading.Thread | None = None
+        self.flushes = 0
+        self.flush_errors = 0
+
+    def initialize(self, now: float | None = None) -> None:
+        """Open the database, load every unexpired counter, and start the writer thread."""
+        super().initialize()
+        assert self._conn is not None
+        current_time = time.time() if now is None else now
+        try:
+            rows = self._conn.execute(
+                "SELECT id, created_at, calls FROM sessions WHERE created_at >= :cutoff",
+                {"cutoff": current_time - config.session_ttl_seconds},
+            ).fetchall()
+        except sqlite3.Error as exc:
+            super().close()
+            raise SessionStoreInitializationError(f"Failed to load session counters from {self._path}: {exc}") from exc
+        self._counters = {session_id: [created_at, calls] for session_id, created_at, calls in rows}
+        self._stop.clear()
+        self._writer = threading.Thread(target=self._run_writer, name="session-store-writer", daemon=True)
+        self._writer.start()
+
+    def check_and_increment(self, session_id: str, created_at: int, max_calls: int) -> int | None:
+        """In-memory equivalent of :meth:`SessionStore.check_and_increment`."""
+        assert self._conn is not None
+        if max_calls <= 0:
+            return None
+        with self._lock:
+            counter = self._counters.get(session_id)
+            if counter is None:
+                counter = self._counters[session_id] = [created_at, 0]
+            elif counter[1] >= max_calls:
+                return None
+            counter[1] += 1
+            self._dirty.add(session_id)
+            return counter[1]
+
+    def refund(self, session_id: str) -> None:
+        assert self._conn is not None
+        with self._lock:
+            counter = self._counters.get(session_id)
+            if counter is not None and counter[1] > 0:
+                counter[1] -= 1
+                self._dirty.add(session_id)
+
+    def get_calls(self, session_id: str) -> int:
+        assert self._conn is not None
+        with self._lock:
+            counter = self._counters.get(session_id)
+            return counter[1] if counter is not None else 0
+
+    def sweep_batch(self, limit: int, now: float | None = None) -> int:
+        """Delete expired rows; the pass's last batch also drops expired counters from memory.
+
+        Pruning memory scans every counter, so it runs once per pass (when the
+        database has no full batch left) rather than once per batch.
+        """
+        current_time = time.time() if now is None else now
+        deleted = super().sweep_batch(limit, now=current_time)
+        if deleted < limit:
+            cutoff = current_time - config.session_ttl_seconds
+            with self._lock:
+                expired = [key for key, (created_at, _) in self._counters.items() if created_at < cutoff]
+                for session_id in expired:
+                    del self._counters[session_id]
+                    self._dirty.discard(session_id)
+        return deleted
+
+    @property
+    def pending_writes(self) -> int:
+        """Counters changed in memory since the last successful flush."""
+        return len(self._dirty)
+
+    def flush(self) -> int:
+        """Write every changed counter to SQLite in one transaction; return how many.
+
+        Rows are written with their absolute in-memory values, so a failed flush
+        simply leaves its counters dirty for the next attempt.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = [
+                    {"id": session_id, "created_at": counter[0], "calls": counter[1]}
+                    for session_id in self._dirty
+                    if (counter := self._counters.get(session_id)) is not None
+                ]
+                self._dirty.clear()
+            if not batch:
+                return 0
+            try:
+                conn = self._writer_connection()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(
+                        """
+                        INSERT INTO sessions (id, created_at, calls)
+                        VALUES (:id, :created_at, :calls)
+                        ON CONFLICT(id) DO UPDATE SET calls = excluded.calls
+                        """,
+                        batch,
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error as exc:
+                self.flush_errors += 1
+                with self._lock:
+                    self._dirty.update(row["id"] for row in batch if row["id"] in self._counters)
+                logger.error("Session counter flush of %d rows failed; retrying next interval: %s", len(batch), exc)
+                return 0
+            self.flushes += 1
+            return len(batch)
+
+    def _writer_connection(self) -> sqlite3.Connection:
+        if self._writer_conn is None:
+            conn = sqlite3.connect(self._path, isolation_level=None, check_same_thread=False)
+            try:
+                conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
+                conn.execute("PRAGMA synchronous = NORMAL")
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._writer_conn = conn
+        return self._writer_conn
+
+    def _run_writer(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            self.flush()
+        self.flush()
+
+    def close(self) -> None:
+        """Stop the writer thread after a final flush, then close both connections. Idempotent."""
+        if self._writer is not None:
+            self._stop.set()
+            self._writer.join()
+            self._writer = None
+        if self._writer_conn is not None:
+            self._writer_conn.close()
+            self._writer_conn = None
+        super().close()
+
+
 _store: SessionStore | None = None
 
 
@@ -220,10 +401,14 @@ def initialize_store(path: str) -> SessionStore:
 
     The new store is initialized before the current one is touched, so a failed
     re-initialization leaves the existing singleton usable; on success the
-    previous store (if any) is closed rather than leaked.
+    previous store (if any) is closed rather than leaked. A positive
+    ``config.session_flush_interval_seconds`` selects the write-behind store.
     """
     global _store
-    store = SessionStore(path)
+    if config.session_flush_interval_seconds > 0:
+        store: SessionStore = WriteBehindSessionStore(path, config.session_flush_interval_seconds)
+    else:
+        store = SessionStore(path)
     store.initialize()
     if _store is not None:
         _store.close()
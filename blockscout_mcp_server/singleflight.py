@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Coalescing of identical in-flight upstream work ("singleflight").
+
+When several agents inspect the same hot transaction, block, or contract at
+once, every tool call used to issue its own identical PRO API request — each
+one spending credits. A :class:`SingleFlight` group lets the first caller for a
+key (the *leader*) run the work while every concurrent caller with the same key
+(a *follower*) waits for and shares the leader's outcome, result or exception.
+
+Two groups are used:
+
+* :data:`upstream_get_flight` — ``make_blockscout_request`` GETs, keyed on
+  chain, path, normalized params, effective timeout, and a fingerprint of the
+  effective PRO API key. The shared value is the raw ``httpx.Response``; every
+  caller parses its own copy of the JSON body and records ``x-credits-remaining``
+  into its own credit sink, so callers may mutate their result freely.
+* :data:`contract_fetch_flight` — the cold-cache path of
+  ``_fetch_and_process_contract``, so a stampede on one popular contract runs the
+  fetch *and* the source-file processing once. The shared ``CachedContract`` is
+  the same object the contract cache hands out on a hit, and is treated as
+  read-only by its consumers for the same reason.
+
+Keys include the PRO API key fingerprint so a caller never observes another
+key's outcome (e.g. a 402 for an exhausted key), and nothing outlives the
+in-flight window: once the leader finishes the key is released, so this is not
+a cache. If the leader is cancelled (its client disconnected), followers are
+not failed with the leader's cancellation — one of them re-runs the work.
+
+Coalescing is controlled by ``BLOCKSCOUT_REQUEST_COALESCING_ENABLED``
+(default on).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+import anyio
+
+
+class _Call:
+    """State of one in-flight leader execution."""
+
+    __slots__ = ("done", "result", "error", "succeeded")
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: Any = None
+        self.error: Exception | None = None
+        self.succeeded = False
+
+
+class SingleFlight:
+    """Group of keyed in-flight calls with coalescing counters.
+
+    Attributes:
+        name: Label used when exporting the counters.
+        executions: Number of times the wrapped work actually ran (leaders).
+        coalesced: Number of calls that joined an in-flight execution instead of
+            running the work themselves.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._calls: dict[Hashable, _Call] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys currently being executed."""
+        return len(self._calls)
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the coalescing counters."""
+        return {"executions": self.executions, "coalesced": self.coalesced, "in_flight": self.in_flight}
+
+    def reset_stats(self) -> None:
+        self.executions = 0
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn`` once per concurrent *key* and share its outcome.
+
+        Followers receive the leader's return value (the same object) or have
+        the leader's exception raised in their own task.
+        """
+        while (call := self._calls.get(key)) is not None:
+            self.coalesced += 1
+            await call.done.wait()
+            if call.succeeded:
+                return call.result
+            if call.error is not None:
+                raise call.error
+            # The leader was cancelled: loop and either join a newer leader or
+            # become the leader ourselves. The follower is no longer counted as
+            # coalesced until it actually joins again.
+            self.coalesced -= 1
+
+        call = _Call()
+        self._calls[key] = call
+        self.executions += 1
+        try:
+            call.result = await fn()
+            call.succeeded = True
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            del self._calls[key]
+            call.done.set()
+
+
+upstream_get_flight = SingleFlight("blockscout_get")
+contract_fetch_flight = SingleFlight("contract_fetch")
@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Background stale-while-revalidate refresh of the PRO API config and chains list.
+
+Every ``make_blockscout_request`` goes through ``ensure_chain_supported``, which
+reads the PRO API config snapshot. When that snapshot expired, the first caller
+fetched ``/api/json/config`` under the cache lock and every other request queued
+behind it; ``get_chains_list`` had the same stall on the Chainscout chains list.
+
+In HTTP mode the lifespan runs :class:`SnapshotRefresher`, which refreshes both
+snapshots before they expire — at ``BLOCKSCOUT_SNAPSHOT_REFRESH_FRACTION`` of
+their TTL, minus up to 10% jitter so replicas do not refresh in lockstep. While
+it runs, a snapshot that did expire (because refreshes are failing) is served
+as-is instead of being re-fetched in the request path; only a cold start with
+no snapshot at all still fetches inline. Failed refreshes back off
+exponentially (with jitter) from a few seconds up to the normal refresh
+interval. When a config refresh changes the set of chains, the chains list is
+rebuilt immediately.
+
+Snapshot age, refresh counts, and consecutive failures are exported via
+:meth:`SnapshotRefresher.stats` (and ``GET /metrics``).
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import anyio
+
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.tools import common
+from blockscout_mcp_server.tools.chains import get_chains_list as chains_list_tool
+
+logger = logging.getLogger(__name__)
+
+# Refresh intervals are shortened by up to this fraction at random.
+_JITTER_FRACTION = 0.1
+# First retry delay after a failed refresh; doubled per consecutive failure.
+_FAILURE_BACKOFF_BASE_SECONDS = 5.0
+# No refresh loop ever spins faster than this, whatever the TTL.
+_MIN_DELAY_SECONDS = 1.0
+
+
+class _RefreshTarget:
+    """One refreshed snapshot and its refresh counters."""
+
+    def __init__(
+        self,
+        name: str,
+        refresh: Callable[[], Awaitable[Any]],
+        cache: Callable[[], Any],
+        ttl_seconds: Callable[[], float],
+    ) -> None:
+        self.name = name
+        self.refresh = refresh
+        # Resolved at call time: tests (and reloads) may swap the cache singletons.
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.refreshes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+
+    def next_delay(self) -> float:
+        interval = max(_MIN_DELAY_SECONDS, self.ttl_seconds() * config.snapshot_refresh_fraction)
+        if self.consecutive_failures:
+            step = min(interval, _FAILURE_BACKOFF_BASE_SECONDS * 2 ** (self.consecutive_failures - 1))
+            return max(_MIN_DELAY_SECONDS, step / 2 + random.uniform(0, step / 2))
+        return interval * (1 - random.uniform(0, _JITTER_FRACTION))
+
+    def stats(self) -> dict[str, object]:
+        cache = self.cache()
+        has_snapshot = cache.stored_at > 0
+        return {
+            "age_seconds": round(time.monotonic() - cache.stored_at, 3) if has_snapshot else None,
+            "expired": not has_snapshot or time.monotonic() >= cache.expiry_timestamp,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+class SnapshotRefresher:
+    """Keep the PRO API config and chains list snapshots fresh in the background."""
+
+    def __init__(self) -> None:
+        self.pro_api_config = _RefreshTarget(
+            "pro_api_config",
+            self._refresh_pro_api_config,
+            lambda: common.pro_api_config_cache,
+            lambda: config.pro_api_config_ttl_seconds,
+        )
+        self.chains_list = _RefreshTarget(
+            "chains_list",
+            chains_list_tool.refresh_chains_list,
+            lambda: common.chains_list_cache,
+            lambda: config.chains_list_ttl_seconds,
+        )
+        self._chains_changed = anyio.Event()
+
+    def stats(self) -> dict[str, dict[str, object]]:
+        return {target.name: target.stats() for target in (self.pro_api_config, self.chains_list)}
+
+    async def _refresh_pro_api_config(self) -> None:
+        if await common.refresh_pro_api_config():
+            self._chains_changed.set()
+
+    async def _refresh_once(self, target: _RefreshTarget) -> None:
+        try:
+            await target.refresh()
+        except Exception as e:
+            target.failures += 1
+            target.consecutive_failures += 1
+            logger.warning(
+                "Background refresh of %s failed (%d in a row); serving the previous snapshot: %s",
+                target.name,
+                target.consecutive_failures,
+                e,
+            )
+            return
+        if target.consecutive_failures:
+            logger.info("Background refresh of %s recovered", target.name)
+        target.refreshes += 1
+        target.consecutive_failures = 0
+
+    async def _run_target(self, target: _RefreshTarget, *, wake_on_chain_change: bool = False) -> None:
+        while True:
+            await self._refresh_once(target)
+            with anyio.move_on_after(target.next_delay()):
+                if wake_on_chain_change:
+                    await self._chains_changed.wait()
+                    self._chains_changed = anyio.Event()
+                else:
+                    await anyio.sleep_forever()
+
+    async def run(self) -> None:
+        """Refresh both snapshots until cancelled; callers serve expired snapshots meanwhile."""
+        caches = (common.pro_api_config_cache, common.chains_list_cache)
+        self._chains_changed = anyio.Event()
+        for cache in caches:
+            cache.background_refresh = True
+        try:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(self._run_target, self.pro_api_config)
+                tg.start_soon(functools.partial(self._run_target, self.chains_list, wake_on_chain_change=True))
+        finally:
+            for cache in caches:
+                cache.background_refresh = False
+
+
+snapshot_refresher = SnapshotRefresher()
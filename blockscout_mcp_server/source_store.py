@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Content-addressed, compressed storage for cached contract source files.
+
+Verified contracts share a lot of source: the same OpenZeppelin libraries are
+vendored into thousands of projects, and CREATE2 factories deploy one set of
+sources to many addresses on many chains. Keeping ``source_files`` as plain
+strings per contract filled the contract cache with duplicates.
+
+:class:`SourceStore` keeps each distinct file body once, keyed by its SHA-256
+digest and reference-counted by the cached contracts that point at it. Bodies of
+at least ``_COMPRESS_MIN_BYTES`` are stored zlib-compressed (Solidity compresses
+roughly 4-6x); cached contracts hand out a :class:`LazySourceFiles` mapping that
+inflates a body only when a specific file is read, so listing a contract's files
+never decompresses anything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import zlib
+from collections.abc import Iterator, Mapping
+
+# Bodies shorter than this are kept uncompressed: zlib framing eats the saving.
+_COMPRESS_MIN_BYTES = 1024
+_COMPRESSION_LEVEL = 6
+
+
+class SourceBlob:
+    """One distinct source file body, possibly compressed."""
+
+    __slots__ = ("compressed", "data", "digest", "raw_size", "refs")
+
+    def __init__(self, digest: str, raw: bytes) -> None:
+        self.digest = digest
+        self.raw_size = len(raw)
+        self.compressed = False
+        self.data = raw
+        if self.raw_size >= _COMPRESS_MIN_BYTES:
+            packed = zlib.compress(raw, _COMPRESSION_LEVEL)
+            if len(packed) < self.raw_size:
+                self.data = packed
+                self.compressed = True
+        self.refs = 0
+
+    @property
+    def size(self) -> int:
+        """Bytes held for this body."""
+        return len(self.data)
+
+    def text(self) -> str:
+        raw = zlib.decompress(self.data) if self.compressed else self.data
+        return raw.decode("utf-8")
+
+
+class LazySourceFiles(Mapping[str, str]):
+    """Read-only ``path -> source`` mapping that decompresses a body on access."""
+
+    __slots__ = ("_blobs",)
+
+    def __init__(self, blobs: Mapping[str, SourceBlob]) -> None:
+        self._blobs = blobs
+
+    def __getitem__(self, path: str) -> str:
+        return self._blobs[path].text()
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._blobs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._blobs)
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def __repr__(self) -> str:
+        return f"LazySourceFiles({list(self._blobs)!r})"
+
+
+def source_digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+class SourceStore:
+    """Reference-counted pool of :class:`SourceBlob` shared by cached contracts."""
+
+    def __init__(self) -> None:
+        self._blobs: dict[str, SourceBlob] = {}
+        self.total_bytes = 0
+        # Uncompressed bytes of every body, counted once per referencing file.
+        self.logical_bytes = 0
+
+    def prepare(self, source_files: Mapping[str, str]) -> dict[str, SourceBlob]:
+        """Map each path to its stored blob, or to a new unstored one.
+
+        Hashing and compressing happen here, outside the contract cache lock;
+        :meth:`acquire` later swaps in any blob stored by a concurrent caller.
+        """
+        prepared: dict[str, SourceBlob] = {}
+        for path, source in source_files.items():
+            raw = source.encode("utf-8")
+            digest = source_digest(raw)
+            prepared[path] = self._blobs.get(digest) or SourceBlob(digest, raw)
+        return prepared
+
+    def new_bytes(self, blobs: Mapping[str, SourceBlob]) -> int:
+        """Bytes that storing ``blobs`` would add (bodies not yet in the store)."""
+        unseen = {blob.digest: blob.size for blob in blobs.values() if blob.digest not in self._blobs}
+        return sum(unseen.values())
+
+    def freed_bytes(self, blobs: Mapping[str, SourceBlob], released: dict[str, int]) -> int:
+        """Bytes released if ``blobs`` lost one reference each.
+
+        ``released`` accumulates pending releases across several calls so that
+        a body shared by two eviction victims is freed only once.
+        """
+        freed = 0
+        for blob in blobs.values():
+            pending = released.get(blob.digest, 0) + 1
+            released[blob.digest] = pending
+            stored = self._blobs.get(blob.digest)
+            if stored is not None and stored.refs == pending:
+                freed += stored.size
+        return freed
+
+    def acquire(self, blobs: Mapping[str, SourceBlob]) -> dict[str, SourceBlob]:
+        """Store ``blobs`` (or reference the existing copies) and return the stored mapping."""
+        stored: dict[str, SourceBlob] = {}
+        for path, blob in blobs.items():
+            existing = self._blobs.get(blob.digest)
+            if existing is None:
+                existing = self._blobs[blob.digest] = blob
+                self.total_bytes += blob.size
+            existing.refs += 1
+            self.logical_bytes += existing.raw_size
+            stored[path] = existing
+        return stored
+
+    def release(self, blobs: Mapping[str, SourceBlob]) -> None:
+        for blob in blobs.values():
+            blob.refs -= 1
+            self.logical_bytes -= blob.raw_size
+            if blob.refs <= 0 and self._blobs.get(blob.digest) is blob:
+                del self._blobs[blob.digest]
+                self.total_bytes -= blob.size
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "source_blobs": len(self._blobs),
+            "source_bytes": self.total_bytes,
+            "source_logical_bytes": self.logical_bytes,
+        }
@@ -13,7 +13,8 @@ from blockscout_mcp_server.constants import (
     SERVER_VERSION,
     AuthOrigin,
 )
-from blockscout_mcp_server.pro_api_key_context import compute_auth_signals
+from blockscout_mcp_server.pro_api_key_context import ClientKeyState, compute_auth_signals
+from blockscout_mcp_server.telemetry_dispatcher import telemetry_dispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +34,7 @@ def is_any_telemetry_active() -> bool:
     return analytics.is_http_mode_enabled() or not config.disable_community_telemetry
 
 
-def resolve_auth_signals(ctx: Any) -> tuple[AuthOrigin | None, str | None]:
+def resolve_auth_signals(ctx: Any, key_state: ClientKeyState | None = None) -> tuple[AuthOrigin | None, str | None]:
     """Derive the ``(auth_origin, api_key_fingerprint)`` pair for the observability sinks.
 
     Single entry point shared by both observability paths — ``log_tool_invocation``
@@ -57,10 +58,16 @@ def resolve_auth_signals(ctx: Any) -> tuple[AuthOrigin | None, str | None]:
     fallback degrades gracefully — the analytics sink records the origin as
     ``AUTH_ORIGIN_UNKNOWN`` (it never re-derives from ``ctx``), the community report
     omits the hash.
+
+    ``key_state`` is the client-key state when the caller has already extracted it
+    from ``ctx`` (the fused tool pipeline does, once per call); it is handed to
+    :func:`compute_auth_signals` so the headers are not read twice.
     """
     try:
         if not is_any_telemetry_active():
             return None, None
+        if key_state is not None:
+            return compute_auth_signals(ctx, key_state)
         return compute_auth_signals(ctx)
     except Exception:
         return None, None
@@ -80,6 +87,9 @@ async def send_community_usage_report(
     ``auth_origin`` and ``api_key_fingerprint`` are already-computed signals (see
     :mod:`blockscout_mcp_server.pro_api_key_context`); this function is a dumb conduit
     and must never receive or handle a raw API key.
+
+    Unless ``BLOCKSCOUT_COMMUNITY_TELEMETRY_QUEUE_SIZE`` is 0, the report is only
+    queued for the next batch (see :mod:`blockscout_mcp_server.telemetry_dispatcher`).
     """
     if config.disable_community_telemetry:
         return
@@ -88,7 +98,6 @@ async def send_community_usage_report(
         return
 
     try:
-        headers = {"User-Agent": f"{config.mcp_user_agent}/{SERVER_VERSION}"}
         payload = {
             "tool_name": tool_name,
             "tool_args": tool_args,
@@ -98,6 +107,11 @@ async def send_community_usage_report(
             "auth_origin": auth_origin,
             "api_key_fingerprint": api_key_fingerprint,
         }
+        if telemetry_dispatcher.enabled:
+            telemetry_dispatcher.submit(payload)
+            return
+
+        headers = {"User-Agent": f"{config.mcp_user_agent}/{SERVER_VERSION}"}
         url = f"{COMMUNITY_TELEMETRY_URL}{COMMUNITY_TELEMETRY_ENDPOINT}"
 
         async with httpx.AsyncClient() as client:
@@ -0,0 +1,226 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Bounded, batched delivery of community telemetry reports.
+
+Every tool call and resource read on a self-hosted server used to schedule its
+own task that built a fresh ``httpx.AsyncClient`` for one POST to the central
+server: under load, thousands of short-lived clients, sockets, and orphan tasks,
+with nothing bounding them and nothing sent at shutdown.
+``send_community_usage_report`` now hands its payload to
+:class:`TelemetryDispatcher` instead, which keeps at most
+``BLOCKSCOUT_COMMUNITY_TELEMETRY_QUEUE_SIZE`` reports in memory (``0`` restores
+the per-report POST) and drops — and counts — new ones beyond that: telemetry
+must never slow a tool call down.
+
+A worker task started with the first report collects reports for
+``BLOCKSCOUT_COMMUNITY_TELEMETRY_FLUSH_INTERVAL_SECONDS`` (or until
+``BLOCKSCOUT_COMMUNITY_TELEMETRY_BATCH_SIZE`` are pending) and POSTs them as a
+JSON array to the central server's batch endpoint over the shared upstream
+connection pool, with at most ``BLOCKSCOUT_COMMUNITY_TELEMETRY_MAX_CONCURRENCY``
+batches in flight. A failed batch is counted and not retried. A central server
+that does not serve the batch endpoint yet (``404``/``405``) gets the batch as
+per-report POSTs instead, and the batch endpoint is tried again after
+``_BATCH_ENDPOINT_RETRY_SECONDS``. In HTTP mode the
+lifespan sends what is still queued before the pool closes; a stdio server has
+no shutdown hook, so reports queued when it exits are lost, as before.
+
+Counters are exported at ``/metrics``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import suppress
+from typing import Any
+
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.constants import (
+    COMMUNITY_TELEMETRY_BATCH_ENDPOINT,
+    COMMUNITY_TELEMETRY_ENDPOINT,
+    COMMUNITY_TELEMETRY_URL,
+    SERVER_VERSION,
+)
+from blockscout_mcp_server.http_pool import HTTP_POOL
+
+logger = logging.getLogger(__name__)
+
+# Same budget the per-report POST always had.
+_SEND_TIMEOUT_SECONDS = 2.0
+# How long shutdown waits for the queued reports to be sent.
+_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+# Statuses of a central server that predates the batch endpoint.
+_BATCH_UNSUPPORTED_STATUSES = frozenset({404, 405})
+# How long reports go out one per POST before the batch endpoint is tried again.
+_BATCH_ENDPOINT_RETRY_SECONDS = 3600.0
+
+
+class TelemetryDispatcher:
+    """Per-process queue of community reports and the worker that sends them in batches."""
+
+    def __init__(self) -> None:
+        self._pending: deque[dict[str, Any]] = deque()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._worker: asyncio.Task | None = None
+        self._sending: set[asyncio.Task] = set()
+        self._slots: asyncio.Semaphore | None = None
+        self._arrived: asyncio.Event | None = None
+        self._full: asyncio.Event | None = None
+        self._batch_unsupported_until = 0.0
+        self.queued = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return config.community_telemetry_queue_size > 0
+
+    def clear(self) -> None:
+        for task in (self._worker, *self._sending):
+            if task is not None:
+                # The task's loop may already be closed (tests run one loop each).
+                with suppress(RuntimeError):
+                    task.cancel()
+        self._pending.clear()
+        self._loop = None
+        self._worker = None
+        self._sending = set()
+        self._batch_unsupported_until = 0.0
+        self.queued = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queued": self.queued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "pending": len(self._pending),
+            "batches_in_flight": len(self._sending),
+        }
+
+    def submit(self, report: dict[str, Any]) -> None:
+        """Queue ``report`` for the next batch, or drop it when the queue is full. Never blocks."""
+        if len(self._pending) >= config.community_telemetry_queue_size:
+            self.dropped += 1
+            logger.debug("Community telemetry queue is full; dropping a report for %s", report.get("tool_name"))
+            return
+        self._ensure_worker()
+        self._pending.append(report)
+        self.queued += 1
+        self._arrived.set()
+        if len(self._pending) >= config.community_telemetry_batch_size:
+            self._full.set()
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._worker is not None and not self._worker.done():
+            return
+        if self._loop is not loop:
+            # Tasks and events of a previous loop cannot be used from this one.
+            self._sending = set()
+            self._slots = asyncio.Semaphore(config.community_telemetry_max_concurrency)
+            self._loop = loop
+        self._arrived = asyncio.Event()
+        self._full = asyncio.Event()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._arrived.wait()
+            if len(self._pending) < config.community_telemetry_batch_size:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._full.wait(), config.community_telemetry_flush_interval_seconds)
+            self._arrived.clear()
+            self._full.clear()
+            await self._send_pending()
+
+    async def _send_pending(self) -> None:
+        while self._pending:
+            # A slot is taken before the batch leaves the queue, so a cancelled
+            # wait never loses reports.
+            await self._slots.acquire()
+            size = min(config.community_telemetry_batch_size, len(self._pending))
+            batch = [self._pending.popleft() for _ in range(size)]
+            task = asyncio.create_task(self._send(batch))
+            self._sending.add(task)
+            task.add_done_callback(self._on_sent)
+
+    def _on_sent(self, task: asyncio.Task) -> None:
+        if task in self._sending:
+            self._sending.discard(task)
+            self._slots.release()
+
+    async def _send(self, batch: list[dict[str, Any]]) -> None:
+        if time.monotonic() < self._batch_unsupported_until:
+            await self._send_one_by_one(batch)
+            return
+        url = f"{COMMUNITY_TELEMETRY_URL}{COMMUNITY_TELEMETRY_BATCH_ENDPOINT}"
+        headers = {"User-Agent": f"{config.mcp_user_agent}/{SERVER_VERSION}"}
+        try:
+            async with HTTP_POOL.lease(timeout=_SEND_TIMEOUT_SECONDS) as client:
+                response = await client.post(url, json=batch, headers=headers)
+            if response.status_code in _BATCH_UNSUPPORTED_STATUSES:
+                self._batch_unsupported_until = time.monotonic() + _BATCH_ENDPOINT_RETRY_SECONDS
+                logger.debug(
+                    "Community telemetry batch endpoint unavailable (HTTP %d); sending reports one by one",
+                    response.status_code,
+                )
+                await self._send_one_by_one(batch)
+                return
+            response.raise_for_status()
+        except Exception as exc:
+            self.failed += len(batch)
+            logger.debug("Failed to send %d community telemetry reports: %s", len(batch), exc)
+            return
+        self.sent += len(batch)
+        logger.debug("Community telemetry batch of %d reports sent", len(batch))
+
+    async def _send_one_by_one(self, batch: list[dict[str, Any]]) -> None:
+        """POST each report of ``batch`` to the per-report endpoint, as the unbatched path does."""
+        url = f"{COMMUNITY_TELEMETRY_URL}{COMMUNITY_TELEMETRY_ENDPOINT}"
+        headers = {"User-Agent": f"{config.mcp_user_agent}/{SERVER_VERSION}"}
+
+        async def _post(client: Any, report: dict[str, Any]) -> None:
+            response = await client.post(url, json=report, headers=headers)
+            response.raise_for_status()
+
+        try:
+            async with HTTP_POOL.lease(timeout=_SEND_TIMEOUT_SECONDS) as client:
+                results = await asyncio.gather(*(_post(client, report) for report in batch), return_exceptions=True)
+        except Exception as exc:
+            results = [exc] * len(batch)
+        failures = [result for result in results if isinstance(result, Exception)]
+        self.sent += len(batch) - len(failures)
+        self.failed += len(failures)
+        if failures:
+            logger.debug("Failed to send %d community telemetry reports: %s", len(failures), failures[0])
+
+    async def close(self, timeout: float = _SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """Stop the worker and send what is still queued, waiting at most ``timeout`` seconds."""
+        worker, self._worker = self._worker, None
+        if worker is None or self._loop is not asyncio.get_running_loop():
+            return
+        worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await worker
+        try:
+            async with asyncio.timeout(timeout):
+                await self._send_pending()
+                if self._sending:
+                    await asyncio.wait(set(self._sending))
+        except TimeoutError:
+            logger.warning(
+                "Community telemetry was not fully sent within %.1fs of shutdown (%d reports still queued)",
+                timeout,
+                len(self._pending),
+            )
+            for task in self._sending:
+                task.cancel()
+
+
+telemetry_dispatcher = TelemetryDispatcher()
@@ -18,6 +18,7 @@ from blockscout_mcp_server.tools.common import (
     build_tool_response,
     encode_cursor,
     make_blockscout_request,
+    prefetch_next_page,
     report_and_log_progress,
 )
 from blockscout_mcp_server.tools.decorators import log_tool_invocation
@@ -103,6 +104,7 @@ async def get_tokens_by_address(
                 },
             )
         )
+        prefetch_next_page(chain_id=chain_id, api_path=api_path, params=params, pagination=pagination)
 
     instructions = [
         "This list only contains ERC-20 tokens. You MUST also call `get_address_info` to get the native coin balance.",
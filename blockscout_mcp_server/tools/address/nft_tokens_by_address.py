@@ -19,7 +19,9 @@ from blockscout_mcp_server.tools.common import (
     build_tool_response,
     create_items_pagination,
     make_blockscout_request,
+    prefetch_next_page,
     report_and_log_progress,
+    take_buffered_items,
 )
 from blockscout_mcp_server.tools.decorators import log_tool_invocation
 
@@ -69,12 +71,25 @@ async def nft_tokens_by_address(
         ctx, progress=0.0, total=1.0, message=f"Starting to fetch NFT tokens for {address} on chain {chain_id}..."
     )
 
-    response_data = await make_blockscout_request(chain_id=chain_id, api_path=api_path, params=params)
+    next_call_base_params = {
+        "chain_id": chain_id,
+        "address": address,
+    }
+    buffered = take_buffered_items(
+        tool_name="nft_tokens_by_address",
+        next_call_base_params=next_call_base_params,
+        cursor=cursor,
+    )
+    if buffered is None:
+        response_data = await make_blockscout_request(chain_id=chain_id, api_path=api_path, params=params)
+        original_items = response_data.get("items", [])
+        upstream_has_more = response_data.get("next_page_params") is not None
+    else:
+        original_items, upstream_has_more = buffered.items, buffered.upstream_has_more
 
     await report_and_log_progress(ctx, progress=1.0, total=1.0, message="Successfully fetched NFT data.")
 
     # Process all items first to prepare for pagination
-    original_items = response_data.get("items", [])
     processed_items = []
 
     for item in original_items:
@@ -120,13 +135,13 @@ async def nft_tokens_by_address(
         items=processed_items,
         page_size=config.nft_page_size,
         tool_name="nft_tokens_by_address",
-        next_call_base_params={
-            "chain_id": chain_id,
-            "address": address,
-        },
+        next_call_base_params=next_call_base_params,
         cursor_extractor=extract_nft_cursor_params,
         force_pagination=False,
+        source_items=original_items,
+        upstream_has_more=upstream_has_more,
     )
+    prefetch_next_page(chain_id=chain_id, api_path=api_path, params=params, pagination=pagination)
 
     # Convert sliced items to NftCollectionHolding objects
     nft_holdings: list[NftCollectionHolding] = []
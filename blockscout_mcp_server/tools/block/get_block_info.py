@@ -69,7 +69,12 @@ async def get_block_info(
 
     results = await asyncio.gather(
         make_blockscout_request(chain_id=chain_id, api_path=block_api_path, timeout=config.bs_light_timeout),
-        make_blockscout_request(chain_id=chain_id, api_path=txs_api_path),
+        # A full page of transactions on a busy chain can be large; stream it under a byte cap.
+        make_blockscout_request(
+            chain_id=chain_id,
+            api_path=txs_api_path,
+            max_body_bytes=config.block_transactions_max_bytes or None,
+        ),
         return_exceptions=True,
     )
     await report_and_log_progress(
@@ -17,6 +17,41 @@ from blockscout_mcp_server.tools.common import (
 )
 from blockscout_mcp_server.tools.decorators import log_tool_invocation
 
+_CHAINSCOUT_CHAINS_PATH = "/api/chains"
+
+
+async def fetch_chains_list() -> list[ChainInfo]:
+    """Build the chains list: Chainscout metadata for every chain the PRO API serves."""
+    pro_api_chains = await ensure_pro_api_config()
+    response_data = await make_chainscout_request(api_path=_CHAINSCOUT_CHAINS_PATH)
+
+    chains = []
+    if isinstance(response_data, dict):
+        for chain_id in pro_api_chains:
+            chain = response_data.get(chain_id)
+            if not isinstance(chain, dict) or not chain.get("name"):
+                continue
+            chains.append(
+                ChainInfo(
+                    name=chain["name"],
+                    chain_id=chain_id,
+                    is_testnet=chain.get("isTestnet", False),
+                    native_currency=chain.get("native_currency"),
+                    ecosystem=chain.get("ecosystem"),
+                    settlement_layer_chain_id=chain.get("settlementLayerChainId"),
+                )
+            )
+    return chains
+
+
+async def refresh_chains_list() -> None:
+    """Rebuild and store the chains list for the background refresher; errors propagate."""
+    async with chains_list_cache.lock:
+        chains = await fetch_chains_list()
+        if not chains:
+            raise ValueError("Chainscout returned no chains for the PRO API chain set")
+        chains_list_cache.store_snapshot(chains)
+
 
 @log_tool_invocation
 @pro_api_key_scope
@@ -44,8 +79,6 @@ async def get_chains_list(
     the full registry to the agent. Do not rely on partial numeric chain ID queries such
     as `1`, because matching is substring-based and may return many chains.
     """
-    api_path = "/api/chains"
-
     await report_and_log_progress(
         ctx,
         progress=0.0,
@@ -54,6 +87,9 @@ async def get_chains_list(
     )
 
     chains = chains_list_cache.get_if_fresh()
+    if chains is None:
+        # The background refresher, when running, revalidates an expired snapshot.
+        chains = chains_list_cache.get_stale_if_refreshing()
     from_cache = True
 
     if chains is None:
@@ -61,26 +97,7 @@ async def get_chains_list(
         async with chains_list_cache.lock:
             chains = chains_list_cache.get_if_fresh()
             if chains is None:
-                pro_api_chains = await ensure_pro_api_config()
-                response_data = await make_chainscout_request(api_path=api_path)
-
-                chains = []
-                if isinstance(response_data, dict):
-                    for chain_id in pro_api_chains:
-                        chain = response_data.get(chain_id)
-                        if not isinstance(chain, dict) or not chain.get("name"):
-                            continue
-                        chains.append(
-                            ChainInfo(
-                                name=chain["name"],
-                                chain_id=chain_id,
-                                is_testnet=chain.get("isTestnet", False),
-                                native_currency=chain.get("native_currency"),
-                                ecosystem=chain.get("ecosystem"),
-                                settlement_layer_chain_id=chain.get("settlementLayerChainId"),
-                            )
-                        )
-
+                chains = await fetch_chains_list()
                 if chains:
                     chains_list_cache.store_snapshot(chains)
 
@@ -1,7 +1,9 @@
 # SPDX-License-Identifier: LicenseRef-Blockscout
 import base64
+import functools
 import json
 import logging
+import random
 import time
 from collections.abc import Awaitable, Callable
 from typing import Any, Literal
@@ -10,7 +12,13 @@ import anyio
 import httpx
 from mcp.server.fastmcp import Context
 
+from blockscout_mcp_server import json_codec, metrics
 from blockscout_mcp_server.cache import ChainsListCache, ProApiConfigCache
+from blockscout_mcp_server.circuit_breaker import (
+    chain_breaker_key,
+    circuit_breakers,
+    host_breaker_key,
+)
 from blockscout_mcp_server.client_meta import get_header_case_insensitive
 from blockscout_mcp_server.config import config
 from blockscout_mcp_server.constants import (
@@ -19,34 +27,47 @@ from blockscout_mcp_server.constants import (
     SERVER_VERSION,
     SESSION_BUDGET_NOTE_TEMPLATE,
 )
+from blockscout_mcp_server.hedging import hedge_policy
+from blockscout_mcp_server.http_pool import HTTP_POOL, PooledClientLease
 from blockscout_mcp_server.models import NextCallInfo, PaginationInfo, ToolResponse
+from blockscout_mcp_server.page_buffer import BufferedPage, page_buffer
+from blockscout_mcp_server.prefetch import prefetcher
 from blockscout_mcp_server.pro_api_key_context import (
     _credit_sink,
+    _fingerprint_pro_api_key,
     client_supplied_valid_key,
     require_pro_api_key,
     resolve_pro_api_key,
 )
+from blockscout_mcp_server.rate_limiter import rate_pacer
+from blockscout_mcp_server.response_cache import is_stale_servable_error, response_cache
 from blockscout_mcp_server.session_gate import get_effective_max_calls, get_remaining_budget
+from blockscout_mcp_server.singleflight import upstream_get_flight
 
 logger = logging.getLogger(__name__)
 
 
-def _create_httpx_client(*, timeout: float) -> httpx.AsyncClient:
-    """Return an AsyncClient pre-configured for Blockscout tooling.
+def _create_httpx_client(*, timeout: float) -> PooledClientLease:
+    """Return a lease on the process-wide pooled HTTP client.
 
     Args:
-        timeout: The timeout value (in seconds) for the HTTP client.
+        timeout: The timeout value (in seconds) applied to every request sent
+            through the lease.
 
     Returns:
-        An instance of httpx.AsyncClient with the specified timeout and
-        `follow_redirects` set to ``True``.
+        A ``PooledClientLease`` used exactly like an ``httpx.AsyncClient``
+        (``async with ... as client: await client.get(...)``). Requests go
+        through the shared per-origin clients of ``HTTP_POOL``, so keep-alive
+        connections are reused across calls; leaving the ``async with`` block
+        returns connections to the pool instead of closing them.
 
     Note:
-        The client is created with ``follow_redirects=True`` so all requests
-        automatically handle HTTP redirects.
+        The pooled clients are created with ``follow_redirects=True`` so all
+        requests automatically handle HTTP redirects. They carry no auth
+        headers — callers pass those per request.
     """
 
-    return httpx.AsyncClient(timeout=timeout, follow_redirects=True)
+    return HTTP_POOL.lease(timeout=timeout)
 
 
 def _capture_credits_remaining(response: Any) -> None:
@@ -95,9 +116,17 @@ class ChainNotFoundError(ValueError):
 
 
 class ResponseTooLargeError(Exception):
-    """Exception raised when a response exceeds the configured size limit."""
+    """Exception raised when a response exceeds the configured size limit.
 
-    pass
+    When raised by a byte-capped read (``max_body_bytes``), ``limit`` is the cap
+    and ``size`` the body size in bytes if the upstream declared it, or ``None``
+    when the transfer was aborted before the full size was known.
+    """
+
+    def __init__(self, message: str, *, size: int | None = None, limit: int | None = None) -> None:
+        super().__init__(message)
+        self.size = size
+        self.limit = limit
 
 
 class CreditsExhaustedError(Exception):
@@ -114,7 +143,7 @@ async def _fetch_pro_api_config() -> dict[str, str]:
     async with _create_httpx_client(timeout=config.pro_api_config_timeout) as client:
         response = await client.get(config.pro_api_config_url)
     response.raise_for_status()
-    payload = response.json()
+    payload = _response_json(response)
 
     chains = payload.get("chains") if isinstance(payload, dict) else None
     if not isinstance(chains, dict):
@@ -127,6 +156,11 @@ async def ensure_pro_api_config() -> dict[str, str]:
     cached = pro_api_config_cache.get_if_fresh()
     if cached is not None:
         return cached
+    # While the background refresher runs, revalidation is its job: serve the
+    # expired snapshot instead of making this caller wait on the network.
+    stale = pro_api_config_cache.get_stale_if_refreshing()
+    if stale is not None:
+        return stale
 
     async with pro_api_config_cache.lock:
         cached = pro_api_config_cache.get_if_fresh()
@@ -149,6 +183,23 @@ async def ensure_pro_api_config() -> dict[str, str]:
             raise
 
 
+async def refresh_pro_api_config() -> bool:
+    """Fetch and store a new PRO API config snapshot for the background refresher.
+
+    Unlike :func:`ensure_pro_api_config` this always fetches and lets errors
+    propagate (the refresher owns backoff). The chains list is not invalidated —
+    the refresher rebuilds it instead, so readers never find it missing.
+
+    Returns:
+        Whether the set of supported chains changed (``False`` for the first snapshot).
+    """
+    async with pro_api_config_cache.lock:
+        previous = pro_api_config_cache.chain_urls_snapshot
+        chain_urls = await _fetch_pro_api_config()
+        pro_api_config_cache.store_snapshot(chain_urls)
+    return previous is not None and previous.keys() != chain_urls.keys()
+
+
 async def ensure_chain_supported(chain_id: str) -> None:
     """Validate that a chain ID is supported by the Blockscout API.
 
@@ -213,7 +264,12 @@ def _extract_http_error_details(response: httpx.Response) -> str:
 
 
 async def make_blockscout_request(
-    chain_id: str, api_path: str, params: dict[str, Any] | None = None, *, timeout: float | None = None
+    chain_id: str,
+    api_path: str,
+    params: dict[str, Any] | None = None,
+    *,
+    timeout: float | None = None,
+    max_body_bytes: int | None = None,
 ) -> dict:
     """
     Make a GET request to the Blockscout PRO API.
@@ -225,6 +281,10 @@ async def make_blockscout_request(
         timeout: Optional override for the HTTP request timeout in seconds.
             When None, uses the heavy timeout (config.bs_timeout, default 120s).
             Pass config.bs_light_timeout (20s) for simple point-lookup endpoints.
+        max_body_bytes: Optional cap on the (decoded) response body size. When set,
+            the body is streamed and the transfer is aborted with
+            ``ResponseTooLargeError`` as soon as it exceeds the cap, before
+            anything is parsed.
 
     Returns:
         The JSON response as a dictionary. If the API returns a JSON null body, returns an empty dictionary {}.
@@ -235,6 +295,8 @@ async def make_blockscout_request(
         CreditsExhaustedError: If the PRO API returns HTTP 402 (credit allowance depleted)
         httpx.HTTPStatusError: If the HTTP request returns a non-402 error status code
         httpx.TimeoutException: If the request times out
+        CircuitOpenError: If the upstream's circuit breaker is open (no request is sent)
+        ResponseTooLargeError: If ``max_body_bytes`` is set and the body exceeds it
         httpx.RequestError: For transport-level errors after final retry
 
     Retry behavior:
@@ -249,20 +311,102 @@ async def make_blockscout_request(
         Rationale: Integration and production traffic can occasionally hit flaky
         network conditions. Centralizing minimal retries here improves robustness
         for all tools and REST endpoints without masking persistent API errors.
+
+    Coalescing:
+        Concurrent identical GETs (same chain, path, params, timeout, and PRO API
+        key) share one upstream request via ``upstream_get_flight`` when
+        ``config.request_coalescing_enabled`` is set. Only the raw response is
+        shared: each caller parses its own copy of the body and records credits
+        into its own sink.
+
+    Caching:
+        Responses the endpoint rules in ``response_cache`` consider final (or
+        cacheable for a TTL) are served from memory without an upstream request
+        or credit spend. When the upstream fails with a transport error, 429, or
+        5xx, a recently expired entry is served instead of the error.
+
+    Prefetching:
+        A request ``prefetch_next_page`` started in the background for the
+        previous page of a paginated tool is served from ``prefetcher`` (awaited
+        if it is still running) instead of being sent again.
+
+    Hedging:
+        Light-timeout lookups (``timeout=config.bs_light_timeout``) may be
+        hedged by ``hedge_policy``: a second attempt is sent when the first is
+        slower than a learned latency percentile, within a global budget. Each
+        retry attempt is hedged on its own, never the whole retry sequence.
     """
     require_pro_api_key("data access")
     # Validate per request: cheap on a warm cache; keeps this helper the one chokepoint no caller can bypass.
     await ensure_chain_supported(chain_id)
     base_url = f"{config.pro_api_base_url}/{chain_id}"
-    return await _make_blockscout_http_request(
-        method="GET",
-        base_url=base_url,
-        api_path=api_path,
-        retry_exceptions=(httpx.RequestError,),
-        headers=_pro_api_headers(),
-        params=params,
-        timeout=timeout,
-    )
+    headers = _pro_api_headers()
+
+    async def _send() -> httpx.Response:
+        return await _send_blockscout_http_request(
+            method="GET",
+            base_url=base_url,
+            api_path=api_path,
+            retry_exceptions=(httpx.RequestError,),
+            headers=headers,
+            params=params,
+            timeout=timeout,
+            circuit_key=chain_breaker_key(chain_id),
+            max_body_bytes=max_body_bytes,
+            hedged=timeout == config.bs_light_timeout and hedge_policy.enabled,
+        )
+
+    cache_key = response_cache.make_key(chain_id, api_path, params) if response_cache.enabled else None
+    if cache_key is not None and (cached := response_cache.get(cache_key, max_bytes=max_body_bytes)) is not None:
+        return cached
+
+    if prefetcher.enabled:
+        prefetched = await prefetcher.take(_coalescing_key(chain_id, api_path, params, timeout, max_body_bytes))
+        if prefetched is not None:
+            return prefetched
+
+    try:
+        if config.request_coalescing_enabled:
+            response = await upstream_get_flight.run(
+                _coalescing_key(chain_id, api_path, params, timeout, max_body_bytes), _send
+            )
+        else:
+            response = await _send()
+    except (httpx.RequestError, httpx.HTTPStatusError) as e:
+        if cache_key is not None and is_stale_servable_error(e):
+            stale = response_cache.get_stale(cache_key, max_bytes=max_body_bytes)
+            if stale is not None:
+                logger.warning(
+                    "Serving stale cached response for %s on chain %s after upstream error: %s", api_path, chain_id, e
+                )
+                return stale
+        raise
+    data = _parse_blockscout_response(response)
+    if cache_key is not None:
+        # getattr: test doubles commonly stub only ``json()``; ``store`` skips non-bytes bodies.
+        response_cache.store(chain_id, api_path, params, getattr(response, "content", None), data)
+    return data
+
+
+def _coalescing_key(
+    chain_id: str,
+    api_path: str,
+    params: dict[str, Any] | None,
+    timeout: float | None,
+    max_body_bytes: int | None = None,
+) -> tuple[str, str, str, float, str, int | None]:
+    """Return the singleflight key for a PRO API GET.
+
+    Params are normalized by sorting and stringifying so that logically equal
+    requests built in different orders coalesce. The effective key is included
+    as a fingerprint so callers with different keys never share an outcome, and
+    the body cap so an uncapped caller never inherits a capped caller's
+    ``ResponseTooLargeError``.
+    """
+    normalized_params = json_codec.dumps(params or {}, sort_keys=True, default=str)
+    effective_timeout = timeout if timeout is not None else config.bs_timeout
+    key_fingerprint = _fingerprint_pro_api_key(resolve_pro_api_key() or "")
+    return (chain_id, api_path, normalized_params, effective_timeout, key_fingerprint, max_body_bytes)
 
 
 async def make_blockscout_post_request(
@@ -272,6 +416,7 @@ async def make_blockscout_post_request(
     params: dict[str, Any] | None = None,
     *,
     timeout: float | None = None,
+    max_body_bytes: int | None = None,
 ) -> dict:
     """Make a POST request to the Blockscout PRO API.
 
@@ -281,11 +426,13 @@ async def make_blockscout_post_request(
         json_body: The JSON body for the POST request
         params: Optional query parameters
         timeout: Optional override for the HTTP request timeout in seconds.
+        max_body_bytes: Optional cap on the response body size (see ``make_blockscout_request``).
 
     Raises:
         ValueError: If no effective PRO API key is configured (neither a server-side nor a client-supplied key)
         ChainNotFoundError: If the chain_id is not supported
         CreditsExhaustedError: If the PRO API returns HTTP 402 (credit allowance depleted)
+        ResponseTooLargeError: If ``max_body_bytes`` is set and the body exceeds it
 
     Retry behavior is intentionally strict because POST requests are not idempotent:
     retries occur only for connection-establishment failures (ConnectError,
@@ -304,6 +451,8 @@ async def make_blockscout_post_request(
         json_body=json_body,
         params=params,
         timeout=timeout,
+        circuit_key=chain_breaker_key(chain_id),
+        max_body_bytes=max_body_bytes,
     )
 
 
@@ -317,50 +466,235 @@ async def _make_blockscout_http_request(
     headers: dict[str, str] | None = None,
     *,
     timeout: float | None = None,
+    circuit_key: str | None = None,
+    max_body_bytes: int | None = None,
 ) -> dict:
+    response = await _send_blockscout_http_request(
+        method=method,
+        base_url=base_url,
+        api_path=api_path,
+        retry_exceptions=retry_exceptions,
+        json_body=json_body,
+        params=params,
+        headers=headers,
+        timeout=timeout,
+        circuit_key=circuit_key,
+        max_body_bytes=max_body_bytes,
+    )
+    return _parse_blockscout_response(response)
+
+
+class _RateLimitedRetry(Exception):
+    """An attempt got a 429 whose Retry-After fits the wait budget; retry it."""
+
+
+async def _send_blockscout_http_request(
+    method: Literal["GET", "POST"],
+    base_url: str,
+    api_path: str,
+    retry_exceptions: tuple[type[Exception], ...],
+    json_body: dict[str, Any] | None = None,
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+    *,
+    timeout: float | None = None,
+    circuit_key: str | None = None,
+    max_body_bytes: int | None = None,
+    hedged: bool = False,
+) -> httpx.Response:
+    """Send a PRO API request with retries and error mapping; return the successful response.
+
+    Split from body parsing so a response can be shared between coalesced
+    callers (see ``make_blockscout_request``) while each caller still parses
+    and accounts for it independently.
+
+    Every attempt runs under the circuit breaker for ``circuit_key`` (the
+    upstream host when omitted). An open breaker raises ``CircuitOpenError``
+    before any network call and is never retried, so a degraded upstream stops
+    costing each call the full retry budget.
+
+    Every attempt is also paced by the ``rate_pacer`` bucket of the effective
+    PRO API key and host. An HTTP 429 is retried after its ``Retry-After`` when
+    that wait fits ``config.rate_limit_max_wait_seconds`` and attempts remain;
+    otherwise it surfaces as the usual ``httpx.HTTPStatusError``.
+
+    With ``max_body_bytes`` the body is streamed through ``_read_capped_response``
+    and the transfer is aborted once it exceeds the cap.
+
+    With ``hedged`` each attempt is run through ``hedge_policy``, so a hedge
+    races a single attempt and never starts a second retry and backoff
+    sequence against the same upstream.
+    """
     effective_timeout = timeout if timeout is not None else config.bs_timeout
+    url = f"{base_url.rstrip('/')}/{api_path.lstrip('/')}"
+    host = httpx.URL(url).host
+    breaker = circuit_breakers.get(circuit_key or host_breaker_key(url))
+    pacing = (
+        rate_pacer.bucket(_fingerprint_pro_api_key(resolve_pro_api_key() or ""), host) if rate_pacer.enabled else None
+    )
+    metric_labels = (host, _chain_label(circuit_key), metrics.endpoint_template(api_path))
     async with _create_httpx_client(timeout=effective_timeout) as client:
         local_params = dict(params) if params is not None else {}
 
-        url = f"{base_url.rstrip('/')}/{api_path.lstrip('/')}"
+        async def _attempt(is_last_attempt: bool) -> httpx.Response:
+            if pacing is not None:
+                await pacing.acquire()
+            with breaker.track(), metrics.track_upstream(*metric_labels) as observed:
+                if max_body_bytes is not None:
+                    response = await _read_capped_response(
+                        client,
+                        method,
+                        url,
+                        max_body_bytes,
+                        json=json_body if method == "POST" else None,
+                        params=local_params,
+                        headers=headers,
+                    )
+                elif method == "GET":
+                    response = await client.get(url, params=local_params, headers=headers)
+                else:
+                    response = await client.post(url, json=json_body, params=local_params, headers=headers)
+                observed.response = response
+                if pacing is not None and response.status_code == 429:
+                    # A 429 means the request was not processed, so it is safe
+                    # to retry even for POST. Queue it behind Retry-After (the
+                    # next ``acquire`` waits) when that fits the wait budget.
+                    retry_after = pacing.on_rate_limited(response)
+                    if not is_last_attempt and retry_after <= config.rate_limit_max_wait_seconds:
+                        raise _RateLimitedRetry
+                _raise_for_pro_api_status(response)
+            return response
 
         last_error: Exception | None = None
         for attempt in range(config.bs_request_max_retries):
+            is_last_attempt = attempt == (config.bs_request_max_retries - 1)
             try:
-                if method == "GET":
-                    response = await client.get(url, params=local_params, headers=headers)
-                else:
-                    response = await client.post(url, json=json_body, params=local_params, headers=headers)
-                try:
-                    response.raise_for_status()
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 402:
-                        raise CreditsExhaustedError(
-                            "Blockscout PRO API credits exhausted (HTTP 402): the API key's credit allowance is "
-                            "depleted. Top up credits or wait for the daily reset; retrying will not succeed until "
-                            "credits are replenished."
-                        ) from e
-                    details = _extract_http_error_details(e.response)
-                    reason = e.response.reason_phrase or "Error"
-                    message = f"{e.response.status_code} {reason}"
-                    if details:
-                        message = f"{message} - Details: {details}"
-                    raise httpx.HTTPStatusError(message, request=e.request, response=e.response) from e
-                data = response.json()
-                # Capture remaining credits as a side effect on the success
-                # path only.  This is intentionally kept separate from the
-                # 402-exhaustion error path above.
-                _capture_credits_remaining(response)
-                return data if data is not None else {}
+                if hedged:
+                    return await hedge_policy.run(functools.partial(_attempt, is_last_attempt))
+                return await _attempt(is_last_attempt)
+            except _RateLimitedRetry:
+                metrics.upstream_retries.inc(*metric_labels, "rate_limited")
             except retry_exceptions as e:
                 last_error = e
-                if attempt == (config.bs_request_max_retries - 1):
+                if is_last_attempt:
                     break
-                await anyio.sleep(0.5 * (2**attempt))
+                metrics.upstream_retries.inc(*metric_labels, "transport")
+                await anyio.sleep(_retry_backoff_seconds(attempt))
         assert last_error is not None
         raise last_error
 
 
+async def _read_capped_response(
+    client: Any, method: Literal["GET", "POST"], url: str, max_bytes: int, **kwargs: Any
+) -> httpx.Response:
+    """Stream a response body and abort the transfer once it exceeds *max_bytes*.
+
+    A declared ``Content-Length`` above the cap (of an uncompressed body) is
+    rejected before any of the body is read. Otherwise the decoded body is accumulated chunk by chunk, so
+    an oversized response costs at most ``max_bytes`` plus one chunk of memory
+    and is never parsed. The returned response is fully buffered and behaves
+    like one from a plain ``get``/``post``.
+    """
+    async with client.stream(method, url, **kwargs) as response:
+        # Content-Length is the encoded size; it bounds the decoded size only without a content coding.
+        declared = response.headers.get("content-length")
+        encoding = response.headers.get("content-encoding", "identity").strip().lower()
+        if encoding == "identity" and declared is not None and declared.isdigit() and int(declared) > max_bytes:
+            raise ResponseTooLargeError(
+                f"Response body ({declared} bytes) exceeds the {max_bytes}-byte limit.",
+                size=int(declared),
+                limit=max_bytes,
+            )
+        chunks: list[bytes] = []
+        received = 0
+        async for chunk in response.aiter_bytes():
+            received += len(chunk)
+            if received > max_bytes:
+                raise ResponseTooLargeError(
+                    f"Response body exceeds the {max_bytes}-byte limit; the transfer was aborted.",
+                    limit=max_bytes,
+                )
+            chunks.append(chunk)
+    # The chunks are already decoded, so the rebuilt response must not claim an encoding.
+    buffered_headers = [
+        (name, value)
+        for name, value in response.headers.multi_items()
+        if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+    ]
+    return httpx.Response(
+        response.status_code,
+        headers=buffered_headers,
+        content=b"".join(chunks),
+        request=response.request,
+        extensions=response.extensions,
+    )
+
+
+def _raise_for_pro_api_status(response: httpx.Response) -> None:
+    """Raise the enriched error for a non-success PRO API response.
+
+    HTTP 402 becomes ``CreditsExhaustedError``; any other error status becomes an
+    ``httpx.HTTPStatusError`` whose message carries the upstream error details.
+    """
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 402:
+            raise CreditsExhaustedError(
+                "Blockscout PRO API credits exhausted (HTTP 402): the API key's credit allowance is "
+                "depleted. Top up credits or wait for the daily reset; retrying will not succeed until "
+                "credits are replenished."
+            ) from e
+        details = _extract_http_error_details(e.response)
+        reason = e.response.reason_phrase or "Error"
+        message = f"{e.response.status_code} {reason}"
+        if details:
+            message = f"{message} - Details: {details}"
+        raise httpx.HTTPStatusError(message, request=e.request, response=e.response) from e
+
+
+def _chain_label(circuit_key: str | None) -> str:
+    """Return the chain id behind a chain-scoped breaker key, for metric labels."""
+    prefix = chain_breaker_key("")
+    return circuit_key[len(prefix) :] if circuit_key and circuit_key.startswith(prefix) else ""
+
+
+def _retry_backoff_seconds(attempt: int) -> float:
+    """Return the jittered delay before retry number ``attempt + 1``.
+
+    "Equal jitter": half of the exponential step (0.5s, 1.0s, ...) is fixed and
+    the other half is random, so callers that failed together do not retry in
+    lockstep and amplify an upstream outage, while every retry still waits at
+    least a meaningful minimum.
+    """
+    step = 0.5 * (2**attempt)
+    return step / 2 + random.uniform(0, step / 2)
+
+
+def _response_json(response: httpx.Response) -> Any:
+    """Decode a response body with the shared JSON codec (``json_codec``).
+
+    Test doubles commonly stub only ``json()``; they keep working through it.
+    """
+    content = getattr(response, "content", None)
+    if isinstance(content, bytes):
+        return json_codec.loads(content)
+    return response.json()
+
+
+def _parse_blockscout_response(response: httpx.Response) -> dict:
+    """Decode a successful PRO API response into a fresh dict.
+
+    Returns an empty dictionary for a JSON ``null`` body.
+    """
+    data = _response_json(response)
+    # Capture remaining credits as a side effect on the success path only.
+    # This is intentionally kept separate from the 402-exhaustion error path
+    # in ``_send_blockscout_http_request``.
+    _capture_credits_remaining(response)
+    return data if data is not None else {}
+
+
 def _pro_api_headers() -> dict[str, str]:
     """Return HTTP headers for Blockscout PRO API requests.
 
@@ -398,12 +732,17 @@ async def make_bens_request(api_path: str, params: dict | None = None) -> dict:
     Raises:
         httpx.HTTPStatusError: If the HTTP request returns an error status code
         httpx.TimeoutException: If the request times out
+        CircuitOpenError: If the upstream's circuit breaker is open (no request is sent)
     """
     async with _create_httpx_client(timeout=config.bens_timeout) as client:
         url = f"{config.bens_url}{api_path}"
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        with (
+            circuit_breakers.get(host_breaker_key(url)).track(),
+            metrics.track_upstream(httpx.URL(url).host, "", metrics.endpoint_template(api_path)) as observed,
+        ):
+            response = observed.response = await client.get(url, params=params)
+            response.raise_for_status()
+        return _response_json(response)
 
 
 async def make_chainscout_request(api_path: str, params: dict | None = None) -> dict:
@@ -420,12 +759,17 @@ async def make_chainscout_request(api_path: str, params: dict | None = None) ->
     Raises:
         httpx.HTTPStatusError: If the HTTP request returns an error status code
         httpx.TimeoutException: If the request times out
+        CircuitOpenError: If the upstream's circuit breaker is open (no request is sent)
     """
     async with _create_httpx_client(timeout=config.chainscout_timeout) as client:
         url = f"{config.chainscout_url}{api_path}"
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        with (
+            circuit_breakers.get(host_breaker_key(url)).track(),
+            metrics.track_upstream(httpx.URL(url).host, "", metrics.endpoint_template(api_path)) as observed,
+        ):
+            response = observed.response = await client.get(url, params=params)
+            response.raise_for_status()
+        return _response_json(response)
 
 
 async def make_metadata_request(api_path: str, params: dict | None = None) -> dict:
@@ -600,7 +944,7 @@ def encode_cursor(params: dict) -> str:
     """JSON-serializes and Base64URL-encodes pagination parameters."""
     if not params:
         return ""
-    json_string = json.dumps(params, separators=(",", ":"))
+    json_string = json_codec.dumps(params, ensure_ascii=True)
     return base64.urlsafe_b64encode(json_string.encode("utf-8")).decode("utf-8")
 
 
@@ -611,7 +955,7 @@ def decode_cursor(cursor: str) -> dict:
     try:
         padded_cursor = cursor + "=" * (-len(cursor) % 4)
         json_string = base64.urlsafe_b64decode(padded_cursor.encode("utf-8")).decode("utf-8")
-        return json.loads(json_string)
+        return json_codec.loads(json_string)
     except (TypeError, ValueError, json.JSONDecodeError, base64.binascii.Error) as e:
         raise InvalidCursorError("Invalid or expired cursor provided.") from e
 
@@ -866,6 +1210,64 @@ def apply_cursor_to_params(cursor: str | None, params: dict) -> None:
             )
 
 
+def take_buffered_items(
+    *,
+    tool_name: str,
+    next_call_base_params: dict,
+    cursor: str | None,
+) -> BufferedPage | None:
+    """Return the upstream items buffered for this follow-up call, or ``None`` to fetch them.
+
+    The counterpart of ``create_items_pagination(..., source_items=...)``: a call
+    repeating an emitted ``next_call`` gets the items that were fetched past the
+    previous page instead of re-requesting them (see ``page_buffer.py``). A hit
+    still requires a PRO API key, as the upstream path would; a miss leaves that
+    check to the upstream request.
+    """
+    if not cursor:
+        return None
+    page = page_buffer.take(tool_name, {**next_call_base_params, "cursor": cursor})
+    if page is not None:
+        require_pro_api_key("data access")
+    return page
+
+
+def prefetch_next_page(
+    *,
+    chain_id: str,
+    api_path: str,
+    params: dict,
+    pagination: PaginationInfo | None,
+    timeout: float | None = None,
+    max_body_bytes: int | None = None,
+) -> None:
+    """Start fetching the upstream page ``pagination.next_call`` will request (see ``prefetch.py``).
+
+    Args:
+        params: The query parameters of the upstream GET this call made; the
+                follow-up call makes the same GET with its cursor applied.
+        timeout, max_body_bytes: As passed to ``make_blockscout_request``, so the
+                prefetch matches the follow-up request exactly.
+
+    Nothing is started when prefetching is disabled, the response has no next
+    page, or the page buffer will serve the next call without an upstream request.
+    """
+    if pagination is None or not prefetcher.enabled:
+        return
+    next_call = pagination.next_call
+    cursor = next_call.params.get("cursor")
+    if not cursor or page_buffer.holds(next_call.tool_name, next_call.params):
+        return
+    next_params = dict(params)
+    next_params.update(decode_cursor(cursor))
+    prefetcher.schedule(
+        _coalescing_key(chain_id, api_path, next_params, timeout, max_body_bytes),
+        functools.partial(
+            make_blockscout_request, chain_id, api_path, next_params, timeout=timeout, max_body_bytes=max_body_bytes
+        ),
+    )
+
+
 def create_items_pagination(
     *,
     items: list[dict],
@@ -874,6 +1276,8 @@ def create_items_pagination(
     next_call_base_params: dict,
     cursor_extractor: Callable[[dict], dict],
     force_pagination: bool = False,
+    source_items: list | None = None,
+    upstream_has_more: bool = True,
 ) -> tuple[list[dict], PaginationInfo | None]:
     """
     Slice items list and generate pagination info if needed.
@@ -882,6 +1286,11 @@ def create_items_pagination(
         force_pagination: If True, creates pagination even when items <= page_size,
                          using the last item for cursor generation. Useful when the caller
                          knows there are more pages available despite having few items.
+        source_items: The upstream items ``items`` were built from, position for position.
+                      When given, the ones past the returned page are buffered under the
+                      emitted ``next_call`` for ``take_buffered_items``.
+        upstream_has_more: Whether the upstream had pages beyond ``source_items``; decides
+                           whether a short buffered remainder may be served on its own.
     """
     if len(items) <= page_size and not force_pagination:
         return items, None
@@ -913,6 +1322,15 @@ def create_items_pagination(
         )
     )
 
+    if source_items is not None and len(items) > page_size:
+        page_buffer.store(
+            tool_name,
+            final_params,
+            source_items[page_size:],
+            page_size=page_size,
+            upstream_has_more=upstream_has_more,
+        )
+
     return sliced_items, pagination
 
 
@@ -1,9 +1,15 @@
 # SPDX-License-Identifier: LicenseRef-Blockscout
 from typing import Any
 
+from blockscout_mcp_server import metrics
 from blockscout_mcp_server.cache import CachedContract, contract_cache
 from blockscout_mcp_server.config import config
-from blockscout_mcp_server.pro_api_key_context import require_pro_api_key
+from blockscout_mcp_server.pro_api_key_context import (
+    _fingerprint_pro_api_key,
+    require_pro_api_key,
+    resolve_pro_api_key,
+)
+from blockscout_mcp_server.singleflight import contract_fetch_flight
 from blockscout_mcp_server.tools.common import (
     _truncate_constructor_args,
     make_blockscout_request,
@@ -22,8 +28,14 @@ def _determine_file_path(raw_data: dict[str, Any]) -> str:
     return file_path
 
 
-async def _fetch_and_process_contract(chain_id: str, address: str) -> CachedContract:
-    """Fetch contract data from cache or Blockscout API."""
+async def _fetch_and_process_contract(chain_id: str, address: str, *, artifact: str = "metadata") -> CachedContract:
+    """Fetch contract data from cache or Blockscout API.
+
+    One ``/api/v2/smart-contracts/{address}`` payload yields every artifact the
+    contract tools serve — metadata, source files, and the ABI — so they all
+    share this cache entry. ``artifact`` names the one the caller is after and
+    only labels the lookup metric.
+    """
 
     # Gate on the effective PRO API key before the cache lookup so that a
     # malformed or absent key fails closed even when protected data is cached.
@@ -38,8 +50,21 @@ async def _fetch_and_process_contract(chain_id: str, address: str) -> CachedCont
     # This is deliberate: the key authorizes the server's upstream requests, and
     # a cache hit makes none, so there is nothing to authorize here.
     if cached := await contract_cache.get(cache_key):
+        metrics.contract_artifact_lookups.inc(artifact, "hit")
         return cached
+    metrics.contract_artifact_lookups.inc(artifact, "miss")
+
+    if not config.request_coalescing_enabled:
+        return await _load_contract(chain_id, normalized_address, cache_key)
+    # Coalesce a cold-cache stampede on one contract into a single fetch and
+    # processing pass. The key fingerprint keeps callers with different PRO API
+    # keys from sharing each other's upstream outcome (e.g. a 402).
+    flight_key = (cache_key, _fingerprint_pro_api_key(resolve_pro_api_key() or ""))
+    return await contract_fetch_flight.run(flight_key, lambda: _load_contract(chain_id, normalized_address, cache_key))
+
 
+async def _load_contract(chain_id: str, normalized_address: str, cache_key: str) -> CachedContract:
+    """Fetch a contract from the Blockscout API, process it, and store it in the cache."""
     api_path = f"/api/v2/smart-contracts/{normalized_address}"
     # 20s light timeout validated empirically: payloads range from ~10 KB
     # (simple proxies) to ~350 KB (large multi-file projects like Uniswap V3
@@ -101,6 +126,6 @@ async def _fetch_and_process_contract(chain_id: str, address: str) -> CachedCont
     ]:
         metadata_copy.pop(field, None)
 
-    cached_contract = CachedContract(metadata=metadata_copy, source_files=source_files)
+    cached_contract = CachedContract(metadata=metadata_copy, source_files=source_files, abi=raw_data.get("abi"))
     await contract_cache.set(cache_key, cached_contract)
     return cached_contract
@@ -4,16 +4,12 @@ from typing import Annotated
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
-from blockscout_mcp_server.config import config
 from blockscout_mcp_server.constants import SESSION_ID_PARAM_DESCRIPTION
 from blockscout_mcp_server.models import ContractAbiData, ToolResponse
 from blockscout_mcp_server.pro_api_key_context import pro_api_credit_scope, pro_api_key_scope
 from blockscout_mcp_server.session_gate import session_gate
-from blockscout_mcp_server.tools.common import (
-    build_tool_response,
-    make_blockscout_request,
-    report_and_log_progress,
-)
+from blockscout_mcp_server.tools.common import build_tool_response, report_and_log_progress
+from blockscout_mcp_server.tools.contract._shared import _fetch_and_process_contract
 from blockscout_mcp_server.tools.decorators import log_tool_invocation
 
 
@@ -31,8 +27,6 @@ async def get_contract_abi(
     Get smart contract ABI (Application Binary Interface).
     An ABI defines all functions, events, their parameters, and return types. The ABI is required to format function calls or interpret contract data.
     """  # noqa: E501
-    api_path = f"/api/v2/smart-contracts/{address}"
-
     # Report start of operation
     await report_and_log_progress(
         ctx,
@@ -41,15 +35,9 @@ async def get_contract_abi(
         message=f"Starting to fetch contract ABI for {address} on chain {chain_id}...",
     )
 
-    # 20s light timeout validated empirically: payloads range from ~10 KB
-    # (simple proxies) to ~350 KB (large multi-file projects like Uniswap V3
-    # Universal Router); worst-case server response is ~10-15s on loaded
-    # instances, leaving comfortable headroom under bs_light_timeout.
-    response_data = await make_blockscout_request(
-        chain_id=chain_id,
-        api_path=api_path,
-        timeout=config.bs_light_timeout,
-    )
+    # Served from the same contract cache entry as inspect_contract_code: one
+    # smart-contract payload yields the metadata, the sources, and the ABI.
+    contract = await _fetch_and_process_contract(chain_id, address, artifact="abi")
 
     # Report completion
     await report_and_log_progress(
@@ -59,8 +47,8 @@ async def get_contract_abi(
         message="Successfully fetched contract ABI.",
     )
 
-    # Extract the ABI from the API response as it is
-    abi_data = ContractAbiData(abi=response_data.get("abi"))
+    # The ABI is cached as returned by the API
+    abi_data = ContractAbiData(abi=contract.abi)
 
     abi_entries = abi_data.abi or []
     function_count = sum(1 for entry in abi_entries if isinstance(entry, dict) and entry.get("type") == "function")
@@ -49,7 +49,10 @@ async def inspect_contract_code(
         message=start_msg,
     )
 
-    processed = await _fetch_and_process_contract(chain_id, address)
+    if file_name is None:
+        processed = await _fetch_and_process_contract(chain_id, address)
+    else:
+        processed = await _fetch_and_process_contract(chain_id, address, artifact="source")
     await report_and_log_progress(
         ctx,
         progress=1.0,
@@ -3,11 +3,15 @@ import asyncio
 import functools
 import inspect
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from typing import Any
 
-from blockscout_mcp_server import analytics, telemetry
-from blockscout_mcp_server.client_meta import extract_client_meta_from_ctx, format_client_meta_suffix
+from blockscout_mcp_server import analytics, metrics, session_gate, telemetry
+from blockscout_mcp_server.call_context import ArgumentBinder, call_context
+from blockscout_mcp_server.client_meta import format_client_meta_suffix
+from blockscout_mcp_server.logging_utils import CappedRepr
+from blockscout_mcp_server.pro_api_key_context import enter_key_scope, exit_key_scope
 
 logger = logging.getLogger(__name__)
 
@@ -21,38 +25,47 @@ _SESSION_ID_REDACTED_PLACEHOLDER = "<redacted>"
 
 
 def log_tool_invocation(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
-    """Log the tool name and arguments when it is invoked."""
-    sig = inspect.signature(func)
+    """Log the tool name and arguments when it is invoked.
+
+    Applied over the standard tool stack (``@pro_api_key_scope``, then
+    ``@session_gate`` or ``@session_gate_unmetered``, then
+    ``@pro_api_credit_scope``), it compiles the stack into one wrapper at
+    registration: the key scope and the gate run inline from here, off one
+    argument binding (see :class:`~blockscout_mcp_server.call_context.ArgumentBinder`)
+    and one :class:`~blockscout_mcp_server.call_context.CallContext`, instead of
+    each binding the arguments and reading ``ctx`` again. Only the credit scope,
+    which reads no arguments, is still called as its own wrapper. Any other
+    stack is wrapped as is.
+    """
+    tool_name = func.__name__
+    binder = ArgumentBinder(inspect.signature(func))
+    inner, key_scope, gate = _compile_stages(func)
 
     @functools.wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
-        bound = sig.bind_partial(*args, **kwargs)
-        bound.apply_defaults()
-        arg_dict = dict(bound.arguments)
+        arg_dict = binder.bind(args, kwargs)
         ctx = arg_dict.pop("ctx", None)
+        call = call_context(ctx)
+        session_id = arg_dict.get("session_id")
 
         # Mask a live `session_id` before it reaches the log line, analytics, or
         # telemetry sinks below — all three read this same `arg_dict`. Masking is
         # unconditional by argument name (not gated on the session feature being
         # enabled), since ungated deployments also receive this argument.
-        if arg_dict.get("session_id"):
+        if session_id:
             arg_dict["session_id"] = _SESSION_ID_REDACTED_PLACEHOLDER
 
-        # Extract client metadata consistently using shared helper
-        meta = extract_client_meta_from_ctx(ctx)
-        client_name = meta.name
-        client_version = meta.version
-        protocol_version = meta.protocol
-
-        # Derive the auth-origin / fingerprint signals once and reuse them for both
-        # sinks below; see telemetry.resolve_auth_signals for the rationale and gating.
-        auth_origin, api_key_fingerprint = telemetry.resolve_auth_signals(ctx)
+        # Client metadata and the auth-origin / fingerprint signals are derived once
+        # per call and reused for both sinks below; see telemetry.resolve_auth_signals
+        # for the rationale and gating.
+        meta = call.client_meta
+        auth_origin, api_key_fingerprint = call.auth_signals
 
         # Track analytics (no-op if disabled)
         try:
             analytics.track_tool_invocation(
                 ctx,
-                func.__name__,
+                tool_name,
                 arg_dict,
                 client_meta=meta,
                 auth_origin=auth_origin,
@@ -62,21 +75,42 @@ def log_tool_invocation(func: Callable[..., Awaitable[Any]]) -> Callable[..., Aw
             # Defensive: tracking must never break tool execution
             pass
 
-        log_message = f"Tool invoked: {func.__name__} with args: {arg_dict} " + format_client_meta_suffix(meta)
-        logger.info(log_message)
+        # Formatted only if the record is emitted, off the event loop when the log
+        # queue is on, and with the arguments rendered up to the configured size.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Tool invoked: %s with args: %s %s", tool_name, CappedRepr(arg_dict), format_client_meta_suffix(meta)
+            )
 
+        # Anything that is neither a result nor an exception is a cancellation.
+        status = "cancelled"
+        started = time.perf_counter()
+        metrics.tools_in_flight.inc(tool_name)
+        key_token = enter_key_scope(call.key_state) if key_scope else None
         try:
-            return await func(*args, **kwargs)
+            if gate is None or not session_gate.gate_enabled() or session_gate.client_supplied_valid_key():
+                result = await inner(*args, **kwargs)
+            else:
+                result = await gate(inner, args, kwargs, session_id, call.call_source)
+            status = "success"
+            return result
+        except Exception:
+            status = "error"
+            raise
         finally:
+            if key_token is not None:
+                exit_key_scope(key_token)
+            metrics.tools_in_flight.dec(tool_name)
+            metrics.tool_duration.observe(time.perf_counter() - started, tool_name, status)
             try:
                 arg_snapshot = arg_dict.copy()
                 asyncio.create_task(
                     telemetry.send_community_usage_report(
-                        func.__name__,
+                        tool_name,
                         arg_snapshot,
-                        client_name,
-                        client_version,
-                        protocol_version,
+                        meta.name,
+                        meta.version,
+                        meta.protocol,
                         auth_origin=auth_origin,
                         api_key_fingerprint=api_key_fingerprint,
                     )
@@ -84,4 +118,24 @@ def log_tool_invocation(func: Callable[..., Awaitable[Any]]) -> Callable[..., Aw
             except Exception:
                 pass
 
+    wrapper.__tool_stage__ = "log_tool_invocation"
     return wrapper
+
+
+def _compile_stages(func: Callable[..., Awaitable[Any]]) -> tuple[Callable[..., Awaitable[Any]], bool, Any]:
+    """Peel the key scope and session gate off *func*'s decorator stack.
+
+    Returns the callable left underneath them, whether a key scope was peeled,
+    and the gate's call body (``session_gate.run_metered`` / ``run_unmetered``)
+    or ``None``. Stages are recognized by the ``__tool_stage__`` marker their
+    decorators set, and only in the order the stacking rules require.
+    """
+    inner, key_scope, gate = func, False, None
+    if getattr(inner, "__tool_stage__", None) == "pro_api_key_scope":
+        inner, key_scope = inner.__wrapped__, True
+    stage = getattr(inner, "__tool_stage__", None)
+    if stage == "session_gate":
+        inner, gate = inner.__wrapped__, session_gate.run_metered
+    elif stage == "session_gate_unmetered":
+        inner, gate = inner.__wrapped__, session_gate.run_unmetered
+    return inner, key_scope, gate
@@ -1,5 +1,4 @@
 # SPDX-License-Identifier: LicenseRef-Blockscout
-import json
 from typing import Annotated, Any, Literal
 
 from mcp.server.fastmcp import Context
@@ -18,7 +17,9 @@ from blockscout_mcp_server.tools.common import (
     encode_cursor,
     make_blockscout_post_request,
     make_blockscout_request,
+    prefetch_next_page,
     report_and_log_progress,
+    take_buffered_items,
 )
 from blockscout_mcp_server.tools.decorators import log_tool_invocation
 from blockscout_mcp_server.tools.direct_api import dispatcher
@@ -116,15 +117,49 @@ async def direct_api_call(
     if method == "GET":
         apply_cursor_to_params(cursor, params)
 
-    if method == "GET":
-        response_json = await make_blockscout_request(chain_id=chain_id, api_path=endpoint_path, params=params)
-    else:
-        response_json = await make_blockscout_post_request(
-            chain_id=chain_id,
-            api_path=endpoint_path,
-            json_body=json_body,
-            params=params,
+    # The size limit guards raw responses only: endpoints with a specialized handler
+    # return curated output. It is enforced while the body streams in, so an
+    # oversized response is aborted mid-transfer instead of being buffered,
+    # parsed, and re-serialized just to be measured.
+    max_body_bytes = (
+        None
+        if dispatcher.has_handler(endpoint_path) or _large_response_allowed(ctx)
+        else config.direct_api_response_size_limit
+    )
+    # A handler that paginates buffers the upstream items past the page it returned;
+    # repeating its next_call takes them instead of fetching them again.
+    buffered = None
+    if method == "GET" and dispatcher.has_handler(endpoint_path):
+        next_call_base_params: dict[str, Any] = {"chain_id": chain_id, "endpoint_path": endpoint_path}
+        if query_params:
+            next_call_base_params["query_params"] = dict(query_params)
+        buffered = take_buffered_items(
+            tool_name="direct_api_call", next_call_base_params=next_call_base_params, cursor=cursor
+        )
+
+    try:
+        if buffered is not None:
+            response_json = {"items": buffered.items}
+        elif method == "GET":
+            response_json = await make_blockscout_request(
+                chain_id=chain_id, api_path=endpoint_path, params=params, max_body_bytes=max_body_bytes
+            )
+        else:
+            response_json = await make_blockscout_post_request(
+                chain_id=chain_id,
+                api_path=endpoint_path,
+                json_body=json_body,
+                params=params,
+                max_body_bytes=max_body_bytes,
+            )
+    except ResponseTooLargeError as e:
+        await report_and_log_progress(
+            ctx,
+            progress=1.0,
+            total=1.0,
+            message="Fetch stopped: the response exceeds the size limit.",
         )
+        raise _response_too_large(ctx, e) from e
 
     handler_response = await dispatcher.dispatch(
         endpoint_path=endpoint_path,
@@ -134,8 +169,17 @@ async def direct_api_call(
         ctx=ctx,
         method=method,
         json_body=json_body,
+        upstream_has_more=buffered.upstream_has_more if buffered is not None else None,
     )
     if handler_response is not None:
+        if method == "GET":
+            prefetch_next_page(
+                chain_id=chain_id,
+                api_path=endpoint_path,
+                params=params,
+                pagination=getattr(handler_response, "pagination", None),
+                max_body_bytes=max_body_bytes,
+            )
         await report_and_log_progress(
             ctx,
             progress=1.0,
@@ -158,6 +202,13 @@ async def direct_api_call(
                 # Defensive copy so the returned pagination params don't alias the caller's dict.
                 next_call_params["query_params"] = dict(query_params)
             pagination = PaginationInfo(next_call=NextCallInfo(tool_name="direct_api_call", params=next_call_params))
+            prefetch_next_page(
+                chain_id=chain_id,
+                api_path=endpoint_path,
+                params=params,
+                pagination=pagination,
+                max_body_bytes=max_body_bytes,
+            )
 
     await report_and_log_progress(
         ctx,
@@ -166,31 +217,6 @@ async def direct_api_call(
         message="Successfully fetched data.",
     )
 
-    response_str = json.dumps(response_json)
-    response_len = len(response_str)
-    response_limit = config.direct_api_response_size_limit
-    if response_len > response_limit:
-        is_rest_call = analytics.get_call_source(ctx) == "rest"
-        if is_rest_call:
-            request_context = getattr(ctx, "request_context", None)
-            request = getattr(request_context, "request", None) if request_context else None
-            headers = getattr(request, "headers", {}) if request is not None else {}
-            if not (
-                isinstance(headers.get(ALLOW_LARGE_RESPONSE_HEADER), str)
-                and headers.get(ALLOW_LARGE_RESPONSE_HEADER).lower() == "true"
-            ):
-                message = (
-                    f"Response size ({response_len} chars) exceeds the safety limit. "
-                    f"To bypass, add the header '{ALLOW_LARGE_RESPONSE_HEADER}: true' to your request."
-                )
-                raise ResponseTooLargeError(message)
-        else:
-            message = (
-                f"Response size ({response_len} chars) exceeds the safety limit of {response_limit}. "
-                "Use query parameters to filter the result or try a more specific tool."
-            )
-            raise ResponseTooLargeError(message)
-
     data_payload = {"items": response_json} if isinstance(response_json, list) else response_json
     data = DirectApiData.model_validate(data_payload)
 
@@ -209,3 +235,31 @@ async def direct_api_call(
         content_text = f"Called {endpoint_path} on chain {chain_id}. Response type: {type(response_json).__name__}."
 
     return build_tool_response(data=data, pagination=pagination, content_text=content_text)
+
+
+def _large_response_allowed(ctx: Context) -> bool:
+    """Return ``True`` for REST calls that opted out of the size limit via the bypass header."""
+    if analytics.get_call_source(ctx) != "rest":
+        return False
+    request_context = getattr(ctx, "request_context", None)
+    request = getattr(request_context, "request", None) if request_context else None
+    headers = getattr(request, "headers", {}) if request is not None else {}
+    value = headers.get(ALLOW_LARGE_RESPONSE_HEADER)
+    return isinstance(value, str) and value.lower() == "true"
+
+
+def _response_too_large(ctx: Context, error: ResponseTooLargeError) -> ResponseTooLargeError:
+    """Build the caller-facing error for a response aborted by the size limit."""
+    limit = config.direct_api_response_size_limit
+    size = f"{error.size} bytes" if error.size is not None else f"over {limit} bytes"
+    if analytics.get_call_source(ctx) == "rest":
+        message = (
+            f"Response size ({size}) exceeds the safety limit. "
+            f"To bypass, add the header '{ALLOW_LARGE_RESPONSE_HEADER}: true' to your request."
+        )
+    else:
+        message = (
+            f"Response size ({size}) exceeds the safety limit of {limit}. "
+            "Use query parameters to filter the result or try a more specific tool."
+        )
+    return ResponseTooLargeError(message, size=error.size, limit=limit)
@@ -34,6 +34,11 @@ def register_handler(path_regex: str) -> Callable[[DirectApiHandler], DirectApiH
     return decorator
 
 
+def has_handler(endpoint_path: str) -> bool:
+    """Return ``True`` if a specialized handler is registered for *endpoint_path*."""
+    return any(path_regex.fullmatch(endpoint_path) for path_regex, _ in HANDLER_REGISTRY)
+
+
 async def dispatch(
     endpoint_path: str,
     **kwargs: Any,
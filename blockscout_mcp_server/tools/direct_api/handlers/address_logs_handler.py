@@ -27,6 +27,9 @@ async def handle_address_logs(
     chain_id: str,
     ctx: Context,  # noqa: ARG001 - reserved for future use in handlers
     query_params: dict[str, Any] | None = None,  # supplied by the dispatcher
+    # Passed by direct_api_call when ``response_json`` holds page-buffered items rather
+    # than an upstream response (which carries its own ``next_page_params``).
+    upstream_has_more: bool | None = None,
     **kwargs: Any,  # noqa: ARG001 - reserved for forward-compatible dispatcher context
 ) -> ToolResponse[list[AddressLogItem]]:
     """Process the raw JSON response for an address logs request."""
@@ -89,6 +92,10 @@ async def handle_address_logs(
         tool_name="direct_api_call",
         next_call_base_params=next_call_base_params,
         cursor_extractor=extract_log_cursor_params,
+        source_items=response_json.get("items", []),
+        upstream_has_more=(
+            upstream_has_more if upstream_has_more is not None else response_json.get("next_page_params") is not None
+        ),
     )
 
     sliced_log_items = [AddressLogItem(**item) for item in sliced_items]
@@ -30,6 +30,9 @@ async def handle_transaction_logs(
     # even for a matching topic), so there is nothing to preserve across pagination. The argument
     # is still required by the dispatcher signature, hence the ARG001 marker below is kept.
     query_params: dict[str, Any] | None = None,  # noqa: ARG001
+    # Passed by direct_api_call when ``response_json`` holds page-buffered items rather
+    # than an upstream response (which carries its own ``next_page_params``).
+    upstream_has_more: bool | None = None,
     **kwargs: Any,  # noqa: ARG001 - reserved for forward-compatible dispatcher context
 ) -> ToolResponse[list[TransactionLogItem]]:
     """Process the raw JSON response for a transaction logs request."""
@@ -96,6 +99,10 @@ async def handle_transaction_logs(
             "endpoint_path": f"/api/v2/transactions/{transaction_hash}/logs",
         },
         cursor_extractor=extract_log_cursor_params,
+        source_items=response_json.get("items", []),
+        upstream_has_more=(
+            upstream_has_more if upstream_has_more is not None else response_json.get("next_page_params") is not None
+        ),
     )
 
     log_items = [TransactionLogItem(**item) for item in sliced_items]
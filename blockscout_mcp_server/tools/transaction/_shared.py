@@ -1,4 +1,9 @@
 # SPDX-License-Identifier: LicenseRef-Blockscout
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+import anyio
+from anyio.abc import TaskGroup
 from mcp.server.fastmcp import Context
 
 from blockscout_mcp_server.config import config
@@ -15,6 +20,12 @@ from blockscout_mcp_server.tools.common import (
 
 EXCLUDED_TX_TYPES = {"ERC-20", "ERC-721", "ERC-1155", "ERC-404"}
 
+# A sharded scan never splits the age window into shards narrower than this.
+_MIN_SCAN_SHARD_SECONDS = 3600.0
+# Upstream pages one first-page walk may fetch. A sharded scan divides it between
+# its shards, so sharding makes the walk faster but never more expensive.
+_MAX_SCAN_PAGES = 10
+
 
 def _transform_advanced_filter_item(item: dict, fields_to_remove: list[str]) -> dict:
     """Transforms a single item from the advanced filter API response."""
@@ -134,7 +145,7 @@ async def _fetch_filtered_transactions_with_smart_pagination(
     target_page_size: int,
     ctx: Context,
     *,
-    max_pages_to_fetch: int = 10,
+    max_pages_to_fetch: int = _MAX_SCAN_PAGES,
     progress_start_step: float = 1.0,
     total_steps: float = 11.0,
 ) -> tuple[list[dict], bool]:
@@ -198,9 +209,153 @@ async def _fetch_filtered_transactions_with_smart_pagination(
     return accumulated_items, has_more_pages
 
 
+def _is_listed_transaction(item: dict) -> bool:
+    """Whether ``get_transactions_by_address`` keeps an advanced-filters item (token transfers are excluded)."""
+    return item.get("type") not in EXCLUDED_TX_TYPES
+
+
+def _parse_age(value: str) -> datetime | None:
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def _format_age(value: datetime) -> str:
+    return value.astimezone(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _age_window_shards(
+    age_from: str, age_to: str | None, *, now: datetime | None = None
+) -> list[tuple[str, str | None]] | None:
+    """Split an advanced-filters age window into ``(age_from, age_to)`` shards, newest first.
+
+    Returns ``None`` when the window should be scanned sequentially: sharding is
+    disabled (``BLOCKSCOUT_ADVANCED_FILTERS_SCAN_SHARDS`` is 1), a bound cannot be
+    parsed, or the window is too narrow for two shards of ``_MIN_SCAN_SHARD_SECONDS``.
+    There are never more shards than ``_MAX_SCAN_PAGES``, so each gets a page.
+    The outer bounds are passed through verbatim, so an open-ended window (no
+    ``age_to``) stays open-ended in its newest shard.
+    """
+    start = _parse_age(age_from)
+    end = _parse_age(age_to) if age_to else (now or datetime.now(UTC))
+    if config.advanced_filters_scan_shards < 2 or start is None or end is None:
+        return None
+    shard_count = min(
+        config.advanced_filters_scan_shards,
+        _MAX_SCAN_PAGES,
+        int((end - start).total_seconds() // _MIN_SCAN_SHARD_SECONDS),
+    )
+    if shard_count < 2:
+        return None
+    step = (end - start) / shard_count
+    bounds = [age_from, *(_format_age(start + step * i) for i in range(1, shard_count)), age_to]
+    return [(bounds[i], bounds[i + 1]) for i in reversed(range(shard_count))]
+
+
+async def _scan_advanced_filters_in_shards(
+    chain_id: str,
+    api_path: str,
+    params: dict,
+    shards: list[tuple[str, str | None]],
+    target_page_size: int,
+    *,
+    item_filter: Callable[[dict], bool] | None = None,
+    max_pages: int = _MAX_SCAN_PAGES,
+) -> tuple[list[dict], bool]:
+    """Fetch the first page of an advanced-filters query as concurrent age shards.
+
+    Each shard (newest first, from ``_age_window_shards``) walks its own upstream
+    pages until it holds more than ``target_page_size`` items (after
+    ``item_filter``), is exhausted, or has used its share of ``max_pages``: the
+    page budget of a sequential walk is divided evenly between the shards, so the
+    scan never fetches more pages in total. At most
+    ``BLOCKSCOUT_ADVANCED_FILTERS_SCAN_CONCURRENCY`` shards run at once.
+
+    Shards are disjoint in time, so concatenating them newest first reproduces
+    the upstream's canonical ``(block_number, transaction_index, ...)`` order;
+    a block on a shared bound is dropped from the older shard by its cursor key.
+    Items of a shard are only usable once every newer shard is known to be
+    exhausted, so the result is the longest prefix with that guarantee: it ends
+    at the first shard that has more pages (or that was not needed), and a cursor
+    taken from any of its items resumes the full window correctly. Once that
+    prefix holds more than ``target_page_size`` items, the remaining shards are
+    cancelled.
+
+    Returns:
+        The ordered items and whether the upstream may have more after them.
+    """
+    results: list[tuple[list[dict], bool] | None] = [None] * len(shards)
+    errors: list[Exception] = []
+    limiter = anyio.CapacityLimiter(config.advanced_filters_scan_concurrency)
+    pages_per_shard = max(1, max_pages // len(shards))
+
+    def _prefix() -> tuple[list[dict], bool] | None:
+        items: list[dict] = []
+        seen: set[tuple] = set()
+        for result in results:
+            if result is None:
+                # An unfinished shard only matters while the page is not full yet.
+                return (items, True) if len(items) > target_page_size else None
+            shard_items, exhausted = result
+            for item in shard_items:
+                key = tuple(extract_advanced_filters_cursor_params(item).values())
+                if key not in seen:
+                    seen.add(key)
+                    items.append(item)
+            if not exhausted:
+                return items, True
+        return items, False
+
+    async def _scan_shard(index: int, shard_from: str, shard_to: str | None, tg: TaskGroup) -> None:
+        shard_params = {**params, "age_from": shard_from}
+        shard_params.pop("age_to", None)
+        if shard_to:
+            shard_params["age_to"] = shard_to
+        items: list[dict] = []
+        exhausted = False
+        try:
+            async with limiter:
+                for _ in range(pages_per_shard):
+                    response_data = await make_blockscout_request(
+                        chain_id=chain_id, api_path=api_path, params=shard_params
+                    )
+                    page_items = response_data.get("items", [])
+                    items.extend(page_items if item_filter is None else filter(item_filter, page_items))
+                    next_page_params = response_data.get("next_page_params")
+                    if not next_page_params:
+                        exhausted = True
+                        break
+                    if len(items) > target_page_size:
+                        break
+                    shard_params.update(next_page_params)
+                # Decided while still holding the slot, so no queued shard starts
+                # a request that is no longer needed.
+                results[index] = (items, exhausted)
+                if _prefix() is not None:
+                    tg.cancel_scope.cancel()
+        except Exception as e:
+            # Surfaced below, unwrapped, unless the shards already answered the page.
+            errors.append(e)
+            tg.cancel_scope.cancel()
+
+    async with anyio.create_task_group() as tg:
+        for index, (shard_from, shard_to) in enumerate(shards):
+            tg.start_soon(_scan_shard, index, shard_from, shard_to, tg)
+
+    prefix = _prefix()
+    if prefix is None:
+        raise errors[0]
+    return prefix
+
+
 __all__ = [
     "EXCLUDED_TX_TYPES",
+    "_age_window_shards",
     "_fetch_filtered_transactions_with_smart_pagination",
+    "_is_listed_transaction",
+    "_scan_advanced_filters_in_shards",
     "_process_and_truncate_log_items",
     "_process_and_truncate_tx_info_data",
     "_recursively_truncate_and_flag_long_strings",
@@ -16,10 +16,16 @@ from blockscout_mcp_server.tools.common import (
     extract_advanced_filters_cursor_params,
     make_blockscout_request,
     make_request_with_periodic_progress,
+    prefetch_next_page,
     report_and_log_progress,
+    take_buffered_items,
 )
 from blockscout_mcp_server.tools.decorators import log_tool_invocation
-from blockscout_mcp_server.tools.transaction._shared import _transform_advanced_filter_item
+from blockscout_mcp_server.tools.transaction._shared import (
+    _age_window_shards,
+    _scan_advanced_filters_in_shards,
+    _transform_advanced_filter_item,
+)
 
 
 @log_tool_invocation
@@ -92,34 +98,73 @@ async def get_token_transfers_by_address(
         message=f"Starting to fetch token transfers for {address} on chain {chain_id}...",
     )
 
-    response_data = await make_request_with_periodic_progress(
-        ctx=ctx,
-        request_function=make_blockscout_request,
-        request_args={"chain_id": chain_id, "api_path": api_path, "params": query_params},
-        total_duration_hint=config.bs_timeout,
-        progress_interval_seconds=config.progress_interval_seconds,
-        in_progress_message_template="Query in progress... ({elapsed_seconds:.0f}s / {total_hint:.0f}s hint)",
-        tool_overall_total_steps=tool_overall_total_steps,
-        current_step_number=1.0,
-        current_step_message_prefix="Fetching token transfers",
+    next_call_base_params = {
+        "chain_id": chain_id,
+        "address": address,
+        "age_from": age_from,
+        "age_to": age_to,
+        "token": token,
+    }
+    buffered = take_buffered_items(
+        tool_name="get_token_transfers_by_address",
+        next_call_base_params=next_call_base_params,
+        cursor=cursor,
     )
+    # Only the first page is sharded; a cursor resumes the whole window sequentially.
+    shards = _age_window_shards(age_from, age_to) if buffered is None and not cursor else None
+    if shards is not None:
+        original_items, upstream_has_more = await make_request_with_periodic_progress(
+            ctx=ctx,
+            request_function=_scan_advanced_filters_in_shards,
+            request_args={
+                "chain_id": chain_id,
+                "api_path": api_path,
+                "params": query_params,
+                "shards": shards,
+                "target_page_size": config.advanced_filters_page_size,
+            },
+            total_duration_hint=config.bs_timeout,
+            progress_interval_seconds=config.progress_interval_seconds,
+            in_progress_message_template="Query in progress... ({elapsed_seconds:.0f}s / {total_hint:.0f}s hint)",
+            tool_overall_total_steps=tool_overall_total_steps,
+            current_step_number=1.0,
+            current_step_message_prefix=f"Scanning {len(shards)} time shards",
+        )
+    elif buffered is None:
+        response_data = await make_request_with_periodic_progress(
+            ctx=ctx,
+            request_function=make_blockscout_request,
+            request_args={"chain_id": chain_id, "api_path": api_path, "params": query_params},
+            total_duration_hint=config.bs_timeout,
+            progress_interval_seconds=config.progress_interval_seconds,
+            in_progress_message_template="Query in progress... ({elapsed_seconds:.0f}s / {total_hint:.0f}s hint)",
+            tool_overall_total_steps=tool_overall_total_steps,
+            current_step_number=1.0,
+            current_step_message_prefix="Fetching token transfers",
+        )
+        original_items = response_data.get("items", [])
+        upstream_has_more = response_data.get("next_page_params") is not None
+    else:
+        original_items, upstream_has_more = buffered.items, buffered.upstream_has_more
+        await report_and_log_progress(
+            ctx,
+            progress=tool_overall_total_steps,
+            total=tool_overall_total_steps,
+            message="Fetching token transfers: Served from the page buffer.",
+        )
 
-    original_items = response_data.get("items", [])
     fields_to_remove = ["value", "internal_transaction_index", "created_contract"]
 
     sliced_items, pagination = create_items_pagination(
         items=original_items,
         page_size=config.advanced_filters_page_size,
         tool_name="get_token_transfers_by_address",
-        next_call_base_params={
-            "chain_id": chain_id,
-            "address": address,
-            "age_from": age_from,
-            "age_to": age_to,
-            "token": token,
-        },
+        next_call_base_params=next_call_base_params,
         cursor_extractor=extract_advanced_filters_cursor_params,
+        source_items=original_items,
+        upstream_has_more=upstream_has_more,
     )
+    prefetch_next_page(chain_id=chain_id, api_path=api_path, params=query_params, pagination=pagination)
     transformed_items = [
         AdvancedFilterItem.model_validate(_transform_advanced_filter_item(item, fields_to_remove))
         for item in sliced_items
@@ -12,11 +12,17 @@ from blockscout_mcp_server.session_gate import session_gate
 from blockscout_mcp_server.tools.common import (
     apply_cursor_to_params,
     build_tool_response,
+    make_request_with_periodic_progress,
+    prefetch_next_page,
     report_and_log_progress,
+    take_buffered_items,
 )
 from blockscout_mcp_server.tools.decorators import log_tool_invocation
 from blockscout_mcp_server.tools.transaction._shared import (
+    _age_window_shards,
     _fetch_filtered_transactions_with_smart_pagination,
+    _is_listed_transaction,
+    _scan_advanced_filters_in_shards,
     _transform_advanced_filter_item,
     create_items_pagination,
     extract_advanced_filters_cursor_params,
@@ -93,15 +99,57 @@ async def get_transactions_by_address(
         message=f"Starting to fetch transactions for {address} on chain {chain_id}...",
     )
 
-    filtered_items, has_more_pages = await _fetch_filtered_transactions_with_smart_pagination(
-        chain_id=chain_id,
-        api_path=api_path,
-        initial_params=query_params,
-        target_page_size=config.advanced_filters_page_size,
-        ctx=ctx,
-        progress_start_step=1.0,
-        total_steps=tool_overall_total_steps,
+    next_call_base_params = {
+        "chain_id": chain_id,
+        "address": address,
+        "age_from": age_from,
+        "age_to": age_to,
+        "methods": methods,
+    }
+    buffered = take_buffered_items(
+        tool_name="get_transactions_by_address",
+        next_call_base_params=next_call_base_params,
+        cursor=cursor,
     )
+    # Only the first page is sharded; a cursor resumes the whole window sequentially.
+    shards = _age_window_shards(age_from, age_to) if buffered is None and not cursor else None
+    upstream_has_more = True
+    if buffered is not None:
+        # A remainder is served from the buffer when it is longer than one page or,
+        # after a sharded scan, when the upstream was exhausted; the smart pagination
+        # below always buffers with more upstream pages assumed.
+        filtered_items, upstream_has_more = buffered.items, buffered.upstream_has_more
+        has_more_pages = upstream_has_more or len(filtered_items) > config.advanced_filters_page_size
+    elif shards is not None:
+        filtered_items, upstream_has_more = await make_request_with_periodic_progress(
+            ctx=ctx,
+            request_function=_scan_advanced_filters_in_shards,
+            request_args={
+                "chain_id": chain_id,
+                "api_path": api_path,
+                "params": query_params,
+                "shards": shards,
+                "target_page_size": config.advanced_filters_page_size,
+                "item_filter": _is_listed_transaction,
+            },
+            total_duration_hint=config.bs_timeout,
+            progress_interval_seconds=config.progress_interval_seconds,
+            in_progress_message_template="Query in progress... ({elapsed_seconds:.0f}s / {total_hint:.0f}s hint)",
+            tool_overall_total_steps=tool_overall_total_steps,
+            current_step_number=1.0,
+            current_step_message_prefix=f"Scanning {len(shards)} time shards",
+        )
+        has_more_pages = upstream_has_more
+    else:
+        filtered_items, has_more_pages = await _fetch_filtered_transactions_with_smart_pagination(
+            chain_id=chain_id,
+            api_path=api_path,
+            initial_params=query_params,
+            target_page_size=config.advanced_filters_page_size,
+            ctx=ctx,
+            progress_start_step=1.0,
+            total_steps=tool_overall_total_steps,
+        )
 
     await report_and_log_progress(
         ctx,
@@ -121,16 +169,14 @@ async def get_transactions_by_address(
         items=filtered_items,
         page_size=config.advanced_filters_page_size,
         tool_name="get_transactions_by_address",
-        next_call_base_params={
-            "chain_id": chain_id,
-            "address": address,
-            "age_from": age_from,
-            "age_to": age_to,
-            "methods": methods,
-        },
+        next_call_base_params=next_call_base_params,
         cursor_extractor=extract_advanced_filters_cursor_params,
         force_pagination=has_more_pages and len(filtered_items) <= config.advanced_filters_page_size,
+        source_items=filtered_items,
+        upstream_has_more=upstream_has_more,
     )
+    # Prefetches the first upstream request of the next call's smart pagination.
+    prefetch_next_page(chain_id=chain_id, api_path=api_path, params=query_params, pagination=pagination)
     transformed_items = [
         AdvancedFilterItem.model_validate(_transform_advanced_filter_item(item, fields_to_remove))
         for item in final_items
@@ -35,6 +35,7 @@ import aiohttp
 from web3 import AsyncWeb3
 from web3.providers.rpc import AsyncHTTPProvider
 
+from blockscout_mcp_server import json_codec
 from blockscout_mcp_server.config import config
 from blockscout_mcp_server.constants import SERVER_VERSION
 from blockscout_mcp_server.pro_api_key_context import require_pro_api_key, resolve_pro_api_key
@@ -109,7 +110,7 @@ class AsyncHTTPProviderBlockscout(AsyncHTTPProvider):
             timeout=timeout,
         ) as response:
             response.raise_for_status()
-            return await response.json()
+            return await response.json(loads=json_codec.loads)
 
     async def make_request(self, method: str, params: Any) -> dict[str, Any]:  # type: ignore[override]
         # Blockscout strictly requires ``params`` to be JSON arrays, so normalize
@@ -224,6 +225,22 @@ class Web3Pool:
         self._pool[key] = w3
         return w3
 
+    def stats(self) -> dict[str, int]:
+        """Return pool utilization: cached instances and shared-session connections.
+
+        Connection counts come from the ``aiohttp`` connector's bookkeeping and
+        read as zero before the shared session exists.
+        """
+        connector = getattr(self._session, "connector", None) if self._session is not None else None
+        acquired = getattr(connector, "_acquired", None)
+        waiters = getattr(connector, "_waiters", None)
+        return {
+            "instances": len(self._pool),
+            "connections_in_use": len(acquired) if isinstance(acquired, set) else 0,
+            "connection_waiters": sum(len(queue) for queue in waiters.values()) if isinstance(waiters, dict) else 0,
+            "connection_limit": config.rpc_pool_per_host,
+        }
+
     async def close(self) -> None:
         for w3 in list(self._pool.values()):
             try:
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Microbenchmark the JSON codec against the stdlib on representative tool payloads.
+
+For each payload the script times one decode of the upstream body plus one
+encode of the result (what a tool call costs in JSON work) with the active
+``json_codec`` backend and with the stdlib forced, and prints the speedup.
+
+Usage: python scripts/benchmark_json_codec.py [--rounds N]
+"""
+
+import argparse
+import time
+from unittest.mock import patch
+
+from blockscout_mcp_server import json_codec
+
+
+def _contract_payload() -> dict:
+    source = "// SPDX-License-Identifier: MIT\npragma solidity ^0.8.20;\n" + "contract C { uint256 x; }\n" * 12_000
+    return {
+        "name": "Proxy",
+        "is_fully_verified": True,
+        "source_code": source,
+        "abi": [{"type": "function", "name": f"f{i}", "inputs": [], "outputs": []} for i in range(200)],
+        "additional_sources": [{"file_path": f"lib/L{i}.sol", "source_code": source[:4000]} for i in range(8)],
+    }
+
+
+def _transfers_page() -> dict:
+    item = {
+        "hash": "0x" + "ab" * 32,
+        "from": {"hash": "0x" + "12" * 20, "name": None, "is_contract": False},
+        "to": {"hash": "0x" + "34" * 20, "name": "Uniswap V3: Router", "is_contract": True},
+        "total": {"decimals": "18", "value": "1000000000000000000000"},
+        "token": {"address_hash": "0x" + "56" * 20, "symbol": "USDC", "type": "ERC-20", "exchange_rate": "1.0"},
+        "timestamp": "2024-01-01T00:00:00.000000Z",
+        "block_number": 19_000_000,
+        "log_index": 12,
+    }
+    return {"items": [item] * 50, "next_page_params": {"block_number": 19_000_000, "index": 12}}
+
+
+def _transaction() -> dict:
+    return {
+        "hash": "0x" + "cd" * 32,
+        "status": "ok",
+        "confirmations": 1200,
+        "raw_input": "0x" + "00" * 4096,
+        "decoded_input": {"method_call": "multicall(bytes[] data)", "parameters": [{"value": ["0x" + "ef" * 96] * 8}]},
+        "token_transfers": [{"total": {"value": str(10**21)}, "type": "token_transfer"}] * 20,
+    }
+
+
+PAYLOADS = {
+    "inspect_contract_code (contract source)": _contract_payload,
+    "get_token_transfers_by_address (page)": _transfers_page,
+    "get_transaction_info": _transaction,
+}
+
+
+def _time_round_trip(body: bytes, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        json_codec.dumps(json_codec.loads(body))
+    return (time.perf_counter() - started) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"active backend: {json_codec.codec_name()}")
+    print(f"{'payload':<42} {'size':>9} {'stdlib':>10} {'codec':>10} {'speedup':>8}")
+    for name, build in PAYLOADS.items():
+        body = json_codec.dumps_bytes(build())
+        with patch.object(json_codec, "_orjson", None):
+            baseline = _time_round_trip(body, args.rounds)
+        fast = _time_round_trip(body, args.rounds)
+        print(
+            f"{name:<42} {len(body) / 1024:>7.0f}KB {baseline * 1e3:>8.3f}ms {fast * 1e3:>8.3f}ms "
+            f"{baseline / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
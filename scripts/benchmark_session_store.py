@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Compare session-gate store latency in direct-write and write-behind modes.
+
+Each simulated metered call is one ``check_and_increment`` against a pool of
+live identifiers, with every tenth call refunded (a failed tool call). The
+script times every store operation on the calling thread — the event loop in
+the server — and prints p50/p99/max per mode. A background thread periodically
+holds the database write lock for ``--stall-ms`` to stand in for a WAL
+checkpoint or a slow disk; pass ``--stall-ms 0`` to measure the quiet case.
+
+Usage: python scripts/benchmark_session_store.py [--calls N] [--stall-ms 5] [--flush-interval 0.5]
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from blockscout_mcp_server.session_store import SessionStore, WriteBehindSessionStore
+
+
+def _hold_write_lock(path: str, stall_seconds: float, stop: threading.Event) -> None:
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA busy_timeout = 5000")
+    while not stop.wait(0.05):
+        conn.execute("BEGIN IMMEDIATE")
+        time.sleep(stall_seconds)
+        conn.execute("COMMIT")
+    conn.close()
+
+
+def _run(store: SessionStore, path: str, calls: int, stall_seconds: float) -> list[float]:
+    store.initialize()
+    stop = threading.Event()
+    staller = threading.Thread(target=_hold_write_lock, args=(path, stall_seconds, stop), daemon=True)
+    if stall_seconds > 0:
+        staller.start()
+    latencies: list[float] = []
+    try:
+        for i in range(calls):
+            session_id = f"session-{i % 5_000}"
+            started = time.perf_counter()
+            store.check_and_increment(session_id, created_at=int(time.time()), max_calls=calls)
+            if i % 10 == 0:
+                store.refund(session_id)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        stop.set()
+        if staller.is_alive():
+            staller.join()
+        store.close()
+    return sorted(latencies)
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--stall-ms", type=float, default=5.0)
+    parser.add_argument("--flush-interval", type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(f"{'mode':<14} {'p50 (us)':>10} {'p99 (us)':>10} {'max (us)':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in ("direct", "write-behind"):
+            path = str(Path(directory) / f"{mode}.db")
+            if mode == "direct":
+                store = SessionStore(path)
+            else:
+                store = WriteBehindSessionStore(path, args.flush_interval)
+            latencies = _run(store, path, args.calls, args.stall_ms / 1000)
+            p50, p99 = _percentile(latencies, 0.5), _percentile(latencies, 0.99)
+            print(f"{mode:<14} {p50 * 1e6:>10.1f} {p99 * 1e6:>10.1f} {latencies[-1] * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Microbenchmark the per-call overhead of the tool decorator stack, with no upstream cost.
+
+A dummy tool with a typical signature is decorated the way every tool is
+(``@log_tool_invocation``, ``@pro_api_key_scope``, ``@session_gate``,
+``@pro_api_credit_scope``) and called with a REST context carrying a
+User-Agent and a client PRO API key header. The script times the bare body,
+the fused pipeline ``log_tool_invocation`` compiles from that stack, and the
+same stack with fusion defeated (each stage binds the arguments and reads
+``ctx`` on its own, as before the pipeline), and prints microseconds per call.
+
+Analytics and community telemetry are off and the log line is not emitted, so
+only the pipeline's own work is measured; the session gate is disabled (no
+session secret), as on a self-hosted server.
+
+Usage: python scripts/benchmark_tool_pipeline.py [--calls N]
+"""
+
+import argparse
+import asyncio
+import functools
+import inspect
+import logging
+import time
+
+from starlette.requests import Request
+
+from blockscout_mcp_server.api.dependencies import MockCtx
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.pro_api_key_context import pro_api_credit_scope, pro_api_key_scope
+from blockscout_mcp_server.session_gate import session_gate
+from blockscout_mcp_server.tools.decorators import log_tool_invocation
+
+
+async def _body(
+    chain_id: str,
+    address: str,
+    ctx: object,
+    cursor: str | None = None,
+    session_id: str | None = None,
+) -> dict:
+    return {"chain_id": chain_id, "address": address}
+
+
+def _opaque(func):
+    """Hide a stage from ``log_tool_invocation`` so the stack is not fused."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await func(*args, **kwargs)
+
+    del wrapper.__tool_stage__
+    wrapper.__signature__ = inspect.signature(func)
+    return wrapper
+
+
+def _stack(opaque: bool):
+    inner = pro_api_key_scope(session_gate(pro_api_credit_scope(_body)))
+    return log_tool_invocation(_opaque(inner) if opaque else inner)
+
+
+def _ctx() -> MockCtx:
+    headers = [
+        (b"user-agent", b"BlockscoutMCP/benchmark"),
+        (config.pro_api_key_header.lower().encode(), b"client-key-0123456789"),
+    ]
+    return MockCtx(Request({"type": "http", "method": "POST", "path": "/", "headers": headers}))
+
+
+async def _time_calls(tool, ctx: MockCtx, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        await tool("1", "0x" + "12" * 20, ctx=ctx)
+    # Let the queued community-report tasks finish outside the timed loop.
+    await asyncio.sleep(0)
+    return (time.perf_counter() - started) / calls
+
+
+async def _run(calls: int) -> None:
+    ctx = _ctx()
+    print(f"{'variant':<32} {'us/call':>9}")
+    for name, tool in (("bare tool body", _body), ("unfused stack", _stack(True)), ("fused pipeline", _stack(False))):
+        await _time_calls(tool, ctx, calls // 10)
+        print(f"{name:<32} {await _time_calls(tool, ctx, calls) * 1e6:>9.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50_000)
+    args = parser.parse_args()
+
+    config.disable_community_telemetry = True
+    config.session_secret = ""
+    logging.getLogger("blockscout_mcp_server.tools.decorators").setLevel(logging.WARNING)
+    asyncio.run(_run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
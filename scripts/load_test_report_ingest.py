@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Measure how many community reports per second per core the central server ingests.
+
+For each worker count the script starts ``python -m blockscout_mcp_server --http
+--rest --workers N`` on a local port and, from concurrent clients for a fixed
+duration, POSTs community reports both one per request to
+``/v1/report_tool_usage`` and as NDJSON batches to ``/v1/report_tool_usage/batch``.
+It prints reports per second and per worker process for each endpoint.
+
+The per-IP admission limit is switched off (every client shares 127.0.0.1), and
+no Mixpanel token is set, so the figures cover parsing, validation, admission,
+and roll-up, not the Mixpanel export worker.
+
+Usage: python scripts/load_test_report_ingest.py [--workers 1 2] [--seconds 10] [--concurrency 32]
+    [--batch-size 100] [--window 1.0]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+_SINGLE_PATH = "/v1/report_tool_usage"
+_BATCH_PATH = "/v1/report_tool_usage/batch"
+_HEADERS = {"User-Agent": "BlockscoutMCP/load-test"}
+_TOOLS = ("get_block_number", "get_address_info", "get_transactions_by_address", "get_tokens_by_address")
+
+
+def _report(n: int) -> dict:
+    return {
+        "tool_name": _TOOLS[n % len(_TOOLS)],
+        "tool_args": {"chain_id": "1", "address": f"0x{n % 1000:040x}"},
+        "client_name": "load-test",
+        "client_version": "1.0",
+        "protocol_version": "2025-06-18",
+        "auth_origin": "none",
+        "api_key_fingerprint": None,
+    }
+
+
+def _start_server(workers: int, port: int, window: float) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "BLOCKSCOUT_DISABLE_COMMUNITY_TELEMETRY": "true",
+        "BLOCKSCOUT_SNAPSHOT_REFRESH_ENABLED": "false",
+        "BLOCKSCOUT_MIXPANEL_TOKEN": "",
+        "BLOCKSCOUT_COMMUNITY_INGEST_REPORTS_PER_IP_PER_MINUTE": "0",
+        "BLOCKSCOUT_COMMUNITY_INGEST_WINDOW_SECONDS": str(window),
+    }
+    command = [sys.executable, "-m", "blockscout_mcp_server", "--http", "--rest", "--http-port", str(port)]
+    return subprocess.Popen(
+        [*command, "--workers", str(workers)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def _wait_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.post(_SINGLE_PATH, json=_report(0), headers=_HEADERS)).status_code == 202:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+async def _drive(base_url: str, seconds: float, concurrency: int, batch_size: int | None) -> float:
+    """Return reports per second; ``batch_size`` ``None`` sends one report per request."""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    counter = itertools.count()
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        await _wait_ready(client)
+        completed = 0
+        deadline = time.monotonic() + seconds
+
+        async def _client_loop() -> None:
+            nonlocal completed
+            while time.monotonic() < deadline:
+                if batch_size is None:
+                    response = await client.post(_SINGLE_PATH, json=_report(next(counter)), headers=_HEADERS)
+                    sent = 1
+                else:
+                    body = "\n".join(json.dumps(_report(next(counter))) for _ in range(batch_size))
+                    headers = {**_HEADERS, "Content-Type": "application/x-ndjson"}
+                    response = await client.post(_BATCH_PATH, content=body, headers=headers)
+                    sent = batch_size
+                if response.status_code != 202:
+                    raise RuntimeError(f"unexpected status {response.status_code}")
+                completed += sent
+
+        started = time.monotonic()
+        await asyncio.gather(*(_client_loop() for _ in range(concurrency)))
+        return completed / (time.monotonic() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--window", type=float, default=1.0, help="BLOCKSCOUT_COMMUNITY_INGEST_WINDOW_SECONDS")
+    parser.add_argument("--port", type=int, default=18766)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'endpoint':>8} {'reports/s':>11} {'per core':>10}")
+    for workers in args.workers:
+        server = _start_server(workers, args.port, args.window)
+        try:
+            base_url = f"http://127.0.0.1:{args.port}"
+            for label, batch_size in (("single", None), ("batch", args.batch_size)):
+                rate = asyncio.run(_drive(base_url, args.seconds, args.concurrency, batch_size))
+                print(f"{workers:>8} {label:>8} {rate:>11.1f} {rate / workers:>10.1f}")
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Measure HTTP throughput of the server as the number of worker processes grows.
+
+For each worker count the script starts ``python -m blockscout_mcp_server --http
+--rest --workers N`` on a local port, drives ``GET /v1/unlock_blockchain_analysis``
+(served without any upstream call, so the cost is request handling, pydantic
+validation, and JSON encoding — the CPU-bound part of every tool call) from
+concurrent clients for a fixed duration, and prints requests per second and the
+speedup over the first count.
+
+Usage: python scripts/load_test_workers.py [--workers 1 2 4] [--seconds 10] [--concurrency 64]
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+_PATH = "/v1/unlock_blockchain_analysis"
+
+
+def _start_server(workers: int, port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        # Keep the run local: no telemetry, no background snapshot fetches.
+        "BLOCKSCOUT_DISABLE_COMMUNITY_TELEMETRY": "true",
+        "BLOCKSCOUT_SNAPSHOT_REFRESH_ENABLED": "false",
+        "BLOCKSCOUT_MIXPANEL_TOKEN": "",
+    }
+    command = [sys.executable, "-m", "blockscout_mcp_server", "--http", "--rest", "--http-port", str(port)]
+    return subprocess.Popen(
+        [*command, "--workers", str(workers)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def _wait_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get(_PATH)).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+async def _drive(base_url: str, seconds: float, concurrency: int) -> float:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        await _wait_ready(client)
+        completed = 0
+        deadline = time.monotonic() + seconds
+
+        async def _client_loop() -> None:
+            nonlocal completed
+            while time.monotonic() < deadline:
+                response = await client.get(_PATH)
+                response.raise_for_status()
+                completed += 1
+
+        started = time.monotonic()
+        await asyncio.gather(*(_client_loop() for _ in range(concurrency)))
+        return completed / (time.monotonic() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--port", type=int, default=18765)
+    args = parser.parse_args()
+
+    baseline: float | None = None
+    print(f"{'workers':>8} {'req/s':>10} {'speedup':>8}")
+    for workers in args.workers:
+        server = _start_server(workers, args.port)
+        try:
+            rate = asyncio.run(_drive(f"http://127.0.0.1:{args.port}", args.seconds, args.concurrency))
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+        baseline = baseline or rate
+        print(f"{workers:>8} {rate:>10.1f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
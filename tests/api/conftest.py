@@ -6,6 +6,7 @@ from httpx import ASGITransport, AsyncClient
 from mcp.server.fastmcp import FastMCP
 
 from blockscout_mcp_server.api.routes import register_api_routes
+from blockscout_mcp_server.config import config
 
 
 @pytest.fixture
@@ -20,3 +21,12 @@ def client(test_mcp_instance):
     register_api_routes(test_mcp_instance)
     asgi_app = test_mcp_instance.streamable_http_app()
     return AsyncClient(transport=ASGITransport(app=asgi_app), base_url="http://test")
+
+
+@pytest.fixture
+def metrics_client(test_mcp_instance, monkeypatch):
+    """Like ``client``, with the metrics and upstream health routes enabled."""
+    monkeypatch.setattr(config, "metrics_enabled", True)
+    register_api_routes(test_mcp_instance)
+    asgi_app = test_mcp_instance.streamable_http_app()
+    return AsyncClient(transport=ASGITransport(app=asgi_app), base_url="http://test")
@@ -7,6 +7,7 @@ import pytest
 from starlette.requests import Request
 
 from blockscout_mcp_server.api.helpers import handle_rest_errors
+from blockscout_mcp_server.circuit_breaker import CircuitOpenError
 from blockscout_mcp_server.tools.common import CreditsExhaustedError
 
 
@@ -45,3 +46,17 @@ async def test_handle_rest_errors_value_error_still_returns_400():
     assert response.status_code == 400
     body = json.loads(response.body)
     assert body["error"] == "bad input"
+
+
+@pytest.mark.asyncio
+async def test_handle_rest_errors_circuit_open_returns_503():
+    """An open upstream circuit breaker surfaces as 503 Service Unavailable."""
+
+    @handle_rest_errors
+    async def handler(request: Request):
+        raise CircuitOpenError("Upstream 'chain:1' is temporarily unavailable")
+
+    response = await handler(_make_request())
+
+    assert response.status_code == 503
+    assert "temporarily unavailable" in json.loads(response.body)["error"]
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: LicenseRef-Blockscout
 """Tests for the REST API routes."""
 
+import json
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import httpx
@@ -8,6 +9,7 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 from mcp.server.fastmcp import FastMCP
 
+from blockscout_mcp_server.config import ServerConfig
 from blockscout_mcp_server.config import config as bms_config
 from blockscout_mcp_server.models import AdvancedFilterItem, TokenTransfer, ToolResponse, TransactionInfoData
 from blockscout_mcp_server.tools.common import CreditsExhaustedError
@@ -38,6 +40,53 @@ async def test_static_routes_work_correctly(mock_track_event, client: AsyncClien
     assert "chatgpt.com/g/" not in response_llms.text
 
 
+@pytest.mark.asyncio
+async def test_upstream_health_route_serves_scoreboard(metrics_client: AsyncClient):
+    response = await metrics_client.get("/health/upstreams")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "upstreams": {},
+        "rate_limits": {},
+        "hedging": {"primaries": 0, "hedges": 0, "hedge_wins": 0, "budget_denied": 0, "hedge_delay_ms": None},
+    }
+
+
+@pytest.mark.asyncio
+async def test_metrics_route_serves_prometheus_text(metrics_client: AsyncClient):
+    from blockscout_mcp_server import metrics
+
+    metrics.tool_duration.observe(0.2, "get_block_info", "success")
+
+    response = await metrics_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'blockscout_mcp_tool_duration_seconds_count{tool="get_block_info",status="success"} 1' in body
+    assert 'blockscout_mcp_cache_lookups_total{cache="contract",result="hits"} 0' in body
+    assert 'blockscout_mcp_cache_entries{cache="page_buffer"} 0' in body
+    assert 'blockscout_mcp_prefetch_outcomes_total{outcome="served"} 0' in body
+    assert 'blockscout_mcp_analytics_events_total{outcome="dropped"} 0' in body
+    assert 'blockscout_mcp_log_records_total{outcome="sampled_out"} 0' in body
+    assert "blockscout_mcp_log_queue_depth 0" in body
+    assert "# TYPE blockscout_mcp_web3_pool_connections_in_use gauge" in body
+
+
+@pytest.mark.asyncio
+async def test_metrics_routes_not_registered_when_disabled(test_mcp_instance):
+    from blockscout_mcp_server.api.routes import register_api_routes
+
+    assert ServerConfig.model_fields["metrics_enabled"].default is False
+    with patch.object(bms_config, "metrics_enabled", False):
+        register_api_routes(test_mcp_instance)
+    async with AsyncClient(
+        transport=ASGITransport(app=test_mcp_instance.streamable_http_app()), base_url="http://test"
+    ) as test_client:
+        assert (await test_client.get("/metrics")).status_code == 404
+        assert (await test_client.get("/health/upstreams")).status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_routes_not_found_on_clean_app():
     """Verify that static routes are not available on a clean, un-configured app."""
@@ -1027,3 +1076,91 @@ async def test_rest_mode_low_credits_note_in_response(client: AsyncClient):
     assert any("https://dev.blockscout.com" in note for note in notes), (
         f"Expected dev.blockscout.com URL in advisory note, got: {notes}"
     )
+
+
+@pytest.mark.asyncio
+@patch("blockscout_mcp_server.api.routes.analytics.track_community_usage")
+async def test_report_tool_usage_batch_skips_invalid_reports(mock_track, client: AsyncClient):
+    valid = {
+        "tool_name": "dummy",
+        "tool_args": {"a": 1},
+        "client_name": "cli",
+        "client_version": "1.0",
+        "protocol_version": "1.1",
+    }
+    response = await client.post(
+        "/v1/report_tool_usage/batch",
+        json=[valid, {"tool_name": "x"}, {**valid, "tool_name": "other"}],
+        headers={"User-Agent": _REPORT_USER_AGENT},
+    )
+
+    assert response.status_code == 202
+    assert [call.kwargs["report"].tool_name for call in mock_track.call_args_list] == ["dummy", "other"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("body", "user_agent", "status"),
+    [({"tool_name": "x"}, _REPORT_USER_AGENT, 422), ([{}] * 101, _REPORT_USER_AGENT, 413), ([], "", 400)],
+)
+async def test_report_tool_usage_batch_rejects_bad_requests(client: AsyncClient, body, user_agent, status):
+    response = await client.post("/v1/report_tool_usage/batch", json=body, headers={"User-Agent": user_agent})
+    assert response.status_code == status
+
+
+@pytest.mark.asyncio
+@patch("blockscout_mcp_server.api.routes.analytics.track_community_usage")
+async def test_report_tool_usage_batch_accepts_ndjson(mock_track, client: AsyncClient):
+    lines = [
+        {"tool_name": name, "tool_args": {}, "client_name": "cli", "client_version": "1.0", "protocol_version": "1.1"}
+        for name in ("first", "second")
+    ]
+    response = await client.post(
+        "/v1/report_tool_usage/batch",
+        content="\n".join(json.dumps(line) for line in lines),
+        headers={"User-Agent": _REPORT_USER_AGENT, "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 202
+    assert [call.kwargs["report"].tool_name for call in mock_track.call_args_list] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+@patch("blockscout_mcp_server.api.routes.analytics.track_community_usage")
+async def test_report_tool_usage_is_throttled_per_ip(mock_track, client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(bms_config, "community_ingest_reports_per_ip_per_minute", 1)
+
+    assert (await post_report(client)).status_code == 202
+    response = await post_report(client)
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "60"
+    mock_track.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("trusted_proxies", [0, 1])
+@patch("blockscout_mcp_server.api.routes.analytics.track_community_usage")
+async def test_report_tool_usage_throttling_ignores_spoofed_forwarded_for(
+    mock_track, client: AsyncClient, monkeypatch, trusted_proxies
+):
+    """A sender rotating its own X-Forwarded-For entry still draws from one bucket."""
+    monkeypatch.setattr(bms_config, "community_ingest_reports_per_ip_per_minute", 1)
+    monkeypatch.setattr(bms_config, "community_ingest_trusted_proxies", trusted_proxies)
+    payload = {
+        "tool_name": "dummy",
+        "tool_args": {},
+        "client_name": "cli",
+        "client_version": "1.0",
+        "protocol_version": "1.1",
+    }
+
+    statuses = []
+    for spoofed in ("198.51.100.1", "198.51.100.2"):
+        # With one trusted proxy, the proxy appends the address it saw after the spoofed one.
+        forwarded = f"{spoofed}, 203.0.113.7" if trusted_proxies else spoofed
+        headers = {"User-Agent": _REPORT_USER_AGENT, "X-Forwarded-For": forwarded}
+        statuses.append((await client.post("/v1/report_tool_usage", json=payload, headers=headers)).status_code)
+
+    assert statuses == [202, 429]
+    mock_track.assert_called_once()
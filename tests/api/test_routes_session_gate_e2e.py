@@ -16,6 +16,7 @@ app on the pytest thread's own event loop — the store's
 `check_same_thread=True` connection is never touched from another thread.
 """
 
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -40,7 +41,7 @@ _CLIENT_KEY = "well-formed-client-key"
 
 
 class CapturingClient:
-    """Fake httpx.AsyncClient that returns a canned response from .get()/.post()."""
+    """Fake httpx.AsyncClient that returns a canned response from .get()/.stream()."""
 
     def __init__(self, response: httpx.Response) -> None:
         self._response = response
@@ -58,6 +59,11 @@ class CapturingClient:
         self.last_params = dict(params or {})
         return self._response
 
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, params=None, headers=None, **kwargs):
+        # direct_api_call reads raw responses through the byte-capped streaming path.
+        yield await self.get(url, params=params, headers=headers)
+
 
 def _block_number_response() -> httpx.Response:
     request = httpx.Request("GET", "https://api.blockscout.com/1/api/v2/main-page/blocks")
@@ -5,9 +5,19 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from blockscout_mcp_server import analytics
+from blockscout_mcp_server import analytics, metrics
+from blockscout_mcp_server.analytics_queue import analytics_queue
+from blockscout_mcp_server.circuit_breaker import circuit_breakers
+from blockscout_mcp_server.community_ingest import community_ingest
 from blockscout_mcp_server.config import ServerConfig, config
+from blockscout_mcp_server.hedging import hedge_policy
+from blockscout_mcp_server.logging_utils import log_pipeline
+from blockscout_mcp_server.page_buffer import page_buffer
+from blockscout_mcp_server.prefetch import prefetcher
+from blockscout_mcp_server.rate_limiter import rate_pacer
+from blockscout_mcp_server.response_cache import response_cache
 from blockscout_mcp_server.session_store import close_store, initialize_store
+from blockscout_mcp_server.telemetry_dispatcher import telemetry_dispatcher
 
 
 @pytest.fixture
@@ -59,6 +69,39 @@ def pristine_config(request, monkeypatch):
         monkeypatch.setattr(config, field_name, getattr(pristine, field_name))
 
 
+@pytest.fixture(autouse=True)
+def reset_upstream_state():
+    """Start and end every test with fresh upstream request machinery.
+
+    The response cache, the page buffer, the prefetcher, the circuit breakers, the
+    rate pacer, and the hedge policy are process-wide singletons underneath the
+    request helpers (the Mixpanel and community telemetry queues, the community
+    ingestion buffer, and the queued log output are reset alongside them); without this, a response stored (or
+    a failure, 429, or latency recorded) by one test could answer (or fail fast,
+    delay, or hedge) a request in another and make results depend on test order.
+    The metrics registry is reset for the same reason, so tests can assert on exact
+    counts.
+    """
+    singletons = (
+        response_cache,
+        page_buffer,
+        prefetcher,
+        circuit_breakers,
+        rate_pacer,
+        hedge_policy,
+        analytics_queue,
+        telemetry_dispatcher,
+        community_ingest,
+        log_pipeline,
+        metrics.registry,
+    )
+    for singleton in singletons:
+        singleton.clear()
+    yield
+    for singleton in singletons:
+        singleton.clear()
+
+
 @pytest.fixture
 def reset_analytics_state(monkeypatch):
     """Reset the analytics module's private state around a test.
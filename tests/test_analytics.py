@@ -15,6 +15,7 @@ pytestmark = pytest.mark.usefixtures("reset_analytics_state")
 
 def test_get_mixpanel_client_non_empty_host_uses_custom_consumer(monkeypatch):
     """A non-empty mixpanel_api_host routes construction through a custom Consumer."""
+    monkeypatch.setattr(server_config, "mixpanel_queue_size", 0)
     monkeypatch.setattr(server_config, "mixpanel_token", "test-token", raising=False)
     monkeypatch.setattr(server_config, "mixpanel_api_host", "api-eu.mixpanel.com", raising=False)
     with (
@@ -35,6 +36,7 @@ def test_get_mixpanel_client_non_empty_host_uses_custom_consumer(monkeypatch):
 
 def test_get_mixpanel_client_empty_host_uses_sdk_default(monkeypatch):
     """An empty mixpanel_api_host skips the custom Consumer and uses the SDK's built-in host."""
+    monkeypatch.setattr(server_config, "mixpanel_queue_size", 0)
     monkeypatch.setattr(server_config, "mixpanel_token", "test-token", raising=False)
     monkeypatch.setattr(server_config, "mixpanel_api_host", "", raising=False)
     with (
@@ -51,6 +53,24 @@ def test_get_mixpanel_client_empty_host_uses_sdk_default(monkeypatch):
         assert client is mp_instance
 
 
+@pytest.mark.parametrize(
+    ("api_host", "consumer_kwargs"), [("api-eu.mixpanel.com", {"api_host": "api-eu.mixpanel.com"}), ("", {})]
+)
+def test_get_mixpanel_client_queues_events_by_default(monkeypatch, api_host, consumer_kwargs):
+    """With a queue size set, the client's consumer is the event queue wrapping the host's Consumer."""
+    monkeypatch.setattr(server_config, "mixpanel_token", "test-token", raising=False)
+    monkeypatch.setattr(server_config, "mixpanel_api_host", api_host, raising=False)
+    with (
+        patch("blockscout_mcp_server.analytics.Consumer") as consumer_cls,
+        patch("blockscout_mcp_server.analytics.Mixpanel") as mp_cls,
+    ):
+        analytics._get_mixpanel_client()
+
+        consumer_cls.assert_called_once_with(**consumer_kwargs)
+        mp_cls.assert_called_once_with("test-token", consumer=analytics.analytics_queue)
+        assert analytics.analytics_queue._consumer is consumer_cls.return_value
+
+
 def test_noop_when_not_http_mode(monkeypatch):
     monkeypatch.setattr(server_config, "mixpanel_token", "test-token", raising=False)
     with patch("blockscout_mcp_server.analytics.Consumer"), patch("blockscout_mcp_server.analytics.Mixpanel") as mp_cls:
@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the queued, batched Mixpanel consumer."""
+
+import json
+import threading
+
+import pytest
+
+from blockscout_mcp_server.analytics_queue import AnalyticsQueue
+from blockscout_mcp_server.config import config
+
+
+class _RecordingConsumer:
+    """Stand-in for the stock Mixpanel consumer that records the batches it is given."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[tuple[str, list]] = []
+        self.fail = fail
+        self.sent = threading.Event()
+
+    def send(self, endpoint, json_message, api_key=None, api_secret=None):
+        self.batches.append((endpoint, json.loads(json_message)))
+        self.sent.set()
+        if self.fail:
+            raise RuntimeError("mixpanel unavailable")
+
+
+@pytest.fixture
+def events(monkeypatch):
+    monkeypatch.setattr(config, "mixpanel_flush_interval_seconds", 60.0)
+    consumer = _RecordingConsumer()
+    events = AnalyticsQueue().attach(consumer)
+    yield events, consumer
+    events.clear()
+
+
+def test_events_are_sent_in_batches_of_the_configured_size(events, monkeypatch):
+    monkeypatch.setattr(config, "mixpanel_batch_size", 2)
+    events, consumer = events
+
+    for n in range(3):
+        events.send("events", json.dumps({"n": n}))
+    assert consumer.sent.wait(1)
+    events.close()
+
+    assert consumer.batches == [("events", [{"n": 0}, {"n": 1}]), ("events", [{"n": 2}])]
+    assert events.stats()["sent"] == 3
+
+
+def test_pending_events_are_sent_after_the_flush_interval(events, monkeypatch):
+    monkeypatch.setattr(config, "mixpanel_flush_interval_seconds", 0.01)
+    events, consumer = events
+
+    events.send("events", json.dumps({"n": 0}))
+
+    assert consumer.sent.wait(1)
+    assert consumer.batches == [("events", [{"n": 0}])]
+
+
+def test_close_sends_what_is_still_queued(events):
+    events, consumer = events
+
+    events.send("events", json.dumps({"n": 0}))
+    events.close()
+
+    assert consumer.batches == [("events", [{"n": 0}])]
+    assert events.stats()["depth"] == 0
+
+
+def test_events_beyond_the_queue_size_are_dropped(events, monkeypatch):
+    monkeypatch.setattr(config, "mixpanel_queue_size", 2)
+    events, consumer = events
+    monkeypatch.setattr(config, "mixpanel_batch_size", 1)
+    started, release = threading.Event(), threading.Event()
+
+    def blocking_send(*args, **kwargs):
+        started.set()
+        release.wait(1)
+
+    # Hold the worker inside its first send so nothing leaves the queue meanwhile.
+    consumer.send = blocking_send
+    events.send("events", "{}")
+    assert started.wait(1)
+
+    for _ in range(3):
+        events.send("events", "{}")
+    release.set()
+
+    assert (events.stats()["queued"], events.stats()["dropped"]) == (3, 1)
+
+
+def test_failed_batches_are_counted_and_dropped(monkeypatch):
+    consumer = _RecordingConsumer(fail=True)
+    events = AnalyticsQueue().attach(consumer)
+
+    events.send("events", "{}")
+    events.close()
+
+    assert events.stats()["failed"] == 1
+    assert events.stats()["sent"] == 0
+
+
+@pytest.mark.parametrize(("rate", "kept"), [(0.0, 0), (1.0, 5)])
+def test_sampling_keeps_the_configured_fraction(events, monkeypatch, rate, kept):
+    monkeypatch.setattr(config, "mixpanel_sample_rate", rate)
+    events, _ = events
+
+    for _ in range(5):
+        events.send("events", "{}")
+
+    assert events.stats()["queued"] == kept
+    assert events.stats()["sampled_out"] == 5 - kept
@@ -5,8 +5,14 @@ from unittest.mock import patch
 import anyio
 import pytest
 
-from blockscout_mcp_server.cache import CachedContract, ChainsListCache, ContractCache, ProApiConfigCache
+from blockscout_mcp_server.cache import (
+    CachedContract,
+    ChainsListCache,
+    ContractCache,
+    ProApiConfigCache,
+)
 from blockscout_mcp_server.config import config
+from blockscout_mcp_server.source_store import LazySourceFiles
 
 pytestmark = pytest.mark.anyio
 
@@ -71,6 +77,137 @@ async def test_contract_cache_access_refreshes_lru():
     assert await cache.get("C") is not None
 
 
+def _sized_contract(key: str, size: int) -> CachedContract:
+    """A contract with a distinct, uncompressed (sub-KB) source body of about ``size`` bytes."""
+    return CachedContract(metadata={}, source_files={"A.sol": key.ljust(size, "x")})
+
+
+@pytest.mark.asyncio
+async def test_contract_cache_tracks_bytes():
+    cache = ContractCache()
+    contract = CachedContract(metadata={"name": "A"}, source_files={"A.sol": "code"})
+    await cache.set("a", contract)
+    expected = len('{"name":"A"}') + len("A.sol") + len("code")
+    assert cache.total_bytes == expected
+
+    await cache.set("a", contract)
+    assert cache.stats()["bytes"] == expected
+    assert cache.stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_contract_cache_shares_identical_sources_across_contracts():
+    cache = ContractCache()
+    library = "// SPDX-License-Identifier: MIT\n" + "library SafeMath { function add() {} }\n" * 200
+    for key in ("1:0xa", "1:0xb", "10:0xa"):
+        await cache.set(key, CachedContract(metadata={}, source_files={"SafeMath.sol": library, f"{key}.sol": key}))
+
+    stats = cache.stats()
+    assert stats["source_blobs"] == 4
+    assert stats["source_logical_bytes"] == 3 * len(library) + sum(len(key) for key in ("1:0xa", "1:0xb", "10:0xa"))
+    assert stats["source_bytes"] < len(library)
+    cached = await cache.get("1:0xb")
+    assert cached.source_files["SafeMath.sol"] == library
+
+
+@pytest.mark.asyncio
+async def test_contract_cache_keeps_shared_sources_until_last_reference_goes():
+    cache = ContractCache()
+    cache._max_size = 2
+    shared = CachedContract(metadata={}, source_files={"Lib.sol": "x" * 5000})
+    await cache.set("a", shared)
+    await cache.set("b", shared)
+    await cache.set("c", CachedContract(metadata={}, source_files={"C.sol": "c"}))
+
+    assert list(cache._cache) == ["b", "c"]
+    assert cache.stats()["source_blobs"] == 2
+
+    await cache.set("d", CachedContract(metadata={}, source_files={"D.sol": "d"}))
+
+    assert list(cache._cache) == ["c", "d"]
+    assert cache.stats()["source_blobs"] == 2
+    assert cache.stats()["bytes"] == 2 * len("{}") + 2 * (len("C.sol") + 1)
+
+
+@pytest.mark.asyncio
+async def test_contract_cache_returns_lazy_source_files():
+    cache = ContractCache()
+    source = "contract A {}\n" * 500
+    await cache.set("a", CachedContract(metadata={"name": "A"}, source_files={"A.sol": source, "B.sol": "b"}))
+
+    cached = await cache.get("a")
+    assert isinstance(cached.source_files, LazySourceFiles)
+    assert list(cached.source_files) == ["A.sol", "B.sol"]
+    assert "A.sol" in cached.source_files
+    assert cached.source_files["A.sol"] == source
+    assert cached.metadata == {"name": "A"}
+
+
+@pytest.mark.asyncio
+async def test_contract_cache_evicts_lru_by_bytes():
+    cache = ContractCache()
+    cache._max_bytes = 2500
+    for key in ("a", "b", "c"):
+        await cache.set(key, _sized_contract(key, 1000))
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= 2500
+    assert await cache.get("a") is None
+    assert await cache.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_contract_cache_rejects_entry_larger_than_budget():
+    cache = ContractCache()
+    cache._max_bytes = 500
+    await cache.set("small", _sized_contract("small", 100))
+    await cache.set("huge", _sized_contract("huge", 1000))
+
+    assert await cache.get("huge") is None
+    assert await cache.get("small") is not None
+    assert cache.stats()["rejections"] == 1
+
+
+@pytest.mark.asyncio
+async def test_contract_cache_scan_does_not_flush_hot_entries():
+    cache = ContractCache()
+    cache._max_size = 2
+    for key in ("hot1", "hot2"):
+        await cache.get(key)
+        await cache.set(key, _sized_contract(key, 10))
+    for _ in range(3):
+        assert await cache.get("hot1") is not None
+        assert await cache.get("hot2") is not None
+
+    for index in range(20):
+        key = f"scan{index}"
+        await cache.get(key)
+        await cache.set(key, _sized_contract(key, 10))
+
+    assert await cache.get("hot1") is not None
+    assert await cache.get("hot2") is not None
+    assert cache.stats()["rejections"] == 20
+    assert cache.stats()["evictions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_contract_cache_expired_entries_do_not_block_admission():
+    cache = ContractCache()
+    cache._max_size = 1
+    cache._ttl = 0.05
+    for _ in range(5):
+        await cache.get("hot")
+    await cache.set("hot", _sized_contract("hot", 10))
+    await anyio.sleep(0.1)
+
+    await cache.set("new", _sized_contract("new", 10))
+
+    assert await cache.get("new") is not None
+    assert cache.stats()["evictions"] == 1
+
+
 def test_pro_api_config_cache_empty():
     cache = ProApiConfigCache()
     assert cache.get_if_fresh() is None
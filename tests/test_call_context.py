@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the per-call request context and the precomputed argument binder."""
+
+import inspect
+from unittest.mock import patch
+
+import pytest
+
+from blockscout_mcp_server.call_context import ArgumentBinder, CallContext, call_context, use_call_context
+
+
+def _tool(chain_id, address, ctx, cursor=None, *, session_id=None):
+    pass
+
+
+def _variadic(chain_id, *rest, ctx=None, **extra):
+    pass
+
+
+def _bind_partial(func, args, kwargs):
+    bound = inspect.signature(func).bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+@pytest.mark.parametrize(
+    ("func", "args", "kwargs"),
+    [
+        (_tool, ("1", "0xabc"), {"ctx": "c"}),
+        (_tool, ("1",), {"address": "0xabc", "ctx": "c", "session_id": "s"}),
+        (_tool, (), {"ctx": "c", "chain_id": "1", "cursor": "p"}),
+        (_tool, ("1", "0xabc", "c", "p"), {}),
+        (_tool, (), {}),
+        (_variadic, ("1", 2, 3), {"ctx": "c", "other": 4}),
+    ],
+)
+def test_binder_matches_bind_partial(func, args, kwargs):
+    arguments = ArgumentBinder(inspect.signature(func)).bind(args, kwargs)
+
+    expected = _bind_partial(func, args, kwargs)
+    assert arguments == expected
+    assert list(arguments) == list(expected)
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs"),
+    [
+        (("1", "0xabc", "c", "p", "extra"), {}),
+        (("1",), {"chain_id": "2"}),
+        ((), {"unknown": 1}),
+    ],
+)
+def test_binder_raises_like_bind_partial(args, kwargs):
+    with pytest.raises(TypeError):
+        ArgumentBinder(inspect.signature(_tool)).bind(args, kwargs)
+
+
+def test_request_facts_are_derived_once():
+    call = CallContext(object())
+
+    with patch("blockscout_mcp_server.call_context.extract_client_meta_from_ctx") as extract_meta:
+        assert call.client_meta is call.client_meta
+        assert call.call_source == call.call_source == "mcp"
+
+    extract_meta.assert_called_once_with(call.ctx)
+
+
+def test_inner_layers_share_the_opened_context():
+    ctx = object()
+
+    with use_call_context(ctx) as opened:
+        assert call_context(ctx) is opened
+        assert call_context(object()) is not opened
+
+    assert call_context(ctx) is not opened
@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from blockscout_mcp_server.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    host_breaker_key,
+    is_upstream_failure,
+)
+from blockscout_mcp_server.config import config
+
+_REQUEST = httpx.Request("GET", "https://api.blockscout.com/1/api/v2/x")
+
+
+def _status_error(code: int) -> httpx.HTTPStatusError:
+    return httpx.HTTPStatusError("err", request=_REQUEST, response=httpx.Response(code, request=_REQUEST))
+
+
+def _fail(breaker: CircuitBreaker, times: int) -> None:
+    for _ in range(times):
+        breaker.record(failed=True, latency=0.1)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("blockscout_mcp_server.circuit_breaker.time.monotonic", fake):
+        yield fake
+
+
+def test_upstream_failure_classification():
+    assert is_upstream_failure(httpx.ConnectError("down", request=_REQUEST))
+    assert is_upstream_failure(httpx.ReadTimeout("slow", request=_REQUEST))
+    assert is_upstream_failure(_status_error(502))
+    assert not is_upstream_failure(_status_error(404))
+    assert not is_upstream_failure(_status_error(429))
+    assert not is_upstream_failure(ValueError("bad"))
+
+
+def test_breaker_opens_at_failure_ratio_after_min_requests(clock):
+    breaker = CircuitBreaker("chain:1")
+    _fail(breaker, config.circuit_breaker_min_requests - 1)
+    assert breaker.state == CLOSED
+    _fail(breaker, 1)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError, match="chain:1"):
+        breaker.before_request()
+    assert breaker.snapshot()["rejected"] == 1
+
+
+def test_breaker_stays_closed_below_failure_ratio(clock):
+    breaker = CircuitBreaker("chain:1")
+    for _ in range(20):
+        breaker.record(failed=False, latency=0.1)
+    _fail(breaker, 10)
+    assert breaker.state == CLOSED
+
+
+def test_old_outcomes_leave_the_window(clock):
+    breaker = CircuitBreaker("chain:1")
+    _fail(breaker, config.circuit_breaker_min_requests - 1)
+    clock.now += config.circuit_breaker_window_seconds + 1
+    _fail(breaker, 1)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_probe_success_closes(clock):
+    breaker = CircuitBreaker("chain:1")
+    _fail(breaker, config.circuit_breaker_min_requests)
+    clock.now += config.circuit_breaker_open_seconds + 1
+
+    assert breaker.before_request() is True
+    assert breaker.state == HALF_OPEN
+    # Only one probe at a time.
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record(failed=False, latency=0.05, probe=True)
+    assert breaker.state == CLOSED
+    assert breaker.before_request() is False
+
+
+def test_half_open_probe_failure_reopens(clock):
+    breaker = CircuitBreaker("chain:1")
+    _fail(breaker, config.circuit_breaker_min_requests)
+    clock.now += config.circuit_breaker_open_seconds + 1
+    probe = breaker.before_request()
+    breaker.record(failed=True, latency=0.05, probe=probe)
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 2
+
+
+def test_track_records_outcomes_and_releases_cancelled_probe(clock):
+    breaker = CircuitBreaker("chain:1")
+    with breaker.track():
+        pass
+    with pytest.raises(httpx.HTTPStatusError), breaker.track():
+        raise _status_error(503)
+    snapshot = breaker.snapshot()
+    assert snapshot["requests"] == 2
+    assert snapshot["failures"] == 1
+
+    _fail(breaker, config.circuit_breaker_min_requests)
+    clock.now += config.circuit_breaker_open_seconds + 1
+    with pytest.raises(KeyboardInterrupt), breaker.track():
+        raise KeyboardInterrupt
+    assert breaker.probe_in_flight is False
+
+
+def test_zero_min_requests_disables_breaker(clock):
+    breaker = CircuitBreaker("chain:1")
+    with patch.object(config, "circuit_breaker_min_requests", 0):
+        _fail(breaker, 50)
+        assert breaker.state == CLOSED
+        assert breaker.before_request() is False
+    assert breaker.snapshot()["failures"] == 50
+
+
+def test_registry_snapshot_reports_latency_percentiles(clock):
+    registry = CircuitBreakerRegistry()
+    breaker = registry.get("chain:1")
+    assert registry.get("chain:1") is breaker
+    for latency in (0.1, 0.2, 0.3, 0.4):
+        breaker.record(failed=False, latency=latency)
+    snapshot = registry.snapshot()["chain:1"]
+    assert snapshot["state"] == CLOSED
+    assert snapshot["latency_p50_ms"] == 200.0
+    assert snapshot["latency_p95_ms"] == 400.0
+    assert snapshot["failure_ratio"] == 0.0
+
+
+def test_host_breaker_key():
+    assert host_breaker_key("https://bens.services.blockscout.com/api/v1/1/x") == "host:bens.services.blockscout.com"
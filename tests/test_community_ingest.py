@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the community report ingestion path of the central server."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from starlette.requests import Request
+
+from blockscout_mcp_server.community_ingest import (
+    AdmissionLimiter,
+    CommunityIngest,
+    admission_ip,
+    parse_reports,
+    validate_reports,
+)
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.models import ToolUsageReport
+
+
+def _raw(tool_name: str = "tool") -> dict:
+    return {
+        "tool_name": tool_name,
+        "tool_args": {"a": 1},
+        "client_name": "cli",
+        "client_version": "1.0",
+        "protocol_version": "1.1",
+    }
+
+
+def _report(tool_name: str = "tool") -> ToolUsageReport:
+    return ToolUsageReport.model_validate(_raw(tool_name))
+
+
+@pytest.mark.parametrize(
+    ("body", "content_type", "expected"),
+    [
+        (json.dumps([_raw("a"), _raw("b")]).encode(), "application/json", [_raw("a"), _raw("b")]),
+        (
+            f"{json.dumps(_raw('a'))}\n\n{json.dumps(_raw('b'))}\n".encode(),
+            "application/x-ndjson",
+            [_raw("a"), _raw("b")],
+        ),
+        (b"[not json", "application/json", None),
+        (json.dumps(_raw("a")).encode(), "application/json", None),
+        (b'{"a": 1}\n{broken', "application/x-ndjson; charset=utf-8", None),
+    ],
+)
+def test_parse_reports(body, content_type, expected):
+    assert parse_reports(body, content_type) == expected
+
+
+def test_validate_reports_skips_only_the_invalid_ones():
+    items = [_raw("a"), {"tool_name": "broken"}, _raw("b"), "junk"]
+
+    reports, rejected = validate_reports(items)
+
+    assert [report.tool_name for report in reports] == ["a", "b"]
+    assert rejected == 2
+
+
+def test_admission_limiter_throttles_per_ip(monkeypatch):
+    monkeypatch.setattr(config, "community_ingest_reports_per_ip_per_minute", 60)
+    limiter = AdmissionLimiter()
+
+    assert limiter.admit("203.0.113.1", 60) is None
+    retry_after = limiter.admit("203.0.113.1", 2)
+    assert retry_after == pytest.approx(2.0, abs=0.01)
+    assert limiter.admit("203.0.113.2", 1) is None
+
+
+def _request(peer: str, *forwarded: str) -> Request:
+    headers = [(b"x-forwarded-for", value.encode()) for value in forwarded]
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": headers, "client": (peer, 1234)})
+
+
+@pytest.mark.parametrize(
+    ("trusted", "forwarded", "expected"),
+    [
+        (0, ("198.51.100.9",), "10.0.0.1"),
+        (1, (), "10.0.0.1"),
+        (1, ("203.0.113.1",), "203.0.113.1"),
+        (1, ("198.51.100.9, 203.0.113.1",), "203.0.113.1"),
+        (2, ("198.51.100.9, 203.0.113.1, 10.0.0.2",), "203.0.113.1"),
+        (2, ("198.51.100.9", "203.0.113.1, 10.0.0.2"), "203.0.113.1"),
+        (3, ("10.0.0.2",), "10.0.0.2"),
+    ],
+)
+def test_admission_ip_ignores_entries_left_of_the_trusted_proxies(monkeypatch, trusted, forwarded, expected):
+    monkeypatch.setattr(config, "community_ingest_trusted_proxies", trusted)
+
+    assert admission_ip(_request("10.0.0.1", *forwarded)) == expected
+
+
+def test_admission_limiter_is_off_at_zero(monkeypatch):
+    monkeypatch.setattr(config, "community_ingest_reports_per_ip_per_minute", 0)
+
+    assert AdmissionLimiter().admit("203.0.113.1", 10_000) is None
+
+
+def test_reports_are_exported_at_once_without_a_window():
+    ingest = CommunityIngest()
+
+    with patch("blockscout_mcp_server.community_ingest.analytics.track_community_usage") as track:
+        ingest.add([_report(), _report()], "203.0.113.1", "ua")
+
+    assert [call.kwargs["count"] for call in track.call_args_list] == [1, 1]
+    assert ingest.stats()["exported"] == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_reports_are_rolled_up_within_the_window(monkeypatch):
+    monkeypatch.setattr(config, "community_ingest_window_seconds", 0.01)
+    ingest = CommunityIngest()
+
+    with patch("blockscout_mcp_server.community_ingest.analytics.track_community_usage") as track:
+        ingest.add([_report("a"), _report("a"), _report("b")], "203.0.113.1", "ua")
+        ingest.add([_report("a")], "203.0.113.2", "ua")
+        assert track.call_count == 0
+        await asyncio.sleep(0.05)
+    ingest.clear()
+
+    exported = sorted(
+        (call.kwargs["report"].tool_name, call.kwargs["ip"], call.kwargs["count"]) for call in track.call_args_list
+    )
+    assert exported == [("a", "203.0.113.1", 2), ("a", "203.0.113.2", 1), ("b", "203.0.113.1", 1)]
+
+
+@pytest.mark.asyncio
+async def test_distinct_reports_beyond_the_buffer_are_dropped_and_close_exports_the_rest(monkeypatch):
+    monkeypatch.setattr(config, "community_ingest_window_seconds", 60.0)
+    monkeypatch.setattr(config, "community_ingest_max_pending", 2)
+    ingest = CommunityIngest()
+
+    with patch("blockscout_mcp_server.community_ingest.analytics.track_community_usage") as track:
+        ingest.add([_report("a"), _report("b"), _report("c"), _report("a")], "203.0.113.1", "ua")
+        await ingest.close()
+
+    assert sorted(call.kwargs["report"].tool_name for call in track.call_args_list) == ["a", "b"]
+    assert (ingest.stats()["dropped"], ingest.stats()["pending"]) == (1, 0)
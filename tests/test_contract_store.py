@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the persistent (SQLite) contract cache tier."""
+
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from blockscout_mcp_server import cache as cache_module
+from blockscout_mcp_server import contract_store as contract_store_module
+from blockscout_mcp_server.cache import CachedContract, ContractCache
+from blockscout_mcp_server.config import ServerConfig, config
+from blockscout_mcp_server.contract_store import ContractStore
+
+
+def _document(name: str, source: str = "contract A {}") -> dict:
+    return {"metadata": {"name": name}, "source_files": {f"{name}.sol": source}, "abi": [{"type": "function"}]}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ContractStore(str(tmp_path / "contracts.db"), max_bytes=0, ttl_seconds=3600)
+    yield store
+    store.close()
+
+
+def test_put_and_get_roundtrip(store):
+    store._put("1:0xabc", _document("A"))
+
+    assert store._get("1:0xabc") == _document("A")
+    assert store._get("1:0xdef") is None
+    assert store.stats() == {"hits": 1, "misses": 1, "writes": 1, "evictions": 0, "errors": 0}
+
+
+def test_put_replaces_existing_row(store):
+    store._put("1:0xabc", _document("A"))
+    store._put("1:0xabc", _document("B"))
+
+    assert store._get("1:0xabc") == _document("B")
+
+
+def test_expired_rows_are_misses(store):
+    store._put("1:0xabc", _document("A"), now=1_000.0)
+
+    assert store._get("1:0xabc", now=1_000.0 + 3599) is not None
+    assert store._get("1:0xabc", now=1_000.0 + 3600) is None
+
+
+def test_budget_evicts_least_recently_read_rows(tmp_path):
+    store = ContractStore(str(tmp_path / "contracts.db"), max_bytes=0, ttl_seconds=3600)
+    store._put("a", _document("A"), now=100.0)
+    row_size = store._connection().execute("SELECT size FROM contracts WHERE key = 'a'").fetchone()[0]
+    store._max_bytes = 2 * row_size + 10
+    store._put("b", _document("B"), now=200.0)
+    # Reading "a" long enough after its write moves it to the back of the LRU order.
+    assert store._get("a", now=300.0) is not None
+
+    store._put("c", _document("C"), now=400.0)
+
+    assert store._get("b", now=500.0) is None
+    assert store._get("a", now=500.0) is not None
+    assert store._get("c", now=500.0) is not None
+    assert store.stats()["evictions"] == 1
+    store.close()
+
+
+def test_rows_are_visible_to_other_connections(tmp_path):
+    path = str(tmp_path / "contracts.db")
+    writer = ContractStore(path, max_bytes=0, ttl_seconds=3600)
+    reader = ContractStore(path, max_bytes=0, ttl_seconds=3600)
+    reader._get("warm-up")
+
+    writer._put("1:0xabc", _document("A"))
+
+    assert reader._get("1:0xabc") == _document("A")
+    writer.close()
+    reader.close()
+
+
+def test_unopenable_database_disables_the_tier(tmp_path):
+    store = ContractStore(str(tmp_path / "missing" / "contracts.db"), max_bytes=0, ttl_seconds=3600)
+
+    store._put("1:0xabc", _document("A"))
+
+    assert store._get("1:0xabc") is None
+    assert store.stats()["writes"] == 0
+
+
+def test_corrupt_payload_is_a_miss(store):
+    store._put("1:0xabc", _document("A"))
+    store._connection().execute("UPDATE contracts SET payload = x'00'")
+
+    assert store._get("1:0xabc") is None
+    assert store.stats()["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_contract_cache_writes_through_and_survives_restart(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "contracts_cache_db_path", str(tmp_path / "contracts.db"))
+    contract = CachedContract(metadata={"name": "A"}, source_files={"A.sol": "code"}, abi=[{"type": "event"}])
+    first = ContractCache()
+    await first.set("1:0xabc", contract)
+    first._persistent.close()
+
+    restarted = ContractCache()
+    cached = await restarted.get("1:0xabc")
+
+    assert cached == contract
+    assert restarted.stats()["misses"] == 1
+    assert restarted.persistent_stats()["hits"] == 1
+    # Promoted into memory: the next lookup does not touch the persistent tier.
+    assert (await restarted.get("1:0xabc")).abi == [{"type": "event"}]
+    assert restarted.stats()["hits"] == 1
+    assert restarted.persistent_stats()["hits"] == 1
+    restarted._persistent.close()
+
+
+@pytest.mark.asyncio
+async def test_unverified_contract_is_not_served_from_disk_after_the_memory_ttl(tmp_path, monkeypatch):
+    fields = ServerConfig.model_fields
+    assert fields["contracts_cache_db_ttl_seconds"].default == fields["contracts_cache_ttl_seconds"].default
+    monkeypatch.setattr(config, "contracts_cache_db_path", str(tmp_path / "contracts.db"))
+    cache = ContractCache()
+    await cache.set("1:0xabc", CachedContract(metadata={"is_fully_verified": False}, source_files={}))
+    later = config.contracts_cache_ttl_seconds + 1
+    monkeypatch.setattr(
+        cache_module, "time", SimpleNamespace(monotonic=lambda: time.monotonic() + later, time=time.time)
+    )
+    monkeypatch.setattr(contract_store_module, "time", SimpleNamespace(time=lambda: time.time() + later))
+
+    assert await cache.get("1:0xabc") is None
+    assert cache.persistent_stats()["misses"] == 1
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_contract_cache_without_persistent_tier():
+    cache = ContractCache()
+    await cache.set("1:0xabc", CachedContract(metadata={}, source_files={}))
+    await cache.get("1:0xdef")
+
+    assert cache._persistent is None
+    assert cache.persistent_stats() == {}
+
+
+def test_payloads_are_compressed(store):
+    source = "pragma solidity ^0.8.0;\n" * 1000
+    store._put("1:0xabc", _document("A", source))
+
+    size = sqlite3.connect(store.path).execute("SELECT size FROM contracts").fetchone()[0]
+    assert size < len(source) // 4
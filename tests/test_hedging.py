@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+from unittest.mock import patch
+
+import anyio
+import pytest
+
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.hedging import HedgePolicy
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def hedging_config():
+    with (
+        patch.object(config, "hedge_budget_ratio", 1.0),
+        patch.object(config, "hedge_percentile", 0.95),
+        patch.object(config, "hedge_min_samples", 3),
+    ):
+        yield
+
+
+def _warmed_policy(latency: float = 0.01) -> HedgePolicy:
+    policy = HedgePolicy()
+    for _ in range(3):
+        policy.record_latency(latency)
+    return policy
+
+
+def test_hedge_delay_needs_samples_and_is_floored(hedging_config):
+    policy = HedgePolicy()
+    policy.record_latency(0.2)
+    assert policy.hedge_delay() is None
+    policy.record_latency(0.3)
+    policy.record_latency(0.4)
+    assert policy.hedge_delay() == 0.4
+    assert _warmed_policy(0.001).hedge_delay() == 0.05
+
+
+async def test_fast_primary_is_not_hedged(hedging_config):
+    policy = _warmed_policy()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        return "ok"
+
+    assert await policy.run(fn) == "ok"
+    assert calls == 1
+    assert policy.hedges == 0
+
+
+async def test_slow_primary_is_hedged_and_loser_cancelled(hedging_config):
+    policy = _warmed_policy()
+    calls = 0
+    primary_cancelled = False
+
+    async def fn():
+        nonlocal calls, primary_cancelled
+        calls += 1
+        if calls == 1:
+            try:
+                await anyio.sleep(10)
+            except anyio.get_cancelled_exc_class():
+                primary_cancelled = True
+                raise
+        return f"attempt-{calls}"
+
+    with anyio.fail_after(5):
+        assert await policy.run(fn) == "attempt-2"
+    assert primary_cancelled
+    assert policy.stats()["hedges"] == 1
+    assert policy.stats()["hedge_wins"] == 1
+
+
+async def test_hedge_win_learns_the_primary_latency(hedging_config):
+    policy = _warmed_policy()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await anyio.sleep(10)
+        return "ok"
+
+    with anyio.fail_after(5):
+        await policy.run(fn)
+
+    # The instant hedge must not be learned; the primary had already run past the delay.
+    assert policy.hedge_wins == 1
+    assert policy._latencies[-1] >= 0.05
+
+
+async def test_budget_caps_hedges(hedging_config):
+    policy = _warmed_policy()
+    calls = 0
+
+    async def slow():
+        nonlocal calls
+        calls += 1
+        await anyio.sleep(0.1)
+        return "ok"
+
+    # A median threshold keeps the learned delay below the slow calls throughout.
+    with patch.object(config, "hedge_budget_ratio", 0.25), patch.object(config, "hedge_percentile", 0.5):
+        for _ in range(4):
+            await policy.run(slow)
+
+    # Four primaries earn one hedge token: exactly one hedge is sent.
+    stats = policy.stats()
+    assert stats["primaries"] == 4
+    assert stats["hedges"] == 1
+    assert stats["budget_denied"] == 3
+    assert calls == 5
+
+
+async def test_both_attempts_failing_raises_primary_error(hedging_config):
+    policy = _warmed_policy()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await anyio.sleep(0.1)
+            raise ValueError("primary")
+        raise RuntimeError("hedge")
+
+    with pytest.raises(ValueError, match="primary"):
+        await policy.run(fn)
+    assert calls == 2
+
+
+async def test_hedge_success_wins_over_failed_primary(hedging_config):
+    policy = _warmed_policy()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await anyio.sleep(0.1)
+            raise ValueError("primary")
+        await anyio.sleep(0.2)
+        return "hedged"
+
+    assert await policy.run(fn) == "hedged"
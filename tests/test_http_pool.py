@@ -0,0 +1,183 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from blockscout_mcp_server import http_pool
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.http_pool import HttpClientPool, _origin_of
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _recording_pool(seen: list[httpx.Request]) -> HttpClientPool:
+    """Return a pool whose clients answer every request locally and record it."""
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    pool = HttpClientPool()
+    pool._build_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(_handler), follow_redirects=True)
+    return pool
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_origin_of_strips_path_and_query():
+    assert _origin_of("https://api.blockscout.com/1/api/v2/blocks?x=1") == "https://api.blockscout.com"
+    assert _origin_of("http://localhost:8080/api") == "http://localhost:8080"
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_client_per_origin():
+    pool = _recording_pool([])
+    first = await pool.get_client("https://api.blockscout.com/1/api/v2/blocks")
+    second = await pool.get_client("https://api.blockscout.com/8453/api/v2/stats")
+    other = await pool.get_client("https://bens.services.blockscout.com/api/v1/1/domains")
+    assert first is second
+    assert other is not first
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_use_creates_single_client():
+    pool = HttpClientPool()
+    built: list[httpx.AsyncClient] = []
+
+    def _build():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+        built.append(client)
+        return client
+
+    pool._build_client = _build
+    clients = await asyncio.gather(*(pool.get_client("https://api.blockscout.com/x") for _ in range(10)))
+    assert len(built) == 1
+    assert all(c is built[0] for c in clients)
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_lease_applies_timeout_and_does_not_close_pooled_client():
+    seen: list[httpx.Request] = []
+    pool = _recording_pool(seen)
+
+    async with pool.lease(timeout=7) as client:
+        response = await client.get("https://api.blockscout.com/1/api/v2/blocks", params={"a": "b"})
+    assert response.json() == {"ok": True}
+    assert seen[0].extensions["timeout"]["read"] == 7
+    assert seen[0].url.params["a"] == "b"
+
+    pooled = await pool.get_client("https://api.blockscout.com/")
+    assert not pooled.is_closed
+    await pool.close()
+    assert pooled.is_closed
+
+
+@pytest.mark.asyncio
+async def test_request_headers_are_not_shared_between_leases():
+    seen: list[httpx.Request] = []
+    pool = _recording_pool(seen)
+
+    async with pool.lease(timeout=5) as client:
+        await client.get("https://api.blockscout.com/1/x", headers={"Authorization": "Bearer key-a"})
+    async with pool.lease(timeout=5) as client:
+        await client.post("https://api.blockscout.com/1/x", json={})
+
+    assert seen[0].headers["Authorization"] == "Bearer key-a"
+    assert "Authorization" not in seen[1].headers
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_closed_client_is_replaced():
+    pool = _recording_pool([])
+    first = await pool.get_client("https://api.blockscout.com/")
+    await first.aclose()
+    second = await pool.get_client("https://api.blockscout.com/")
+    assert second is not first
+    await pool.close()
+
+
+def test_clients_from_previous_event_loop_are_discarded():
+    pool = _recording_pool([])
+    first = asyncio.run(pool.get_client("https://api.blockscout.com/"))
+    second = asyncio.run(pool.get_client("https://api.blockscout.com/"))
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_close_is_idempotent():
+    pool = _recording_pool([])
+    await pool.get_client("https://api.blockscout.com/")
+    await pool.close()
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_does_not_replay_cookies():
+    seen: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, headers={"Set-Cookie": "__cf_bm=abc; Path=/"})
+
+    real_client = httpx.AsyncClient
+    pool = HttpClientPool()
+    with patch(
+        "blockscout_mcp_server.http_pool.httpx.AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(_handler), **kwargs),
+    ):
+        async with pool.lease(timeout=1.0) as first:
+            await first.get("https://a.example/one")
+        async with pool.lease(timeout=1.0) as second:
+            await second.get("https://a.example/two")
+
+    assert [request.headers.get("cookie") for request in seen] == [None, None]
+    await pool.close()
+
+
+def test_build_client_uses_configured_limits():
+    pool = HttpClientPool()
+    with (
+        patch.object(config, "http_pool_max_connections", 7),
+        patch.object(config, "http_pool_max_keepalive_connections", 3),
+        patch.object(config, "http_pool_keepalive_expiry_seconds", 1.5),
+        patch("blockscout_mcp_server.http_pool.httpx.AsyncClient") as mock_client_cls,
+    ):
+        pool._build_client()
+    kwargs = mock_client_cls.call_args.kwargs
+    assert kwargs["follow_redirects"] is True
+    assert kwargs["limits"] == httpx.Limits(max_connections=7, max_keepalive_connections=3, keepalive_expiry=1.5)
+    assert kwargs["http2"] is False
+
+
+def test_http2_falls_back_when_h2_missing(caplog):
+    pool = HttpClientPool()
+    with (
+        patch.object(config, "http_pool_http2", True),
+        patch.object(http_pool, "_H2_AVAILABLE", False),
+        patch("blockscout_mcp_server.http_pool.httpx.AsyncClient") as mock_client_cls,
+        caplog.at_level("WARNING", logger="blockscout_mcp_server.http_pool"),
+    ):
+        pool._build_client()
+    assert mock_client_cls.call_args.kwargs["http2"] is False
+    assert "h2" in caplog.text
+
+
+def test_http2_enabled_when_h2_available():
+    pool = HttpClientPool()
+    with (
+        patch.object(config, "http_pool_http2", True),
+        patch.object(http_pool, "_H2_AVAILABLE", True),
+        patch("blockscout_mcp_server.http_pool.httpx.AsyncClient") as mock_client_cls,
+    ):
+        pool._build_client()
+    assert mock_client_cls.call_args.kwargs["http2"] is True
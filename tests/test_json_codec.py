@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+import json
+from unittest.mock import patch
+
+import pytest
+from starlette.responses import JSONResponse
+
+from blockscout_mcp_server import json_codec
+from blockscout_mcp_server.api.helpers import CodecJSONResponse
+
+pytestmark = pytest.mark.skipif(json_codec.orjson is None, reason="orjson (fast-json extra) not installed")
+
+PAYLOAD = {
+    "hash": "0x" + "ab" * 32,
+    "value": "1000000000000000000000",
+    "method": "transfer",
+    "name": "Ünïcødé 名前 🚀",
+    "items": [{"block": 19_000_000, "ok": True, "fee": None, "ratio": 0.25}],
+}
+
+
+def test_dumps_matches_stdlib_compact_non_ascii_output():
+    expected = json.dumps(PAYLOAD, ensure_ascii=False, separators=(",", ":"))
+    assert json_codec.dumps(PAYLOAD) == expected
+    assert json_codec.dumps_bytes(PAYLOAD) == expected.encode()
+    with patch.object(json_codec, "_orjson", None):
+        assert json_codec.dumps(PAYLOAD) == expected
+
+
+def test_dumps_ensure_ascii_matches_stdlib():
+    expected = json.dumps(PAYLOAD, separators=(",", ":"))
+    assert json_codec.dumps(PAYLOAD, ensure_ascii=True) == expected
+    assert json_codec.dumps({"a": 1}, ensure_ascii=True) == '{"a":1}'
+
+
+def test_dumps_sort_keys_and_default_match_stdlib():
+    params = {"b": 2, "a": {"y": 1, "x": object}}
+    expected = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    assert json_codec.dumps(params, sort_keys=True, default=str) == expected
+
+
+@pytest.mark.parametrize("obj", [{"v": 2**70}, {1: "int key"}])
+def test_dumps_falls_back_for_values_orjson_rejects(obj):
+    assert json_codec.dumps(obj) == json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def test_loads_keeps_wide_integers_exact():
+    body = b'{"total_supply": 123456789012345678901234567890, "small": [1, -9223372036854775808]}'
+    assert json_codec.loads(body) == json.loads(body)
+    assert isinstance(json_codec.loads(body)["total_supply"], int)
+
+
+def test_loads_decodes_str_and_bytes():
+    text = json.dumps(PAYLOAD, ensure_ascii=False)
+    assert json_codec.loads(text) == PAYLOAD
+    assert json_codec.loads(text.encode()) == PAYLOAD
+
+
+def test_loads_raises_stdlib_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b'{"broken": ')
+
+
+def test_codec_json_response_renders_like_starlette():
+    content = {"data": PAYLOAD, "notes": None}
+    assert CodecJSONResponse(content).body == JSONResponse(content).body
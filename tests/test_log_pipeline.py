@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the queued, structured log pipeline in logging_utils."""
+
+import io
+import json
+import logging
+import queue
+import sys
+
+import pytest
+
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.logging_utils import (
+    CappedRepr,
+    JsonFormatter,
+    LogPipeline,
+    SamplingFilter,
+    _LogQueueHandler,
+    parse_sample_rates,
+)
+
+
+def _record(name="blockscout_mcp_server.tools", level=logging.INFO, msg="hello %s", args=("world",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"chain_id": "1", "address": "0xabc", "cursor": None},
+        ["a", 1, 2.5, b"x", (1,), ()],
+        {"nested": {"list": [1, 2, {"k": "v"}], "tuple": (1, 2)}},
+        "it's",
+    ],
+)
+def test_capped_repr_matches_repr_when_it_fits(value):
+    assert str(CappedRepr(value, limit=1000)) == repr(value)
+
+
+def test_capped_repr_truncates_large_values():
+    value = {"abi": [{"name": f"fn{i}", "inputs": ["x" * 50] * 10} for i in range(1000)]}
+
+    rendered = str(CappedRepr(value, limit=100))
+
+    assert rendered == repr(value)[:100] + "...<truncated>"
+
+
+def test_capped_repr_zero_limit_renders_in_full(monkeypatch):
+    monkeypatch.setattr(config, "log_arg_max_chars", 0)
+    value = {"data": "x" * 5000}
+
+    assert str(CappedRepr(value)) == repr(value)
+
+
+def test_json_formatter_emits_one_object_per_record():
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = logging.LogRecord("mod", logging.ERROR, __file__, 1, "failed %d", (3,), sys.exc_info())
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["level"] == "ERROR"
+    assert entry["logger"] == "mod"
+    assert entry["message"] == "failed 3"
+    assert entry["time"].endswith("+00:00")
+    assert "RuntimeError: boom" in entry["exception"]
+
+
+def test_parse_sample_rates():
+    assert parse_sample_rates("") == {}
+    assert parse_sample_rates(" httpx=0.1, mcp.server=1 ,") == {"httpx": 0.1, "mcp.server": 1.0}
+
+
+@pytest.mark.parametrize("spec", ["httpx", "httpx=abc", "=0.5", "httpx=1.5", "httpx=-0.1"])
+def test_parse_sample_rates_rejects_invalid_entries(spec):
+    with pytest.raises(ValueError, match="Invalid log sample rate"):
+        parse_sample_rates(spec)
+
+
+def test_sampling_filter_uses_most_specific_logger_and_keeps_warnings():
+    sampler = SamplingFilter({"httpx": 0.0, "httpx.keep": 1.0})
+
+    assert sampler.filter(_record(name="httpx._client")) is False
+    assert sampler.filter(_record(name="httpx.keep.inner")) is True
+    assert sampler.filter(_record(name="httpxother")) is True
+    assert sampler.filter(_record(name="httpx", level=logging.WARNING)) is True
+    assert sampler.sampled_out == 1
+
+
+def test_queue_handler_defers_formatting_of_immutable_args():
+    handler = _LogQueueHandler(queue.Queue())
+    arguments = {"a": 1}
+    capped = _record(msg="%s %s", args=("tool", CappedRepr(arguments)))
+    mutable = _record(msg="%s %s", args=("tool", arguments))
+
+    handler.emit(capped)
+    handler.emit(mutable)
+    arguments["a"] = 2
+
+    deferred, resolved = handler.queue.get_nowait(), handler.queue.get_nowait()
+    assert deferred is capped and deferred.args == capped.args
+    assert resolved.msg == "tool {'a': 1}" and resolved.args is None
+    assert mutable.args == ("tool", arguments)
+
+
+def test_queue_handler_drops_when_full():
+    handler = _LogQueueHandler(queue.Queue(1))
+
+    handler.emit(_record())
+    handler.emit(_record())
+
+    assert handler.dropped == 1
+    assert handler.queue.qsize() == 1
+
+
+def _stream_handlers():
+    return [handler for handler in logging.getLogger().handlers if type(handler) is logging.StreamHandler]
+
+
+@pytest.fixture
+def root_stream():
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+    yield handler, stream
+    root.handlers = saved_handlers
+    root.setLevel(saved_level)
+
+
+def test_pipeline_queues_formats_and_restores_handlers(root_stream, monkeypatch):
+    handler, stream = root_stream
+    monkeypatch.setattr(config, "log_format", "json")
+    monkeypatch.setattr(config, "log_queue_size", 10)
+    monkeypatch.setattr(config, "log_sample_rates", "noisy=0")
+    pipeline = LogPipeline()
+
+    pipeline.install()
+    assert _stream_handlers() == []
+    logging.getLogger("app").info("queued %s", "line")
+    logging.getLogger("noisy.child").info("sampled out")
+    pipeline.close()
+
+    assert _stream_handlers() == [handler]
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(line["logger"], line["message"]) for line in lines] == [("app", "queued line")]
+    assert handler.filters == []
+
+
+def test_pipeline_without_queue_only_formats_and_samples(root_stream, monkeypatch):
+    handler, stream = root_stream
+    monkeypatch.setattr(config, "log_queue_size", 0)
+    monkeypatch.setattr(config, "log_sample_rates", "noisy=0")
+    pipeline = LogPipeline()
+
+    pipeline.install()
+    logging.getLogger("app").info("direct")
+    logging.getLogger("noisy").info("dropped")
+
+    assert _stream_handlers() == [handler]
+    assert stream.getvalue().endswith(" - app - INFO - direct\n")
+    assert pipeline.stats() == {"dropped": 0, "sampled_out": 1, "depth": 0}
+    pipeline.close()
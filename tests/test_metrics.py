@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the in-process Prometheus metrics."""
+
+from unittest.mock import patch
+
+import pytest
+
+from blockscout_mcp_server import metrics
+from blockscout_mcp_server.cache import CachedContract, ChainsListCache, ContractCache
+from blockscout_mcp_server.metrics import MetricsRegistry, endpoint_template
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/api/v2/transactions/0x" + "ab" * 32, "/api/v2/transactions/{hash}"),
+        ("/api/v2/addresses/0x" + "12" * 20 + "/token-transfers", "/api/v2/addresses/{address}/token-transfers"),
+        ("/api/v2/blocks/19000000", "/api/v2/blocks/{id}"),
+        ("/api/v1/1/domains/vitalik.eth", "/api/v1/{id}/domains/{id}"),
+        ("/api/v2/stats", "/api/v2/stats"),
+        ("/api/v2/advanced-filters?q=1", "/api/v2/advanced-filters"),
+    ],
+)
+def test_endpoint_template(path, expected):
+    assert endpoint_template(path) == expected
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("demo_seconds", "Demo.", ("tool",), (0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, "x")
+
+    assert registry.render().splitlines() == [
+        "# HELP demo_seconds Demo.",
+        "# TYPE demo_seconds histogram",
+        'demo_seconds_bucket{tool="x",le="0.1"} 2',
+        'demo_seconds_bucket{tool="x",le="1"} 3',
+        'demo_seconds_bucket{tool="x",le="+Inf"} 4',
+        'demo_seconds_sum{tool="x"} 3.65',
+        'demo_seconds_count{tool="x"} 4',
+    ]
+
+
+def test_histogram_time_labels_outcome():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("op_seconds", "Op.", ("operation", "status"), (1.0,))
+
+    with histogram.time("read"):
+        pass
+    with pytest.raises(RuntimeError), histogram.time("read"):
+        raise RuntimeError("boom")
+
+    assert histogram.count("read", "success") == 1
+    assert histogram.count("read", "error") == 1
+
+
+def test_counter_and_gauge_render_escaped_labels():
+    registry = MetricsRegistry()
+    counter = registry.counter("demo_total", "Demo.", ("path",))
+    gauge = registry.gauge("demo_in_flight", "Demo.", ())
+
+    counter.inc('a"b\\c')
+    counter.inc('a"b\\c', amount=2)
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    rendered = registry.render()
+    assert 'demo_total{path="a\\"b\\\\c"} 3' in rendered
+    assert "demo_in_flight 1" in rendered
+
+
+def test_series_beyond_cap_fold_into_overflow_series():
+    registry = MetricsRegistry()
+    counter = registry.counter("demo_total", "Demo.", ("path", "status"))
+
+    with patch.object(metrics, "_MAX_SERIES_PER_METRIC", 2):
+        for path in ("a", "b", "c", "d"):
+            counter.inc(path, "200")
+
+    assert counter.value("a", "200") == 1
+    assert counter.value("b", "200") == 1
+    assert counter.value("other", "other") == 2
+
+
+def test_registry_clear_drops_series():
+    metrics.tool_duration.observe(0.2, "get_block_info", "success")
+
+    metrics.registry.clear()
+
+    assert metrics.tool_duration.count("get_block_info", "success") == 0
+
+
+@pytest.mark.asyncio
+async def test_contract_cache_counts_hits_and_misses():
+    cache = ContractCache()
+    await cache.get("1:0xabc")
+    await cache.set("1:0xabc", CachedContract(metadata={}, source_files={}))
+    await cache.get("1:0xabc")
+
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "entries": 1,
+        "bytes": cache.total_bytes,
+        "evictions": 0,
+        "rejections": 0,
+        "source_blobs": 0,
+        "source_bytes": 0,
+        "source_logical_bytes": 0,
+    }
+
+
+def test_chains_list_cache_counts_hits_and_misses():
+    cache = ChainsListCache()
+    cache.get_if_fresh()
+    cache.store_snapshot([])
+    cache.get_if_fresh()
+
+    assert cache.stats() == {"hits": 1, "misses": 1, "stale_hits": 0}
@@ -18,6 +18,7 @@ from blockscout_mcp_server.models import (
     TransactionInfoData,
     UserOperationData,
     UserOperationRawData,
+    serialize_tool_response,
 )
 
 
@@ -524,3 +525,47 @@ def test_build_tool_response_supports_content_text():
 
     response_without = build_tool_response(data="test")
     assert response_without.content_text is None
+
+
+def test_serialize_tool_response_matches_model_dump_encoding():
+    response = ToolResponse[TransactionInfoData](
+        data=TransactionInfoData(
+            **{
+                "from": "0xfrom",
+                "to": None,
+                "token_transfers": [TokenTransfer(**{"from": "0xa", "to": "0xb", "type": "transfer", "token": None})],
+            }
+        ),
+        notes=["Ünïcode ✓"],
+        content_text="summary",
+    )
+
+    expected = json.dumps(
+        response.model_dump(mode="json", by_alias=True), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+    assert serialize_tool_response(response) == expected
+    assert b"content_text" not in serialize_tool_response(response)
+
+
+def test_serialize_tool_response_is_semantically_equivalent_not_byte_identical():
+    data = {"tiny": 1e-7, "huge": 1e16, "plain": 0.1, "text": 'é ✓ \u2028 \x7f "q" <tag>', "big": 2**70}
+    response = ToolResponse[dict](data=data, notes=["Ünïcode ✓"])
+
+    encoded = serialize_tool_response(response)
+    previous = json.dumps(response.model_dump(mode="json", by_alias=True), ensure_ascii=False, separators=(",", ":"))
+
+    assert json.loads(encoded) == json.loads(previous) == response.model_dump(mode="json", by_alias=True)
+    assert "é ✓".encode() in encoded
+    assert b": " not in encoded and b", " not in encoded
+    # The one known spelling difference: pydantic writes exponents without zero padding.
+    assert b'"tiny":1e-7' in encoded and '"tiny":1e-07' in previous
+
+
+def test_serialize_tool_response_reuses_adapter_per_response_type():
+    from blockscout_mcp_server.models import _tool_response_adapter
+
+    serialize_tool_response(ToolResponse[dict](data={"a": 1}))
+    serialize_tool_response(ToolResponse[dict](data={"b": 2}))
+
+    assert _tool_response_adapter(ToolResponse[dict]) is _tool_response_adapter(ToolResponse[dict])
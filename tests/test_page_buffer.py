@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the page buffer of upstream items fetched past a returned page."""
+
+import pytest
+
+from blockscout_mcp_server import page_buffer as page_buffer_module
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.page_buffer import PageBuffer
+
+_PARAMS = {"chain_id": "1", "address": "0xabc", "cursor": "CURSOR"}
+
+
+@pytest.fixture
+def buffer():
+    return PageBuffer()
+
+
+def test_take_returns_buffered_items_once(buffer):
+    buffer.store("tool", _PARAMS, list(range(15)), page_size=10, upstream_has_more=True)
+
+    page = buffer.take("tool", dict(reversed(_PARAMS.items())))
+
+    assert page.items == list(range(15))
+    assert page.upstream_has_more is True
+    assert buffer.take("tool", _PARAMS) is None
+    assert buffer.stats() == {"hits": 1, "misses": 1, "stores": 1, "evictions": 0, "entries": 0}
+
+
+def test_keys_include_tool_name_and_every_param(buffer):
+    buffer.store("tool", _PARAMS, list(range(15)), page_size=10, upstream_has_more=True)
+
+    assert buffer.take("other_tool", _PARAMS) is None
+    assert buffer.take("tool", {**_PARAMS, "cursor": "OTHER"}) is None
+    assert buffer.take("tool", _PARAMS) is not None
+
+
+@pytest.mark.parametrize(("upstream_has_more", "served"), [(True, False), (False, True)])
+def test_short_remainder_is_served_only_when_upstream_is_exhausted(buffer, upstream_has_more, served):
+    buffer.store("tool", _PARAMS, list(range(10)), page_size=10, upstream_has_more=upstream_has_more)
+
+    assert (buffer.take("tool", _PARAMS) is not None) is served
+
+
+def test_expired_entries_are_misses(buffer, monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(page_buffer_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(config, "page_buffer_ttl_seconds", 60.0)
+    buffer.store("tool", _PARAMS, list(range(15)), page_size=10, upstream_has_more=True)
+
+    now[0] += 60.0
+
+    assert buffer.take("tool", _PARAMS) is None
+
+
+def test_least_recently_stored_entries_are_evicted(buffer, monkeypatch):
+    monkeypatch.setattr(config, "page_buffer_max_entries", 2)
+    for cursor in ("A", "B", "C"):
+        buffer.store("tool", {**_PARAMS, "cursor": cursor}, list(range(15)), page_size=10, upstream_has_more=True)
+
+    assert buffer.take("tool", {**_PARAMS, "cursor": "A"}) is None
+    assert buffer.take("tool", {**_PARAMS, "cursor": "C"}) is not None
+    assert buffer.stats()["evictions"] == 1
+
+
+def test_zero_entries_disables_the_buffer(buffer, monkeypatch):
+    monkeypatch.setattr(config, "page_buffer_max_entries", 0)
+    buffer.store("tool", _PARAMS, list(range(15)), page_size=10, upstream_has_more=True)
+
+    assert buffer.take("tool", _PARAMS) is None
+    assert buffer.stats()["stores"] == 0
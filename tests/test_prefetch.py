@@ -0,0 +1,165 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the speculative next-page prefetch."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from blockscout_mcp_server import metrics
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.prefetch import Prefetcher
+from blockscout_mcp_server.pro_api_key_context import CreditSink, _credit_sink
+from blockscout_mcp_server.tools.address.get_tokens_by_address import get_tokens_by_address
+
+
+@pytest.fixture
+def prefetcher(monkeypatch):
+    monkeypatch.setattr(config, "prefetch_max_concurrency", 2)
+    prefetcher = Prefetcher()
+    yield prefetcher
+    prefetcher.clear()
+
+
+def _fetch(result, *, started=None, release=None):
+    async def fetch():
+        if started is not None:
+            started.set()
+        if release is not None:
+            await release.wait()
+        return result
+
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_finished_prefetch_is_served_once(prefetcher):
+    assert prefetcher.schedule("key", _fetch({"items": [1]}))
+    await asyncio.sleep(0)
+
+    assert await prefetcher.take("key") == {"items": [1]}
+    assert await prefetcher.take("key") is None
+    assert prefetcher.stats()["served"] == 1
+
+
+@pytest.mark.asyncio
+async def test_running_prefetch_is_awaited_by_the_follow_up(prefetcher):
+    release = asyncio.Event()
+    prefetcher.schedule("key", _fetch({"items": [1]}, release=release))
+
+    take = asyncio.create_task(prefetcher.take("key"))
+    await asyncio.sleep(0)
+    assert not take.done()
+    release.set()
+
+    assert await take == {"items": [1]}
+
+
+@pytest.mark.asyncio
+async def test_failed_prefetch_is_a_miss(prefetcher):
+    async def fetch():
+        raise httpx.ConnectError("down")
+
+    prefetcher.schedule("key", fetch)
+    await asyncio.sleep(0)
+
+    assert await prefetcher.take("key") is None
+    assert prefetcher.stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_skips_extra_prefetches(prefetcher):
+    release = asyncio.Event()
+    for key in ("a", "b", "c"):
+        prefetcher.schedule(key, _fetch({}, release=release))
+
+    assert prefetcher.stats()["in_flight"] == 2
+    assert prefetcher.stats()["skipped_concurrency"] == 1
+    release.set()
+
+
+@pytest.mark.asyncio
+async def test_budget_is_refunded_by_served_prefetches(prefetcher, monkeypatch):
+    monkeypatch.setattr(config, "prefetch_budget_per_minute", 1)
+
+    assert prefetcher.schedule("a", _fetch({}))
+    assert not prefetcher.schedule("b", _fetch({}))
+    await asyncio.sleep(0)
+    await prefetcher.take("a")
+
+    assert prefetcher.schedule("b", _fetch({}))
+    assert prefetcher.stats()["skipped_budget"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unused_prefetches_expire(prefetcher, monkeypatch):
+    monkeypatch.setattr(config, "prefetch_ttl_seconds", 0.01)
+    prefetcher.schedule("key", _fetch({}))
+    await asyncio.sleep(0.02)
+
+    assert await prefetcher.take("key") is None
+    assert prefetcher.stats()["unused"] == 1
+
+
+@pytest.mark.asyncio
+async def test_load_skips_new_and_cancels_running_prefetches(prefetcher, monkeypatch):
+    monkeypatch.setattr(config, "prefetch_max_tool_calls_in_flight", 1)
+    started = asyncio.Event()
+    prefetcher.schedule("running", _fetch({}, started=started, release=asyncio.Event()))
+    await started.wait()
+
+    metrics.tools_in_flight.inc("tool_a")
+    metrics.tools_in_flight.inc("tool_b")
+    assert not prefetcher.schedule("new", _fetch({}))
+    assert await prefetcher.take("other") is None
+    await asyncio.sleep(0.01)
+
+    stats = prefetcher.stats()
+    assert (stats["skipped_load"], stats["cancelled"], stats["in_flight"], stats["entries"]) == (1, 1, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_credits_seen_by_the_prefetch_reach_the_served_call(prefetcher):
+    async def fetch():
+        _credit_sink.get().record(1234.0)
+        return {}
+
+    prefetcher.schedule("key", fetch)
+    await asyncio.sleep(0)
+    sink = CreditSink()
+    token = _credit_sink.set(sink)
+    try:
+        await prefetcher.take("key")
+    finally:
+        _credit_sink.reset(token)
+
+    assert sink.remaining == 1234.0
+
+
+@pytest.mark.asyncio
+async def test_next_page_is_prefetched_and_served_to_the_next_call(mock_ctx, monkeypatch):
+    monkeypatch.setattr(config, "pro_api_key", "server-key")
+    monkeypatch.setattr(config, "prefetch_max_concurrency", 1)
+    pages = {
+        None: {"items": [], "next_page_params": {"id": 2}},
+        2: {"items": [], "next_page_params": None},
+    }
+    sent = []
+
+    async def send(**kwargs):
+        sent.append(kwargs["params"].get("id"))
+        return httpx.Response(200, json=pages[kwargs["params"].get("id")], request=httpx.Request("GET", "https://x"))
+
+    with (
+        patch("blockscout_mcp_server.tools.common.ensure_chain_supported", AsyncMock()),
+        patch("blockscout_mcp_server.tools.common._send_blockscout_http_request", side_effect=send),
+    ):
+        first = await get_tokens_by_address(chain_id="1", address="0xabc", ctx=mock_ctx)
+        await asyncio.sleep(0.01)
+        assert sent == [None, 2]
+
+        second = await get_tokens_by_address(**first.pagination.next_call.params, ctx=mock_ctx)
+
+    assert sent == [None, 2]
+    assert second.pagination is None
@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.rate_limiter import PacingBucket, RatePacer, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("blockscout_mcp_server.rate_limiter.time.monotonic", fake):
+        yield fake
+
+
+@pytest.fixture
+def fake_sleep(clock):
+    async def _sleep(seconds):
+        clock.now += seconds
+
+    with patch("blockscout_mcp_server.rate_limiter.anyio.sleep", AsyncMock(side_effect=_sleep)) as mock_sleep:
+        yield mock_sleep
+
+
+def _429(retry_after: str | None = None) -> httpx.Response:
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return httpx.Response(429, headers=headers)
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:05 GMT", now=1445412480.0) == 5.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412490.0) == 0.0
+    assert parse_retry_after("") is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_unpaced_bucket_never_waits(clock, fake_sleep):
+    bucket = PacingBucket("h")
+    for _ in range(50):
+        await bucket.acquire()
+    fake_sleep.assert_not_awaited()
+    assert bucket.snapshot()["paced_rps"] is None
+
+
+@pytest.mark.asyncio
+async def test_retry_after_blocks_next_acquire(clock, fake_sleep):
+    bucket = PacingBucket("h")
+    assert bucket.on_rate_limited(_429("2")) == 2.0
+    await bucket.acquire()
+    fake_sleep.assert_awaited_once_with(2.0)
+    snapshot = bucket.snapshot()
+    assert snapshot["rate_limited"] == 1
+    assert snapshot["waits"] == 1
+    assert snapshot["max_wait_seconds"] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_paces_to_observed_throughput(clock, fake_sleep):
+    bucket = PacingBucket("h")
+    # 50 requests within the throughput window => 5 rps observed => paced at 4 rps.
+    for _ in range(50):
+        await bucket.acquire()
+        clock.now += 0.1
+    bucket.on_rate_limited(_429("0"))
+    assert bucket.snapshot()["paced_rps"] == 4.0
+
+    start = clock.now
+    for _ in range(8):
+        await bucket.acquire()
+    assert clock.now - start == pytest.approx(2.0, abs=0.26)
+
+
+@pytest.mark.asyncio
+async def test_pacing_lifts_after_recovery_window(clock, fake_sleep):
+    bucket = PacingBucket("h")
+    bucket.on_rate_limited(_429("0"))
+    assert bucket.rate is not None
+    clock.now += config.rate_limit_recovery_seconds + 1
+    await bucket.acquire()
+    assert bucket.rate is None
+
+
+@pytest.mark.asyncio
+async def test_waits_beyond_budget_are_not_queued(clock, fake_sleep):
+    bucket = PacingBucket("h")
+    bucket.on_rate_limited(_429(str(config.rate_limit_max_wait_seconds + 5)))
+    await bucket.acquire()
+    fake_sleep.assert_not_awaited()
+    assert bucket.snapshot()["over_budget"] == 1
+
+
+def test_pacer_buckets_are_per_key_and_host():
+    pacer = RatePacer()
+    a = pacer.bucket("a" * 64, "api.blockscout.com")
+    assert pacer.bucket("a" * 64, "api.blockscout.com") is a
+    assert pacer.bucket("b" * 64, "api.blockscout.com") is not a
+    assert pacer.bucket("a" * 64, "bens.services.blockscout.com") is not a
+    a.rate_limited = 2
+    pacer.bucket("b" * 64, "api.blockscout.com").rate_limited = 1
+
+    # Exported per host only: key fingerprints never become labels.
+    snapshot = pacer.snapshot()
+    assert set(snapshot) == {"api.blockscout.com", "bens.services.blockscout.com"}
+    assert (snapshot["api.blockscout.com"]["buckets"], snapshot["api.blockscout.com"]["rate_limited"]) == (2, 3)
+
+
+def test_pacer_forgets_least_recently_used_buckets():
+    pacer = RatePacer()
+    with patch("blockscout_mcp_server.rate_limiter._MAX_TRACKED_BUCKETS", 2):
+        first = pacer.bucket("a" * 64, "api.blockscout.com")
+        pacer.bucket("b" * 64, "api.blockscout.com")
+        assert pacer.bucket("a" * 64, "api.blockscout.com") is first
+        pacer.bucket("c" * 64, "api.blockscout.com")
+
+    assert pacer.snapshot()["api.blockscout.com"]["buckets"] == 2
+    assert pacer.bucket("a" * 64, "api.blockscout.com") is first
+
+
+def test_pacer_disabled_with_zero_max_wait():
+    with patch.object(config, "rate_limit_max_wait_seconds", 0):
+        assert RatePacer().enabled is False
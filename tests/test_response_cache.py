@@ -0,0 +1,194 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.response_cache import (
+    UpstreamResponseCache,
+    finality_depth,
+    is_stale_servable_error,
+)
+
+TX_HASH = "0x" + "ab" * 32
+TX_PATH = f"/api/v2/transactions/{TX_HASH}"
+CONTRACT_PATH = "/api/v2/smart-contracts/0x" + "12" * 20
+
+
+def _store(cache: UpstreamResponseCache, chain_id: str, path: str, data, params=None) -> None:
+    cache.store(chain_id, path, params, json.dumps(data).encode(), data)
+
+
+def _cached(cache: UpstreamResponseCache, chain_id: str, path: str, params=None):
+    return cache.get(cache.make_key(chain_id, path, params))
+
+
+def test_confirmed_transaction_is_cached_as_final():
+    cache = UpstreamResponseCache()
+    tx = {"hash": TX_HASH, "status": "ok", "confirmations": 100, "block_number": 1000}
+    _store(cache, "1", TX_PATH, tx)
+    assert _cached(cache, "1", TX_PATH) == tx
+    # The transaction also tells the cache where the chain head is.
+    assert cache.chain_head("1") == 1099
+
+
+def test_cached_transaction_confirmations_follow_the_head():
+    cache = UpstreamResponseCache()
+    tx = {"hash": TX_HASH, "status": "ok", "confirmations": 100, "block_number": 1000}
+    _store(cache, "1", TX_PATH, tx)
+
+    _store(cache, "1", "/api/v2/blocks/1500", {"height": 1500})
+
+    assert _cached(cache, "1", TX_PATH)["confirmations"] == 501
+    assert cache.get_stale(cache.make_key("1", TX_PATH, None))["confirmations"] == 501
+
+
+@pytest.mark.parametrize(
+    "tx",
+    [
+        {"status": None, "confirmations": 0},
+        {"status": "ok", "confirmations": 3},
+    ],
+)
+def test_pending_or_shallow_transaction_is_not_cached(tx):
+    cache = UpstreamResponseCache()
+    _store(cache, "1", TX_PATH, tx)
+    assert _cached(cache, "1", TX_PATH) is None
+
+
+def test_mutable_ttl_caches_not_yet_final_responses():
+    cache = UpstreamResponseCache()
+    with patch.object(config, "response_cache_mutable_ttl_seconds", 5.0):
+        _store(cache, "1", TX_PATH, {"status": "ok", "confirmations": 3})
+    assert _cached(cache, "1", TX_PATH) == {"status": "ok", "confirmations": 3}
+
+
+def test_block_is_final_only_below_observed_head():
+    cache = UpstreamResponseCache()
+    _store(cache, "1", "/api/v2/blocks/100", {"height": 100})
+    assert _cached(cache, "1", "/api/v2/blocks/100") is None
+
+    cache.store("1", "/api/v2/main-page/blocks", None, b"[]", [{"height": 500}, {"height": 499}])
+    assert cache.chain_head("1") == 500
+
+    _store(cache, "1", "/api/v2/blocks/100", {"height": 100})
+    _store(cache, "1", "/api/v2/blocks/480", {"height": 480})
+    assert _cached(cache, "1", "/api/v2/blocks/100") == {"height": 100}
+    assert _cached(cache, "1", "/api/v2/blocks/480") is None
+
+
+def test_per_chain_finality_depth_override():
+    with patch.object(config, "response_cache_finality_depths", "1:5, 137:256"):
+        assert finality_depth("1") == 5
+        assert finality_depth("137") == 256
+        assert finality_depth("10") == config.response_cache_finality_depth
+
+
+def test_getblocknobytime_cached_when_block_is_final():
+    cache = UpstreamResponseCache()
+    cache.observe_head("1", 1000)
+    params = {"module": "block", "action": "getblocknobytime", "timestamp": 1, "closest": "before"}
+    body = {"status": "1", "result": {"blockNumber": "10"}}
+    _store(cache, "1", "/api", body, params)
+    assert _cached(cache, "1", "/api", params) == body
+
+    other = {"module": "account", "action": "balance"}
+    _store(cache, "1", "/api", body, other)
+    assert _cached(cache, "1", "/api", other) is None
+
+
+def test_verified_contract_gets_contract_ttl_and_unverified_is_skipped():
+    cache = UpstreamResponseCache()
+    _store(cache, "1", CONTRACT_PATH, {"is_fully_verified": True})
+    assert _cached(cache, "1", CONTRACT_PATH) == {"is_fully_verified": True}
+
+    cache.clear()
+    _store(cache, "1", CONTRACT_PATH, {"is_fully_verified": False})
+    assert _cached(cache, "1", CONTRACT_PATH) is None
+
+
+def test_unknown_endpoints_are_never_cached():
+    cache = UpstreamResponseCache()
+    cache.observe_head("1", 10_000)
+    _store(cache, "1", "/api/v2/addresses/0xabc", {"height": 1})
+    _store(cache, "1", f"{TX_PATH}/logs", {"status": "ok", "confirmations": 1000})
+    assert cache.stats()["entries"] == 0
+
+
+def test_hits_return_independent_copies_and_count():
+    cache = UpstreamResponseCache()
+    _store(cache, "1", TX_PATH, {"status": "ok", "confirmations": 100, "items": [1]})
+    first = _cached(cache, "1", TX_PATH)
+    first["items"].append(2)
+    assert _cached(cache, "1", TX_PATH)["items"] == [1]
+    _cached(cache, "1", "/api/v2/blocks/1")
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["stores"] == 1
+
+
+def test_entries_larger_than_callers_cap_are_misses():
+    cache = UpstreamResponseCache()
+    tx = {"status": "ok", "confirmations": 100}
+    _store(cache, "1", TX_PATH, tx)
+    key = cache.make_key("1", TX_PATH, None)
+    size = len(json.dumps(tx).encode())
+    assert cache.get(key, max_bytes=size) == tx
+    assert cache.get(key, max_bytes=size - 1) is None
+
+
+def test_lru_eviction_by_bytes():
+    cache = UpstreamResponseCache()
+    tx = {"status": "ok", "confirmations": 100, "pad": "x" * 100}
+    body_size = len(json.dumps(tx).encode())
+    with patch.object(config, "response_cache_max_bytes", body_size * 16 * 2):
+        paths = [f"/api/v2/transactions/0x{i:064x}" for i in range(40)]
+        for path in paths:
+            _store(cache, "1", path, tx)
+        stats = cache.stats()
+        assert stats["bytes"] <= config.response_cache_max_bytes
+        assert stats["evictions"] > 0
+        assert _cached(cache, "1", paths[0]) is None
+        assert _cached(cache, "1", paths[-1]) is not None
+
+
+def test_oversized_entry_is_not_cached():
+    cache = UpstreamResponseCache()
+    with patch.object(config, "response_cache_max_bytes", 160):
+        _store(cache, "1", TX_PATH, {"status": "ok", "confirmations": 100, "pad": "x" * 64})
+    assert cache.stats()["entries"] == 0
+
+
+def test_stale_entry_served_only_within_stale_window():
+    cache = UpstreamResponseCache()
+    with patch("blockscout_mcp_server.response_cache.time.monotonic", return_value=0.0):
+        _store(cache, "1", CONTRACT_PATH, {"is_fully_verified": True})
+    key = cache.make_key("1", CONTRACT_PATH, None)
+    expiry = config.response_cache_contract_ttl_seconds
+
+    with patch("blockscout_mcp_server.response_cache.time.monotonic", return_value=expiry + 1):
+        assert cache.get(key) is None
+        assert cache.get_stale(key) == {"is_fully_verified": True}
+    with patch(
+        "blockscout_mcp_server.response_cache.time.monotonic",
+        return_value=expiry + config.response_cache_stale_if_error_seconds + 1,
+    ):
+        assert cache.get_stale(key) is None
+    assert cache.stats()["stale_hits"] == 1
+
+
+def test_stale_servable_errors():
+    request = httpx.Request("GET", "https://api.blockscout.com/1/api/v2/x")
+
+    def status_error(code: int) -> httpx.HTTPStatusError:
+        response = httpx.Response(code, request=request)
+        return httpx.HTTPStatusError("err", request=request, response=response)
+
+    assert is_stale_servable_error(httpx.ConnectError("boom", request=request))
+    assert is_stale_servable_error(status_error(503))
+    assert is_stale_servable_error(status_error(429))
+    assert not is_stale_servable_error(status_error(404))
+    assert not is_stale_servable_error(ValueError("bad"))
@@ -131,6 +131,19 @@ def test_empty_pro_api_key_header_fails_gated_startup(monkeypatch, tmp_path):
     mock_run.assert_not_called()
 
 
+def test_write_behind_counters_refuse_multiple_workers(monkeypatch, tmp_path):
+    db_path = tmp_path / "sessions.db"
+    _set_valid_gated_config(monkeypatch, str(db_path))
+    monkeypatch.setattr(config, "session_flush_interval_seconds", 1.0)
+
+    result, app, mock_run = _invoke_http_capturing_app(["--workers", "2"])
+
+    assert result.exit_code == 1
+    assert "BLOCKSCOUT_SESSION_FLUSH_INTERVAL_SECONDS" in result.stderr
+    assert not db_path.exists()
+    mock_run.assert_not_called()
+
+
 def test_empty_pro_api_key_header_ungated_http_still_starts(monkeypatch):
     monkeypatch.setattr(config, "session_secret", "")
     monkeypatch.setattr(config, "pro_api_key_header", "")
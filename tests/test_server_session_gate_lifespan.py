@@ -42,6 +42,7 @@ import pytest
 from typer.testing import CliRunner
 
 from blockscout_mcp_server import server, session_lifecycle, session_store
+from blockscout_mcp_server.cache import CachedContract, contract_cache
 from blockscout_mcp_server.config import config
 from blockscout_mcp_server.web3_pool import WEB3_POOL
 
@@ -52,6 +53,17 @@ _VALID_HEADER = "Blockscout-MCP-Pro-Api-Key"
 _VALID_KEY = "test-pro-api-key"
 
 
+@pytest.fixture(autouse=True)
+def _disable_snapshot_refresher(monkeypatch):
+    """Keep the background snapshot refresher out of the served app.
+
+    These tests count the lifespan's background tasks exactly, and the refresher
+    would add one that reaches the network; it is covered by
+    `tests/test_snapshot_refresher.py`.
+    """
+    monkeypatch.setattr(config, "snapshot_refresh_enabled", False)
+
+
 def _set_valid_gated_config(monkeypatch, db_path: str) -> None:
     monkeypatch.setattr(config, "session_secret", _VALID_SECRET)
     monkeypatch.setattr(config, "session_db_path", db_path)
@@ -91,7 +103,9 @@ def _reset_session_manager() -> None:
 
 def test_gated_lifespan_sweeps_and_tears_down_cleanly(monkeypatch, tmp_path):
     db_path = tmp_path / "sessions.db"
+    contracts_db_path = tmp_path / "contracts.db"
     monkeypatch.setattr(config, "session_ttl_seconds", 100)
+    monkeypatch.setattr(config, "contracts_cache_db_path", str(contracts_db_path))
     _set_valid_gated_config(monkeypatch, str(db_path))
     _reset_session_manager()
 
@@ -119,6 +133,9 @@ def test_gated_lifespan_sweeps_and_tears_down_cleanly(monkeypatch, tmp_path):
 
             assert store.get_calls("expired-session") == 0
             assert store.get_calls("fresh-session") == 1
+
+            await contract_cache.set("1:0xabc", CachedContract(metadata={}, source_files={}))
+            assert contract_cache.persistent_stats()["writes"] == 1
         return sweep_task
 
     sweep_task = asyncio.run(_run())
@@ -128,6 +145,9 @@ def test_gated_lifespan_sweeps_and_tears_down_cleanly(monkeypatch, tmp_path):
     web3_close_mock.assert_awaited_once()
     with pytest.raises(RuntimeError):
         session_store.get_store()
+    # The persistent contract tier is closed, which merges its WAL into the database.
+    assert contract_cache.persistent_stats() == {}
+    assert not (tmp_path / "contracts.db-wal").exists()
 
 
 def test_ungated_lifespan_runs_cleanly_without_sweep(monkeypatch):
@@ -354,3 +374,74 @@ def test_sweep_pass_drains_backlog_in_batches(monkeypatch, tmp_path):
         assert store.get_calls(f"expired-{i}") == 0
 
     session_store.close_store()
+
+
+# ---------------------------------------------------------------------------
+# Multi-worker mode
+# ---------------------------------------------------------------------------
+
+
+def test_workers_mode_validates_once_and_hands_off_to_uvicorn_factory(monkeypatch, tmp_path):
+    """With `--workers`, the supervisor validates and creates the store schema, then
+    closes its connection and lets every worker build the app through the factory."""
+    db_path = tmp_path / "sessions.db"
+    _set_valid_gated_config(monkeypatch, str(db_path))
+    monkeypatch.setenv(server._WORKER_OPTIONS_ENV, "")
+
+    with patch("uvicorn.run") as mock_run:
+        result = runner.invoke(server.cli_app, ["--http", "--rest", "--workers", "3"])
+
+    assert result.exit_code == 0, result.output
+    assert "with 3 workers" in result.output
+    assert mock_run.call_args.args == ("blockscout_mcp_server.server:create_worker_app",)
+    assert mock_run.call_args.kwargs["factory"] is True
+    assert mock_run.call_args.kwargs["workers"] == 3
+    assert db_path.exists()
+    assert session_lifecycle.session_store._store is None
+    assert server.os.environ[server._WORKER_OPTIONS_ENV] == '{"rest": true, "http_host": "127.0.0.1"}'
+
+
+def test_worker_factory_opens_its_own_store_connection(monkeypatch, tmp_path):
+    db_path = tmp_path / "sessions.db"
+    _set_valid_gated_config(monkeypatch, str(db_path))
+    monkeypatch.setenv(server._WORKER_OPTIONS_ENV, '{"rest": false, "http_host": "127.0.0.1"}')
+
+    try:
+        app = server.create_worker_app()
+        assert session_store.get_store().generation
+        assert app.router.lifespan_context is not None
+    finally:
+        session_store.close_store()
+
+
+def test_workers_flag_requires_http():
+    result = runner.invoke(server.cli_app, ["--workers", "2"])
+
+    assert result.exit_code != 0
+    assert "--workers flag can only be used with the --http flag" in result.output
+
+
+def test_only_the_sweep_lease_holder_sweeps(monkeypatch, tmp_path):
+    """Another worker process holding the lease file lock makes this process skip sweeps."""
+    import fcntl
+
+    db_path = tmp_path / "sessions.db"
+    monkeypatch.setattr(config, "session_db_path", str(db_path))
+    monkeypatch.setattr(config, "session_ttl_seconds", 100)
+    session_store.initialize_store(str(db_path))
+    sweeps = []
+    monkeypatch.setattr(session_store.get_store(), "sweep_batch", lambda limit: sweeps.append(limit) or 0)
+    other_worker = open(f"{db_path}.sweep-lock", "w")  # noqa: SIM115
+    fcntl.flock(other_worker, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    try:
+        asyncio.run(session_lifecycle.run_sweep_pass())
+        assert sweeps == []
+
+        # The holder exits: the next pass here takes the lease over.
+        other_worker.close()
+        asyncio.run(session_lifecycle.run_sweep_pass())
+        assert sweeps == [session_lifecycle.SWEEP_BATCH_SIZE]
+    finally:
+        other_worker.close()
+        session_lifecycle._release_sweep_lease()
+        session_store.close_store()
@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the write-behind (in-memory, batch-flushed) session counter store."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from blockscout_mcp_server import session_store
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.session_store import SessionStore, WriteBehindSessionStore, close_store, initialize_store
+
+# Long enough that the writer thread never flushes on its own during a test.
+_IDLE_INTERVAL = 3600.0
+
+
+def _rows(db_path) -> dict[str, tuple[int, int]]:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return {row[0]: (row[1], row[2]) for row in conn.execute("SELECT id, created_at, calls FROM sessions")}
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = WriteBehindSessionStore(str(tmp_path / "sessions.db"), _IDLE_INTERVAL)
+    store.initialize()
+    yield store
+    store.close()
+
+
+def test_counters_enforce_the_ceiling_before_any_flush(store, tmp_path):
+    assert [store.check_and_increment("s1", created_at=1_000, max_calls=2) for _ in range(3)] == [1, 2, None]
+    assert store.check_and_increment("s2", created_at=1_000, max_calls=0) is None
+    assert store.get_calls("s1") == 2
+    assert store.get_calls("s2") == 0
+    assert _rows(tmp_path / "sessions.db") == {}
+    assert store.pending_writes == 1
+
+
+def test_refund_never_goes_negative(store):
+    store.check_and_increment("s1", created_at=1_000, max_calls=5)
+    store.refund("s1")
+    store.refund("s1")
+    store.refund("missing")
+
+    assert store.get_calls("s1") == 0
+    assert store.check_and_increment("s1", created_at=1_000, max_calls=5) == 1
+
+
+def test_get_calls_reads_under_the_counter_lock(store):
+    store.check_and_increment("s1", created_at=1_000, max_calls=5)
+    calls: list[int] = []
+    reader = threading.Thread(target=lambda: calls.append(store.get_calls("s1")))
+
+    with store._lock:
+        reader.start()
+        reader.join(0.1)
+        assert calls == []
+    reader.join(5)
+
+    assert calls == [1]
+
+
+def test_flush_writes_changed_counters_in_one_batch(store, tmp_path):
+    for _ in range(3):
+        store.check_and_increment("s1", created_at=1_000, max_calls=5)
+    store.check_and_increment("s2", created_at=2_000, max_calls=5)
+
+    assert store.flush() == 2
+    assert _rows(tmp_path / "sessions.db") == {"s1": (1_000, 3), "s2": (2_000, 1)}
+    assert store.pending_writes == 0
+    assert store.flush() == 0
+
+    store.refund("s1")
+    assert store.flush() == 1
+    assert _rows(tmp_path / "sessions.db")["s1"] == (1_000, 2)
+
+
+def test_failed_flush_keeps_counters_dirty(store):
+    store.check_and_increment("s1", created_at=1_000, max_calls=5)
+    store._writer_connection().execute("DROP TABLE sessions")
+
+    assert store.flush() == 0
+    assert store.flush_errors == 1
+    assert store.pending_writes == 1
+
+    store._writer_connection().execute("CREATE TABLE sessions (id TEXT PRIMARY KEY, created_at INTEGER, calls INTEGER)")
+    assert store.flush() == 1
+
+
+def test_close_flushes_and_warm_start_resumes_counters(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "session_ttl_seconds", 100)
+    db_path = tmp_path / "sessions.db"
+    first = WriteBehindSessionStore(str(db_path), _IDLE_INTERVAL)
+    first.initialize(now=1_050)
+    first.check_and_increment("live", created_at=1_000, max_calls=3)
+    first.check_and_increment("live", created_at=1_000, max_calls=3)
+    first.check_and_increment("expired", created_at=900, max_calls=3)
+    first.close()
+
+    restarted = WriteBehindSessionStore(str(db_path), _IDLE_INTERVAL)
+    restarted.initialize(now=1_050)
+    try:
+        assert restarted.get_calls("live") == 2
+        assert restarted.get_calls("expired") == 0
+        assert restarted.check_and_increment("live", created_at=1_000, max_calls=3) == 3
+        assert restarted.check_and_increment("live", created_at=1_000, max_calls=3) is None
+    finally:
+        restarted.close()
+
+
+def test_sweep_drops_expired_counters_from_memory(store, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "session_ttl_seconds", 100)
+    store.check_and_increment("old", created_at=1_000, max_calls=5)
+    store.check_and_increment("new", created_at=1_500, max_calls=5)
+    store.flush()
+    store.check_and_increment("old", created_at=1_000, max_calls=5)
+
+    assert store.sweep_batch(10, now=1_550) == 1
+
+    assert store.get_calls("old") == 0
+    assert store.get_calls("new") == 1
+    assert store.pending_writes == 0
+    assert _rows(tmp_path / "sessions.db") == {"new": (1_500, 1)}
+
+
+def test_writer_thread_flushes_on_its_interval(tmp_path):
+    store = WriteBehindSessionStore(str(tmp_path / "sessions.db"), 0.01)
+    store.initialize()
+    try:
+        store.check_and_increment("s1", created_at=1_000, max_calls=5)
+        for _ in range(200):
+            if _rows(tmp_path / "sessions.db"):
+                break
+            store._stop.wait(0.01)
+        assert _rows(tmp_path / "sessions.db") == {"s1": (1_000, 1)}
+    finally:
+        store.close()
+
+
+def test_initialize_store_selects_the_write_behind_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "session_flush_interval_seconds", 0.5)
+    try:
+        assert isinstance(initialize_store(str(tmp_path / "a.db")), WriteBehindSessionStore)
+        monkeypatch.setattr(config, "session_flush_interval_seconds", 0.0)
+        store = initialize_store(str(tmp_path / "b.db"))
+        assert type(store) is SessionStore
+        assert session_store.get_store() is store
+    finally:
+        close_store()
@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+import anyio
+import pytest
+
+from blockscout_mcp_server.singleflight import SingleFlight
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    release = anyio.Event()
+    runs = 0
+    results: list[object] = []
+
+    async def work():
+        nonlocal runs
+        runs += 1
+        await release.wait()
+        return {"value": 1}
+
+    async def caller():
+        results.append(await flight.run("k", work))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(caller)
+        await anyio.wait_all_tasks_blocked()
+        assert flight.in_flight == 1
+        release.set()
+
+    assert runs == 1
+    assert len(results) == 5
+    assert all(r is results[0] for r in results)
+    assert flight.stats() == {"executions": 1, "coalesced": 4, "in_flight": 0}
+
+
+async def test_distinct_keys_run_independently():
+    flight = SingleFlight("test")
+
+    async def work(value):
+        await anyio.sleep(0)
+        return value
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(flight.run, "a", lambda: work("a"))
+        tg.start_soon(flight.run, "b", lambda: work("b"))
+
+    assert flight.executions == 2
+    assert flight.coalesced == 0
+
+
+async def test_leader_exception_is_raised_for_every_caller():
+    flight = SingleFlight("test")
+    release = anyio.Event()
+    errors: list[Exception] = []
+
+    async def work():
+        await release.wait()
+        raise ValueError("upstream failed")
+
+    async def caller():
+        try:
+            await flight.run("k", work)
+        except ValueError as e:
+            errors.append(e)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(caller)
+        await anyio.wait_all_tasks_blocked()
+        release.set()
+
+    assert len(errors) == 3
+    assert flight.executions == 1
+
+
+async def test_key_is_released_after_completion():
+    flight = SingleFlight("test")
+    runs = 0
+
+    async def work():
+        nonlocal runs
+        runs += 1
+        return runs
+
+    assert await flight.run("k", work) == 1
+    assert await flight.run("k", work) == 2
+    assert flight.in_flight == 0
+
+
+async def test_cancelled_leader_does_not_fail_followers():
+    flight = SingleFlight("test")
+    started = anyio.Event()
+    follower_result: list[object] = []
+    runs = 0
+
+    async def work():
+        nonlocal runs
+        runs += 1
+        if runs == 1:
+            started.set()
+            await anyio.sleep_forever()
+        return "second run"
+
+    async def follower():
+        follower_result.append(await flight.run("k", work))
+
+    leader_scope = anyio.CancelScope()
+
+    async def leader():
+        with leader_scope:
+            await flight.run("k", work)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(leader)
+        await started.wait()
+        tg.start_soon(follower)
+        await anyio.wait_all_tasks_blocked()
+        leader_scope.cancel()
+
+    assert follower_result == ["second run"]
+    assert runs == 2
+    assert flight.coalesced == 0
@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the background PRO API config / chains list refresher."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import anyio
+import pytest
+
+from blockscout_mcp_server import session_lifecycle
+from blockscout_mcp_server.cache import ChainsListCache, ProApiConfigCache
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.models import ChainInfo
+from blockscout_mcp_server.snapshot_refresher import SnapshotRefresher, _RefreshTarget
+from blockscout_mcp_server.tools import common
+from blockscout_mcp_server.web3_pool import WEB3_POOL
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches(monkeypatch):
+    monkeypatch.setattr(common, "pro_api_config_cache", ProApiConfigCache())
+    monkeypatch.setattr(common, "chains_list_cache", ChainsListCache())
+    monkeypatch.setattr(
+        "blockscout_mcp_server.tools.chains.get_chains_list.chains_list_cache", common.chains_list_cache
+    )
+
+
+def _target(ttl: float = 300.0) -> _RefreshTarget:
+    return _RefreshTarget("demo", AsyncMock(), lambda: common.pro_api_config_cache, lambda: ttl)
+
+
+def test_next_delay_refreshes_before_expiry_with_jitter():
+    target = _target(ttl=300)
+    delays = [target.next_delay() for _ in range(200)]
+
+    assert all(0.8 * 300 * 0.9 <= delay <= 0.8 * 300 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_next_delay_backs_off_exponentially_up_to_refresh_interval():
+    target = _target(ttl=300)
+
+    target.consecutive_failures = 1
+    assert 2.5 <= target.next_delay() <= 5.0
+    target.consecutive_failures = 3
+    assert 10.0 <= target.next_delay() <= 20.0
+    target.consecutive_failures = 20
+    assert target.next_delay() <= 0.8 * 300
+
+
+@pytest.mark.anyio
+async def test_failed_refresh_keeps_snapshot_and_counts_failures():
+    common.pro_api_config_cache.store_snapshot({"1": "https://eth"})
+    target = _target()
+    target.refresh.side_effect = OSError("down")
+    refresher = SnapshotRefresher()
+
+    await refresher._refresh_once(target)
+    await refresher._refresh_once(target)
+    target.refresh.side_effect = None
+    await refresher._refresh_once(target)
+
+    assert (target.failures, target.consecutive_failures, target.refreshes) == (2, 0, 1)
+    assert common.pro_api_config_cache.chain_urls_snapshot == {"1": "https://eth"}
+
+
+@pytest.mark.anyio
+async def test_expired_snapshot_is_served_without_fetching_while_refresher_runs(monkeypatch):
+    monkeypatch.setattr(config, "pro_api_config_ttl_seconds", 0)
+    common.pro_api_config_cache.store_snapshot({"1": "https://eth"})
+    fetch = AsyncMock(return_value={"1": "https://eth"})
+
+    with patch.object(common, "_fetch_pro_api_config", fetch):
+        common.pro_api_config_cache.background_refresh = True
+        assert await common.ensure_pro_api_config() == {"1": "https://eth"}
+        fetch.assert_not_awaited()
+
+        common.pro_api_config_cache.background_refresh = False
+        await common.ensure_pro_api_config()
+        fetch.assert_awaited_once()
+
+    assert common.pro_api_config_cache.stats()["stale_hits"] == 1
+
+
+@pytest.mark.anyio
+async def test_run_warms_both_snapshots_and_rebuilds_chains_on_chain_set_change(monkeypatch):
+    monkeypatch.setattr(config, "pro_api_config_ttl_seconds", 3600)
+    monkeypatch.setattr(config, "chains_list_ttl_seconds", 3600)
+    configs = iter([{"1": "https://eth"}, {"1": "https://eth", "10": "https://op"}])
+    chains_payload = {
+        "1": {"name": "Ethereum"},
+        "10": {"name": "Optimism"},
+    }
+    refresher = SnapshotRefresher()
+
+    with (
+        patch.object(common, "_fetch_pro_api_config", AsyncMock(side_effect=lambda: next(configs))),
+        patch(
+            "blockscout_mcp_server.tools.chains.get_chains_list.make_chainscout_request",
+            AsyncMock(return_value=chains_payload),
+        ),
+    ):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(refresher.run)
+            await anyio.sleep(0.05)
+            assert common.pro_api_config_cache.background_refresh
+            assert [c.chain_id for c in common.chains_list_cache.chains_snapshot] == ["1"]
+
+            # A config refresh that adds a chain rebuilds the chains list right away.
+            await refresher._refresh_once(refresher.pro_api_config)
+            await anyio.sleep(0.05)
+            tg.cancel_scope.cancel()
+
+    assert [c.chain_id for c in common.chains_list_cache.chains_snapshot] == ["1", "10"]
+    assert isinstance(common.chains_list_cache.chains_snapshot[0], ChainInfo)
+    assert not common.pro_api_config_cache.background_refresh
+    stats = refresher.stats()
+    assert stats["chains_list"]["refreshes"] == 2
+    assert stats["pro_api_config"]["expired"] is False
+
+
+def test_lifespan_runs_refresher_only_when_enabled(monkeypatch):
+    started = []
+
+    async def _fake_run():
+        started.append(True)
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(session_lifecycle.snapshot_refresher, "run", _fake_run)
+    monkeypatch.setattr(WEB3_POOL, "close", AsyncMock())
+
+    @asynccontextmanager
+    async def _original_lifespan(app):
+        yield
+
+    async def _run(refresh_snapshots: bool) -> int:
+        lifespan = session_lifecycle.build_lifespan(
+            _original_lifespan, gate_enabled=False, refresh_snapshots=refresh_snapshots
+        )
+        async with lifespan(None):
+            await asyncio.sleep(0)
+            return len(asyncio.all_tasks()) - 1
+
+    assert asyncio.run(_run(False)) == 0
+    assert asyncio.run(_run(True)) == 1
+    assert started == [True]
@@ -0,0 +1,69 @@
+import os
+import zlib
+
+from blockscout_mcp_server.source_store import LazySourceFiles, SourceBlob, SourceStore, source_digest
+
+
+def test_small_bodies_are_stored_raw():
+    blob = SourceBlob(source_digest(b"abc"), b"abc")
+    assert not blob.compressed
+    assert blob.size == 3
+    assert blob.text() == "abc"
+
+
+def test_large_bodies_are_compressed():
+    raw = ("pragma solidity ^0.8.0;\n" * 200).encode()
+    blob = SourceBlob(source_digest(raw), raw)
+    assert blob.compressed
+    assert blob.size < len(raw)
+    assert zlib.decompress(blob.data) == raw
+    assert blob.text() == raw.decode()
+
+
+def test_incompressible_bodies_stay_raw():
+    raw = os.urandom(2048)
+    blob = SourceBlob(source_digest(raw), raw)
+    assert not blob.compressed
+    assert blob.size == len(raw)
+
+
+def test_prepare_reuses_stored_blobs():
+    store = SourceStore()
+    stored = store.acquire(store.prepare({"A.sol": "same"}))
+    prepared = store.prepare({"B.sol": "same", "C.sol": "other"})
+
+    assert prepared["B.sol"] is stored["A.sol"]
+    assert store.new_bytes(prepared) == len("other")
+
+
+def test_acquire_and_release_reference_count():
+    store = SourceStore()
+    first = store.acquire(store.prepare({"A.sol": "same"}))
+    second = store.acquire(store.prepare({"B.sol": "same"}))
+    assert store.stats() == {"source_blobs": 1, "source_bytes": 4, "source_logical_bytes": 8}
+
+    store.release(first)
+    assert store.stats() == {"source_blobs": 1, "source_bytes": 4, "source_logical_bytes": 4}
+    store.release(second)
+    assert store.stats() == {"source_blobs": 0, "source_bytes": 0, "source_logical_bytes": 0}
+
+
+def test_freed_bytes_counts_shared_bodies_once():
+    store = SourceStore()
+    first = store.acquire(store.prepare({"A.sol": "same"}))
+    second = store.acquire(store.prepare({"B.sol": "same"}))
+    released: dict[str, int] = {}
+
+    assert store.freed_bytes(first, released) == 0
+    assert store.freed_bytes(second, released) == 4
+
+
+def test_lazy_source_files_mapping():
+    store = SourceStore()
+    files = LazySourceFiles(store.acquire(store.prepare({"A.sol": "a", "B.sol": "b"})))
+
+    assert len(files) == 2
+    assert list(files.keys()) == ["A.sol", "B.sol"]
+    assert files["B.sol"] == "b"
+    assert "C.sol" not in files
+    assert files == {"A.sol": "a", "B.sol": "b"}
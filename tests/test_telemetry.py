@@ -12,6 +12,13 @@ from blockscout_mcp_server.constants import (
     RESOURCE_READ_EVENT,
 )
 
+
+@pytest.fixture(autouse=True)
+def per_report_delivery(monkeypatch):
+    """Send each report in its own POST; batched delivery is covered in test_telemetry_dispatcher.py."""
+    monkeypatch.setattr(config, "community_telemetry_queue_size", 0)
+
+
 # ---------------------------------------------------------------------------
 # resolve_auth_signals — shared derivation entry point + all-disabled short-circuit
 # ---------------------------------------------------------------------------
@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the batched community telemetry dispatcher."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from blockscout_mcp_server import telemetry
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.constants import (
+    COMMUNITY_TELEMETRY_BATCH_ENDPOINT,
+    COMMUNITY_TELEMETRY_ENDPOINT,
+    COMMUNITY_TELEMETRY_URL,
+)
+from blockscout_mcp_server.telemetry_dispatcher import TelemetryDispatcher
+
+
+class _FakePool:
+    """Stands in for HTTP_POOL and records every batch POSTed through it."""
+
+    def __init__(
+        self, status_code: int = 202, release: asyncio.Event | None = None, statuses: dict[str, int] | None = None
+    ) -> None:
+        self.posts: list[tuple[str, list]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.status_code = status_code
+        self.statuses = statuses or {}
+        self.release = release
+
+    def lease(self, *, timeout):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def post(self, url, *, json, headers):
+        self.posts.append((url, json))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.release is not None:
+                await self.release.wait()
+        finally:
+            self.in_flight -= 1
+        return httpx.Response(self.statuses.get(url, self.status_code), request=httpx.Request("POST", url))
+
+
+@pytest.fixture
+def dispatcher(monkeypatch):
+    monkeypatch.setattr(config, "community_telemetry_flush_interval_seconds", 60.0)
+    dispatcher = TelemetryDispatcher()
+    yield dispatcher
+    dispatcher.clear()
+
+
+def _report(n: int) -> dict:
+    return {"tool_name": f"tool_{n}"}
+
+
+@pytest.mark.asyncio
+async def test_reports_are_posted_as_one_batch_after_the_flush_interval(dispatcher, monkeypatch):
+    monkeypatch.setattr(config, "community_telemetry_flush_interval_seconds", 0.01)
+    pool = _FakePool()
+
+    with patch("blockscout_mcp_server.telemetry_dispatcher.HTTP_POOL", pool):
+        dispatcher.submit(_report(0))
+        dispatcher.submit(_report(1))
+        await asyncio.sleep(0.05)
+
+    assert pool.posts == [(f"{COMMUNITY_TELEMETRY_URL}{COMMUNITY_TELEMETRY_BATCH_ENDPOINT}", [_report(0), _report(1)])]
+    assert dispatcher.stats()["sent"] == 2
+
+
+@pytest.mark.asyncio
+async def test_a_full_batch_is_sent_without_waiting_for_the_interval(dispatcher, monkeypatch):
+    monkeypatch.setattr(config, "community_telemetry_batch_size", 2)
+    pool = _FakePool()
+
+    with patch("blockscout_mcp_server.telemetry_dispatcher.HTTP_POOL", pool):
+        for n in range(3):
+            dispatcher.submit(_report(n))
+        await asyncio.sleep(0.01)
+
+    assert [batch for _, batch in pool.posts] == [[_report(0), _report(1)], [_report(2)]]
+
+
+@pytest.mark.asyncio
+async def test_reports_beyond_the_queue_size_are_dropped(dispatcher, monkeypatch):
+    monkeypatch.setattr(config, "community_telemetry_queue_size", 2)
+
+    for n in range(3):
+        dispatcher.submit(_report(n))
+
+    assert (dispatcher.stats()["pending"], dispatcher.stats()["dropped"]) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_batches_in_flight_are_capped(dispatcher, monkeypatch):
+    monkeypatch.setattr(config, "community_telemetry_batch_size", 1)
+    monkeypatch.setattr(config, "community_telemetry_max_concurrency", 2)
+    pool = _FakePool(release=asyncio.Event())
+
+    with patch("blockscout_mcp_server.telemetry_dispatcher.HTTP_POOL", pool):
+        for n in range(5):
+            dispatcher.submit(_report(n))
+        await asyncio.sleep(0.01)
+        assert (pool.in_flight, dispatcher.stats()["pending"]) == (2, 3)
+        pool.release.set()
+        await asyncio.sleep(0.01)
+
+    assert pool.max_in_flight == 2
+    assert dispatcher.stats()["sent"] == 5
+
+
+@pytest.mark.asyncio
+async def test_close_sends_what_is_still_queued(dispatcher):
+    pool = _FakePool()
+
+    with patch("blockscout_mcp_server.telemetry_dispatcher.HTTP_POOL", pool):
+        dispatcher.submit(_report(0))
+        await dispatcher.close()
+
+    assert [batch for _, batch in pool.posts] == [[_report(0)]]
+
+
+@pytest.mark.asyncio
+async def test_rejected_batches_are_counted_as_failed(dispatcher):
+    pool = _FakePool(status_code=500)
+
+    with patch("blockscout_mcp_server.telemetry_dispatcher.HTTP_POOL", pool):
+        dispatcher.submit(_report(0))
+        await dispatcher.close()
+
+    assert (dispatcher.stats()["sent"], dispatcher.stats()["failed"]) == (0, 1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [404, 405])
+async def test_batches_fall_back_to_per_report_posts_without_the_batch_endpoint(dispatcher, status_code):
+    batch_url = f"{COMMUNITY_TELEMETRY_URL}{COMMUNITY_TELEMETRY_BATCH_ENDPOINT}"
+    single_url = f"{COMMUNITY_TELEMETRY_URL}{COMMUNITY_TELEMETRY_ENDPOINT}"
+    pool = _FakePool(statuses={batch_url: status_code})
+
+    with patch("blockscout_mcp_server.telemetry_dispatcher.HTTP_POOL", pool):
+        dispatcher.submit(_report(0))
+        dispatcher.submit(_report(1))
+        await dispatcher.close()
+        dispatcher.submit(_report(2))
+        await dispatcher.close()
+
+    # The batch endpoint is not asked again once it is known to be missing.
+    assert pool.posts == [
+        (batch_url, [_report(0), _report(1)]),
+        (single_url, _report(0)),
+        (single_url, _report(1)),
+        (single_url, _report(2)),
+    ]
+    assert (dispatcher.stats()["sent"], dispatcher.stats()["failed"]) == (3, 0)
+
+
+@pytest.mark.asyncio
+async def test_usage_reports_are_queued_instead_of_posted(monkeypatch):
+    monkeypatch.setattr(config, "disable_community_telemetry", False)
+
+    with patch("httpx.AsyncClient") as client_cls:
+        await telemetry.send_community_usage_report("tool", {"a": 1}, "client", "1.0", "1.1")
+
+    client_cls.assert_not_called()
+    assert telemetry.telemetry_dispatcher.stats()["pending"] == 1
@@ -72,7 +72,11 @@ async def test_get_block_info_with_txs_success(mock_ctx):
                     api_path=f"/api/v2/blocks/{number_or_hash}",
                     timeout=config.bs_light_timeout,
                 ),
-                call(chain_id=chain_id, api_path=f"/api/v2/blocks/{number_or_hash}/transactions"),
+                call(
+                    chain_id=chain_id,
+                    api_path=f"/api/v2/blocks/{number_or_hash}/transactions",
+                    max_body_bytes=config.block_transactions_max_bytes,
+                ),
             ],
             any_order=True,
         )
@@ -117,7 +121,11 @@ async def test_get_block_info_with_txs_partial_failure(mock_ctx):
                     api_path=f"/api/v2/blocks/{number_or_hash}",
                     timeout=config.bs_light_timeout,
                 ),
-                call(chain_id=chain_id, api_path=f"/api/v2/blocks/{number_or_hash}/transactions"),
+                call(
+                    chain_id=chain_id,
+                    api_path=f"/api/v2/blocks/{number_or_hash}/transactions",
+                    max_body_bytes=config.block_transactions_max_bytes,
+                ),
             ],
             any_order=True,
         )
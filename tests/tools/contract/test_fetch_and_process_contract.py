@@ -1,4 +1,5 @@
 # SPDX-License-Identifier: LicenseRef-Blockscout
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -336,3 +337,39 @@ async def test_fetch_and_process_cache_key_stays_credential_free(mock_ctx):
     # Must not contain any key material
     assert "super-secret-client-key" not in set_key_arg
     assert "super-secret-client-key" not in mock_get.await_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_fetch_and_process_cold_cache_stampede_fetches_once(mock_ctx):
+    release = asyncio.Event()
+    api_response = {"name": "C", "language": "Solidity", "source_code": "code", "file_path": "C.sol"}
+
+    async def slow_request(**kwargs):
+        await release.wait()
+        return dict(api_response)
+
+    with (
+        patch.object(config, "pro_api_key", "test_key"),
+        patch(
+            "blockscout_mcp_server.tools.contract._shared.contract_cache.get",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+        patch(
+            "blockscout_mcp_server.tools.contract._shared.make_blockscout_request",
+            new_callable=AsyncMock,
+            side_effect=slow_request,
+        ) as mock_request,
+        patch(
+            "blockscout_mcp_server.tools.contract._shared.contract_cache.set",
+            new_callable=AsyncMock,
+        ) as mock_set,
+    ):
+        tasks = [asyncio.create_task(_fetch_and_process_contract("1", "0xAbC")) for _ in range(4)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+    assert mock_request.await_count == 1
+    assert mock_set.await_count == 1
+    assert all(r is results[0] for r in results)
@@ -4,10 +4,20 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
+from blockscout_mcp_server import metrics
+from blockscout_mcp_server.cache import ContractCache
 from blockscout_mcp_server.config import config
 from blockscout_mcp_server.models import ContractAbiData, ToolResponse
 from blockscout_mcp_server.tools.common import ChainNotFoundError
 from blockscout_mcp_server.tools.contract.get_contract_abi import get_contract_abi
+from blockscout_mcp_server.tools.contract.inspect_contract_code import inspect_contract_code
+
+
+@pytest.fixture(autouse=True)
+def _isolated_contract_cache(monkeypatch):
+    """The ABI is served through the shared contract cache; give each test an empty one."""
+    monkeypatch.setattr(config, "pro_api_key", "test_key")
+    monkeypatch.setattr("blockscout_mcp_server.tools.contract._shared.contract_cache", ContractCache())
 
 
 def assert_contract_abi_response(result: ToolResponse, expected_abi) -> None:
@@ -45,7 +55,7 @@ async def test_get_contract_abi_success(mock_ctx):
     mock_api_response = {"abi": mock_abi_list}
 
     with patch(
-        "blockscout_mcp_server.tools.contract.get_contract_abi.make_blockscout_request",
+        "blockscout_mcp_server.tools.contract._shared.make_blockscout_request",
         new_callable=AsyncMock,
     ) as mock_request:
         mock_request.return_value = mock_api_response
@@ -82,7 +92,7 @@ async def test_get_contract_abi_missing_abi_field(mock_ctx):
     mock_api_response = {}  # No abi field
 
     with patch(
-        "blockscout_mcp_server.tools.contract.get_contract_abi.make_blockscout_request", new_callable=AsyncMock
+        "blockscout_mcp_server.tools.contract._shared.make_blockscout_request", new_callable=AsyncMock
     ) as mock_request:
         mock_request.return_value = mock_api_response
 
@@ -118,7 +128,7 @@ async def test_get_contract_abi_empty_abi(mock_ctx):
     mock_api_response = {"abi": []}
 
     with patch(
-        "blockscout_mcp_server.tools.contract.get_contract_abi.make_blockscout_request", new_callable=AsyncMock
+        "blockscout_mcp_server.tools.contract._shared.make_blockscout_request", new_callable=AsyncMock
     ) as mock_request:
         mock_request.return_value = mock_api_response
 
@@ -154,7 +164,7 @@ async def test_get_contract_abi_api_error(mock_ctx):
     api_error = httpx.HTTPStatusError("Not Found", request=MagicMock(), response=MagicMock(status_code=404))
 
     with patch(
-        "blockscout_mcp_server.tools.contract.get_contract_abi.make_blockscout_request", new_callable=AsyncMock
+        "blockscout_mcp_server.tools.contract._shared.make_blockscout_request", new_callable=AsyncMock
     ) as mock_request:
         mock_request.side_effect = api_error
 
@@ -185,7 +195,7 @@ async def test_get_contract_abi_chain_not_found(mock_ctx):
     chain_error = ChainNotFoundError(f"Chain with ID '{chain_id}' not found on Chainscout.")
 
     with patch(
-        "blockscout_mcp_server.tools.contract.get_contract_abi.make_blockscout_request", new_callable=AsyncMock
+        "blockscout_mcp_server.tools.contract._shared.make_blockscout_request", new_callable=AsyncMock
     ) as mock_request:
         mock_request.side_effect = chain_error
 
@@ -215,7 +225,7 @@ async def test_get_contract_abi_invalid_address_format(mock_ctx):
     api_error = httpx.HTTPStatusError("Bad Request", request=MagicMock(), response=MagicMock(status_code=400))
 
     with patch(
-        "blockscout_mcp_server.tools.contract.get_contract_abi.make_blockscout_request", new_callable=AsyncMock
+        "blockscout_mcp_server.tools.contract._shared.make_blockscout_request", new_callable=AsyncMock
     ) as mock_request:
         mock_request.side_effect = api_error
 
@@ -273,7 +283,7 @@ async def test_get_contract_abi_complex_abi(mock_ctx):
     mock_abi_list = mock_api_response["abi"]
 
     with patch(
-        "blockscout_mcp_server.tools.contract.get_contract_abi.make_blockscout_request", new_callable=AsyncMock
+        "blockscout_mcp_server.tools.contract._shared.make_blockscout_request", new_callable=AsyncMock
     ) as mock_request:
         mock_request.return_value = mock_api_response
 
@@ -294,3 +304,30 @@ async def test_get_contract_abi_complex_abi(mock_ctx):
         info_messages = [call.args[0] for call in mock_ctx.info.await_args_list]
         assert "Starting to fetch contract ABI for 0xa0b86a33e6dd0ba3c70de3b8e2b9e48cd6efb7b0" in info_messages[0]
         assert "Successfully fetched contract ABI." in info_messages[1]
+
+
+@pytest.mark.asyncio
+async def test_get_contract_abi_shares_cache_with_inspect_contract_code(mock_ctx):
+    """
+    Verify inspecting a contract and then fetching its ABI downloads the payload once.
+    """
+    address = "0xa0b86a33e6dd0ba3c70de3b8e2b9e48cd6efb7b0"
+    abi = [{"name": "transfer", "type": "function"}, {"name": "Transfer", "type": "event"}]
+    api_response = {"name": "Token", "language": "Solidity", "source_code": "code", "file_path": "T.sol", "abi": abi}
+
+    with patch(
+        "blockscout_mcp_server.tools.contract._shared.make_blockscout_request",
+        new_callable=AsyncMock,
+        return_value=api_response,
+    ) as mock_request:
+        await inspect_contract_code(chain_id="1", address=address, file_name=None, ctx=mock_ctx)
+        result = await get_contract_abi(chain_id="1", address=address, ctx=mock_ctx)
+        second = await get_contract_abi(chain_id="1", address=address, ctx=mock_ctx)
+
+    mock_request.assert_awaited_once()
+    assert_contract_abi_response(result, abi)
+    assert second.data.abi == abi
+    assert result.content_text == f"ABI for contract {address} on chain 1: 1 functions, 1 events."
+    assert metrics.contract_artifact_lookups.value("metadata", "miss") == 1
+    assert metrics.contract_artifact_lookups.value("abi", "hit") == 2
+    assert metrics.contract_artifact_lookups.value("abi", "miss") == 0
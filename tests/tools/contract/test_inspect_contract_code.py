@@ -67,7 +67,7 @@ async def test_inspect_contract_file_content_mode_success(mock_ctx):
         return_value=contract,
     ) as mock_fetch:
         result = await inspect_contract_code(chain_id="1", address="0xabc", file_name="A.sol", ctx=mock_ctx)
-    mock_fetch.assert_awaited_once_with("1", "0xabc")
+    mock_fetch.assert_awaited_once_with("1", "0xabc", artifact="source")
     assert mock_ctx.report_progress.await_count == 2
     assert (
         mock_ctx.report_progress.await_args_list[0].kwargs["message"]
@@ -90,7 +90,7 @@ async def test_inspect_contract_file_not_found_raises_error(mock_ctx):
     ) as mock_fetch:
         with pytest.raises(ValueError) as exc:
             await inspect_contract_code(chain_id="1", address="0xabc", file_name="B.sol", ctx=mock_ctx)
-    mock_fetch.assert_awaited_once_with("1", "0xabc")
+    mock_fetch.assert_awaited_once_with("1", "0xabc", artifact="source")
     assert mock_ctx.report_progress.await_count == 2
     assert (
         mock_ctx.report_progress.await_args_list[0].kwargs["message"]
@@ -30,7 +30,12 @@ async def test_direct_api_call_no_params(mock_ctx):
             ctx=mock_ctx,
         )
 
-        mock_request.assert_called_once_with(chain_id=chain_id, api_path=endpoint_path, params={})
+        mock_request.assert_called_once_with(
+            chain_id=chain_id,
+            api_path=endpoint_path,
+            params={},
+            max_body_bytes=direct_api_call_module.config.direct_api_response_size_limit,
+        )
         assert isinstance(result, ToolResponse)
         assert isinstance(result.data, DirectApiData)
         assert result.data.model_dump() == mock_response
@@ -77,6 +82,7 @@ async def test_direct_api_call_with_query_params_and_cursor(mock_ctx):
             chain_id=chain_id,
             api_path=endpoint_path,
             params={"limit": "1", "page": 2},
+            max_body_bytes=direct_api_call_module.config.direct_api_response_size_limit,
         )
         assert isinstance(result, ToolResponse)
         assert isinstance(result.data, DirectApiData)
@@ -113,7 +119,12 @@ async def test_direct_api_call_with_pagination(mock_ctx):
         assert nc["endpoint_path"] == endpoint_path
         assert "cursor" in nc
         assert "query_params" not in nc
-        mock_request.assert_called_once_with(chain_id=chain_id, api_path=endpoint_path, params={})
+        mock_request.assert_called_once_with(
+            chain_id=chain_id,
+            api_path=endpoint_path,
+            params={},
+            max_body_bytes=direct_api_call_module.config.direct_api_response_size_limit,
+        )
         assert mock_ctx.report_progress.await_count == 2
 
 
@@ -146,7 +157,12 @@ async def test_direct_api_call_with_query_params_pagination(mock_ctx):
         assert nc["endpoint_path"] == endpoint_path
         assert nc["query_params"] == query_params
         assert "cursor" in nc
-        mock_request.assert_called_once_with(chain_id=chain_id, api_path=endpoint_path, params=query_params)
+        mock_request.assert_called_once_with(
+            chain_id=chain_id,
+            api_path=endpoint_path,
+            params=query_params,
+            max_body_bytes=direct_api_call_module.config.direct_api_response_size_limit,
+        )
         assert mock_ctx.report_progress.await_count == 2
 
 
@@ -214,7 +230,6 @@ async def test_direct_api_call_allows_response_under_limit(mock_ctx):
 async def test_direct_api_call_rejects_mcp_over_limit(mock_ctx):
     chain_id = "1"
     endpoint_path = "/api/v2/stats"
-    mock_response = {"data": "x" * 150}
 
     with (
         patch.object(direct_api_call_module.config, "direct_api_response_size_limit", 100),
@@ -223,21 +238,22 @@ async def test_direct_api_call_rejects_mcp_over_limit(mock_ctx):
             new_callable=AsyncMock,
         ) as mock_request,
     ):
-        mock_request.return_value = mock_response
+        # The request helper aborts the streamed body once it exceeds the cap.
+        mock_request.side_effect = ResponseTooLargeError("body too large", size=150, limit=100)
 
-        with pytest.raises(ResponseTooLargeError):
+        with pytest.raises(ResponseTooLargeError, match=r"Response size \(150 bytes\) exceeds the safety limit of 100"):
             await direct_api_call_module.direct_api_call(
                 chain_id=chain_id,
                 endpoint_path=endpoint_path,
                 ctx=mock_ctx,
             )
+        mock_request.assert_awaited_once_with(chain_id=chain_id, api_path=endpoint_path, params={}, max_body_bytes=100)
 
 
 @pytest.mark.asyncio
 async def test_direct_api_call_rejects_rest_over_limit_without_header():
     chain_id = "1"
     endpoint_path = "/api/v2/stats"
-    mock_response = {"data": "x" * 150}
     ctx = MockCtx(request=SimpleNamespace(headers={}))
 
     with (
@@ -247,9 +263,10 @@ async def test_direct_api_call_rejects_rest_over_limit_without_header():
             new_callable=AsyncMock,
         ) as mock_request,
     ):
-        mock_request.return_value = mock_response
+        # No Content-Length: the transfer was aborted before the full size was known.
+        mock_request.side_effect = ResponseTooLargeError("body too large", limit=100)
 
-        with pytest.raises(ResponseTooLargeError):
+        with pytest.raises(ResponseTooLargeError, match=r"\(over 100 bytes\).*X-Blockscout-Allow-Large-Response"):
             await direct_api_call_module.direct_api_call(
                 chain_id=chain_id,
                 endpoint_path=endpoint_path,
@@ -281,6 +298,7 @@ async def test_direct_api_call_allows_rest_over_limit_with_header():
 
         assert isinstance(result, ToolResponse)
         assert result.data.model_dump() == mock_response
+        assert mock_request.await_args.kwargs["max_body_bytes"] is None
 
 
 @pytest.mark.asyncio
@@ -340,7 +358,6 @@ async def test_direct_api_call_list_response_size_limit_behavior(mock_ctx):
     chain_id = "1"
     endpoint_path = "/api/v2/main-page/blocks"
     under_limit_response = [{"height": 1}]
-    over_limit_response = [{"height": i, "hash": "x" * 20} for i in range(5)]
 
     with (
         patch.object(direct_api_call_module.config, "direct_api_response_size_limit", 50),
@@ -362,7 +379,7 @@ async def test_direct_api_call_list_response_size_limit_behavior(mock_ctx):
         )
         assert under_limit_result.data.model_dump() == {"items": under_limit_response}
 
-        mock_request.return_value = over_limit_response
+        mock_request.side_effect = ResponseTooLargeError("body too large", size=120, limit=50)
         with pytest.raises(ResponseTooLargeError):
             await direct_api_call_module.direct_api_call(chain_id=chain_id, endpoint_path=endpoint_path, ctx=mock_ctx)
 
@@ -389,6 +406,7 @@ async def test_direct_api_call_post_basic(mock_ctx):
             api_path="/json-rpc",
             json_body={"id": 1},
             params={},
+            max_body_bytes=direct_api_call_module.config.direct_api_response_size_limit,
         )
         assert mock_ctx.report_progress.await_count == 2
 
@@ -420,6 +438,7 @@ async def test_direct_api_call_post_with_query_params(mock_ctx):
             api_path="/json-rpc",
             json_body={"id": 1},
             params={"foo": "bar"},
+            max_body_bytes=direct_api_call_module.config.direct_api_response_size_limit,
         )
         assert mock_ctx.report_progress.await_count == 2
 
@@ -496,5 +515,58 @@ async def test_direct_api_call_post_ignores_next_page_params_for_pagination(mock
             api_path="/json-rpc",
             json_body={"id": 1},
             params={},
+            max_body_bytes=direct_api_call_module.config.direct_api_response_size_limit,
         )
         assert mock_ctx.report_progress.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_direct_api_call_handler_endpoints_are_not_byte_capped(mock_ctx):
+    endpoint_path = "/api/v2/transactions/0x" + "a" * 64 + "/summary"
+
+    with (
+        patch.object(direct_api_call_module.config, "direct_api_response_size_limit", 10),
+        patch(
+            "blockscout_mcp_server.tools.direct_api.direct_api_call.make_blockscout_request",
+            new_callable=AsyncMock,
+        ) as mock_request,
+        patch(
+            "blockscout_mcp_server.tools.direct_api.direct_api_call.dispatcher.dispatch", new_callable=AsyncMock
+        ) as mock_dispatch,
+    ):
+        mock_request.return_value = {"data": {"summaries": []}}
+        mock_dispatch.return_value = ToolResponse(data={"summary": None})
+
+        await direct_api_call_module.direct_api_call(chain_id="1", endpoint_path=endpoint_path, ctx=mock_ctx)
+
+        assert mock_request.await_args.kwargs["max_body_bytes"] is None
+
+
+@pytest.mark.asyncio
+async def test_direct_api_call_serves_next_logs_page_from_page_buffer(mock_ctx, monkeypatch):
+    monkeypatch.setattr(direct_api_call_module.config, "pro_api_key", "server-key")
+    endpoint_path = "/api/v2/addresses/0x" + "1" * 40 + "/logs"
+    page_size = direct_api_call_module.config.logs_page_size
+    logs = [
+        {
+            "block_number": 100 - i,
+            "transaction_hash": f"0xtx{i}",
+            "topics": [],
+            "data": "0x",
+            "decoded": None,
+            "index": i,
+        }
+        for i in range(page_size + 3)
+    ]
+
+    with patch(
+        "blockscout_mcp_server.tools.direct_api.direct_api_call.make_blockscout_request",
+        new_callable=AsyncMock,
+        return_value={"items": logs, "next_page_params": None},
+    ) as mock_request:
+        first = await direct_api_call_module.direct_api_call(chain_id="1", endpoint_path=endpoint_path, ctx=mock_ctx)
+        second = await direct_api_call_module.direct_api_call(**first.pagination.next_call.params, ctx=mock_ctx)
+
+    mock_request.assert_awaited_once()
+    assert [item.index for item in second.data] == [log["index"] for log in logs[page_size:]]
+    assert second.pagination is None
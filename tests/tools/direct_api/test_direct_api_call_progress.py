@@ -177,7 +177,6 @@ async def test_large_response_mcp_both_beats_fire_before_error(mock_ctx):
     """Both start and completion beats fire before ResponseTooLargeError is raised (non-REST)."""
     chain_id = "1"
     endpoint_path = "/api/v2/stats"
-    mock_response = {"data": "x" * 150}
 
     with (
         patch.object(direct_api_call_module.config, "direct_api_response_size_limit", 100),
@@ -186,7 +185,7 @@ async def test_large_response_mcp_both_beats_fire_before_error(mock_ctx):
             new_callable=AsyncMock,
         ) as mock_request,
     ):
-        mock_request.return_value = mock_response
+        mock_request.side_effect = ResponseTooLargeError("body too large", size=150, limit=100)
 
         with pytest.raises(ResponseTooLargeError):
             await direct_api_call_module.direct_api_call(
@@ -167,7 +167,12 @@ async def test_direct_api_call_allows_non_legacy_lookalike_path(mock_ctx):
             endpoint_path="/api/eth-rpc-foo",
             ctx=mock_ctx,
         )
-        mock_get.assert_awaited_once_with(chain_id="1", api_path="/api/eth-rpc-foo", params={})
+        mock_get.assert_awaited_once_with(
+            chain_id="1",
+            api_path="/api/eth-rpc-foo",
+            params={},
+            max_body_bytes=direct_api_call_module.config.direct_api_response_size_limit,
+        )
 
 
 @pytest.mark.asyncio
@@ -192,6 +197,7 @@ async def test_direct_api_call_allows_supported_json_rpc_path(mock_ctx):
             api_path="/json-rpc",
             json_body={"jsonrpc": "2.0", "method": "eth_blockNumber", "id": 1},
             params={},
+            max_body_bytes=direct_api_call_module.config.direct_api_response_size_limit,
         )
 
 
@@ -210,4 +216,9 @@ async def test_direct_api_call_strips_whitespace_around_supported_path(mock_ctx)
             endpoint_path="  /api/v2/stats  ",
             ctx=mock_ctx,
         )
-        mock_get.assert_awaited_once_with(chain_id="1", api_path="/api/v2/stats", params={})
+        mock_get.assert_awaited_once_with(
+            chain_id="1",
+            api_path="/api/v2/stats",
+            params={},
+            max_body_bytes=direct_api_call_module.config.direct_api_response_size_limit,
+        )
@@ -6,13 +6,22 @@ plus the new fail-fast (missing PRO API key) and chain-validation guards
 introduced when the helper was migrated to the PRO API.
 """
 
+import gzip
+import json
 from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
+from blockscout_mcp_server import metrics
+from blockscout_mcp_server.circuit_breaker import CircuitOpenError, circuit_breakers
 from blockscout_mcp_server.config import config
-from blockscout_mcp_server.tools.common import ChainNotFoundError, CreditsExhaustedError, make_blockscout_request
+from blockscout_mcp_server.tools.common import (
+    ChainNotFoundError,
+    CreditsExhaustedError,
+    ResponseTooLargeError,
+    make_blockscout_request,
+)
 
 # ---------------------------------------------------------------------------
 # Fake httpx.AsyncClient for transport tests
@@ -469,3 +478,217 @@ def test_credits_exhausted_error_is_exception_not_value_error():
     """
     assert issubclass(CreditsExhaustedError, Exception)
     assert not issubclass(CreditsExhaustedError, ValueError)
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_make_blockscout_request_fails_fast_when_chain_circuit_is_open():
+    """Once a chain's breaker opens, calls fail without touching the network."""
+    client = MockAsyncClient(_make_response(503, json_data={"message": "down"}))
+    client.get = AsyncMock(wraps=client.get)
+    patch_key, stub_chain = _patch_guards()
+    with (
+        patch_key,
+        stub_chain,
+        patch.object(config, "bs_request_max_retries", 1),
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+    ):
+        for _ in range(config.circuit_breaker_min_requests):
+            with pytest.raises(httpx.HTTPStatusError):
+                await make_blockscout_request("1", "/api/v2/test")
+        calls_before = client.get.await_count
+        with pytest.raises(CircuitOpenError):
+            await make_blockscout_request("1", "/api/v2/test")
+        assert client.get.await_count == calls_before
+        # Other chains are unaffected.
+        with pytest.raises(httpx.HTTPStatusError):
+            await make_blockscout_request("8453", "/api/v2/test")
+
+    assert circuit_breakers.snapshot()["chain:1"]["state"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_make_blockscout_request_retry_backoff_is_jittered():
+    """Retries sleep a randomized delay within [step/2, step] of the exponential step."""
+    request = httpx.Request("GET", _DEFAULT_URL)
+    client = MockAsyncClient(_make_response(200, json_data={}))
+    client.get = AsyncMock(side_effect=httpx.ConnectError("down", request=request))
+    patch_key, stub_chain = _patch_guards()
+    with (
+        patch_key,
+        stub_chain,
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+        patch("blockscout_mcp_server.tools.common.anyio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        with pytest.raises(httpx.ConnectError):
+            await make_blockscout_request("1", "/api/v2/test")
+
+    delays = [c.args[0] for c in mock_sleep.await_args_list]
+    assert len(delays) == config.bs_request_max_retries - 1
+    for attempt, delay in enumerate(delays):
+        step = 0.5 * (2**attempt)
+        assert step / 2 <= delay <= step
+
+
+# ---------------------------------------------------------------------------
+# 429 pacing integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_make_blockscout_request_retries_429_after_retry_after():
+    """A 429 within the wait budget is queued and retried instead of failing the call."""
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "1"}, request=httpx.Request("GET", _DEFAULT_URL)),
+        _make_response(200, json_data={"ok": True}),
+    ]
+    client = MockAsyncClient(responses[1])
+    client.get = AsyncMock(side_effect=responses)
+    patch_key, stub_chain = _patch_guards()
+    with (
+        patch_key,
+        stub_chain,
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+        patch("blockscout_mcp_server.rate_limiter.anyio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        result = await make_blockscout_request("1", "/api/v2/test")
+
+    assert result == {"ok": True}
+    assert client.get.await_count == 2
+    assert mock_sleep.await_args.args[0] == pytest.approx(1.0, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_make_blockscout_request_surfaces_429_when_pacing_disabled():
+    client = MockAsyncClient(httpx.Response(429, request=httpx.Request("GET", _DEFAULT_URL)))
+    client.get = AsyncMock(wraps=client.get)
+    patch_key, stub_chain = _patch_guards()
+    with (
+        patch_key,
+        stub_chain,
+        patch.object(config, "rate_limit_max_wait_seconds", 0),
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+    ):
+        with pytest.raises(httpx.HTTPStatusError, match="429"):
+            await make_blockscout_request("1", "/api/v2/test")
+    assert client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_make_blockscout_request_surfaces_429_beyond_wait_budget():
+    response = httpx.Response(429, headers={"Retry-After": "3600"}, request=httpx.Request("GET", _DEFAULT_URL))
+    client = MockAsyncClient(response)
+    client.get = AsyncMock(wraps=client.get)
+    patch_key, stub_chain = _patch_guards()
+    with (
+        patch_key,
+        stub_chain,
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+    ):
+        with pytest.raises(httpx.HTTPStatusError, match="429"):
+            await make_blockscout_request("1", "/api/v2/test")
+    assert client.get.await_count == 1
+
+
+# ---------------------------------------------------------------------------
+# Byte-capped streaming reads (max_body_bytes)
+# ---------------------------------------------------------------------------
+
+
+def _streaming_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_make_blockscout_request_capped_read_returns_body_within_cap():
+    body = json.dumps({"items": [1, 2, 3]}).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=gzip.compress(body), headers={"Content-Encoding": "gzip"})
+
+    patch_key, stub_chain = _patch_guards()
+    with (
+        patch_key,
+        stub_chain,
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=_streaming_client(handler)),
+    ):
+        result = await make_blockscout_request("1", "/api/v2/test", max_body_bytes=len(body))
+
+    assert result == {"items": [1, 2, 3]}
+
+
+@pytest.mark.asyncio
+async def test_make_blockscout_request_capped_read_rejects_declared_oversized_body():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b'{"data": "' + b"x" * 500 + b'"}')
+
+    patch_key, stub_chain = _patch_guards()
+    with (
+        patch_key,
+        stub_chain,
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=_streaming_client(handler)),
+    ):
+        with pytest.raises(ResponseTooLargeError) as exc_info:
+            await make_blockscout_request("1", "/api/v2/test", max_body_bytes=100)
+
+    assert exc_info.value.size == 512
+    assert exc_info.value.limit == 100
+
+
+@pytest.mark.asyncio
+async def test_make_blockscout_request_capped_read_aborts_transfer_midway():
+    produced: list[int] = []
+
+    async def chunks():
+        for i in range(100):
+            produced.append(i)
+            yield b"x" * 64
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # No Content-Length: the size is only discovered while streaming.
+        return httpx.Response(200, content=chunks())
+
+    patch_key, stub_chain = _patch_guards()
+    with (
+        patch_key,
+        stub_chain,
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=_streaming_client(handler)),
+    ):
+        with pytest.raises(ResponseTooLargeError) as exc_info:
+            await make_blockscout_request("1", "/api/v2/test", max_body_bytes=200)
+
+    assert exc_info.value.size is None
+    assert len(produced) < 10
+
+
+# ---------------------------------------------------------------------------
+# Upstream metrics
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_make_blockscout_request_records_upstream_metrics_per_attempt():
+    tx_path = "/api/v2/transactions/0x" + "ab" * 32
+    request = httpx.Request("GET", _DEFAULT_URL)
+    client = MockAsyncClient(_make_response(200, json_data={}))
+    client.get = AsyncMock(
+        side_effect=[httpx.ConnectError("down", request=request), _make_response(200, json_data={"ok": True})]
+    )
+    patch_key, stub_chain = _patch_guards()
+    with (
+        patch_key,
+        stub_chain,
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+        patch("blockscout_mcp_server.tools.common.anyio.sleep", new_callable=AsyncMock),
+    ):
+        await make_blockscout_request("1", tx_path)
+
+    labels = ("api.blockscout.com", "1", "/api/v2/transactions/{hash}")
+    assert metrics.upstream_duration.count(*labels, "ConnectError") == 1
+    assert metrics.upstream_duration.count(*labels, "200") == 1
+    assert metrics.upstream_retries.value(*labels, "transport") == 1
+    assert metrics.upstream_in_flight.value("api.blockscout.com") == 0
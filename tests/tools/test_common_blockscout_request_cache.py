@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the response cache underneath make_blockscout_request."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.response_cache import response_cache
+from blockscout_mcp_server.tools.common import make_blockscout_request
+
+TX_PATH = "/api/v2/transactions/0x" + "cd" * 32
+CONFIRMED_TX = {"hash": "0x" + "cd" * 32, "status": "ok", "confirmations": 500, "block_number": 10}
+
+
+class ScriptedAsyncClient:
+    """Fake client replaying a list of responses or exceptions, one per get()."""
+
+    def __init__(self, outcomes: list) -> None:
+        self._outcomes = list(outcomes)
+        self.calls = 0
+
+    async def __aenter__(self) -> "ScriptedAsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        self.calls += 1
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, body = outcome
+        return httpx.Response(status, json=body, request=httpx.Request("GET", url))
+
+
+@pytest.fixture
+def guards():
+    with (
+        patch.object(config, "pro_api_key", "server-key"),
+        patch.object(config, "bs_request_max_retries", 1),
+        patch("blockscout_mcp_server.tools.common.ensure_chain_supported", AsyncMock()),
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_final_response_is_served_from_cache(guards):
+    client = ScriptedAsyncClient([(200, CONFIRMED_TX)])
+    with patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client):
+        first = await make_blockscout_request("1", TX_PATH)
+        second = await make_blockscout_request("1", TX_PATH)
+    assert first == second == CONFIRMED_TX
+    assert first is not second
+    assert client.calls == 1
+    assert response_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_checks_key_and_chain_before_lookup(guards):
+    client = ScriptedAsyncClient([(200, CONFIRMED_TX)])
+    with patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client):
+        await make_blockscout_request("1", TX_PATH)
+    with patch.object(config, "pro_api_key", ""), pytest.raises(ValueError):
+        await make_blockscout_request("1", TX_PATH)
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_served_when_upstream_fails(guards):
+    contract_path = "/api/v2/smart-contracts/0x" + "34" * 20
+    contract = {"is_fully_verified": True, "name": "C"}
+    request = httpx.Request("GET", "https://api.blockscout.com/1" + contract_path)
+    client = ScriptedAsyncClient([(200, contract), httpx.ConnectError("down", request=request)])
+    with (
+        patch.object(config, "response_cache_contract_ttl_seconds", 0.000001),
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+    ):
+        await make_blockscout_request("1", contract_path)
+        assert await make_blockscout_request("1", contract_path) == contract
+    assert client.calls == 2
+    assert response_cache.stats()["stale_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_masked_by_stale_entries(guards):
+    contract_path = "/api/v2/smart-contracts/0x" + "56" * 20
+    client = ScriptedAsyncClient([(200, {"is_fully_verified": True}), (404, {"message": "Not found"})])
+    with (
+        patch.object(config, "response_cache_contract_ttl_seconds", 0.000001),
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+    ):
+        await make_blockscout_request("1", contract_path)
+        with pytest.raises(httpx.HTTPStatusError):
+            await make_blockscout_request("1", contract_path)
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_with_zero_budget(guards):
+    client = ScriptedAsyncClient([(200, CONFIRMED_TX), (200, CONFIRMED_TX)])
+    with (
+        patch.object(config, "response_cache_max_bytes", 0),
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+    ):
+        await make_blockscout_request("1", TX_PATH)
+        await make_blockscout_request("1", TX_PATH)
+    assert client.calls == 2
@@ -0,0 +1,217 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for singleflight coalescing of concurrent make_blockscout_request GETs."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.hedging import hedge_policy
+from blockscout_mcp_server.pro_api_key_context import CreditSink, _client_key_state, _credit_sink, _Valid
+from blockscout_mcp_server.singleflight import upstream_get_flight
+from blockscout_mcp_server.tools.common import make_blockscout_request
+
+
+class GatedAsyncClient:
+    """Fake client whose get() blocks until released, recording each call."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+        self.release = asyncio.Event()
+
+    async def __aenter__(self) -> "GatedAsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    async def get(self, url: str, params: dict | None = None, headers: dict | None = None, **kwargs):
+        self.calls.append({"url": url, "params": params, "headers": headers})
+        await self.release.wait()
+        return httpx.Response(
+            200,
+            json={"items": [1, 2]},
+            headers={"x-credits-remaining": "1234"},
+            request=httpx.Request("GET", url),
+        )
+
+
+async def _gather_released(client: GatedAsyncClient, *coros):
+    tasks = [asyncio.create_task(c) for c in coros]
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    client.release.set()
+    return await asyncio.gather(*tasks)
+
+
+@pytest.fixture
+def guards():
+    with (
+        patch.object(config, "pro_api_key", "server-key"),
+        patch("blockscout_mcp_server.tools.common.ensure_chain_supported", AsyncMock()),
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_gets_share_one_request(guards):
+    client = GatedAsyncClient()
+    before = upstream_get_flight.stats()
+    with patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client):
+        results = await _gather_released(
+            client,
+            make_blockscout_request("1", "/api/v2/blocks/1", {"a": "1", "b": "2"}),
+            make_blockscout_request("1", "/api/v2/blocks/1", {"b": "2", "a": "1"}),
+            make_blockscout_request("1", "/api/v2/blocks/1", {"a": "1", "b": "2"}),
+        )
+
+    assert len(client.calls) == 1
+    assert results[0] == results[1] == results[2] == {"items": [1, 2]}
+    # Every caller owns its copy of the decoded body.
+    results[0]["items"].append(3)
+    assert results[1] == {"items": [1, 2]}
+    stats = upstream_get_flight.stats()
+    assert stats["executions"] - before["executions"] == 1
+    assert stats["coalesced"] - before["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_different_params_are_not_coalesced(guards):
+    client = GatedAsyncClient()
+    with patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client):
+        await _gather_released(
+            client,
+            make_blockscout_request("1", "/api/v2/blocks/1", {"a": "1"}),
+            make_blockscout_request("1", "/api/v2/blocks/1", {"a": "2"}),
+            make_blockscout_request("8453", "/api/v2/blocks/1", {"a": "1"}),
+        )
+    assert len(client.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_different_pro_api_keys_are_not_coalesced(guards):
+    client = GatedAsyncClient()
+
+    async def call_with_client_key(key: str):
+        _client_key_state.set(_Valid(key))
+        return await make_blockscout_request("1", "/api/v2/blocks/1")
+
+    with patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client):
+        await _gather_released(client, call_with_client_key("key-a"), call_with_client_key("key-b"))
+
+    authorizations = sorted(call["headers"]["Authorization"] for call in client.calls)
+    assert authorizations == ["Bearer key-a", "Bearer key-b"]
+
+
+@pytest.mark.asyncio
+async def test_each_coalesced_caller_records_credits_in_its_own_sink(guards):
+    client = GatedAsyncClient()
+    sinks = [CreditSink(), CreditSink()]
+
+    async def call_with_sink(sink: CreditSink):
+        _credit_sink.set(sink)
+        return await make_blockscout_request("1", "/api/v2/blocks/1")
+
+    with patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client):
+        await _gather_released(client, *(call_with_sink(s) for s in sinks))
+
+    assert len(client.calls) == 1
+    assert [s.remaining for s in sinks] == [1234.0, 1234.0]
+
+
+@pytest.mark.asyncio
+async def test_coalescing_can_be_disabled(guards):
+    client = GatedAsyncClient()
+    with (
+        patch.object(config, "request_coalescing_enabled", False),
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+    ):
+        await _gather_released(
+            client,
+            make_blockscout_request("1", "/api/v2/blocks/1"),
+            make_blockscout_request("1", "/api/v2/blocks/1"),
+        )
+    assert len(client.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_light_lookup_is_hedged_once_for_all_coalesced_callers(guards):
+    calls = 0
+
+    class SlowFirstClient(GatedAsyncClient):
+        async def get(self, url: str, params: dict | None = None, headers: dict | None = None, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(10)
+            return httpx.Response(200, json={"hash": "0x1"}, request=httpx.Request("GET", url))
+
+    for _ in range(3):
+        hedge_policy.record_latency(0.01)
+    client = SlowFirstClient()
+    with (
+        patch.object(config, "hedge_budget_ratio", 1.0),
+        patch.object(config, "hedge_min_samples", 3),
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+    ):
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                make_blockscout_request("1", "/api/v2/addresses/0x1", timeout=config.bs_light_timeout),
+                make_blockscout_request("1", "/api/v2/addresses/0x1", timeout=config.bs_light_timeout),
+            ),
+            timeout=5,
+        )
+
+    assert results == [{"hash": "0x1"}, {"hash": "0x1"}]
+    assert calls == 2
+    assert hedge_policy.stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_races_each_retry_attempt_not_the_whole_retry_loop(guards):
+    class SlowFailingClient(GatedAsyncClient):
+        async def get(self, url: str, params: dict | None = None, headers: dict | None = None, **kwargs):
+            self.calls.append({"url": url})
+            await asyncio.sleep(0.1)
+            raise httpx.ConnectError("unreachable", request=httpx.Request("GET", url))
+
+    for _ in range(3):
+        hedge_policy.record_latency(0.01)
+    client = SlowFailingClient()
+    with (
+        patch.object(config, "hedge_budget_ratio", 1.0),
+        patch.object(config, "hedge_min_samples", 3),
+        patch.object(config, "bs_request_max_retries", 3),
+        patch("blockscout_mcp_server.tools.common._retry_backoff_seconds", return_value=0),
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+        pytest.raises(httpx.ConnectError),
+    ):
+        await asyncio.wait_for(
+            make_blockscout_request("1", "/api/v2/addresses/0x1", timeout=config.bs_light_timeout), timeout=5
+        )
+
+    # One primary and one hedge per attempt; a hedge never runs its own retry loop.
+    stats = hedge_policy.stats()
+    assert stats["primaries"] == stats["hedges"] == 3
+    assert len(client.calls) == 6
+
+
+@pytest.mark.asyncio
+async def test_default_timeout_requests_are_never_hedged(guards):
+    for _ in range(3):
+        hedge_policy.record_latency(0.01)
+    client = GatedAsyncClient()
+    with (
+        patch.object(config, "hedge_budget_ratio", 1.0),
+        patch.object(config, "hedge_min_samples", 3),
+        patch("blockscout_mcp_server.tools.common._create_httpx_client", return_value=client),
+    ):
+        task = asyncio.create_task(make_blockscout_request("1", "/api/v2/addresses/0x1"))
+        await asyncio.sleep(0.2)
+        client.release.set()
+        await task
+
+    assert len(client.calls) == 1
+    assert hedge_policy.stats()["primaries"] == 0
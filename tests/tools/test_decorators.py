@@ -11,6 +11,7 @@ from mcp.types import RequestParams
 from pro_api_key_helpers import ctx_with_header
 from starlette.datastructures import Headers
 
+from blockscout_mcp_server import metrics
 from blockscout_mcp_server.analytics import _build_fingerprint_distinct_id
 from blockscout_mcp_server.api.dependencies import MockCtx
 from blockscout_mcp_server.client_meta import (
@@ -96,6 +97,23 @@ async def test_log_tool_invocation_decorator(caplog: pytest.LogCaptureFixture, m
     assert str(mock_ctx) not in log_text
 
 
+@pytest.mark.asyncio
+async def test_log_tool_invocation_records_latency_by_outcome(mock_ctx: Context) -> None:
+    @log_tool_invocation
+    async def dummy_tool(fail: bool, ctx: Context) -> str:
+        if fail:
+            raise ValueError("boom")
+        return "ok"
+
+    await dummy_tool(False, ctx=mock_ctx)
+    with pytest.raises(ValueError):
+        await dummy_tool(True, ctx=mock_ctx)
+
+    assert metrics.tool_duration.count("dummy_tool", "success") == 1
+    assert metrics.tool_duration.count("dummy_tool", "error") == 1
+    assert metrics.tools_in_flight.value("dummy_tool") == 0
+
+
 @pytest.mark.asyncio
 async def test_log_tool_invocation_mcp_context(caplog: pytest.LogCaptureFixture, mock_ctx: Context) -> None:
     """Verify that client info is logged correctly from a full MCP context."""
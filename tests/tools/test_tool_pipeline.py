@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the fused pipeline `log_tool_invocation` compiles from the standard tool stack.
+
+The behavior of each stage is covered by the decorator tests; these check that
+the fused form runs the same stages off a single argument binding and a single
+read of each request fact.
+"""
+
+import inspect
+from unittest.mock import patch
+
+import pytest
+from pro_api_key_helpers import ctx_with_header
+
+from blockscout_mcp_server import call_context
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.pro_api_key_context import (
+    CreditSink,
+    _credit_sink,
+    client_supplied_valid_key,
+    pro_api_credit_scope,
+    pro_api_key_scope,
+)
+from blockscout_mcp_server.session_gate import (
+    SessionIdMissingError,
+    get_remaining_budget,
+    mint_token,
+    session_gate,
+    session_gate_unmetered,
+)
+from blockscout_mcp_server.tools.decorators import log_tool_invocation
+
+
+def _stacked(gate, observed: dict):
+    @log_tool_invocation
+    @pro_api_key_scope
+    @gate
+    @pro_api_credit_scope
+    async def tool(chain_id: str, ctx, session_id: str | None = None) -> str:
+        observed["exempt"] = client_supplied_valid_key()
+        observed["remaining"] = get_remaining_budget()
+        observed["credit_sink"] = isinstance(_credit_sink.get(), CreditSink)
+        return chain_id
+
+    return tool
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("gate", [session_gate, session_gate_unmetered])
+async def test_stack_is_bound_once_per_call(enabled_session_gate, mock_ctx, monkeypatch, gate):
+    monkeypatch.setattr(config, "session_mcp_max_calls", 5)
+    observed: dict = {}
+    tool = _stacked(gate, observed)
+
+    with patch.object(inspect.Signature, "bind_partial", side_effect=AssertionError("bound again")):
+        assert await tool("1", ctx=mock_ctx, session_id=mint_token()) == "1"
+
+    assert observed == {"exempt": False, "remaining": 4 if gate is session_gate else 5, "credit_sink": True}
+
+
+@pytest.mark.asyncio
+async def test_gate_still_refuses_before_the_body(enabled_session_gate, mock_ctx):
+    observed: dict = {}
+    tool = _stacked(session_gate, observed)
+
+    with pytest.raises(SessionIdMissingError):
+        await tool("1", ctx=mock_ctx)
+
+    assert observed == {}
+
+
+@pytest.mark.asyncio
+async def test_client_key_is_read_once_and_exempts_the_call(enabled_session_gate):
+    observed: dict = {}
+    tool = _stacked(session_gate, observed)
+    ctx = ctx_with_header(config.pro_api_key_header, "client-key-123")
+
+    with patch.object(
+        call_context,
+        "extract_client_pro_api_key_from_ctx",
+        wraps=call_context.extract_client_pro_api_key_from_ctx,
+    ) as extract_key:
+        assert await tool("1", ctx=ctx) == "1"
+
+    extract_key.assert_called_once_with(ctx)
+    assert observed == {"exempt": True, "remaining": None, "credit_sink": True}
@@ -311,3 +311,49 @@ async def test_get_token_transfers_by_address_invalid_cursor(mock_ctx):
                 ctx=mock_ctx,
             )
     mock_apply.assert_called_once()
+
+
+def _transfer(index: int) -> dict:
+    return {
+        "type": "ERC-20",
+        "hash": f"0x{index:064x}",
+        "from": {"hash": "0xfrom"},
+        "to": {"hash": "0xto"},
+        "total": {"decimals": "18", "value": "1"},
+        "block_number": 1_000 - index,
+        "transaction_index": 0,
+        "internal_transaction_index": None,
+        "token_transfer_batch_index": None,
+        "token_transfer_index": index,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("upstream_has_more", "upstream_calls"), [(False, 1), (True, 2)])
+async def test_follow_up_pages_are_served_from_the_page_buffer(
+    mock_ctx, monkeypatch, upstream_has_more, upstream_calls
+):
+    """Paging through one upstream page fetches it once; a short tail refetches only if more may follow."""
+    monkeypatch.setattr(config, "pro_api_key", "server-key")
+    page_size = config.advanced_filters_page_size
+    upstream_items = [_transfer(i) for i in range(2 * page_size + 5)]
+    next_page_params = {"block_number": 1} if upstream_has_more else None
+
+    with patch(
+        "blockscout_mcp_server.tools.transaction.get_token_transfers_by_address.make_request_with_periodic_progress",
+        new_callable=AsyncMock,
+    ) as mock_wrapper:
+        mock_wrapper.side_effect = lambda **kwargs: {
+            "items": upstream_items[-5:] if "block_number" in kwargs["request_args"]["params"] else upstream_items,
+            "next_page_params": next_page_params if "block_number" not in kwargs["request_args"]["params"] else None,
+        }
+
+        pages = [await get_token_transfers_by_address(chain_id="1", address="0xabc", age_from="2024", ctx=mock_ctx)]
+        while pages[-1].pagination is not None:
+            next_call = pages[-1].pagination.next_call
+            assert next_call.tool_name == "get_token_transfers_by_address"
+            pages.append(await get_token_transfers_by_address(**next_call.params, ctx=mock_ctx))
+
+    returned = [item.model_dump()["hash"] for page in pages for item in page.data]
+    assert returned == [item["hash"] for item in upstream_items]
+    assert mock_wrapper.await_count == upstream_calls
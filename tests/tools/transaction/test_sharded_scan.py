@@ -0,0 +1,210 @@
+# SPDX-License-Identifier: LicenseRef-Blockscout
+"""Tests for the time-sharded first-page scan of the advanced-filters tools."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from blockscout_mcp_server.config import config
+from blockscout_mcp_server.tools.transaction._shared import _age_window_shards, _scan_advanced_filters_in_shards
+from blockscout_mcp_server.tools.transaction.get_token_transfers_by_address import get_token_transfers_by_address
+from blockscout_mcp_server.tools.transaction.get_transactions_by_address import get_transactions_by_address
+
+_BASE = datetime(2024, 1, 1, tzinfo=UTC)
+_UPSTREAM_PAGE = 50
+
+
+def _at(hours: float) -> str:
+    return (_BASE + timedelta(hours=hours)).isoformat().replace("+00:00", "Z")
+
+
+def _item(hour: int, item_type: str = "ERC-20") -> dict:
+    return {
+        "hash": f"0x{hour:064x}",
+        "type": item_type,
+        "block_number": hour,
+        "transaction_index": 0,
+        "timestamp": _at(hour),
+        "from": {"hash": "0xabc"},
+        "to": {"hash": "0xdef"},
+    }
+
+
+class _FakeAdvancedFilters:
+    """Advanced-filters upstream over one item per hour, newest first, with inclusive age bounds."""
+
+    def __init__(self, hours: range, item_type: str = "ERC-20") -> None:
+        self.items = [_item(hour, item_type) for hour in sorted(hours, reverse=True)]
+        self.requests: list[dict] = []
+
+    async def __call__(self, *, chain_id, api_path, params, **kwargs):
+        self.requests.append(dict(params))
+        low = datetime.fromisoformat(params["age_from"])
+        high = datetime.fromisoformat(params["age_to"]) if params.get("age_to") else None
+        selected = [
+            item
+            for item in self.items
+            if low <= datetime.fromisoformat(item["timestamp"])
+            and (high is None or datetime.fromisoformat(item["timestamp"]) <= high)
+        ]
+        if params.get("block_number") is not None:
+            selected = [item for item in selected if item["block_number"] < params["block_number"]]
+        page = selected[:_UPSTREAM_PAGE]
+        more = len(selected) > _UPSTREAM_PAGE
+        return {
+            "items": page,
+            "next_page_params": {"block_number": page[-1]["block_number"], "transaction_index": 0} if more else None,
+        }
+
+
+@pytest.fixture
+def sharded(monkeypatch):
+    monkeypatch.setattr(config, "advanced_filters_scan_shards", 4)
+    monkeypatch.setattr(config, "advanced_filters_scan_concurrency", 4)
+
+
+def test_age_window_shards_split_newest_first(sharded):
+    shards = _age_window_shards(_at(0), _at(200))
+
+    assert len(shards) == 4
+    assert shards[0][1] == _at(200)
+    assert datetime.fromisoformat(shards[0][0]) == _BASE + timedelta(hours=150)
+    assert shards[-1][0] == _at(0)
+    assert all(newer[0] == older[1] for newer, older in zip(shards, shards[1:], strict=False))
+
+
+def test_age_window_shards_keep_an_open_window_open(sharded):
+    shards = _age_window_shards(_at(0), None, now=_BASE + timedelta(hours=8))
+
+    assert shards[0][1] is None
+    assert shards[-1][0] == _at(0)
+
+
+@pytest.mark.parametrize(
+    ("shard_count", "age_from", "age_to"),
+    [(1, _at(0), _at(200)), (4, _at(0), _at(1.5)), (4, "not a date", _at(200))],
+)
+def test_age_window_shards_fall_back_to_sequential(monkeypatch, shard_count, age_from, age_to):
+    monkeypatch.setattr(config, "advanced_filters_scan_shards", shard_count)
+
+    assert _age_window_shards(age_from, age_to) is None
+
+
+@pytest.mark.asyncio
+async def test_scan_merges_shards_in_order_without_boundary_duplicates(sharded):
+    upstream = _FakeAdvancedFilters(range(0, 201, 10))
+    shards = _age_window_shards(_at(0), _at(200))
+
+    with patch("blockscout_mcp_server.tools.transaction._shared.make_blockscout_request", new=upstream):
+        items, has_more = await _scan_advanced_filters_in_shards("1", "/api/v2/advanced-filters", {}, shards, 100)
+
+    assert [item["block_number"] for item in items] == list(range(200, -1, -10))
+    assert has_more is False
+
+
+@pytest.mark.asyncio
+async def test_scan_stops_at_the_first_shard_with_more_pages(sharded):
+    upstream = _FakeAdvancedFilters(range(0, 201))
+    shards = _age_window_shards(_at(0), _at(200))
+
+    with patch("blockscout_mcp_server.tools.transaction._shared.make_blockscout_request", new=upstream):
+        items, has_more = await _scan_advanced_filters_in_shards("1", "/api/v2/advanced-filters", {}, shards, 10)
+
+    # The newest shard (hours 150-200) has 51 items: its first upstream page ends the prefix.
+    assert [item["block_number"] for item in items] == list(range(200, 150, -1))
+    assert has_more is True
+
+
+@pytest.mark.asyncio
+async def test_scan_cancels_shards_once_the_page_is_full(sharded, monkeypatch):
+    monkeypatch.setattr(config, "advanced_filters_scan_concurrency", 1)
+    upstream = _FakeAdvancedFilters(range(0, 201))
+    shards = _age_window_shards(_at(0), _at(200))
+
+    with patch("blockscout_mcp_server.tools.transaction._shared.make_blockscout_request", new=upstream):
+        await _scan_advanced_filters_in_shards("1", "/api/v2/advanced-filters", {}, shards, 10)
+
+    assert len(upstream.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_scan_raises_shard_errors_unwrapped(sharded):
+    shards = _age_window_shards(_at(0), _at(200))
+    error = httpx.ConnectError("down")
+
+    with (
+        patch("blockscout_mcp_server.tools.transaction._shared.make_blockscout_request", side_effect=error),
+        pytest.raises(httpx.ConnectError),
+    ):
+        await _scan_advanced_filters_in_shards("1", "/api/v2/advanced-filters", {}, shards, 10)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shard_count", [1, 4])
+async def test_sharded_first_page_paginates_through_the_whole_window(mock_ctx, monkeypatch, shard_count):
+    """A walk that starts with a sharded page returns every item once, in upstream order."""
+    monkeypatch.setattr(config, "pro_api_key", "server-key")
+    monkeypatch.setattr(config, "advanced_filters_scan_shards", shard_count)
+    upstream = _FakeAdvancedFilters(range(0, 201, 2))
+
+    with (
+        patch("blockscout_mcp_server.tools.transaction._shared.make_blockscout_request", new=upstream),
+        patch(
+            "blockscout_mcp_server.tools.transaction.get_token_transfers_by_address.make_blockscout_request",
+            new=upstream,
+        ),
+    ):
+        pages = [
+            await get_token_transfers_by_address(
+                chain_id="1", address="0xabc", age_from=_at(0), age_to=_at(200), ctx=mock_ctx
+            )
+        ]
+        while pages[-1].pagination is not None:
+            pages.append(await get_token_transfers_by_address(**pages[-1].pagination.next_call.params, ctx=mock_ctx))
+
+    returned = [item.model_dump()["block_number"] for page in pages for item in page.data]
+    assert returned == list(range(200, -1, -2))
+
+
+@pytest.mark.asyncio
+async def test_exhausted_sharded_window_ends_without_an_empty_page(mock_ctx, monkeypatch, sharded):
+    """The buffered tail of an exhausted window is the last page: it carries no next_call."""
+    monkeypatch.setattr(config, "pro_api_key", "server-key")
+    monkeypatch.setattr(config, "advanced_filters_page_size", 10)
+    upstream = _FakeAdvancedFilters(range(0, 200, 14), item_type="call")
+
+    with patch("blockscout_mcp_server.tools.transaction._shared.make_blockscout_request", new=upstream):
+        first = await get_transactions_by_address(
+            chain_id="1", address="0xabc", age_from=_at(0), age_to=_at(200), ctx=mock_ctx
+        )
+        requests_after_first = len(upstream.requests)
+        last = await get_transactions_by_address(**first.pagination.next_call.params, ctx=mock_ctx)
+
+    assert len(first.data) == 10
+    assert [item.model_dump()["block_number"] for item in last.data] == [56, 42, 28, 14, 0]
+    assert last.pagination is None
+    assert len(upstream.requests) == requests_after_first
+
+
+@pytest.mark.asyncio
+async def test_scan_shares_the_sequential_page_budget_between_shards(sharded):
+    # 2000 hourly items: every 500-item shard would need ten pages to fill a page nothing passes.
+    upstream = _FakeAdvancedFilters(range(0, 2001))
+    shards = _age_window_shards(_at(0), _at(2000))
+
+    with patch("blockscout_mcp_server.tools.transaction._shared.make_blockscout_request", new=upstream):
+        items, has_more = await _scan_advanced_filters_in_shards(
+            "1", "/api/v2/advanced-filters", {}, shards, 10, item_filter=lambda item: False
+        )
+
+    assert items == []
+    assert has_more is True
+    assert len(upstream.requests) == 8
+
+
+def test_age_window_shards_never_outnumber_the_page_budget(monkeypatch):
+    monkeypatch.setattr(config, "advanced_filters_scan_shards", 50)
+
+    assert len(_age_window_shards(_at(0), _at(200))) == 10